@@ -4,12 +4,45 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
 from accounts.models import ServiceAccountKey
 
+SERVICE_ACCOUNT_KEY_CACHE_KEY = "accounts:service-account-key:{prefix}:{digest}"
+SERVICE_ACCOUNT_LAST_USED_KEY = "accounts:service-account-key:last-used:{key_id}"
+
+
+def _key_cache_key(prefix: str, digest: str) -> str:
+    return SERVICE_ACCOUNT_KEY_CACHE_KEY.format(prefix=prefix, digest=digest)
+
+
+def invalidate_service_account_key(key: ServiceAccountKey) -> None:
+    """Drop the verified-key cache entry so the next request re-reads the row."""
+
+    cache.delete(_key_cache_key(key.prefix, key.secret_hash))
+
+
+def record_service_account_use(key: ServiceAccountKey) -> bool:
+    """Stamp ``last_used_at`` at most once per key per configured interval.
+
+    The write is a queryset ``update`` so it neither invalidates the cached key
+    nor races other fields being edited; returns whether a write happened.
+    """
+
+    now = timezone.now()
+    key.last_used_at = now
+    interval = int(getattr(settings, "SERVICE_ACCOUNT_LAST_USED_INTERVAL_SECONDS", 300))
+    if interval > 0 and not cache.add(
+        SERVICE_ACCOUNT_LAST_USED_KEY.format(key_id=key.id), 1, timeout=interval
+    ):
+        return False
+    ServiceAccountKey.all_objects.filter(pk=key.pk).update(last_used_at=now)
+    return True
+
 
 @dataclass
 class ServiceAccountPrincipal:
@@ -69,8 +102,7 @@ class ServiceAccountAuthentication(authentication.BaseAuthentication):
         if not key.is_active:
             raise AuthenticationFailed("API key is inactive")
 
-        key.last_used_at = timezone.now()
-        key.save(update_fields=["last_used_at"])
+        record_service_account_use(key)
 
         return ServiceAccountPrincipal(key), None
 
@@ -82,10 +114,21 @@ class ServiceAccountAuthentication(authentication.BaseAuthentication):
             prefix = prefix_part[3:]
         else:
             prefix = prefix_part
+
+        # The entry is keyed on the secret's digest, so a hit is already a
+        # verified match; wrong secrets miss and fall through to the row check.
+        cache_key = _key_cache_key(prefix, ServiceAccountKey._hash_secret(secret))
+        key = cache.get(cache_key)
+        if key is not None:
+            return key
+
         try:
-            key = ServiceAccountKey.all_objects.get(prefix=prefix)
+            key = ServiceAccountKey.all_objects.select_related("tenant", "role").get(prefix=prefix)
         except ServiceAccountKey.DoesNotExist as exc:  # pragma: no cover - defensive
             raise AuthenticationFailed("Invalid API key") from exc
         if not key.verify(secret):
             raise AuthenticationFailed("Invalid API key")
+        ttl = int(getattr(settings, "SERVICE_ACCOUNT_KEY_CACHE_TTL_SECONDS", 60))
+        if key.is_active and ttl > 0:
+            cache.set(cache_key, key, timeout=ttl)
         return key
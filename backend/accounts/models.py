@@ -223,6 +223,21 @@ class ServiceAccountKey(models.Model):
         candidate = self._hash_secret(secret)
         return hmac.compare_digest(self.secret_hash, candidate)
 
+    def save(self, *args, **kwargs):  # noqa: ANN002, ANN003 - Django signature
+        super().save(*args, **kwargs)
+        self._invalidate_cached_verification()
+
+    def delete(self, *args, **kwargs):  # noqa: ANN002, ANN003 - Django signature
+        self._invalidate_cached_verification()
+        return super().delete(*args, **kwargs)
+
+    def _invalidate_cached_verification(self) -> None:
+        # Deactivation, role and tenant changes must not outlive the
+        # authentication cache TTL.
+        from accounts.authentication import invalidate_service_account_key
+
+        invalidate_service_account_key(self)
+
     def mark_used(self) -> None:
         self.last_used_at = timezone.now()
         self.save(update_fields=["last_used_at"])
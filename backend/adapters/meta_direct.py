@@ -4,14 +4,29 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date, datetime, time
+from datetime import date
 from decimal import Decimal
-from typing import Any, Iterable, Mapping, Sequence
-
-from django.db.models import Q
+from operator import itemgetter
+from typing import Any, Iterable, Mapping
+
+from django.db.models import (
+    BooleanField,
+    Case,
+    F,
+    Max,
+    Min,
+    Q,
+    QuerySet,
+    Sum,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Coalesce, NullIf, RowNumber, Trim, Upper
 from django.utils import timezone
 
-from analytics.models import RawPerformanceRecord
+from analytics.fx import fx_rate_engine
+from analytics.models import Ad, RawPerformanceRecord
 from analytics.serializers import CombinedMetricsQueryParamsSerializer
 
 from .base import AdapterInterface, MetricsAdapter
@@ -28,6 +43,10 @@ MANUAL_PAID_METRIC_COLUMNS = {
     "clicks": {"clicks"},
     "conversions": {"conversions"},
 }
+RECORD_METRICS = ("spend", "impressions", "reach", "clicks", "conversions")
+# Payload ordering of performance records; "first record" attributes (account
+# ids, creative campaign, currency) are taken in this order.
+RECORD_ORDERING = ("date", "campaign__name", "ad__name", "external_id")
 
 # Best-effort mapping: Meta region name (lowercased) → canonical parish name from jm_parishes.json.
 META_REGION_TO_PARISH: dict[str, str] = {
@@ -198,8 +217,9 @@ def _sum_optional_values(values: Iterable[float | int | None]) -> float | int |
     return total
 
 
-def _manual_metric_was_supplied(record: RawPerformanceRecord, metric: str) -> bool:
-    raw_payload = record.raw_payload if isinstance(record.raw_payload, Mapping) else {}
+def _manual_metric_was_supplied(raw_payload: Any, metric: str) -> bool:
+    if not isinstance(raw_payload, Mapping):
+        return True
     if raw_payload.get("source") != MANUAL_PAID_CSV_SOURCE:
         return True
     metric_columns = raw_payload.get("metric_columns")
@@ -210,16 +230,61 @@ def _manual_metric_was_supplied(record: RawPerformanceRecord, metric: str) -> bo
     return bool(supplied & aliases)
 
 
-def _record_float_metric(record: RawPerformanceRecord, metric: str) -> float | None:
-    if not _manual_metric_was_supplied(record, metric):
-        return None
-    return _to_optional_float(getattr(record, metric, None))
+def _manual_row_metrics(row: Mapping[str, Any]) -> dict[str, float | int | None]:
+    """Metric contributions of a manual CSV row; unsupplied columns count as ``None``."""
+    metrics: dict[str, float | int | None] = {}
+    for metric in RECORD_METRICS:
+        if not _manual_metric_was_supplied(row["raw_payload"], metric):
+            metrics[metric] = None
+        elif metric == "spend":
+            metrics[metric] = _to_optional_float(row[metric])
+        else:
+            metrics[metric] = _to_optional_int(row[metric])
+    return metrics
 
 
-def _record_int_metric(record: RawPerformanceRecord, metric: str) -> int | None:
-    if not _manual_metric_was_supplied(record, metric):
-        return None
-    return _to_optional_int(getattr(record, metric, None))
+def _metric_sums() -> dict[str, Sum]:
+    # Manual CSV rows are summed in Python so unsupplied columns stay ``None``.
+    return {
+        f"sum_{metric}": Sum(metric, filter=Q(is_manual_csv=False))
+        for metric in RECORD_METRICS
+    }
+
+
+def _grouped_metrics(row: Mapping[str, Any]) -> dict[str, float | int | None]:
+    return {
+        metric: (
+            _to_optional_float(row[f"sum_{metric}"])
+            if metric == "spend"
+            else _to_optional_int(row[f"sum_{metric}"])
+        )
+        for metric in RECORD_METRICS
+    }
+
+
+def _add_metrics(group: dict[str, Any], metrics: Mapping[str, float | int | None]) -> None:
+    for metric, value in metrics.items():
+        group[metric] = _sum_optional(group[metric], value)
+
+
+def _first_rows_by(queryset: QuerySet, partition: str, *fields: str) -> dict[Any, dict[str, Any]]:
+    """Return the first record per ``partition`` value, in first-appearance order."""
+
+    ordering = [F(name).asc() for name in RECORD_ORDERING]
+    rows = (
+        queryset.order_by()
+        .annotate(
+            overall_position=Window(RowNumber(), order_by=ordering),
+            partition_position=Window(
+                RowNumber(), partition_by=[F(partition)], order_by=ordering
+            ),
+        )
+        .filter(partition_position=1)
+        .values(partition, "overall_position", *fields)
+    )
+    return {
+        row[partition]: row for row in sorted(rows, key=itemgetter("overall_position"))
+    }
 
 
 def _validated_filters(options: Mapping[str, Any] | None) -> MetaDirectFilters:
@@ -267,36 +332,21 @@ def _validated_filters(options: Mapping[str, Any] | None) -> MetaDirectFilters:
     )
 
 
-def _coverage_payload(filters: MetaDirectFilters, records: Sequence[RawPerformanceRecord]) -> dict[str, str | None]:
+def _coverage_payload(
+    filters: MetaDirectFilters, bounds: tuple[date, date] | None
+) -> dict[str, str | None]:
     if filters.start_date or filters.end_date:
         return {
             "startDate": filters.start_date.isoformat() if filters.start_date else None,
             "endDate": filters.end_date.isoformat() if filters.end_date else None,
         }
-    if not records:
+    if bounds is None:
         return {"startDate": None, "endDate": None}
-    return {
-        "startDate": min(record.date for record in records).isoformat(),
-        "endDate": max(record.date for record in records).isoformat(),
-    }
-
-
-def _snapshot_generated_at(records: Sequence[RawPerformanceRecord]) -> str | None:
-    if not records:
-        return None
-    freshest = max(
-        (
-            record.ingested_at
-            or record.updated_at
-            or timezone.make_aware(datetime.combine(record.date, time.max))
-        )
-        for record in records
-    )
-    return freshest.isoformat()
+    return {"startDate": bounds[0].isoformat(), "endDate": bounds[1].isoformat()}
 
 
 def _empty_payload(*, tenant_id: str, filters: MetaDirectFilters, reason: str) -> dict[str, Any]:
-    coverage = _coverage_payload(filters, [])
+    coverage = _coverage_payload(filters, None)
     return {
         "tenant_id": tenant_id,
         "campaign": {
@@ -331,12 +381,7 @@ def _empty_payload(*, tenant_id: str, filters: MetaDirectFilters, reason: str) -
     }
 
 
-def _record_currency(record: RawPerformanceRecord) -> str:
-    candidates = [
-        record.currency,
-        record.campaign.currency if record.campaign_id and record.campaign is not None else None,
-        record.ad_account.currency if record.ad_account_id and record.ad_account is not None else None,
-    ]
+def _resolve_currency(*candidates: Any) -> str:
     for candidate in candidates:
         if isinstance(candidate, str):
             trimmed = candidate.strip()
@@ -345,6 +390,97 @@ def _record_currency(record: RawPerformanceRecord) -> str:
     return FALLBACK_CURRENCY
 
 
+def _resolved_currency_expression(fallback: str | None = FALLBACK_CURRENCY) -> Coalesce:
+    candidates = [
+        NullIf(Trim("currency"), Value("")),
+        NullIf(Trim("campaign__currency"), Value("")),
+        NullIf(Trim("ad_account__currency"), Value("")),
+    ]
+    if fallback is not None:
+        candidates.append(Value(fallback))
+    return Coalesce(*candidates)
+
+
+def _first_reporting_currency(queryset: QuerySet) -> str:
+    """Currency of the first record (in payload order) that resolves to a non-fallback code."""
+
+    # SQL TRIM only strips spaces, so it can only keep rows that Python would
+    # resolve to the fallback; the exact resolution happens below.
+    candidates = (
+        queryset.annotate(resolved_currency=_resolved_currency_expression())
+        .exclude(resolved_currency=FALLBACK_CURRENCY)
+        .order_by(*RECORD_ORDERING)
+        .values_list("currency", "campaign__currency", "ad_account__currency")
+    )
+    for candidate in candidates.iterator():
+        currency = _resolve_currency(*candidate)
+        if currency != FALLBACK_CURRENCY:
+            return currency
+    return FALLBACK_CURRENCY
+
+
+def _record_currency_expression() -> Upper:
+    """Upper-cased record currency, ``NULL`` when nothing on the record names one."""
+
+    return Upper(_resolved_currency_expression(fallback=None))
+
+
+def _convert_foreign_spend(
+    records: QuerySet,
+    trend_by_date: dict[date, dict[str, Any]],
+    *,
+    currency: str,
+    manual_spend: Mapping[tuple[date, str], Decimal],
+) -> dict[str, Any]:
+    """Re-express spend billed in other currencies in ``currency``, in place.
+
+    Foreign spend is summed per date and currency in SQL (``manual_spend``
+    carries the supplied spend of manual CSV rows, which the caller already
+    walks), converted as one column through the FX engine and swapped into
+    the matching trend points, so the summary totals built from the trend come
+    out in one currency. Records with no currency count as ``currency``;
+    amounts without a rate are dropped and counted. Returns the summary fields
+    to add, or ``{}`` when nothing bills in another currency.
+    """
+
+    display = currency.strip().upper()
+    foreign_spend: dict[tuple[date, str], Decimal] = defaultdict(Decimal)
+    grouped = (
+        records.filter(is_manual_csv=False)
+        .annotate(resolved_currency=_record_currency_expression())
+        .exclude(resolved_currency__isnull=True)
+        .exclude(resolved_currency=display)
+        .exclude(spend=0)
+        .order_by()
+        .values_list("date", "resolved_currency")
+        .annotate(currency_spend=Sum("spend"))
+    )
+    for day, row_currency, spend in grouped:
+        foreign_spend[(day, row_currency.strip())] += spend or 0
+    for (day, row_currency), spend in manual_spend.items():
+        foreign_spend[(day, row_currency.strip())] += spend
+    keys = [key for key, spend in foreign_spend.items() if key[1] != display and spend]
+    if not keys:
+        return {}
+
+    converted = fx_rate_engine().convert_column(
+        [foreign_spend[key] for key in keys],
+        currencies=[row_currency for _, row_currency in keys],
+        dates=[day for day, _ in keys],
+        target=display,
+    )
+    unconverted = 0
+    for key, amount in zip(keys, converted):
+        if amount is None:
+            unconverted += 1
+        point = trend_by_date[key[0]]
+        point["spend"] = _sum_optional(point["spend"], float((amount or 0) - foreign_spend[key]))
+    return {
+        "sourceCurrencies": sorted({display, *(row_currency for _, row_currency in keys)}),
+        "fxUnconvertedPoints": unconverted,
+    }
+
+
 class MetaDirectAdapter(MetricsAdapter):
     key = "meta_direct"
     name = "Meta direct sync"
@@ -374,11 +510,6 @@ class MetaDirectAdapter(MetricsAdapter):
         queryset = RawPerformanceRecord.objects.filter(
             tenant_id=tenant_id,
             source__iexact="meta",
-        ).select_related(
-            "ad_account",
-            "campaign",
-            "adset",
-            "ad",
         )
         if filters.start_date:
             queryset = queryset.filter(date__gte=filters.start_date)
@@ -413,8 +544,12 @@ class MetaDirectAdapter(MetricsAdapter):
                 | Q(adset__name__icontains=filters.campaign_search)
             )
 
-        records = list(queryset.order_by("date", "campaign__name", "ad__name", "external_id"))
-        if not records:
+        bounds = queryset.aggregate(
+            first_date=Min("date"),
+            last_date=Max("date"),
+            freshest=Max("ingested_at"),
+        )
+        if bounds["first_date"] is None:
             empty_reason = "no_matching_filters" if filters.campaign_search else "no_recent_data"
             return _empty_payload(
                 tenant_id=tenant_id,
@@ -422,145 +557,134 @@ class MetaDirectAdapter(MetricsAdapter):
                 reason=empty_reason,
             )
 
-        coverage = _coverage_payload(filters, records)
-        coverage_start = filters.start_date or min(record.date for record in records)
-        coverage_end = filters.end_date or max(record.date for record in records)
+        coverage = _coverage_payload(filters, (bounds["first_date"], bounds["last_date"]))
+        coverage_start = filters.start_date or bounds["first_date"]
+        coverage_end = filters.end_date or bounds["last_date"]
         window_days = max((coverage_end - coverage_start).days + 1, 1)
         today = timezone.localdate()
         elapsed_end = min(coverage_end, today) if coverage_start <= today else coverage_start
         elapsed_days = max((elapsed_end - coverage_start).days + 1, 1)
 
-        currency = next(
-            (
-                candidate
-                for candidate in (_record_currency(record) for record in records)
-                if candidate != FALLBACK_CURRENCY
+        currency = _first_reporting_currency(queryset)
+
+        records = queryset.order_by().annotate(
+            account_key=Coalesce(
+                "ad_account__external_id",
+                "campaign__account_external_id",
+                Value(""),
+            ),
+            is_manual_csv=Case(
+                When(raw_payload__source=MANUAL_PAID_CSV_SOURCE, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
             ),
-            FALLBACK_CURRENCY,
         )
+        campaign_records = records.filter(campaign__isnull=False)
+        creative_records = campaign_records.filter(ad__isnull=False)
+
+        trend_by_date: dict[date, dict[str, Any]] = {}
+        trend_accounts = _first_rows_by(records, "date", "account_key")
+        for row in records.values("date").annotate(**_metric_sums()):
+            trend_by_date[row["date"]] = {
+                "date": row["date"].isoformat(),
+                **_grouped_metrics(row),
+                "adAccountId": trend_accounts[row["date"]]["account_key"] or None,
+            }
 
-        trend_by_date: dict[str, dict[str, Any]] = {}
         campaign_groups: dict[str, dict[str, Any]] = {}
-        creative_groups: dict[str, dict[str, Any]] = {}
-        campaign_budgets: dict[str, dict[str, float]] = defaultdict(dict)
+        campaign_keys: dict[Any, str] = {}
+        campaign_totals = {
+            row["campaign_id"]: row
+            for row in campaign_records.values(
+                "campaign_id",
+                "campaign__external_id",
+                "campaign__name",
+                "campaign__status",
+                "campaign__objective",
+            ).annotate(first_date=Min("date"), last_date=Max("date"), **_metric_sums())
+        }
+        for campaign_id, first in _first_rows_by(
+            campaign_records, "campaign_id", "account_key"
+        ).items():
+            row = campaign_totals[campaign_id]
+            campaign_key = row["campaign__external_id"]
+            campaign_keys[campaign_id] = campaign_key
+            campaign_groups[campaign_key] = {
+                "id": campaign_key,
+                "adAccountId": first["account_key"],
+                "name": row["campaign__name"],
+                "platform": META_PLATFORM_LABEL,
+                "status": row["campaign__status"] or "Unknown",
+                "objective": row["campaign__objective"] or None,
+                "parishes": [],
+                **_grouped_metrics(row),
+                "startDate": row["first_date"].isoformat(),
+                "endDate": row["last_date"].isoformat(),
+            }
 
-        for record in records:
-            spend = _record_float_metric(record, "spend")
-            impressions = _record_int_metric(record, "impressions")
-            reach = _record_int_metric(record, "reach")
-            clicks = _record_int_metric(record, "clicks")
-            conversions = _record_int_metric(record, "conversions")
-            ad_account_id = (
-                record.ad_account.external_id
-                if record.ad_account_id and record.ad_account is not None
-                else record.campaign.account_external_id
-                if record.campaign_id and record.campaign is not None
-                else ""
+        creative_groups: dict[str, dict[str, Any]] = {}
+        creative_keys: dict[Any, str] = {}
+        creative_totals = {
+            row["ad_id"]: row
+            for row in creative_records.values("ad_id", "ad__external_id", "ad__name").annotate(
+                first_date=Min("date"), last_date=Max("date"), **_metric_sums()
             )
+        }
+        creative_firsts = _first_rows_by(
+            creative_records,
+            "ad_id",
+            "account_key",
+            "campaign__external_id",
+            "campaign__name",
+        )
+        thumbnails: dict[Any, str] = {}
+        for ad_id, creative in Ad.all_objects.filter(pk__in=list(creative_firsts)).values_list(
+            "id", "creative"
+        ):
+            if isinstance(creative, Mapping) and isinstance(creative.get("thumbnail_url"), str):
+                thumbnails[ad_id] = creative["thumbnail_url"]
+        for ad_id, first in creative_firsts.items():
+            row = creative_totals[ad_id]
+            creative_key = row["ad__external_id"]
+            creative_keys[ad_id] = creative_key
+            creative_groups[creative_key] = {
+                "id": creative_key,
+                "adAccountId": first["account_key"],
+                "name": row["ad__name"],
+                "campaignId": first["campaign__external_id"],
+                "campaignName": first["campaign__name"],
+                "platform": META_PLATFORM_LABEL,
+                "parishes": [],
+                **_grouped_metrics(row),
+                "startDate": row["first_date"].isoformat(),
+                "endDate": row["last_date"].isoformat(),
+                "thumbnailUrl": thumbnails.get(ad_id),
+            }
 
-            trend_key = record.date.isoformat()
-            trend_point = trend_by_date.setdefault(
-                trend_key,
-                {
-                    "date": trend_key,
-                    "spend": None,
-                    "impressions": None,
-                    "reach": None,
-                    "clicks": None,
-                    "conversions": None,
-                    "adAccountId": ad_account_id or None,
-                },
-            )
-            trend_point["spend"] = _sum_optional(trend_point["spend"], spend)
-            trend_point["impressions"] = _sum_optional(
-                trend_point["impressions"], impressions
-            )
-            trend_point["reach"] = _sum_optional(trend_point["reach"], reach)
-            trend_point["clicks"] = _sum_optional(trend_point["clicks"], clicks)
-            trend_point["conversions"] = _sum_optional(
-                trend_point["conversions"], conversions
+        manual_spend: dict[tuple[date, str], Decimal] = defaultdict(Decimal)
+        for row in (
+            records.filter(is_manual_csv=True)
+            .annotate(resolved_currency=_record_currency_expression())
+            .values(
+                "date", "campaign_id", "ad_id", "raw_payload", "resolved_currency", *RECORD_METRICS
             )
+        ):
+            metrics = _manual_row_metrics(row)
+            if metrics["spend"] is not None and row["resolved_currency"]:
+                manual_spend[(row["date"], row["resolved_currency"])] += row["spend"]
+            _add_metrics(trend_by_date[row["date"]], metrics)
+            if row["campaign_id"] is not None:
+                _add_metrics(campaign_groups[campaign_keys[row["campaign_id"]]], metrics)
+                if row["ad_id"] is not None:
+                    _add_metrics(creative_groups[creative_keys[row["ad_id"]]], metrics)
 
-            if record.campaign_id and record.campaign is not None:
-                campaign_key = record.campaign.external_id
-                campaign_group = campaign_groups.setdefault(
-                    campaign_key,
-                    {
-                        "id": campaign_key,
-                        "adAccountId": ad_account_id,
-                        "name": record.campaign.name,
-                        "platform": META_PLATFORM_LABEL,
-                        "status": record.campaign.status or "Unknown",
-                        "objective": record.campaign.objective or None,
-                        "parishes": [],
-                        "spend": None,
-                        "impressions": None,
-                        "reach": None,
-                        "clicks": None,
-                        "conversions": None,
-                        "startDate": record.date.isoformat(),
-                        "endDate": record.date.isoformat(),
-                    },
-                )
-                campaign_group["spend"] = _sum_optional(campaign_group["spend"], spend)
-                campaign_group["impressions"] = _sum_optional(
-                    campaign_group["impressions"], impressions
-                )
-                campaign_group["reach"] = _sum_optional(campaign_group["reach"], reach)
-                campaign_group["clicks"] = _sum_optional(
-                    campaign_group["clicks"], clicks
-                )
-                campaign_group["conversions"] = _sum_optional(
-                    campaign_group["conversions"], conversions
-                )
-                campaign_group["startDate"] = min(campaign_group["startDate"], record.date.isoformat())
-                campaign_group["endDate"] = max(campaign_group["endDate"], record.date.isoformat())
-
-                if record.adset_id and record.adset is not None:
-                    campaign_budgets[campaign_key][record.adset.external_id] = _to_float(
-                        record.adset.daily_budget
-                    )
-
-            if record.ad_id and record.ad is not None and record.campaign_id and record.campaign is not None:
-                creative_key = record.ad.external_id
-                creative_group = creative_groups.setdefault(
-                    creative_key,
-                    {
-                        "id": creative_key,
-                        "adAccountId": ad_account_id,
-                        "name": record.ad.name,
-                        "campaignId": record.campaign.external_id,
-                        "campaignName": record.campaign.name,
-                        "platform": META_PLATFORM_LABEL,
-                        "parishes": [],
-                        "spend": None,
-                        "impressions": None,
-                        "reach": None,
-                        "clicks": None,
-                        "conversions": None,
-                        "startDate": record.date.isoformat(),
-                        "endDate": record.date.isoformat(),
-                        "thumbnailUrl": (
-                            record.ad.creative.get("thumbnail_url")
-                            if isinstance(record.ad.creative, Mapping)
-                            and isinstance(record.ad.creative.get("thumbnail_url"), str)
-                            else None
-                        ),
-                    },
-                )
-                creative_group["spend"] = _sum_optional(creative_group["spend"], spend)
-                creative_group["impressions"] = _sum_optional(
-                    creative_group["impressions"], impressions
-                )
-                creative_group["reach"] = _sum_optional(creative_group["reach"], reach)
-                creative_group["clicks"] = _sum_optional(
-                    creative_group["clicks"], clicks
-                )
-                creative_group["conversions"] = _sum_optional(
-                    creative_group["conversions"], conversions
-                )
-                creative_group["startDate"] = min(creative_group["startDate"], record.date.isoformat())
-                creative_group["endDate"] = max(creative_group["endDate"], record.date.isoformat())
+        campaign_budgets: dict[str, dict[str, float]] = defaultdict(dict)
+        for campaign_id, adset_key, daily_budget in (
+            campaign_records.filter(adset__isnull=False)
+            .values_list("campaign_id", "adset__external_id", "adset__daily_budget")
+            .distinct()
+        ):
+            campaign_budgets[campaign_keys[campaign_id]][adset_key] = _to_float(daily_budget)
 
         campaign_rows = list(campaign_groups.values())
         for row in campaign_rows:
@@ -628,6 +752,9 @@ class MetaDirectAdapter(MetricsAdapter):
                 }
             )
 
+        fx_summary = _convert_foreign_spend(
+            records, trend_by_date, currency=currency, manual_spend=manual_spend
+        )
         trend_rows = [trend_by_date[key] for key in sorted(trend_by_date)]
         total_spend = _sum_optional_values(point["spend"] for point in trend_rows)
         total_impressions = _sum_optional_values(
@@ -654,6 +781,7 @@ class MetaDirectAdapter(MetricsAdapter):
             ),
             "cpa": _safe_divide(total_spend, total_conversions),
             "frequency": _safe_divide(total_impressions, total_reach),
+            **fx_summary,
         }
 
         # --- Parish aggregation from MetaRegionDaily ---
@@ -879,5 +1007,5 @@ class MetaDirectAdapter(MetricsAdapter):
             "platforms": platforms,
             "coverage": coverage,
             "availability": availability,
-            "snapshot_generated_at": _snapshot_generated_at(records),
+            "snapshot_generated_at": bounds["freshest"].isoformat(),
         }
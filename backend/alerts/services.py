@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
 import logging
 import re
-from contextlib import nullcontext
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from time import monotonic
 from typing import Any, Iterable, Iterator, Mapping, Sequence
@@ -11,6 +14,9 @@ from uuid import UUID
 
 import hashlib
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.utils import timezone
 
 from accounts.tenant_context import tenant_context
@@ -35,6 +41,7 @@ _IDENTIFIER_KEYS: frozenset[str] = frozenset(
     }
 )
 _DB_RULE_SLUG_PREFIX = "tenant_alert:"
+_SUMMARY_CACHE_KEY = "alerts:llm-summary:{slug}:{fingerprint}"
 _METRIC_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _OPERATOR_SQL = {
     AlertRuleDefinition.OPERATOR_GREATER_THAN: ">",
@@ -82,6 +89,31 @@ def _sanitise_rows(rows: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
     return sanitised_rows
 
 
+def _rows_fingerprint(rows: Sequence[Mapping[str, Any]]) -> str:
+    encoded = json.dumps(rows, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _summary_cache_key(rule: AlertRule, rows: Sequence[Mapping[str, Any]]) -> str:
+    return _SUMMARY_CACHE_KEY.format(slug=rule.slug, fingerprint=_rows_fingerprint(rows))
+
+
+def _positive_setting(name: str, default: int) -> int:
+    try:
+        return max(int(getattr(settings, name, default)), 1)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class _RuleEvaluation:
+    rule: AlertRule
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    row_count: int = 0
+    error: Exception | None = None
+    duration_ms: int = 0
+
+
 def _metric_column(metric: str) -> str:
     metric = metric.strip()
     if not _METRIC_IDENTIFIER_RE.fullmatch(metric):
@@ -109,9 +141,9 @@ def _database_rule_to_alert_rule(rule: AlertRuleDefinition) -> AlertRule:
             %(threshold)s as threshold,
             %(comparison_operator)s as comparison_operator,
             %(lookback_hours)s as lookback_hours
-        from vw_campaign_daily c
-        where c.tenant_id::text = %(tenant_id)s
-          and c.date_day >= (current_timestamp - (%(lookback_hours)s * interval '1 hour'))::date
+        from alert_window_campaign c
+        where c.tenant_ref = %(tenant_id)s
+          and c.date_day >= %(since)s
           and c.{metric} {operator} %(threshold)s
         order by c.date_day desc, metric_value {order_direction} nulls last
         limit %(limit)s
@@ -133,8 +165,10 @@ def _database_rule_to_alert_rule(rule: AlertRuleDefinition) -> AlertRule:
             "threshold": rule.threshold,
             "comparison_operator": rule.comparison_operator,
             "lookback_hours": rule.lookback_hours,
+            "since": (timezone.now() - timedelta(hours=rule.lookback_hours)).date(),
         },
         tenant_id=str(rule.tenant_id),
+        window="campaign",
     )
 
 
@@ -162,6 +196,7 @@ class AlertService:
         self._llm = llm_client or get_llm_client()
         self._include_database_rules = include_database_rules
         self._notifier = notifier or AlertNotificationDispatcher()
+        self.last_cycle_timings: dict[str, int] = {}
 
     def _iter_rules(self) -> Iterator[AlertRule]:
         yield from self._rules
@@ -181,57 +216,187 @@ class AlertService:
                 )
 
     def run_cycle(self) -> list[AlertRun]:
-        runs: list[AlertRun] = []
-        for rule in self._iter_rules():
-            run = AlertRun.objects.create(rule_slug=rule.slug, status=AlertRun.Status.STARTED)
-            started = monotonic()
+        """Evaluate, summarise, persist and notify, one stage at a time.
+
+        Rules reading a shared window table are evaluated on this thread against
+        the cycle's temporary tables; only rules without a window run on the
+        bounded thread pool. LLM summaries for every rule with rows then go out
+        as one concurrent batch, deduplicated and cached on the rule plus a
+        fingerprint of its sanitised rows. The runs
+        are written with a single ``bulk_create`` before notifications fire.
+        """
+
+        timings: dict[str, int] = {}
+        stage_started = monotonic()
+        rules = list(self._iter_rules())
+        evaluations = self._evaluate_rules(rules)
+        timings["evaluate_ms"] = int((monotonic() - stage_started) * 1000)
+
+        stage_started = monotonic()
+        runs = [self._build_run(evaluation) for evaluation in evaluations]
+        self._summarise_runs(
+            [
+                (evaluation.rule, run)
+                for evaluation, run in zip(evaluations, runs)
+                if run.status == AlertRun.Status.STARTED
+            ]
+        )
+        timings["summarise_ms"] = int((monotonic() - stage_started) * 1000)
+
+        stage_started = monotonic()
+        completed_at = timezone.now()
+        for run in runs:
+            run.completed_at = completed_at
+        AlertRun.objects.bulk_create(runs)
+        timings["persist_ms"] = int((monotonic() - stage_started) * 1000)
+
+        stage_started = monotonic()
+        for evaluation, run in zip(evaluations, runs):
+            self._notify_if_needed(evaluation.rule, run)
+        timings["notify_ms"] = int((monotonic() - stage_started) * 1000)
+
+        self.last_cycle_timings = timings
+        logger.info(
+            "alerts.cycle.completed",
+            extra={"rule_count": len(runs), "timings_ms": timings},
+        )
+        return runs
+
+    def _evaluate_rules(self, rules: Sequence[AlertRule]) -> list[_RuleEvaluation]:
+        windowed = [rule for rule in rules if rule.window]
+        direct = [rule for rule in rules if not rule.window]
+        results: dict[int, _RuleEvaluation] = {}
+        if windowed:
+            # Window tables are connection-scoped temporaries, so their rules run
+            # here one after another; each is a predicate over a small
+            # precomputed table. Only rules without a window use the pool below.
             try:
-                context = tenant_context(rule.tenant_id) if rule.tenant_id else nullcontext()
-                with context:
-                    rows = self._evaluator.run(rule)
-                sanitised_rows = _sanitise_rows(rows)
-                run.row_count = len(rows)
-                run.raw_results = sanitised_rows
-                run.error_message = ""
-
-                if not rows:
-                    run.status = AlertRun.Status.NO_RESULTS
-                    run.llm_summary = "No rows matched this alert during the cycle."
+                with self._window_tables(windowed) as failed_windows:
+                    for rule in windowed:
+                        error = failed_windows.get(rule.window)
+                        results[id(rule)] = (
+                            _RuleEvaluation(rule=rule, error=error)
+                            if error is not None
+                            else self._evaluate(rule)
+                        )
+            except Exception as exc:  # noqa: BLE001 - recorded on each affected run
+                logger.exception("Alert window preparation failed")
+                for rule in windowed:
+                    results.setdefault(id(rule), _RuleEvaluation(rule=rule, error=exc))
+        # ALERT_EVALUATION_CONCURRENCY bounds the pool for rules without a window.
+        concurrency = min(
+            _positive_setting("ALERT_EVALUATION_CONCURRENCY", 4), max(len(direct), 1)
+        )
+        if concurrency == 1:
+            evaluated = [self._evaluate(rule) for rule in direct]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="alert-eval"
+            ) as executor:
+                evaluated = list(executor.map(self._evaluate_on_worker, direct))
+        results.update((id(evaluation.rule), evaluation) for evaluation in evaluated)
+        return [results[id(rule)] for rule in rules]
+
+    def _window_tables(
+        self, rules: Sequence[AlertRule]
+    ) -> AbstractContextManager[dict[str, Exception]]:
+        window_days = _positive_setting("ALERT_WINDOW_DAYS", 14)
+        for rule in rules:
+            lookback_hours = (rule.parameters or {}).get("lookback_hours")
+            if lookback_hours:
+                window_days = max(window_days, -(-int(lookback_hours) // 24) + 1)
+        return self._evaluator.windows(
+            (rule.window for rule in rules),
+            window_start=timezone.localdate() - timedelta(days=window_days),
+        )
+
+    def _evaluate_on_worker(self, rule: AlertRule) -> _RuleEvaluation:
+        try:
+            return self._evaluate(rule)
+        finally:
+            # Each worker thread opened its own connection; don't leak it.
+            connection.close()
+
+    def _evaluate(self, rule: AlertRule) -> _RuleEvaluation:
+        started = monotonic()
+        try:
+            context = tenant_context(rule.tenant_id) if rule.tenant_id else nullcontext()
+            with context:
+                rows = self._evaluator.run(rule)
+            evaluation = _RuleEvaluation(rule=rule, rows=_sanitise_rows(rows), row_count=len(rows))
+        except Exception as exc:  # pragma: no cover - defensive catch-all
+            logger.exception("Alert rule %s failed", rule.slug)
+            evaluation = _RuleEvaluation(rule=rule, error=exc)
+        evaluation.duration_ms = int((monotonic() - started) * 1000)
+        return evaluation
+
+    @staticmethod
+    def _build_run(evaluation: _RuleEvaluation) -> AlertRun:
+        run = AlertRun(
+            rule_slug=evaluation.rule.slug,
+            status=AlertRun.Status.STARTED,
+            row_count=evaluation.row_count,
+            raw_results=evaluation.rows,
+            error_message="",
+            duration_ms=evaluation.duration_ms,
+        )
+        if evaluation.error is not None:
+            run.status = AlertRun.Status.FAILED
+            run.row_count = 0
+            run.raw_results = []
+            run.llm_summary = "Alert execution failed before summarisation."
+            run.error_message = str(evaluation.error)
+        elif not evaluation.row_count:
+            run.status = AlertRun.Status.NO_RESULTS
+            run.llm_summary = "No rows matched this alert during the cycle."
+        return run
+
+    def _summarise_runs(self, pending: Sequence[tuple[AlertRule, AlertRun]]) -> None:
+        cache_enabled = self._summary_cache_enabled()
+        ttl = _positive_setting("ALERT_SUMMARY_CACHE_TTL_SECONDS", 3600)
+        groups: dict[str, list[tuple[AlertRule, AlertRun]]] = {}
+        for rule, run in pending:
+            key = _summary_cache_key(rule, run.raw_results)
+            cached = cache.get(key) if cache_enabled else None
+            if cached is not None:
+                run.status = AlertRun.Status.SUCCESS
+                run.llm_summary = cached
+                continue
+            groups.setdefault(key, []).append((rule, run))
+        if not groups:
+            return
+
+        batch = [(members[0][0], members[0][1].raw_results) for members in groups.values()]
+        results = self._summarise_batch(batch)
+        for (key, members), result in zip(groups.items(), results):
+            for rule, run in members:
+                if isinstance(result, LLMError):
+                    logger.warning("LLM summary failed for %s: %s", rule.slug, result)
+                    run.status = AlertRun.Status.PARTIAL
+                    run.llm_summary = self._llm.fallback_summary(run.raw_results)
+                    run.error_message = str(result)
                 else:
-                    try:
-                        summary = self._llm.summarize(rule, sanitised_rows)
-                    except LLMError as exc:
-                        logger.warning("LLM summary failed for %s: %s", rule.slug, exc)
-                        run.status = AlertRun.Status.PARTIAL
-                        run.llm_summary = self._llm.fallback_summary(sanitised_rows)
-                        run.error_message = str(exc)
-                    else:
-                        run.status = AlertRun.Status.SUCCESS
-                        run.llm_summary = summary
-            except Exception as exc:  # pragma: no cover - defensive catch-all
-                logger.exception("Alert rule %s failed", rule.slug)
-                run.status = AlertRun.Status.FAILED
-                run.row_count = 0
-                run.raw_results = []
-                run.llm_summary = "Alert execution failed before summarisation."
-                run.error_message = str(exc)
-            finally:
-                run.duration_ms = int((monotonic() - started) * 1000)
-                run.completed_at = timezone.now()
-                run.save(
-                    update_fields=[
-                        "status",
-                        "row_count",
-                        "raw_results",
-                        "llm_summary",
-                        "error_message",
-                        "duration_ms",
-                        "completed_at",
-                    ]
-                )
-                self._notify_if_needed(rule, run)
-                runs.append(run)
-        return runs
+                    run.status = AlertRun.Status.SUCCESS
+                    run.llm_summary = result
+            if cache_enabled and not isinstance(result, LLMError):
+                cache.set(key, result, timeout=ttl)
+
+    def _summarise_batch(
+        self, batch: Sequence[tuple[AlertRule, list[dict[str, Any]]]]
+    ) -> list[str | LLMError]:
+        try:
+            return self._llm.summarize_batch(
+                batch, concurrency=_positive_setting("ALERT_SUMMARY_CONCURRENCY", 4)
+            )
+        except Exception as exc:  # noqa: BLE001 - keep evaluated runs
+            logger.exception("LLM summary batch failed")
+            return [LLMError(str(exc) or "LLM summary batch failed")] * len(batch)
+
+    def _summary_cache_enabled(self) -> bool:
+        # A disabled client only produces the generic fallback; caching it
+        # would mask real summaries for a TTL once the provider is configured.
+        is_enabled = getattr(self._llm, "is_enabled", None)
+        return not callable(is_enabled) or bool(is_enabled())
 
     def _notify_if_needed(self, rule: AlertRule, run: AlertRun) -> None:
         if run.status not in {AlertRun.Status.SUCCESS, AlertRun.Status.PARTIAL}:
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone as dt_timezone
 from typing import Any, Mapping
 
+from django.conf import settings
 from django.db import DatabaseError, IntegrityError, connection
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
+from rest_framework.renderers import JSONRenderer
 
 from adapters.base import MetricsAdapter
 from adapters.warehouse import (
@@ -42,8 +47,30 @@ from .warehouse_metrics import (
 )
 
 
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
 logger = logging.getLogger(__name__)
 
+RENDERED_ENCODING_IDENTITY = "identity"
+RENDERED_ENCODING_GZIP = "gzip"
+RENDERED_ENCODING_BROTLI = "br"
+
+_FILTER_KEYS = (
+    "start_date",
+    "end_date",
+    "parish",
+    "account_id",
+    "channels",
+    "campaign_search",
+    "client_id",
+)
+# Any of these narrows the payload, so the pre-rendered snapshot body cannot
+# answer the request.
+_RENDERED_BYPASS_KEYS = (*_FILTER_KEYS, "platforms")
+
 # Adapters known to ignore client_scoped_* options. Remove an entry from this
 # set when the adapter is patched to honour scoping.
 _SCOPE_UNAWARE_ADAPTER_KEYS: frozenset[str] = frozenset()
@@ -62,6 +89,14 @@ class CombinedMetricsResult:
     client_resolution: dict[str, Any] | None = None
 
 
+@dataclass(frozen=True)
+class RenderedCombinedMetrics:
+    body: bytes
+    encoding: str
+    etag: str
+    query_count: int
+
+
 def _payloads_equal(existing: Mapping[str, Any], candidate: Mapping[str, Any]) -> bool:
     return existing == candidate
 
@@ -84,16 +119,11 @@ def _build_snapshot_result(
     query_count: int,
     client_resolution: dict[str, Any] | None = None,
 ) -> CombinedMetricsResult:
-    canonical_payload = _validate_and_clean_combined_payload(
+    cached_payload = _snapshot_response_payload(
         payload=snapshot.payload,
         source=source,
+        generated_at=snapshot.generated_at,
     )
-    cached_payload = _prepare_response_payload(
-        payload=canonical_payload,
-        source=source,
-    )
-    if "snapshot_generated_at" not in cached_payload:
-        cached_payload["snapshot_generated_at"] = snapshot.generated_at.isoformat()
     if client_resolution is not None:
         cached_payload = {**cached_payload, "client_resolution": client_resolution}
     return CombinedMetricsResult(
@@ -379,16 +409,7 @@ def resolve_client_scoping(
 
 
 def _resolve_filter_options(query_params) -> tuple[dict[str, Any], bool, list[str]]:  # noqa: ANN001
-    filter_keys = (
-        "start_date",
-        "end_date",
-        "parish",
-        "account_id",
-        "channels",
-        "campaign_search",
-        "client_id",
-    )
-    if not any(key in query_params for key in filter_keys):
+    if not any(key in query_params for key in _FILTER_KEYS):
         return query_params.dict(), False, []
 
     filters_data = query_params
@@ -447,6 +468,7 @@ def _create_snapshot_after_cache_miss(
             payload=dict(payload),
             generated_at=generated_at,
             updated_at=timezone.now(),
+            **rendered_snapshot_fields(payload=payload, source=source, generated_at=generated_at),
         )
 
 
@@ -461,6 +483,7 @@ def _upsert_snapshot_without_cached_row(
         payload=dict(payload),
         generated_at=generated_at,
         updated_at=timezone.now(),
+        **rendered_snapshot_fields(payload=payload, source=source, generated_at=generated_at),
     )
     if updated:
         return
@@ -552,6 +575,135 @@ def _prepare_response_payload(
     return response_payload
 
 
+def _snapshot_response_payload(
+    *,
+    payload: Mapping[str, Any],
+    source: str,
+    generated_at: datetime,
+) -> dict[str, Any]:
+    canonical_payload = _validate_and_clean_combined_payload(
+        payload=payload,
+        source=source,
+    )
+    response_payload = _prepare_response_payload(
+        payload=canonical_payload,
+        source=source,
+    )
+    if "snapshot_generated_at" not in response_payload:
+        response_payload["snapshot_generated_at"] = generated_at.isoformat()
+    return response_payload
+
+
+def _rendered_snapshot_encoding() -> str:
+    configured = str(
+        getattr(settings, "METRICS_SNAPSHOT_RESPONSE_ENCODING", RENDERED_ENCODING_GZIP) or ""
+    ).strip().lower()
+    if configured == RENDERED_ENCODING_BROTLI:
+        return RENDERED_ENCODING_BROTLI if brotli is not None else RENDERED_ENCODING_GZIP
+    if configured == RENDERED_ENCODING_GZIP:
+        return RENDERED_ENCODING_GZIP
+    return RENDERED_ENCODING_IDENTITY
+
+
+def _encode_rendered_body(body: bytes, encoding: str) -> bytes:
+    if encoding == RENDERED_ENCODING_GZIP:
+        return gzip.compress(body, mtime=0)
+    if encoding == RENDERED_ENCODING_BROTLI:
+        return brotli.compress(body)
+    return body
+
+
+def decode_rendered_body(body: bytes, encoding: str) -> bytes:
+    if encoding == RENDERED_ENCODING_GZIP:
+        return gzip.decompress(body)
+    if encoding == RENDERED_ENCODING_BROTLI:
+        return brotli.decompress(body)
+    return body
+
+
+def rendered_snapshot_fields(
+    *,
+    payload: Mapping[str, Any],
+    source: str,
+    generated_at: datetime,
+) -> dict[str, Any]:
+    """Render the unfiltered response for a snapshot payload at write time.
+
+    The body matches what ``_build_snapshot_result`` plus DRF's JSON renderer
+    produce for the stored row, so the view can hand it out verbatim. Payloads
+    the request path would reject (for example a warehouse snapshot that was
+    not fetched) are left unrendered and keep going through the full path.
+    """
+
+    empty = {"rendered_body": None, "rendered_encoding": "", "rendered_etag": ""}
+    if timezone.is_naive(generated_at):  # pragma: no cover - depends on USE_TZ
+        generated_at = timezone.make_aware(generated_at)
+    try:
+        # Render from the JSON the row will hold, not the caller's objects.
+        stored_payload = json.loads(json.dumps(payload))
+        response_payload = _snapshot_response_payload(
+            payload=stored_payload,
+            source=source,
+            generated_at=generated_at.astimezone(dt_timezone.utc),
+        )
+    except WarehouseSnapshotUnavailable:
+        return empty
+    except (TypeError, ValueError, AttributeError):
+        logger.warning(
+            "metrics.snapshot.render_failed",
+            extra={"source": source},
+            exc_info=True,
+        )
+        return empty
+
+    body = JSONRenderer().render(response_payload)
+    encoding = _rendered_snapshot_encoding()
+    return {
+        "rendered_body": _encode_rendered_body(body, encoding),
+        "rendered_encoding": encoding,
+        "rendered_etag": f'W/"{hashlib.sha256(body).hexdigest()}"',
+    }
+
+
+def load_rendered_combined_metrics(
+    *,
+    tenant,
+    source: str,
+    query_params,
+    ttl_seconds: int,
+    cache_enabled: bool,
+) -> RenderedCombinedMetrics | None:  # noqa: ANN001
+    """Return the pre-rendered body for an unfiltered snapshot hit, if stored.
+
+    Only the rendered columns are read; the snapshot JSON is never loaded. A
+    ``None`` result sends the caller down ``load_combined_metrics_payload``.
+    """
+
+    if not cache_enabled or any(key in query_params for key in _RENDERED_BYPASS_KEYS):
+        return None
+    query_counter = _DatabaseQueryCounter()
+    with connection.execute_wrapper(query_counter):
+        snapshot = (
+            TenantMetricsSnapshot.objects.filter(tenant=tenant, source=source)
+            .order_by("-generated_at", "-created_at")
+            .only("generated_at", "rendered_body", "rendered_encoding", "rendered_etag")
+            .first()
+        )
+    if (
+        snapshot is None
+        or snapshot.rendered_body is None
+        or not snapshot.rendered_etag
+        or not snapshot.is_fresh(ttl_seconds)
+    ):
+        return None
+    return RenderedCombinedMetrics(
+        body=bytes(snapshot.rendered_body),
+        encoding=snapshot.rendered_encoding or RENDERED_ENCODING_IDENTITY,
+        etag=snapshot.rendered_etag,
+        query_count=query_counter.count,
+    )
+
+
 def load_combined_metrics_payload(
     *,
     tenant,
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import csv
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.db import connection
+
+DEFAULT_EXPORT_FETCH_SIZE = 2000
+_CSV_FORMULA_PREFIXES = frozenset({"=", "+", "-", "@"})
 
 
 MetricRow = Sequence[str | int | float]
@@ -64,3 +72,60 @@ class FakeMetricsExportAdapter:
     def iter_rows(self) -> Iterable[MetricRow]:
         return iter(self._DATASET.rows)
 
+
+
+class _Echo:
+    """Minimal buffer to adapt csv.writer for streaming responses."""
+
+    def write(self, value: str) -> str:  # pragma: no cover - trivial adapter
+        return value
+
+
+def export_fetch_size() -> int:
+    """Rows pulled per round trip while streaming an export."""
+
+    try:
+        size = int(getattr(settings, "CSV_EXPORT_FETCH_SIZE", DEFAULT_EXPORT_FETCH_SIZE))
+    except (TypeError, ValueError):
+        return DEFAULT_EXPORT_FETCH_SIZE
+    return max(size, 1)
+
+
+def safe_csv_value(value: Any) -> Any:
+    """Neutralise spreadsheet formula injection in exported text cells."""
+
+    if isinstance(value, str) and value[:1] in _CSV_FORMULA_PREFIXES:
+        return f"'{value}"
+    return value
+
+
+def iter_query_rows(
+    sql: str,
+    params: Mapping[str, Any] | Sequence[Any] | None = None,
+    *,
+    fetch_size: int | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Yield raw result tuples from ``sql`` in ``fetchmany`` batches.
+
+    ``chunked_cursor`` opens a named server-side cursor on PostgreSQL (unless
+    ``DISABLE_SERVER_SIDE_CURSORS`` is set for pgbouncer deployments) and a
+    regular cursor elsewhere, so only one batch is resident at a time.
+    """
+
+    size = fetch_size or export_fetch_size()
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql, params)
+        while True:
+            batch = cursor.fetchmany(size)
+            if not batch:
+                return
+            yield from batch
+
+
+def iter_csv_lines(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Render ``rows`` as CSV lines, header first, escaping formula-like text."""
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow([safe_csv_value(value) for value in row])
@@ -7,7 +7,13 @@ Sprint 6 of Client grouping:
 
     The public surface is intentionally minimal — callers pass an amount + a
     source/target currency + a date and get a Decimal back. Batch call sites
-    should pre-fetch rates via :func:`load_rate_table` to avoid N+1 queries.
+    convert whole columns via :meth:`FxRateEngine.convert_column`.
+
+    Lookups go through a process-wide :class:`FxRateEngine` that loads each
+    currency pair's history once into ascending date/rate arrays and resolves
+    on-or-before dates with :mod:`bisect`. ``refresh_fx_rates`` bumps a shared
+    generation marker so every process reloads after new rows land; rows
+    inserted by hand are picked up once ``FX_RATE_CACHE_TTL_SECONDS`` elapses.
 
     Missing rates: ``convert`` returns ``None`` so callers can decide whether
     to show a warning banner ("2 accounts billed in JMD — rate unavailable
@@ -17,11 +23,17 @@ Sprint 6 of Client grouping:
 
 from __future__ import annotations
 
+import threading
+import time
+import uuid
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Iterable
+from typing import Iterable, Sequence
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 
 from .models import DailyFxRate
@@ -31,6 +43,9 @@ from .models import DailyFxRate
 # rates (e.g. JPY→USD) and matches the DB column.
 _FX_PRECISION = Decimal("0.00000001")
 
+FX_RATE_GENERATION_KEY = "analytics:fx-rates:generation"
+DEFAULT_FX_RATE_CACHE_TTL_SECONDS = 300
+
 
 def _normalize_ccy(value: str | None) -> str | None:
     if not value:
@@ -55,20 +70,194 @@ class RateLookup:
     used_date: date
 
 
-def _find_single(
-    *,
-    on_date: date,
-    base: str,
-    quote: str,
-) -> DailyFxRate | None:
-    """Return the freshest rate on-or-before ``on_date`` for the pair."""
-
-    return (
-        DailyFxRate.objects
-        .filter(base_currency=base, quote_currency=quote, rate_date__lte=on_date)
-        .order_by("-rate_date")
-        .first()
-    )
+class FxRateEngine:
+    """Process-wide FX rate series indexed for on-or-before lookups.
+
+    Each ``(base, quote)`` pair is read once into parallel ascending date and
+    rate lists; a lookup is a ``bisect_right`` on the dates. Pairs with no rows
+    are remembered as empty so misses do not re-query either.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], tuple[list[date], list[Decimal]]] = {}
+        self._loaded_at = 0.0
+        self._generation: object = None
+
+    def refresh_if_stale(self) -> None:
+        """Drop loaded series when the TTL elapsed or another process bumped the marker."""
+
+        ttl_seconds = max(
+            int(getattr(settings, "FX_RATE_CACHE_TTL_SECONDS", DEFAULT_FX_RATE_CACHE_TTL_SECONDS)),
+            1,
+        )
+        generation = cache.get(FX_RATE_GENERATION_KEY)
+        with self._lock:
+            now = time.monotonic()
+            if generation != self._generation or now - self._loaded_at >= ttl_seconds:
+                self._series = {}
+                self._loaded_at = now
+                self._generation = generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._series = {}
+
+    def preload(self, *, currencies: Iterable[str | None], target: str) -> None:
+        """Load the direct and inverse series of every ``currency → target`` pair in one query."""
+
+        target_norm = _normalize_ccy(target)
+        if not target_norm:
+            return
+        pairs: set[tuple[str, str]] = set()
+        for currency in currencies:
+            ccy = _normalize_ccy(currency)
+            if ccy and ccy != target_norm:
+                pairs.update({(ccy, target_norm), (target_norm, ccy)})
+        self._load_pairs(pairs)
+
+    def _load_pairs(
+        self, pairs: set[tuple[str, str]]
+    ) -> dict[tuple[str, str], tuple[list[date], list[Decimal]]]:
+        with self._lock:
+            missing = pairs.difference(self._series)
+            if not missing:
+                return {pair: self._series[pair] for pair in pairs}
+            query = Q()
+            for base, quote in missing:
+                query |= Q(base_currency=base, quote_currency=quote)
+            loaded: dict[tuple[str, str], tuple[list[date], list[Decimal]]] = {
+                pair: ([], []) for pair in missing
+            }
+            rows = (
+                DailyFxRate.objects.filter(query)
+                .order_by("rate_date")
+                .values_list("base_currency", "quote_currency", "rate_date", "rate")
+            )
+            for base, quote, rate_date, rate in rows:
+                dates, rates = loaded[(base, quote)]
+                dates.append(rate_date)
+                rates.append(rate)
+            self._series.update(loaded)
+            return {pair: self._series[pair] for pair in pairs}
+
+    def _on_or_before(self, base: str, quote: str, on_date: date) -> tuple[date, Decimal] | None:
+        series = self._series.get((base, quote))
+        if series is None:
+            series = self._load_pairs({(base, quote)})[(base, quote)]
+        dates, rates = series
+        index = bisect_right(dates, on_date)
+        if not index:
+            return None
+        return dates[index - 1], rates[index - 1]
+
+    def lookup(self, *, on_date: date, base_currency: str, quote_currency: str) -> RateLookup | None:
+        """Resolve ``base → quote`` on ``on_date``; see :func:`resolve_rate` for the rules."""
+
+        base = _normalize_ccy(base_currency)
+        quote = _normalize_ccy(quote_currency)
+        if not base or not quote:
+            return None
+        if base == quote:
+            return RateLookup(
+                rate_date=on_date,
+                base_currency=base,
+                quote_currency=quote,
+                rate=Decimal("1"),
+                used_date=on_date,
+            )
+
+        direct = self._on_or_before(base, quote, on_date)
+        if direct is not None:
+            used_date, rate = direct
+        else:
+            inverse = self._on_or_before(quote, base, on_date)
+            if inverse is None or not inverse[1] or inverse[1] <= 0:
+                return None
+            used_date, rate = inverse[0], (Decimal("1") / inverse[1]).quantize(_FX_PRECISION)
+        return RateLookup(
+            rate_date=on_date,
+            base_currency=base,
+            quote_currency=quote,
+            rate=rate,
+            used_date=used_date,
+        )
+
+    def rate_column(
+        self,
+        *,
+        currencies: Sequence[str | None],
+        dates: Sequence[date],
+        target: str,
+    ) -> list[Decimal | None]:
+        """Rate to ``target`` for each ``(currency, date)`` position; ``None`` when unavailable."""
+
+        self.preload(currencies=set(currencies), target=target)
+        memo: dict[tuple[str | None, date], Decimal | None] = {}
+        rates: list[Decimal | None] = []
+        for currency, on_date in zip(currencies, dates):
+            key = (currency, on_date)
+            if key not in memo:
+                lookup = self.lookup(
+                    on_date=on_date,
+                    base_currency=currency or "",
+                    quote_currency=target,
+                )
+                memo[key] = lookup.rate if lookup is not None else None
+            rates.append(memo[key])
+        return rates
+
+    def convert_column(
+        self,
+        amounts: Sequence[Decimal | float | int | None],
+        *,
+        currencies: Sequence[str | None],
+        dates: Sequence[date],
+        target: str,
+    ) -> list[Decimal | None]:
+        """Convert a column of amounts to ``target`` with one rate load for the whole column.
+
+        ``amounts``, ``currencies`` and ``dates`` are parallel; a position is
+        ``None`` when its amount is missing or no rate is available, matching
+        :func:`convert`.
+        """
+
+        rates = self.rate_column(currencies=currencies, dates=dates, target=target)
+        converted: list[Decimal | None] = []
+        for amount, rate in zip(amounts, rates):
+            value = _to_decimal(amount)
+            converted.append(
+                None if value is None or rate is None else (value * rate).quantize(_FX_PRECISION)
+            )
+        return converted
+
+
+_engine = FxRateEngine()
+
+
+def fx_rate_engine() -> FxRateEngine:
+    """Return the process-wide engine, reloading it if rates changed elsewhere."""
+
+    _engine.refresh_if_stale()
+    return _engine
+
+
+def invalidate_fx_rates() -> None:
+    """Force every process to reload FX series on its next lookup."""
+
+    cache.set(FX_RATE_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+    _engine.invalidate()
+
+
+def _to_decimal(amount: Decimal | float | int | None) -> Decimal | None:
+    if amount is None:
+        return None
+    if isinstance(amount, Decimal):
+        return amount
+    try:
+        return Decimal(str(amount))
+    except (TypeError, ValueError, ArithmeticError):
+        return None
 
 
 def resolve_rate(
@@ -91,42 +280,11 @@ def resolve_rate(
     should treat the contribution as unconvertible.
     """
 
-    base = _normalize_ccy(base_currency)
-    quote = _normalize_ccy(quote_currency)
-    if not base or not quote:
-        return None
-
-    if base == quote:
-        return RateLookup(
-            rate_date=on_date,
-            base_currency=base,
-            quote_currency=quote,
-            rate=Decimal("1"),
-            used_date=on_date,
-        )
-
-    direct = _find_single(on_date=on_date, base=base, quote=quote)
-    if direct is not None:
-        return RateLookup(
-            rate_date=on_date,
-            base_currency=base,
-            quote_currency=quote,
-            rate=direct.rate,
-            used_date=direct.rate_date,
-        )
-
-    inverse = _find_single(on_date=on_date, base=quote, quote=base)
-    if inverse is not None and inverse.rate and inverse.rate > 0:
-        flipped = (Decimal("1") / inverse.rate).quantize(_FX_PRECISION)
-        return RateLookup(
-            rate_date=on_date,
-            base_currency=base,
-            quote_currency=quote,
-            rate=flipped,
-            used_date=inverse.rate_date,
-        )
-
-    return None
+    return fx_rate_engine().lookup(
+        on_date=on_date,
+        base_currency=base_currency,
+        quote_currency=quote_currency,
+    )
 
 
 def convert(
@@ -143,22 +301,12 @@ def convert(
     warn the user) from ``Decimal("0")`` (zero-valued spend, aggregate as-is).
     """
 
-    if amount is None:
-        return None
-    if not isinstance(amount, Decimal):
-        try:
-            amount = Decimal(str(amount))
-        except (TypeError, ValueError, ArithmeticError):
-            return None
-
-    lookup = resolve_rate(
-        on_date=on_date,
-        base_currency=from_currency or "",
-        quote_currency=to_currency or "",
-    )
-    if lookup is None:
-        return None
-    return (amount * lookup.rate).quantize(_FX_PRECISION)
+    return fx_rate_engine().convert_column(
+        [amount],
+        currencies=[from_currency],
+        dates=[on_date],
+        target=to_currency or "",
+    )[0]
 
 
 def load_rate_table(
@@ -169,70 +317,23 @@ def load_rate_table(
 ) -> dict[tuple[date, str], Decimal]:
     """Pre-fetch a ``(date, ccy) → rate-to-target`` lookup for batch conversion.
 
-    Warehouse/meta_direct adapters aggregate thousands of rows per request;
-    calling :func:`convert` per-row would do one query per row. This helper
-    issues a single query that covers every ``(from_ccy, to=target)`` pair
-    across the requested date window, then fills in gaps by falling back to
-    the last known rate (emulating the on-or-before behaviour of
-    :func:`resolve_rate`).
+    Kept for callers that want a keyed table; new batch code should prefer
+    :meth:`FxRateEngine.rate_column`, which this wraps.
     """
 
     target_norm = _normalize_ccy(target)
     if not target_norm:
         return {}
 
-    ccy_set = {c for c in (_normalize_ccy(x) for x in currencies) if c and c != target_norm}
+    ccy_list = sorted({c for c in (_normalize_ccy(x) for x in currencies) if c and c != target_norm})
     date_list = sorted(set(dates))
-    if not ccy_set or not date_list:
+    if not ccy_list or not date_list:
         return {}
 
-    latest = date_list[-1]
-
-    # Fetch direct pairs covering the window, plus the most recent pre-window
-    # row per ccy (to seed on-or-before fallback for the first day).
-    direct_rows = list(
-        DailyFxRate.objects.filter(
-            Q(base_currency__in=ccy_set, quote_currency=target_norm)
-            | Q(base_currency=target_norm, quote_currency__in=ccy_set),
-            rate_date__lte=latest,
-        ).order_by("rate_date")
+    keys = [(d, ccy) for d in date_list for ccy in ccy_list]
+    rates = fx_rate_engine().rate_column(
+        currencies=[ccy for _, ccy in keys],
+        dates=[d for d, _ in keys],
+        target=target_norm,
     )
-
-    # Build per-currency sorted rate list for greedy on-or-before lookup.
-    per_ccy_direct: dict[str, list[tuple[date, Decimal]]] = {}
-    per_ccy_inverse: dict[str, list[tuple[date, Decimal]]] = {}
-    for row in direct_rows:
-        if row.base_currency in ccy_set and row.quote_currency == target_norm:
-            per_ccy_direct.setdefault(row.base_currency, []).append((row.rate_date, row.rate))
-        elif row.quote_currency in ccy_set and row.base_currency == target_norm:
-            if row.rate and row.rate > 0:
-                per_ccy_inverse.setdefault(row.quote_currency, []).append(
-                    (row.rate_date, (Decimal("1") / row.rate).quantize(_FX_PRECISION))
-                )
-
-    out: dict[tuple[date, str], Decimal] = {}
-    for d in date_list:
-        for ccy in ccy_set:
-            rate = _pick_on_or_before(per_ccy_direct.get(ccy), d)
-            if rate is None:
-                rate = _pick_on_or_before(per_ccy_inverse.get(ccy), d)
-            if rate is not None:
-                out[(d, ccy)] = rate
-
-    return out
-
-
-def _pick_on_or_before(
-    series: list[tuple[date, Decimal]] | None, on_date: date
-) -> Decimal | None:
-    if not series:
-        return None
-    # series is sorted ascending by date — walk backwards for the freshest
-    # entry on-or-before ``on_date``. Linear is fine for typical ranges.
-    chosen: Decimal | None = None
-    for rate_date, rate in series:
-        if rate_date <= on_date:
-            chosen = rate
-        else:
-            break
-    return chosen
+    return {key: rate for key, rate in zip(keys, rates) if rate is not None}
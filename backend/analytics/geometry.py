@@ -0,0 +1,262 @@
+"""Precomputed parish geometry served by ``ParishGeometryView``.
+
+The bundled GeoJSON is parsed once per process. Each resolution is simplified
+(Douglas-Peucker), rounded to a fixed coordinate precision, JSON-encoded and
+compressed up front, so a request only has to pick a ready-made byte string.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from django.conf import settings
+
+try:  # pragma: no cover - optional dependency
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+PARISH_GEOJSON_PATH = Path(settings.BASE_DIR) / "analytics" / "assets" / "jm_parishes.json"
+
+ENCODING_IDENTITY = "identity"
+ENCODING_GZIP = "gzip"
+ENCODING_BROTLI = "br"
+
+
+@dataclass(frozen=True)
+class GeometryResolution:
+    """Simplification tolerance (degrees) and coordinate precision (decimals)."""
+
+    name: str
+    tolerance: float
+    precision: int | None
+
+
+# ~0.0005° is ~55 m and 0.002° is ~220 m at Jamaica's latitude; five and four
+# decimals keep ~1 m and ~11 m precision, below what either tolerance removes.
+RESOLUTIONS: dict[str, GeometryResolution] = {
+    "full": GeometryResolution("full", tolerance=0.0, precision=None),
+    "medium": GeometryResolution("medium", tolerance=0.0005, precision=5),
+    "low": GeometryResolution("low", tolerance=0.002, precision=4),
+}
+DEFAULT_RESOLUTION = "medium"
+
+
+@dataclass(frozen=True)
+class EncodedGeometry:
+    """One pre-encoded representation of a resolution."""
+
+    body: bytes
+    encoding: str
+    etag: str
+
+
+@dataclass(frozen=True)
+class GeometryVariant:
+    resolution: str
+    point_count: int
+    representations: dict[str, EncodedGeometry]
+
+    def select(self, accepted: Sequence[str]) -> EncodedGeometry:
+        """Return the smallest representation among ``accepted`` encodings."""
+
+        for encoding in (ENCODING_BROTLI, ENCODING_GZIP):
+            if encoding in accepted and encoding in self.representations:
+                return self.representations[encoding]
+        return self.representations[ENCODING_IDENTITY]
+
+
+def _perpendicular_distance(point: Sequence[float], start: Sequence[float], end: Sequence[float]) -> float:
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    if dx == 0 and dy == 0:
+        return ((point[0] - start[0]) ** 2 + (point[1] - start[1]) ** 2) ** 0.5
+    return abs(dy * point[0] - dx * point[1] + end[0] * start[1] - end[1] * start[0]) / (
+        (dx * dx + dy * dy) ** 0.5
+    )
+
+
+def simplify_line(points: Sequence[Sequence[float]], tolerance: float) -> list[Sequence[float]]:
+    """Douglas-Peucker simplification that always keeps both endpoints."""
+
+    if tolerance <= 0 or len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_distance = 0.0
+        index = first
+        for candidate in range(first + 1, last):
+            distance = _perpendicular_distance(points[candidate], points[first], points[last])
+            if distance > max_distance:
+                max_distance, index = distance, candidate
+        if max_distance > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _round_ring(ring: Sequence[Sequence[float]], precision: int | None) -> list[list[float]]:
+    if precision is None:
+        return [list(point) for point in ring]
+    rounded: list[list[float]] = []
+    for point in ring:
+        candidate = [round(point[0], precision), round(point[1], precision)]
+        if not rounded or rounded[-1] != candidate:
+            rounded.append(candidate)
+    return rounded
+
+
+def _simplify_polygon(
+    polygon: Sequence[Sequence[Sequence[float]]], resolution: GeometryResolution
+) -> list[list[list[float]]] | None:
+    rings: list[list[list[float]]] = []
+    for index, ring in enumerate(polygon):
+        simplified = _round_ring(simplify_line(ring, resolution.tolerance), resolution.precision)
+        if len(simplified) < 4:
+            if index == 0:
+                # Exterior collapsed: the islet is below this resolution.
+                return None
+            continue
+        rings.append(simplified)
+    return rings
+
+
+def simplify_geometry(geometry: dict[str, Any], resolution: GeometryResolution) -> dict[str, Any]:
+    """Simplify a Polygon/MultiPolygon, keeping at least one polygon per feature."""
+
+    geometry_type = geometry.get("type")
+    if geometry_type == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry_type == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return geometry
+
+    simplified = [
+        rings for rings in (_simplify_polygon(polygon, resolution) for polygon in polygons) if rings
+    ]
+    if not simplified:
+        largest = max(polygons, key=lambda polygon: len(polygon[0]))
+        simplified = [[_round_ring(ring, resolution.precision) for ring in largest]]
+    if geometry_type == "Polygon":
+        return {"type": "Polygon", "coordinates": simplified[0]}
+    return {"type": "MultiPolygon", "coordinates": simplified}
+
+
+def _count_points(collection: dict[str, Any]) -> int:
+    total = 0
+    for feature in collection.get("features", []):
+        geometry = feature.get("geometry") or {}
+        coordinates = geometry.get("coordinates") or []
+        polygons = [coordinates] if geometry.get("type") == "Polygon" else coordinates
+        total += sum(len(ring) for polygon in polygons for ring in polygon)
+    return total
+
+
+def _encode_variant(name: str, collection: dict[str, Any]) -> GeometryVariant:
+    body = json.dumps(collection, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    representations = {
+        ENCODING_IDENTITY: EncodedGeometry(body, ENCODING_IDENTITY, f'"{digest}"'),
+        ENCODING_GZIP: EncodedGeometry(
+            gzip.compress(body, compresslevel=9, mtime=0), ENCODING_GZIP, f'"{digest}-gzip"'
+        ),
+    }
+    if brotli is not None:
+        representations[ENCODING_BROTLI] = EncodedGeometry(
+            brotli.compress(body), ENCODING_BROTLI, f'"{digest}-br"'
+        )
+    return GeometryVariant(
+        resolution=name, point_count=_count_points(collection), representations=representations
+    )
+
+
+class ParishGeometryService:
+    """Process-wide holder of the precomputed parish geometry variants."""
+
+    def __init__(self, path: Path = PARISH_GEOJSON_PATH) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._variants: dict[str, GeometryVariant] = {}
+
+    def warm(self) -> bool:
+        """Load and precompute every resolution; returns whether geometry is available."""
+
+        if self._loaded:
+            return bool(self._variants)
+        with self._lock:
+            if not self._loaded:
+                self._variants = self._build_variants()
+                self._loaded = True
+        return bool(self._variants)
+
+    def variant(self, resolution: str = DEFAULT_RESOLUTION) -> GeometryVariant | None:
+        self.warm()
+        return self._variants.get(resolution)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._variants = {}
+            self._loaded = False
+
+    def _build_variants(self) -> dict[str, GeometryVariant]:
+        try:
+            source = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            logger.warning("parish.geometry.missing", extra={"path": str(self._path)})
+            return {}
+        except json.JSONDecodeError as exc:
+            logger.error(
+                "parish.geometry.invalid",
+                extra={"path": str(self._path)},
+                exc_info=exc,
+            )
+            return {}
+
+        variants: dict[str, GeometryVariant] = {}
+        for name, resolution in RESOLUTIONS.items():
+            collection = {
+                **source,
+                "features": [
+                    {**feature, "geometry": simplify_geometry(feature["geometry"], resolution)}
+                    if feature.get("geometry")
+                    else feature
+                    for feature in source.get("features", [])
+                ],
+            }
+            variants[name] = _encode_variant(name, collection)
+        logger.info(
+            "parish.geometry.precomputed",
+            extra={
+                "path": str(self._path),
+                "variants": {
+                    name: {
+                        "points": variant.point_count,
+                        "bytes": len(variant.representations[ENCODING_IDENTITY].body),
+                    }
+                    for name, variant in variants.items()
+                },
+            },
+        )
+        return variants
+
+
+_service = ParishGeometryService()
+
+
+def parish_geometry() -> ParishGeometryService:
+    return _service
@@ -39,6 +39,9 @@ class GoogleAdsListQuerySerializer(GoogleAdsDateRangeQuerySerializer):
     page_size = serializers.IntegerField(required=False, min_value=1, max_value=200, default=50)
     sort = serializers.CharField(required=False, default="-spend")
     q = serializers.CharField(required=False, allow_blank=True, default="")
+    # Keyset pagination: pass an empty cursor for the first page, then the
+    # ``next_cursor`` from the previous response.
+    cursor = serializers.CharField(required=False, allow_blank=True, trim_whitespace=True)
 
 
 class GoogleAdsExecutiveQuerySerializer(GoogleAdsDateRangeQuerySerializer):
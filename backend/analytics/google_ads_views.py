@@ -1,28 +1,31 @@
 from __future__ import annotations
 
-import csv
-import hashlib
+import base64
+import binascii
+import json
 from calendar import monthrange
 from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Max, Q, Sum
+from django.db.models import Case, F, FloatField, Max, Q, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, NullIf
 from django.http import FileResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from accounts.audit import log_audit_event
 from accounts.models import Role
+from analytics.exporters import export_fetch_size, iter_csv_lines
 from analytics.google_ads_serializers import (
     GoogleAdsAccountAssignmentSerializer,
     GoogleAdsBreakdownQuerySerializer,
@@ -34,6 +37,7 @@ from analytics.google_ads_serializers import (
     GoogleAdsSavedViewSerializer,
 )
 from analytics.models import GoogleAdsExportJob, GoogleAdsSavedView
+from core.tenant_cache import get_cached, tenant_cache_key
 from integrations.clients.resolver import resolve_client_accounts
 from integrations.models import (
     CampaignBudget,
@@ -268,6 +272,149 @@ def _metric_payload(*, spend: Decimal, impressions: Decimal, clicks: Decimal, co
     }
 
 
+# --- SQL-side list ordering and pagination ------------------------------------
+#
+# List endpoints group daily rows in the database. The sort key, including
+# derived ratios, is annotated onto the grouped queryset as ``sort_value`` so
+# ordering, ``q`` filtering and LIMIT/OFFSET all run in SQL. Only the requested
+# page reaches Python. Callers can pass ``cursor`` for keyset pagination, which
+# skips OFFSET on deep pages: the cursor carries the last row's
+# ``(sort_value, *tie_breakers)`` tuple.
+
+
+def _metric_total_sort(alias: str):
+    return Cast(F(alias), FloatField())
+
+
+def _metric_ratio_sort(numerator: str, denominator: str, *, scale: float = 1.0):
+    """``numerator * scale / denominator`` with the zero-denominator rule of ``_safe_div``."""
+
+    return Case(
+        When(**{denominator: 0}, then=Value(0.0)),
+        default=Cast(F(numerator), FloatField()) * Value(scale) / Cast(F(denominator), FloatField()),
+        output_field=FloatField(),
+    )
+
+
+_METRIC_SORTS: dict[str, Any] = {
+    "spend": _metric_total_sort("spend_micros"),
+    "impressions": _metric_total_sort("impressions_total"),
+    "clicks": _metric_total_sort("clicks_total"),
+    "conversions": _metric_total_sort("conversions_total"),
+    "ctr": _metric_ratio_sort("clicks_total", "impressions_total"),
+    "avg_cpc": _metric_ratio_sort("spend_micros", "clicks_total", scale=1e-6),
+    "cpa": _metric_ratio_sort("spend_micros", "conversions_total", scale=1e-6),
+}
+_ROAS_SORT = _metric_ratio_sort("conversion_value_total", "spend_micros", scale=1e6)
+_CAMPAIGN_LIST_SORTS: dict[str, Any] = {
+    **_METRIC_SORTS,
+    "roas": _ROAS_SORT,
+    "campaign_name": Coalesce(NullIf(F("campaign_name"), Value("")), F("campaign_id")),
+}
+_LIST_PAGINATION_PARAMS = ("page", "page_size", "cursor")
+
+
+def _encode_list_cursor(sort: str, row: dict[str, Any], tie_breakers: tuple[str, ...]) -> str:
+    position = [row["sort_value"], *(row[field] for field in tie_breakers)]
+    raw = json.dumps({"sort": sort, "after": position}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_list_cursor(cursor: str, *, sort: str, width: int) -> list[Any]:
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValidationError({"cursor": "Invalid cursor."}) from exc
+    if not isinstance(decoded, dict):
+        raise ValidationError({"cursor": "Invalid cursor."})
+    position = decoded.get("after")
+    if decoded.get("sort") != sort or not isinstance(position, list) or len(position) != width:
+        raise ValidationError({"cursor": "Cursor does not match the requested sort."})
+    return position
+
+
+def _after_cursor(position: list[Any], *, descending: bool, tie_breakers: tuple[str, ...]) -> Q:
+    fields = ("sort_value", *tie_breakers)
+    condition = Q()
+    for index, field in enumerate(fields):
+        lookup = "lt" if descending and index == 0 else "gt"
+        condition |= Q(
+            **{prior: position[offset] for offset, prior in enumerate(fields[:index])},
+            **{f"{field}__{lookup}": position[index]},
+        )
+    return condition
+
+
+def _page_grouped_rows(
+    grouped,
+    validated: dict[str, Any],
+    *,
+    sort_fields: dict[str, Any],
+    tie_breakers: tuple[str, ...],
+    search_fields: tuple[str, ...] = (),
+    paginate: bool = True,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Filter, order and slice a ``values().annotate()`` queryset in SQL.
+
+    Returns the rows to render plus the pagination keys for the response body.
+    ``paginate=False`` keeps the full ordered list (and returns no keys), for
+    endpoints whose callers roll up every row.
+    """
+
+    query = (validated.get("q") or "").strip()
+    if query and search_fields:
+        matches = Q()
+        for field in search_fields:
+            matches |= Q(**{f"{field}__icontains": query})
+        grouped = grouped.filter(matches)
+
+    sort = validated.get("sort") or "-spend"
+    descending = sort.startswith("-")
+    sort_key = sort[1:] if descending else sort
+    if sort_key not in sort_fields:
+        sort, sort_key, descending = "-spend", "spend", True
+    ordered = grouped.annotate(sort_value=sort_fields[sort_key]).order_by(
+        F("sort_value").desc() if descending else F("sort_value").asc(),
+        *tie_breakers,
+    )
+    if not paginate:
+        return list(ordered), {}
+
+    page_size = validated["page_size"]
+    cursor = validated.get("cursor")
+    if cursor is None:
+        paginator = Paginator(ordered, page_size)
+        page_obj = paginator.get_page(validated["page"])
+        return list(page_obj.object_list), {
+            "count": paginator.count,
+            "page": page_obj.number,
+            "page_size": page_size,
+            "num_pages": paginator.num_pages,
+        }
+
+    count = ordered.count()
+    window = ordered
+    if cursor:
+        position = _decode_list_cursor(cursor, sort=sort, width=len(tie_breakers) + 1)
+        window = ordered.filter(
+            _after_cursor(position, descending=descending, tie_breakers=tie_breakers)
+        )
+    rows = list(window[: page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+    return rows, {
+        "count": count,
+        "page": None,
+        "page_size": page_size,
+        "num_pages": max(1, -(-count // page_size)),
+        "next_cursor": _encode_list_cursor(sort, rows[-1], tie_breakers) if has_next else None,
+    }
+
+
+def _wants_pagination(request) -> bool:  # noqa: ANN001
+    return any(param in request.query_params for param in _LIST_PAGINATION_PARAMS)
+
+
 def _build_executive_payload(
     *,
     user,
@@ -279,9 +426,13 @@ def _build_executive_payload(
     cache_ttl = int(getattr(settings, "GOOGLE_ADS_TODAY_CACHE_TTL_SECONDS", 300) or 300)
     # Fold the resolved scope into the cache key so client_id-scoped results
     # don't collide with unscoped ones.
-    cache_key_src = f"{user.tenant_id}:{validated}:scope={scoped_customer_ids}"
-    cache_key = f"{cache_key_prefix}:{hashlib.sha256(cache_key_src.encode('utf-8')).hexdigest()}"
-    cached = cache.get(cache_key)
+    cache_key = tenant_cache_key(
+        user.tenant_id,
+        cache_key_prefix,
+        validated,
+        {"scope": scoped_customer_ids},
+    )
+    cached = get_cached(cache_key, area=cache_key_prefix)
     if isinstance(cached, dict):
         return cached
 
@@ -434,7 +585,25 @@ def _build_executive_payload(
     return payload
 
 
-def _campaign_rows_for_export(user, filters: dict[str, Any]) -> list[dict[str, Any]]:  # noqa: ANN001
+GOOGLE_ADS_EXPORT_HEADERS = [
+    "customer_id",
+    "campaign_id",
+    "campaign_name",
+    "channel_type",
+    "campaign_status",
+    "spend",
+    "impressions",
+    "clicks",
+    "ctr",
+    "avg_cpc",
+    "conversions",
+    "conversion_value",
+    "cpa",
+    "roas",
+]
+
+
+def _campaign_rows_for_export(user, filters: dict[str, Any]) -> Iterator[list[Any]]:  # noqa: ANN001
     scoped_ids, _meta = _resolve_google_customer_ids(user, filters)
     qs = GoogleAdsSdkCampaignDaily.objects.filter(tenant_id=user.tenant_id)
     qs = _apply_customer_scope(qs, user)
@@ -456,32 +625,28 @@ def _campaign_rows_for_export(user, filters: dict[str, Any]) -> list[dict[str, A
         )
         .order_by("campaign_name", "campaign_id")
     )
-    payload: list[dict[str, Any]] = []
-    for row in rows:
+    for row in rows.iterator(chunk_size=export_fetch_size()):
         spend = _micros_to_currency(row["spend_micros"])
         clicks = _to_decimal(row["clicks_total"])
         impressions = _to_decimal(row["impressions_total"])
         conversions = _to_decimal(row["conversions_total"])
         conversion_value = _to_decimal(row["conversion_value_total"])
-        payload.append(
-            {
-                "customer_id": row["customer_id"],
-                "campaign_id": row["campaign_id"],
-                "campaign_name": row["campaign_name"],
-                "channel_type": row["advertising_channel_type"],
-                "campaign_status": row["campaign_status"],
-                "spend": float(spend),
-                "impressions": float(impressions),
-                "clicks": float(clicks),
-                "ctr": float(_safe_div(clicks, impressions)),
-                "avg_cpc": float(_safe_div(spend, clicks)),
-                "conversions": float(conversions),
-                "conversion_value": float(conversion_value),
-                "cpa": float(_safe_div(spend, conversions)),
-                "roas": float(_safe_div(conversion_value, spend)),
-            }
-        )
-    return payload
+        yield [
+            row["customer_id"],
+            row["campaign_id"],
+            row["campaign_name"],
+            row["advertising_channel_type"],
+            row["campaign_status"],
+            float(spend),
+            float(impressions),
+            float(clicks),
+            float(_safe_div(clicks, impressions)),
+            float(_safe_div(spend, clicks)),
+            float(conversions),
+            float(conversion_value),
+            float(_safe_div(spend, conversions)),
+            float(_safe_div(conversion_value, spend)),
+        ]
 
 
 class GoogleAdsExecutiveView(APIView):
@@ -621,29 +786,36 @@ class GoogleAdsCampaignListView(APIView):
         qs = _apply_customer_scope(qs, request.user)
         qs = _apply_date_and_common_filters(qs, validated, scoped_customer_ids=scoped_ids)
 
-        rows = list(
-            qs.values(
-                "customer_id",
-                "campaign_id",
-                "campaign_name",
-                "campaign_status",
-                "advertising_channel_type",
-            )
-            .annotate(
-                spend_micros=Sum("cost_micros"),
-                impressions_total=Sum("impressions"),
-                clicks_total=Sum("clicks"),
-                conversions_total=Sum("conversions"),
-                conversion_value_total=Sum("conversions_value"),
+        grouped = qs.values(
+            "customer_id",
+            "campaign_id",
+            "campaign_name",
+            "campaign_status",
+            "advertising_channel_type",
+        ).annotate(
+            spend_micros=Sum("cost_micros"),
+            impressions_total=Sum("impressions"),
+            clicks_total=Sum("clicks"),
+            conversions_total=Sum("conversions"),
+            conversion_value_total=Sum("conversions_value"),
+        )
+        query = validated.get("q", "").strip()
+        if query:
+            # Unnamed campaigns are displayed (and searched) by their id.
+            grouped = grouped.filter(
+                Q(campaign_name__icontains=query)
+                | Q(campaign_name="", campaign_id__icontains=query)
             )
+        rows, page_meta = _page_grouped_rows(
+            grouped,
+            validated,
+            sort_fields=_CAMPAIGN_LIST_SORTS,
+            tie_breakers=("customer_id", "campaign_id"),
         )
 
-        query = validated.get("q", "").strip().lower()
         payload = []
         for row in rows:
             campaign_name = row["campaign_name"] or row["campaign_id"]
-            if query and query not in campaign_name.lower():
-                continue
             spend = _micros_to_currency(row["spend_micros"])
             impressions = _to_decimal(row["impressions_total"])
             clicks = _to_decimal(row["clicks_total"])
@@ -668,32 +840,11 @@ class GoogleAdsCampaignListView(APIView):
                 }
             )
 
-        sort = validated.get("sort", "-spend")
-        reverse = sort.startswith("-")
-        sort_key = sort[1:] if reverse else sort
-        if sort_key not in {
-            "campaign_name",
-            "spend",
-            "clicks",
-            "impressions",
-            "conversions",
-            "roas",
-            "cpa",
-        }:
-            sort_key = "spend"
-            reverse = True
-        payload.sort(key=lambda row: row.get(sort_key) or 0, reverse=reverse)
-
-        paginator = Paginator(payload, validated["page_size"])
-        page_obj = paginator.get_page(validated["page"])
         return _attach_client_resolution(
             Response(
                 {
-                    "count": paginator.count,
-                    "page": page_obj.number,
-                    "page_size": validated["page_size"],
-                    "num_pages": paginator.num_pages,
-                    "results": list(page_obj.object_list),
+                    **page_meta,
+                    "results": payload,
                     "source_engine": _source_engine_for_tenant(str(request.user.tenant_id)),
                 }
             ),
@@ -844,24 +995,29 @@ class GoogleAdsAdsView(APIView):
         qs = _apply_customer_scope(qs, request.user)
         qs = _apply_date_and_common_filters(qs, validated, scoped_customer_ids=scoped_ids)
 
-        rows = (
-            qs.values(
-                "customer_id",
-                "campaign_id",
-                "ad_group_id",
-                "ad_id",
-                "ad_name",
-                "ad_status",
-                "policy_approval_status",
-                "policy_review_status",
-            )
-            .annotate(
-                spend_micros=Sum("cost_micros"),
-                impressions_total=Sum("impressions"),
-                clicks_total=Sum("clicks"),
-                conversions_total=Sum("conversions"),
-            )
-            .order_by("-spend_micros")
+        group_fields = (
+            "customer_id",
+            "campaign_id",
+            "ad_group_id",
+            "ad_id",
+            "ad_name",
+            "ad_status",
+            "policy_approval_status",
+            "policy_review_status",
+        )
+        grouped = qs.values(*group_fields).annotate(
+            spend_micros=Sum("cost_micros"),
+            impressions_total=Sum("impressions"),
+            clicks_total=Sum("clicks"),
+            conversions_total=Sum("conversions"),
+        )
+        rows, page_meta = _page_grouped_rows(
+            grouped,
+            validated,
+            sort_fields={**_METRIC_SORTS, "ad_name": F("ad_name")},
+            tie_breakers=group_fields,
+            search_fields=("ad_name",),
+            paginate=_wants_pagination(request),
         )
 
         payload = []
@@ -886,7 +1042,7 @@ class GoogleAdsAdsView(APIView):
                 }
             )
         return _attach_client_resolution(
-            Response({"count": len(payload), "results": payload}), resolution_meta
+            Response({"count": len(payload), **page_meta, "results": payload}), resolution_meta
         )
 
 
@@ -941,27 +1097,32 @@ class GoogleAdsKeywordsView(APIView):
         qs = _apply_customer_scope(qs, request.user)
         qs = _apply_date_and_common_filters(qs, validated, scoped_customer_ids=scoped_ids)
 
-        rows = (
-            qs.values(
-                "customer_id",
-                "campaign_id",
-                "ad_group_id",
-                "criterion_id",
-                "keyword_text",
-                "match_type",
-                "criterion_status",
-                "quality_score",
-                "ad_relevance",
-                "expected_ctr",
-                "landing_page_experience",
-            )
-            .annotate(
-                spend_micros=Sum("cost_micros"),
-                impressions_total=Sum("impressions"),
-                clicks_total=Sum("clicks"),
-                conversions_total=Sum("conversions"),
-            )
-            .order_by("-spend_micros")
+        # quality_score is nullable, so it stays out of the keyset tie-breakers.
+        tie_breakers = (
+            "customer_id",
+            "campaign_id",
+            "ad_group_id",
+            "criterion_id",
+            "keyword_text",
+            "match_type",
+            "criterion_status",
+            "ad_relevance",
+            "expected_ctr",
+            "landing_page_experience",
+        )
+        grouped = qs.values(*tie_breakers, "quality_score").annotate(
+            spend_micros=Sum("cost_micros"),
+            impressions_total=Sum("impressions"),
+            clicks_total=Sum("clicks"),
+            conversions_total=Sum("conversions"),
+        )
+        rows, page_meta = _page_grouped_rows(
+            grouped,
+            validated,
+            sort_fields={**_METRIC_SORTS, "keyword_text": F("keyword_text")},
+            tie_breakers=tie_breakers,
+            search_fields=("keyword_text",),
+            paginate=_wants_pagination(request),
         )
 
         payload = []
@@ -993,7 +1154,7 @@ class GoogleAdsKeywordsView(APIView):
             )
 
         return _attach_client_resolution(
-            Response({"count": len(payload), "results": payload}), resolution_meta
+            Response({"count": len(payload), **page_meta, "results": payload}), resolution_meta
         )
 
 
@@ -1010,21 +1171,20 @@ class GoogleAdsSearchTermsView(APIView):
         qs = _apply_customer_scope(qs, request.user)
         qs = _apply_date_and_common_filters(qs, validated, scoped_customer_ids=scoped_ids)
 
-        rows = (
-            qs.values(
-                "customer_id",
-                "campaign_id",
-                "ad_group_id",
-                "criterion_id",
-                "search_term",
-            )
-            .annotate(
-                spend_micros=Sum("cost_micros"),
-                impressions_total=Sum("impressions"),
-                clicks_total=Sum("clicks"),
-                conversions_total=Sum("conversions"),
-            )
-            .order_by("-spend_micros")
+        group_fields = ("customer_id", "campaign_id", "ad_group_id", "criterion_id", "search_term")
+        grouped = qs.values(*group_fields).annotate(
+            spend_micros=Sum("cost_micros"),
+            impressions_total=Sum("impressions"),
+            clicks_total=Sum("clicks"),
+            conversions_total=Sum("conversions"),
+        )
+        rows, page_meta = _page_grouped_rows(
+            grouped,
+            validated,
+            sort_fields={**_METRIC_SORTS, "search_term": F("search_term")},
+            tie_breakers=group_fields,
+            search_fields=("search_term",),
+            paginate=_wants_pagination(request),
         )
 
         payload = []
@@ -1049,7 +1209,7 @@ class GoogleAdsSearchTermsView(APIView):
                 }
             )
         return _attach_client_resolution(
-            Response({"count": len(payload), "results": payload}), resolution_meta
+            Response({"count": len(payload), **page_meta, "results": payload}), resolution_meta
         )
 
 
@@ -1157,22 +1317,27 @@ class GoogleAdsPmaxAssetGroupsView(APIView):
         qs = _apply_customer_scope(qs, request.user)
         qs = _apply_date_and_common_filters(qs, validated, scoped_customer_ids=scoped_ids)
 
-        rows = (
-            qs.values(
-                "customer_id",
-                "campaign_id",
-                "asset_group_id",
-                "asset_group_name",
-                "asset_group_status",
-            )
-            .annotate(
-                spend_micros=Sum("cost_micros"),
-                impressions_total=Sum("impressions"),
-                clicks_total=Sum("clicks"),
-                conversions_total=Sum("conversions"),
-                conversion_value_total=Sum("conversions_value"),
-            )
-            .order_by("-spend_micros")
+        group_fields = (
+            "customer_id",
+            "campaign_id",
+            "asset_group_id",
+            "asset_group_name",
+            "asset_group_status",
+        )
+        grouped = qs.values(*group_fields).annotate(
+            spend_micros=Sum("cost_micros"),
+            impressions_total=Sum("impressions"),
+            clicks_total=Sum("clicks"),
+            conversions_total=Sum("conversions"),
+            conversion_value_total=Sum("conversions_value"),
+        )
+        rows, page_meta = _page_grouped_rows(
+            grouped,
+            validated,
+            sort_fields={**_METRIC_SORTS, "roas": _ROAS_SORT, "asset_group_name": F("asset_group_name")},
+            tie_breakers=group_fields,
+            search_fields=("asset_group_name",),
+            paginate=_wants_pagination(request),
         )
 
         payload = []
@@ -1198,7 +1363,7 @@ class GoogleAdsPmaxAssetGroupsView(APIView):
             )
 
         return _attach_client_resolution(
-            Response({"count": len(payload), "results": payload}), resolution_meta
+            Response({"count": len(payload), **page_meta, "results": payload}), resolution_meta
         )
 
 
@@ -1332,12 +1497,13 @@ class GoogleAdsBudgetPacingView(APIView):
         effective_customer_ids = sorted(
             set(qs.values_list("customer_id", flat=True))
         )
-        cache_key = (
-            f"ga_pacing_v1:{request.user.tenant_id}:"
-            f"{hashlib.sha1(repr(effective_customer_ids).encode()).hexdigest()[:12]}:"
-            f"{month_end.isoformat()}"
+        cache_key = tenant_cache_key(
+            request.user.tenant_id,
+            "ga_pacing",
+            effective_customer_ids,
+            month_end,
         )
-        cached_payload = cache.get(cache_key)
+        cached_payload = get_cached(cache_key, area="ga_pacing")
         if cached_payload is not None:
             payload = dict(cached_payload)
             payload["cache"] = {
@@ -1802,12 +1968,6 @@ class GoogleAdsAccountAssignmentViewSet(viewsets.ModelViewSet):
         )
 
 
-def _safe_export_csv_value(value: Any) -> Any:
-    if isinstance(value, str) and value[:1] in {"=", "+", "-", "@"}:
-        return f"'{value}"
-    return value
-
-
 class GoogleAdsExportCreateView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -1836,37 +1996,14 @@ class GoogleAdsExportCreateView(APIView):
             file_name = f"google_ads_export_{job.id}.csv"
             artifact_path = output_dir / file_name
 
+            # enumerate() counts the header as line 0, so the last index is the data row count.
+            row_count = 0
             with artifact_path.open("w", newline="", encoding="utf-8") as csv_file:
-                writer = csv.DictWriter(
-                    csv_file,
-                    fieldnames=[
-                        "customer_id",
-                        "campaign_id",
-                        "campaign_name",
-                        "channel_type",
-                        "campaign_status",
-                        "spend",
-                        "impressions",
-                        "clicks",
-                        "ctr",
-                        "avg_cpc",
-                        "conversions",
-                        "conversion_value",
-                        "cpa",
-                        "roas",
-                    ],
-                )
-                writer.writeheader()
-                writer.writerows(
-                    {
-                        field: _safe_export_csv_value(value)
-                        for field, value in row.items()
-                    }
-                    for row in rows
-                )
+                for row_count, line in enumerate(iter_csv_lines(GOOGLE_ADS_EXPORT_HEADERS, rows)):
+                    csv_file.write(line)
 
             metadata = {
-                "row_count": len(rows),
+                "row_count": row_count,
                 "requested_format": validated["export_format"],
                 "actual_format": "csv",
             }
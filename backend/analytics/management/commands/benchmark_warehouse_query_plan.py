@@ -0,0 +1,95 @@
+"""Compare per-section and single-pass filtered warehouse query plans.
+
+Usage:
+    python manage.py benchmark_warehouse_query_plan --tenant-id <uuid>
+    python manage.py benchmark_warehouse_query_plan --tenant-id <uuid> \
+        --start-date 2025-01-01 --end-date 2025-12-31 --campaign-search brand --iterations 50
+
+Needs the Postgres warehouse views built by dbt; point it at a tenant with a
+representative ``vw_campaign_daily`` volume (for example ~1M daily rows).
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from analytics.warehouse_metrics import (
+    WarehouseCombinedFilters,
+    _fetch_campaign_payload,
+    _fetch_campaign_slice_single_pass,
+    _fetch_coverage,
+    _fetch_parish_rows,
+    warehouse_schema_catalog,
+)
+
+
+def _per_section(*, tenant_id: str, filters: WarehouseCombinedFilters) -> tuple[Any, ...]:
+    return (
+        _fetch_coverage(tenant_id=tenant_id, filters=filters),
+        _fetch_campaign_payload(tenant_id=tenant_id, filters=filters),
+        _fetch_parish_rows(tenant_id=tenant_id, filters=filters),
+    )
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(percentile * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = "Measure median/p95 latency of the per-section vs. single-pass warehouse query plans."
+
+    def add_arguments(self, parser):  # noqa: ANN001
+        parser.add_argument("--tenant-id", required=True)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--start-date")
+        parser.add_argument("--end-date")
+        parser.add_argument("--account-id")
+        parser.add_argument("--parish")
+        parser.add_argument("--campaign-search")
+
+    def handle(self, *args: Any, **options: Any):  # noqa: ANN001
+        if connection.vendor != "postgresql":
+            raise CommandError("The warehouse query plan benchmark requires Postgres.")
+        iterations = int(options["iterations"])
+        if iterations <= 0:
+            raise CommandError("--iterations must be positive.")
+
+        tenant_id = str(options["tenant_id"])
+        filters = WarehouseCombinedFilters.from_options(
+            {
+                "start_date": options.get("start_date"),
+                "end_date": options.get("end_date"),
+                "account_id": options.get("account_id"),
+                "parish": options.get("parish"),
+                "campaign_search": options.get("campaign_search"),
+            }
+        )
+        warehouse_schema_catalog.refresh_if_stale()
+
+        plans: tuple[tuple[str, Callable[..., tuple[Any, ...]]], ...] = (
+            ("per_section", _per_section),
+            ("single_pass", _fetch_campaign_slice_single_pass),
+        )
+        results: dict[str, tuple[Any, ...]] = {}
+        for label, plan in plans:
+            # Warm-up pass so both plans run against a hot buffer cache.
+            results[label] = plan(tenant_id=tenant_id, filters=filters)
+            samples = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                plan(tenant_id=tenant_id, filters=filters)
+                samples.append(time.perf_counter() - started)
+            self.stdout.write(
+                f"{label:<12} median={statistics.median(samples) * 1000:9.1f}ms "
+                f"p95={_percentile(samples, 0.95) * 1000:9.1f}ms iterations={iterations}"
+            )
+
+        matches = results["per_section"] == results["single_pass"]
+        self.stdout.write(f"payload_match={'yes' if matches else 'no'}")
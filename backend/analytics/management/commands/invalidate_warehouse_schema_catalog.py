@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from analytics.warehouse_metrics import invalidate_warehouse_schema_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Reset the cached warehouse relation/column catalog. Run after dbt builds "
+        "that add or drop columns on reporting views."
+    )
+
+    def handle(self, *args: Any, **options: Any):  # noqa: ANN001
+        invalidate_warehouse_schema_catalog()
+        self.stdout.write(self.style.SUCCESS("Warehouse schema catalog invalidated."))
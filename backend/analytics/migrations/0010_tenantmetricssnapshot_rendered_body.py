@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0009_savedreportlayout"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tenantmetricssnapshot",
+            name="rendered_body",
+            field=models.BinaryField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="tenantmetricssnapshot",
+            name="rendered_encoding",
+            field=models.CharField(blank=True, default="", max_length=16),
+        ),
+        migrations.AddField(
+            model_name="tenantmetricssnapshot",
+            name="rendered_etag",
+            field=models.CharField(blank=True, default="", max_length=80),
+        ),
+    ]
@@ -223,16 +223,42 @@ class TenantMetricsSnapshot(models.Model):
     source = models.CharField(max_length=64, default="combined")
     payload = models.JSONField(default=dict)
     generated_at = models.DateTimeField(default=timezone.now)
+    # Unfiltered combined-metrics response rendered whenever ``payload`` is
+    # saved, so polling dashboards are served without touching the JSON.
+    rendered_body = models.BinaryField(null=True, blank=True, editable=False)
+    rendered_encoding = models.CharField(max_length=16, blank=True, default="")
+    rendered_etag = models.CharField(max_length=80, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     objects = TenantAwareManager()
     all_objects = models.Manager()
 
+    RENDERED_FIELDS = ("rendered_body", "rendered_encoding", "rendered_etag")
+
     class Meta:
         unique_together = ("tenant", "source")
         ordering = ("-generated_at", "-created_at")
 
+    def save(self, *args, **kwargs):  # noqa: ANN002, ANN003
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "payload" in update_fields:
+            self.render_response()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *self.RENDERED_FIELDS}
+        super().save(*args, **kwargs)
+
+    def render_response(self) -> None:
+        # Scoped import: the service module imports this one.
+        from analytics.combined_metrics_service import rendered_snapshot_fields
+
+        for field, value in rendered_snapshot_fields(
+            payload=self.payload,
+            source=self.source,
+            generated_at=self.generated_at,
+        ).items():
+            setattr(self, field, value)
+
     def is_fresh(self, ttl_seconds: int) -> bool:
         return (timezone.now() - self.generated_at) <= timedelta(seconds=ttl_seconds)
 
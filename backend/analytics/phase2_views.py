@@ -6,7 +6,6 @@ import mimetypes
 from datetime import timedelta
 from typing import Any
 
-from django.core.cache import cache
 from django.db import transaction
 from django.http import HttpResponseBase
 from django.http import FileResponse
@@ -28,6 +27,7 @@ from analytics.models import (
     ReportExportJob,
     TenantMetricsSnapshot,
 )
+from core.tenant_cache import increment_counter, tenant_cache_key
 from integrations.models import AirbyteConnection
 from integrations.views import AlertRuleDefinitionViewSet
 
@@ -231,19 +231,17 @@ def _check_report_action_quota(
     limit: int,
 ) -> tuple[bool, int]:
     now = timezone.now()
-    cache_key = (
-        f"reporting:{tenant_id}:{report_id}:{action_name}:"
-        f"{now.strftime('%Y%m%d%H')}"
+    # Unversioned: quota windows must survive tenant cache generation bumps.
+    cache_key = tenant_cache_key(
+        tenant_id,
+        "report_quota",
+        str(report_id),
+        action_name,
+        now.strftime("%Y%m%d%H"),
+        versioned=False,
     )
-    added = cache.add(cache_key, 1, timeout=3700)
-    if added:
-        return True, 1
-    try:
-        current = cache.incr(cache_key)
-    except ValueError:
-        cache.set(cache_key, 1, timeout=3700)
-        current = 1
-    return current <= limit, int(current)
+    current = increment_counter(cache_key, timeout=3700)
+    return current <= limit, current
 
 
 class ReportDefinitionSchema(AutoSchema):
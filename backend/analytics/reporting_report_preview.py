@@ -13,6 +13,7 @@ from django.core.cache import cache
 from django.utils import timezone
 
 from analytics.models import AdAccount, ReportDefinition, SavedReportLayout
+from core.tenant_cache import get_cached, tenant_cache_key
 
 from .reporting_catalog import (
     REPORT_SCHEMA_VERSION,
@@ -36,6 +37,7 @@ REPORT_EXPORT_BLOCKING_COVERAGE_STATUSES = {
 REPORT_LAYOUT_DEFAULT_COLS = 12
 REPORT_LAYOUT_DEFAULT_ROW_HEIGHT = 64
 REPORT_PREVIEW_CACHE_TTL_SECONDS = 60
+REPORT_PREVIEW_CACHE_AREA = "report_preview"
 NON_METRIC_ROW_KEYS = frozenset(
     {
         "ad",
@@ -102,7 +104,7 @@ def build_report_preview(
 
     context = _preview_context(report=report, payload=payload)
     cache_key = _report_preview_cache_key(report=report, context=context)
-    cached_payload = cache.get(cache_key)
+    cached_payload = get_cached(cache_key, area=REPORT_PREVIEW_CACHE_AREA)
     if isinstance(cached_payload, Mapping):
         return deepcopy(dict(cached_payload))
 
@@ -204,18 +206,11 @@ def _report_preview_cache_key(
     *, report: ReportDefinition, context: Mapping[str, Any]
 ) -> str:
     updated_at = report.updated_at.isoformat() if report.updated_at else ""
-    payload = {
-        "tenant_id": str(report.tenant_id),
-        "report_id": str(report.id),
-        "updated_at": updated_at,
-        "context": context,
-    }
-    digest = hashlib.sha256(
-        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode(
-            "utf-8"
-        )
-    ).hexdigest()
-    return f"analytics:report_preview:{digest}"
+    return tenant_cache_key(
+        report.tenant_id,
+        REPORT_PREVIEW_CACHE_AREA,
+        {"report_id": str(report.id), "updated_at": updated_at, "context": context},
+    )
 
 
 def build_report_export_metadata(
@@ -8,10 +8,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from django.conf import settings
 from django.db import DatabaseError, OperationalError, ProgrammingError, connection
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+from analytics.warehouse_metrics import warehouse_schema_catalog
+
 logger = logging.getLogger(__name__)
 
 AGGREGATE_SNAPSHOT_VIEW_UNAVAILABLE_DETAIL = (
@@ -107,17 +110,63 @@ def _parse_generated_at(value: Any) -> datetime:
     return timezone.now()
 
 
+AGGREGATE_SNAPSHOT_RELATION = "vw_dashboard_aggregate_snapshot"
+
+
+def _snapshot_window_days() -> int:
+    try:
+        return max(int(getattr(settings, "WAREHOUSE_SNAPSHOT_WINDOW_DAYS", 30)), 1)
+    except (TypeError, ValueError):  # pragma: no cover - defensive config parsing
+        return 30
+
+
+def _snapshot_row_filter(tenant_id: str) -> tuple[str, dict[str, Any]]:
+    params: dict[str, Any] = {"tenant_id": tenant_id}
+    # The dbt model is materialized per (tenant_id, window_days) with a unique
+    # index; older deployments still expose it as a tenant-keyed view.
+    window_clause = ""
+    if warehouse_schema_catalog.has_column(AGGREGATE_SNAPSHOT_RELATION, "window_days"):
+        window_clause = "and window_days = %(window_days)s "
+        params["window_days"] = _snapshot_window_days()
+    return (
+        f"from {AGGREGATE_SNAPSHOT_RELATION} "
+        "where tenant_id = %(tenant_id)s "
+        f"{window_clause}"
+        "order by generated_at desc limit 1"
+    ), params
+
+
+def fetch_snapshot_source_marker(*, tenant_id: str) -> str | None:
+    """Return a cheap fingerprint of the tenant's aggregate row, or ``None``.
+
+    Reads only the timestamps (not the JSON payload) so unchanged tenants can
+    be skipped before the full row is fetched.
+    """
+
+    columns = ["generated_at"]
+    if warehouse_schema_catalog.has_column(AGGREGATE_SNAPSHOT_RELATION, "source_changed_at"):
+        columns.append("source_changed_at")
+    row_filter, params = _snapshot_row_filter(tenant_id)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"select {', '.join(columns)} {row_filter}", params)
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if not row or row[0] is None:
+        return None
+    return "|".join(str(value) for value in row)
+
+
 def fetch_snapshot_metrics_result(*, tenant_id: str) -> SnapshotFetchResult:
+    row_filter, params = _snapshot_row_filter(tenant_id)
     sql = (
         "select tenant_id, generated_at, campaign_metrics, creative_metrics, "
-        "budget_metrics, parish_metrics "
-        "from vw_dashboard_aggregate_snapshot "
-        "where tenant_id = %(tenant_id)s "
-        "order by generated_at desc limit 1"
+        f"budget_metrics, parish_metrics {row_filter}"
     )
     try:
         with connection.cursor() as cursor:
-            cursor.execute(sql, {"tenant_id": tenant_id})
+            cursor.execute(sql, params)
             row = cursor.fetchone()
             if not row:
                 return SnapshotFetchResult(
@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 from uuid import uuid4
 
-from celery import shared_task
+from celery import chord, shared_task
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
@@ -33,9 +33,11 @@ from analytics.snapshots import (
     default_snapshot_metrics,
     fetch_snapshot_metrics,
     fetch_snapshot_metrics_result,
+    fetch_snapshot_source_marker,
     snapshot_metrics_to_combined_payload,
 )
 from analytics.summaries import build_daily_summary_payload, summarize_daily_metrics
+from analytics.warehouse_metrics import invalidate_warehouse_schema_catalog
 from analytics.notifications import send_daily_summary_email
 from app.llm import get_llm_client
 from core.metrics import observe_task, observe_task_retry
@@ -50,15 +52,41 @@ DAILY_SUMMARY_FAILURE_REASON_GENERATION = "daily_summary_generation_failed"
 SNAPSHOT_SYNC_LOCK_KEY = "analytics.sync_metrics_snapshots.lock"
 SNAPSHOT_SYNC_LOCK_TTL_SECONDS = 15 * 60
 SNAPSHOT_LOCK_SCOPE_ALL = "all"
+SNAPSHOT_SOURCE_MARKER_KEY = "analytics.sync_metrics_snapshots.source:{tenant_id}"
+SNAPSHOT_STATUS_LOCKED = "locked"
+SNAPSHOT_STATUS_FAILED = "failed"
 
 
 @dataclass
 class SnapshotOutcome:
     tenant_id: str
     status: str
-    generated_at: datetime
+    generated_at: datetime | None
     stale: bool
     row_counts: dict[str, int]
+    unchanged: bool = False
+
+    def to_task_result(self) -> dict[str, Any]:
+        return {
+            "tenant_id": self.tenant_id,
+            "status": self.status,
+            "generated_at": self.generated_at.isoformat() if self.generated_at else None,
+            "stale": self.stale,
+            "row_counts": self.row_counts,
+            "unchanged": self.unchanged,
+        }
+
+    @classmethod
+    def from_task_result(cls, result: Mapping[str, Any]) -> "SnapshotOutcome":
+        generated_at = result.get("generated_at")
+        return cls(
+            tenant_id=str(result.get("tenant_id", "")),
+            status=str(result.get("status", SNAPSHOT_STATUS_FAILED)),
+            generated_at=datetime.fromisoformat(generated_at) if generated_at else None,
+            stale=bool(result.get("stale")),
+            row_counts=dict(result.get("row_counts") or {}),
+            unchanged=bool(result.get("unchanged")),
+        )
 
 
 @dataclass
@@ -271,58 +299,76 @@ def _release_snapshot_sync_lock(*, lock_key: str, token: str | None) -> None:
             cache.delete(lock_key)
 
 
-def generate_snapshots_for_tenants(
-    tenant_ids: Sequence[str] | None = None,
-) -> list[SnapshotOutcome]:
-    tenants: Iterable[Tenant]
-    queryset = Tenant.objects.all().order_by("created_at")
-    if tenant_ids:
-        queryset = queryset.filter(id__in=tenant_ids)
-    tenants = queryset
+def _snapshot_source_marker_key(tenant_id: str) -> str:
+    return SNAPSHOT_SOURCE_MARKER_KEY.format(tenant_id=tenant_id)
 
-    outcomes: list[SnapshotOutcome] = []
-    stale_ttl_seconds = _snapshot_stale_ttl_seconds()
-    for tenant in tenants:
-        tenant_id = str(tenant.id)
-        with tenant_context(tenant_id):
-            payload, generated_at, status = _snapshot_payload_for_tenant(tenant_id)
-            generated_at = _ensure_aware(generated_at)
-            TenantMetricsSnapshot.objects.update_or_create(
-                tenant=tenant,
-                source="warehouse",
-                defaults={
-                    "payload": payload,
-                    "generated_at": generated_at,
-                },
-            )
-            row_counts = _count_payload_rows(payload)
-            is_stale, age_seconds = evaluate_snapshot_freshness(
-                generated_at=generated_at,
-                stale_ttl_seconds=stale_ttl_seconds,
-            )
-            outcomes.append(
-                SnapshotOutcome(
-                    tenant_id=tenant_id,
-                    status=status,
-                    generated_at=generated_at,
-                    stale=is_stale,
-                    row_counts=row_counts,
-                )
-            )
-            if is_stale:
-                logger.warning(
-                    "metrics.snapshot.stale",
-                    extra={
-                        "tenant_id": tenant_id,
-                        "status": status,
-                        "generated_at": generated_at.isoformat(),
-                        "age_seconds": age_seconds,
-                        "stale_ttl_seconds": stale_ttl_seconds,
-                        "row_counts": row_counts,
-                    },
-                )
+
+def _unchanged_snapshot_outcome(
+    tenant: Tenant, *, source_marker: str | None, stale_ttl_seconds: int
+) -> SnapshotOutcome | None:
+    """Reuse the stored snapshot when the warehouse row has not moved since it was built."""
+
+    if source_marker is None or cache.get(_snapshot_source_marker_key(str(tenant.id))) != source_marker:
+        return None
+    snapshot = TenantMetricsSnapshot.all_objects.filter(tenant=tenant, source="warehouse").first()
+    if snapshot is None:
+        return None
+    generated_at = _ensure_aware(snapshot.generated_at)
+    is_stale, _age_seconds = evaluate_snapshot_freshness(
+        generated_at=generated_at,
+        stale_ttl_seconds=stale_ttl_seconds,
+    )
+    return SnapshotOutcome(
+        tenant_id=str(tenant.id),
+        status=str(snapshot.payload.get(WAREHOUSE_SNAPSHOT_STATUS_KEY) or "fetched"),
+        generated_at=generated_at,
+        stale=is_stale,
+        row_counts=_count_payload_rows(snapshot.payload),
+        unchanged=True,
+    )
+
+
+def _generate_snapshot_for_tenant(
+    tenant: Tenant,
+    *,
+    stale_ttl_seconds: int,
+    skip_unchanged: bool = False,
+) -> SnapshotOutcome:
+    tenant_id = str(tenant.id)
+    with tenant_context(tenant_id):
+        source_marker = fetch_snapshot_source_marker(tenant_id=tenant_id) if skip_unchanged else None
+        unchanged = _unchanged_snapshot_outcome(
+            tenant,
+            source_marker=source_marker,
+            stale_ttl_seconds=stale_ttl_seconds,
+        )
+        if unchanged is not None:
             logger.info(
-                "metrics.snapshot.persisted",
+                "metrics.snapshot.unchanged",
+                extra={"tenant_id": tenant_id, "generated_at": unchanged.generated_at.isoformat()},
+            )
+            return unchanged
+
+        payload, generated_at, status = _snapshot_payload_for_tenant(tenant_id)
+        generated_at = _ensure_aware(generated_at)
+        TenantMetricsSnapshot.objects.update_or_create(
+            tenant=tenant,
+            source="warehouse",
+            defaults={
+                "payload": payload,
+                "generated_at": generated_at,
+            },
+        )
+        if source_marker is not None and status == "fetched":
+            cache.set(_snapshot_source_marker_key(tenant_id), source_marker, timeout=None)
+        row_counts = _count_payload_rows(payload)
+        is_stale, age_seconds = evaluate_snapshot_freshness(
+            generated_at=generated_at,
+            stale_ttl_seconds=stale_ttl_seconds,
+        )
+        if is_stale:
+            logger.warning(
+                "metrics.snapshot.stale",
                 extra={
                     "tenant_id": tenant_id,
                     "status": status,
@@ -332,6 +378,51 @@ def generate_snapshots_for_tenants(
                     "row_counts": row_counts,
                 },
             )
+        logger.info(
+            "metrics.snapshot.persisted",
+            extra={
+                "tenant_id": tenant_id,
+                "status": status,
+                "generated_at": generated_at.isoformat(),
+                "age_seconds": age_seconds,
+                "stale_ttl_seconds": stale_ttl_seconds,
+                "row_counts": row_counts,
+            },
+        )
+        return SnapshotOutcome(
+            tenant_id=tenant_id,
+            status=status,
+            generated_at=generated_at,
+            stale=is_stale,
+            row_counts=row_counts,
+        )
+
+
+def _snapshot_tenants(tenant_ids: Sequence[str] | None):
+    queryset = Tenant.objects.all().order_by("created_at")
+    if tenant_ids:
+        queryset = queryset.filter(id__in=tenant_ids)
+    return queryset
+
+
+def generate_snapshots_for_tenants(
+    tenant_ids: Sequence[str] | None = None,
+    *,
+    skip_unchanged: bool = False,
+) -> list[SnapshotOutcome]:
+    stale_ttl_seconds = _snapshot_stale_ttl_seconds()
+    outcomes = [
+        _generate_snapshot_for_tenant(
+            tenant,
+            stale_ttl_seconds=stale_ttl_seconds,
+            skip_unchanged=skip_unchanged,
+        )
+        for tenant in _snapshot_tenants(tenant_ids)
+    ]
+    if any(not outcome.unchanged for outcome in outcomes):
+        # Snapshot refreshes follow warehouse rebuilds; make filtered requests
+        # re-read relation/column metadata instead of trusting the old catalog.
+        invalidate_warehouse_schema_catalog()
     return outcomes
 
 
@@ -394,18 +485,112 @@ def generate_daily_summaries_for_tenants(
     return outcomes
 
 
+def _snapshot_skip_unchanged_default() -> bool:
+    return bool(getattr(settings, "METRICS_SNAPSHOT_SKIP_UNCHANGED", True))
+
+
+def _summarize_snapshot_outcomes(
+    outcomes: Sequence[SnapshotOutcome],
+    *,
+    duration: float,
+    tenant_scope: str,
+    task_id: str | None,
+) -> dict:
+    stale_tenant_ids = [outcome.tenant_id for outcome in outcomes if outcome.stale]
+    status_counts = {
+        "default": sum(outcome.status == "default" for outcome in outcomes),
+        "fetched": sum(outcome.status == "fetched" for outcome in outcomes),
+    }
+    for status in (SNAPSHOT_STATUS_LOCKED, SNAPSHOT_STATUS_FAILED):
+        count = sum(outcome.status == status for outcome in outcomes)
+        if count:
+            status_counts[status] = count
+    row_totals = {
+        key: sum(outcome.row_counts.get(key, 0) for outcome in outcomes)
+        for key in ("campaign_rows", "campaign_trend", "creative", "budget", "parish")
+    }
+    unchanged_count = sum(outcome.unchanged for outcome in outcomes)
+    generated_at_values = [
+        outcome.generated_at for outcome in outcomes if outcome.generated_at is not None
+    ]
+    oldest = min(generated_at_values).isoformat() if generated_at_values else None
+    newest = max(generated_at_values).isoformat() if generated_at_values else None
+    logger.info(
+        "metrics.snapshot.completed",
+        extra={
+            "task_id": task_id,
+            "tenant_scope": tenant_scope,
+            "processed": len(outcomes),
+            "duration_seconds": duration,
+            "status_counts": status_counts,
+            "stale_count": len(stale_tenant_ids),
+            "stale_tenants_sample": stale_tenant_ids[:10],
+            "unchanged_count": unchanged_count,
+            "row_totals": row_totals,
+            "oldest_snapshot_generated_at": oldest,
+            "newest_snapshot_generated_at": newest,
+        },
+    )
+    return {
+        "processed": len(outcomes),
+        "duration_seconds": duration,
+        "status_counts": status_counts,
+        "stale_count": len(stale_tenant_ids),
+        "unchanged_count": unchanged_count,
+        "row_totals": row_totals,
+        "oldest_snapshot_generated_at": oldest,
+        "newest_snapshot_generated_at": newest,
+        "tenant_scope": tenant_scope,
+    }
+
+
+def _dispatch_snapshot_fan_out(
+    tenant_ids: Sequence[str],
+    *,
+    tenant_scope: str,
+    skip_unchanged: bool,
+    started: datetime,
+) -> int:
+    """Queue one snapshot subtask per tenant, summarized by a chord callback."""
+
+    resolved = [str(pk) for pk in _snapshot_tenants(tenant_ids).values_list("id", flat=True)]
+    if not resolved:
+        return 0
+    header = [
+        sync_tenant_metrics_snapshot.s(tenant_id=tenant_id, skip_unchanged=skip_unchanged)
+        for tenant_id in resolved
+    ]
+    chord(header)(
+        summarize_metrics_snapshots.s(tenant_scope=tenant_scope, started_at=started.isoformat())
+    )
+    return len(resolved)
+
+
 @shared_task(
     bind=True,
     name="analytics.sync_metrics_snapshots",
     base=BaseAdInsightsTask,
     max_retries=5,
 )
-def sync_metrics_snapshots(self, tenant_ids: list[str] | None = None) -> dict:
+def sync_metrics_snapshots(
+    self,
+    tenant_ids: list[str] | None = None,
+    skip_unchanged: bool | None = None,
+) -> dict:
+    """Refresh warehouse snapshots.
+
+    A single explicitly requested tenant (the post-sync trigger) is refreshed
+    inline. Anything wider fans out one ``sync_tenant_metrics_snapshot`` per
+    tenant on the snapshot queue; the lock taken here only guards dispatch.
+    """
+
     started = timezone.now()
     normalized_tenant_ids = _normalize_snapshot_tenant_ids(tenant_ids)
     lock_key = _snapshot_sync_lock_key_for_tenants(normalized_tenant_ids)
     lock_ttl_seconds = _snapshot_sync_lock_ttl_seconds()
     tenant_scope = _snapshot_lock_scope(normalized_tenant_ids)
+    if skip_unchanged is None:
+        skip_unchanged = _snapshot_skip_unchanged_default()
     lock_token = _acquire_snapshot_sync_lock(
         lock_key=lock_key,
         ttl_seconds=lock_ttl_seconds,
@@ -444,8 +629,18 @@ def sync_metrics_snapshots(self, tenant_ids: list[str] | None = None) -> dict:
             "reason": SNAPSHOT_FAILURE_REASON_LOCKED,
             "tenant_scope": tenant_scope,
         }
+    outcomes: list[SnapshotOutcome] = []
+    dispatched = 0
     try:
-        outcomes = generate_snapshots_for_tenants(normalized_tenant_ids or None)
+        if len(normalized_tenant_ids) == 1:
+            outcomes = generate_snapshots_for_tenants(normalized_tenant_ids)
+        else:
+            dispatched = _dispatch_snapshot_fan_out(
+                normalized_tenant_ids,
+                tenant_scope=tenant_scope,
+                skip_unchanged=skip_unchanged,
+                started=started,
+            )
     except Exception as exc:  # pragma: no cover - surfaced via Celery retry mechanisms
         duration = (timezone.now() - started).total_seconds()
         _record_task_outcome(self, "failure", duration)
@@ -474,56 +669,141 @@ def sync_metrics_snapshots(self, tenant_ids: list[str] | None = None) -> dict:
 
     duration = (timezone.now() - started).total_seconds()
     _record_task_outcome(self, "success", duration)
-    stale_tenant_ids = [outcome.tenant_id for outcome in outcomes if outcome.stale]
-    status_counts = {
-        "default": sum(outcome.status == "default" for outcome in outcomes),
-        "fetched": sum(outcome.status == "fetched" for outcome in outcomes),
-    }
-    row_totals = {
-        "campaign_rows": sum(
-            outcome.row_counts.get("campaign_rows", 0) for outcome in outcomes
-        ),
-        "campaign_trend": sum(
-            outcome.row_counts.get("campaign_trend", 0) for outcome in outcomes
-        ),
-        "creative": sum(outcome.row_counts.get("creative", 0) for outcome in outcomes),
-        "budget": sum(outcome.row_counts.get("budget", 0) for outcome in outcomes),
-        "parish": sum(outcome.row_counts.get("parish", 0) for outcome in outcomes),
-    }
-    generated_at_values = [outcome.generated_at for outcome in outcomes]
-    logger.info(
-        "metrics.snapshot.completed",
-        extra={
-            "task_id": getattr(getattr(self, "request", None), "id", None),
-            "tenant_scope": tenant_scope,
-            "processed": len(outcomes),
+    task_id = getattr(getattr(self, "request", None), "id", None)
+    if dispatched:
+        logger.info(
+            "metrics.snapshot.dispatched",
+            extra={
+                "task_id": task_id,
+                "tenant_scope": tenant_scope,
+                "tenant_count": dispatched,
+                "skip_unchanged": skip_unchanged,
+            },
+        )
+        return {
+            "dispatched": dispatched,
             "duration_seconds": duration,
-            "status_counts": status_counts,
-            "stale_count": len(stale_tenant_ids),
-            "stale_tenants_sample": stale_tenant_ids[:10],
-            "row_totals": row_totals,
-            "oldest_snapshot_generated_at": min(generated_at_values).isoformat()
-            if generated_at_values
-            else None,
-            "newest_snapshot_generated_at": max(generated_at_values).isoformat()
-            if generated_at_values
-            else None,
-        },
+            "skip_unchanged": skip_unchanged,
+            "tenant_scope": tenant_scope,
+        }
+    return _summarize_snapshot_outcomes(
+        outcomes,
+        duration=duration,
+        tenant_scope=tenant_scope,
+        task_id=task_id,
     )
-    return {
-        "processed": len(outcomes),
-        "duration_seconds": duration,
-        "status_counts": status_counts,
-        "stale_count": len(stale_tenant_ids),
-        "row_totals": row_totals,
-        "oldest_snapshot_generated_at": min(generated_at_values).isoformat()
-        if generated_at_values
-        else None,
-        "newest_snapshot_generated_at": max(generated_at_values).isoformat()
-        if generated_at_values
-        else None,
-        "tenant_scope": tenant_scope,
-    }
+
+
+@shared_task(
+    bind=True,
+    name="analytics.sync_tenant_metrics_snapshot",
+    base=BaseAdInsightsTask,
+    max_retries=3,
+)
+def sync_tenant_metrics_snapshot(self, tenant_id: str, skip_unchanged: bool = True) -> dict:
+    """Refresh one tenant's warehouse snapshot under that tenant's own lock."""
+
+    started = timezone.now()
+    tenant_id = str(tenant_id)
+    lock_key = _snapshot_sync_lock_key_for_tenants([tenant_id])
+    lock_token = _acquire_snapshot_sync_lock(
+        lock_key=lock_key,
+        ttl_seconds=_snapshot_sync_lock_ttl_seconds(),
+    )
+    if lock_token is None:
+        _record_task_outcome(self, "skipped", (timezone.now() - started).total_seconds())
+        logger.warning(
+            "metrics.snapshot.tenant.skipped.locked",
+            extra={"tenant_id": tenant_id, "lock_key": lock_key},
+        )
+        return SnapshotOutcome(
+            tenant_id=tenant_id,
+            status=SNAPSHOT_STATUS_LOCKED,
+            generated_at=None,
+            stale=False,
+            row_counts={},
+        ).to_task_result()
+    try:
+        tenant = Tenant.objects.get(id=tenant_id)
+        outcome = _generate_snapshot_for_tenant(
+            tenant,
+            stale_ttl_seconds=_snapshot_stale_ttl_seconds(),
+            skip_unchanged=skip_unchanged,
+        )
+    except Exception as exc:
+        _record_task_outcome(self, "failure", (timezone.now() - started).total_seconds())
+        retries = getattr(getattr(self, "request", None), "retries", 0) or 0
+        if isinstance(exc, Tenant.DoesNotExist) or retries >= (self.max_retries or 0):
+            # Report the tenant as failed so the chord callback still summarizes the run.
+            logger.exception(
+                "metrics.snapshot.tenant.failed",
+                extra={
+                    "tenant_id": tenant_id,
+                    "failure_reason": SNAPSHOT_FAILURE_REASON_GENERATION,
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return SnapshotOutcome(
+                tenant_id=tenant_id,
+                status=SNAPSHOT_STATUS_FAILED,
+                generated_at=None,
+                stale=False,
+                row_counts={},
+            ).to_task_result()
+        raise _retry_analytics_task(
+            self,
+            exc=exc,
+            reason=SNAPSHOT_FAILURE_REASON_GENERATION,
+            base_delay=60,
+            max_delay=900,
+        )
+    finally:
+        _release_snapshot_sync_lock(lock_key=lock_key, token=lock_token)
+
+    _record_task_outcome(self, "success", (timezone.now() - started).total_seconds())
+    return outcome.to_task_result()
+
+
+@shared_task(
+    bind=True,
+    name="analytics.summarize_metrics_snapshots",
+    base=BaseAdInsightsTask,
+    # The first positional argument is the chord's result list, not a tenant.
+    tenant_arg_index=-1,
+)
+def summarize_metrics_snapshots(
+    self,
+    results: list[dict] | None = None,
+    tenant_scope: str = SNAPSHOT_LOCK_SCOPE_ALL,
+    started_at: str | None = None,
+) -> dict:
+    """Chord callback: aggregate per-tenant outcomes into the run summary."""
+
+    outcomes = [
+        SnapshotOutcome.from_task_result(result)
+        for result in results or []
+        if isinstance(result, Mapping)
+    ]
+    if any(
+        not outcome.unchanged
+        and outcome.status not in {SNAPSHOT_STATUS_LOCKED, SNAPSHOT_STATUS_FAILED}
+        for outcome in outcomes
+    ):
+        invalidate_warehouse_schema_catalog()
+    started = _parse_snapshot_started_at(started_at)
+    return _summarize_snapshot_outcomes(
+        outcomes,
+        duration=(timezone.now() - started).total_seconds(),
+        tenant_scope=tenant_scope,
+        task_id=getattr(getattr(self, "request", None), "id", None),
+    )
+
+
+def _parse_snapshot_started_at(value: str | None) -> datetime:
+    if value:
+        with suppress(ValueError):
+            return _ensure_aware(datetime.fromisoformat(value))
+    return timezone.now()
 
 
 @shared_task(
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import gzip
+import json
+
 import pytest
 
+from analytics.geometry import RESOLUTIONS, simplify_geometry
+
 
 ENDPOINT = "/api/analytics/parish-geometry/"
 
@@ -23,3 +28,54 @@ def test_parish_geometry_returns_feature_collection(api_client, user):
     payload = response.json()
     assert payload.get("type") == "FeatureCollection"
     assert isinstance(payload.get("features"), list)
+
+
+@pytest.mark.django_db
+def test_parish_geometry_serves_precompressed_resolutions_with_strong_etags(api_client, user):
+    api_client.force_authenticate(user=user)
+
+    full = api_client.get(ENDPOINT, {"resolution": "full"})
+    medium = api_client.get(ENDPOINT)
+    low = api_client.get(ENDPOINT, {"resolution": "low"}, HTTP_ACCEPT_ENCODING="gzip")
+
+    assert full.status_code == medium.status_code == low.status_code == 200
+    assert low["Content-Encoding"] == "gzip"
+    low_payload = json.loads(gzip.decompress(low.content))
+    assert len(low.content) < len(medium.content) < len(full.content)
+    assert [feature["properties"] for feature in low_payload["features"]] == [
+        feature["properties"] for feature in full.json()["features"]
+    ]
+    assert not medium["ETag"].startswith("W/")
+    assert medium["ETag"] != full["ETag"]
+    assert "max-age=" in medium["Cache-Control"]
+    assert "Accept-Encoding" in medium["Vary"]
+
+    revalidated = api_client.get(ENDPOINT, HTTP_IF_NONE_MATCH=medium["ETag"])
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+@pytest.mark.django_db
+def test_parish_geometry_rejects_unknown_resolution(api_client, user):
+    api_client.force_authenticate(user=user)
+
+    response = api_client.get(ENDPOINT, {"resolution": "ultra"})
+
+    assert response.status_code == 400
+
+
+def test_simplified_rings_stay_closed_and_drop_collapsed_islets():
+    resolution = RESOLUTIONS["low"]
+    mainland = [[-77.0, 18.0], [-76.9, 18.0001], [-76.8, 18.0], [-76.8, 18.2], [-77.0, 18.2], [-77.0, 18.0]]
+    islet = [[-76.5, 18.5], [-76.5001, 18.5001], [-76.5, 18.5002], [-76.5, 18.5]]
+
+    simplified = simplify_geometry(
+        {"type": "MultiPolygon", "coordinates": [[mainland], [islet]]}, resolution
+    )
+
+    assert simplified["coordinates"] == [
+        [[[-77.0, 18.0], [-76.8, 18.0], [-76.8, 18.2], [-77.0, 18.2], [-77.0, 18.0]]]
+    ]
+    only_islet = simplify_geometry({"type": "Polygon", "coordinates": [islet]}, resolution)
+    # A feature whose every polygon collapses keeps its largest one unsimplified.
+    assert only_islet["coordinates"] == [islet]
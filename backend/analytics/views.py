@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import csv
-import json
 import logging
 import subprocess
 import sys
@@ -11,13 +9,15 @@ import time
 from datetime import timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterator, Mapping, Sequence
 
 from django.conf import settings
 from django.db import connection
-from django.http import StreamingHttpResponse
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 from django.utils.dateparse import parse_date
+from django.utils.http import parse_etags
 from rest_framework import permissions, status, viewsets
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.generics import GenericAPIView
@@ -52,12 +52,24 @@ from core.metrics import observe_combined_metrics_request
 from core.observability import emit_observability_event
 
 from accounts.audit import log_audit_event
+from accounts.tenant_context import tenant_context
 from analytics.combined_metrics_service import (
+    RENDERED_ENCODING_IDENTITY,
+    RenderedCombinedMetrics,
+    decode_rendered_body,
     default_adapter_key,
     load_combined_metrics_payload,
+    load_rendered_combined_metrics,
     parse_cache_flag,
 )
 from analytics.dataset_status import build_adapter_registry, build_dataset_status_payload
+from analytics.exporters import iter_csv_lines, iter_query_rows
+from analytics.geometry import (
+    DEFAULT_RESOLUTION,
+    ENCODING_IDENTITY,
+    RESOLUTIONS,
+    parish_geometry,
+)
 from analytics.snapshots import (
     default_snapshot_metrics,
     fetch_snapshot_metrics,
@@ -85,30 +97,6 @@ METRIC_EXPORT_HEADERS = [
     "roas",
 ]
 
-_PARISH_GEOJSON_PATH = Path(settings.BASE_DIR) / "analytics" / "assets" / "jm_parishes.json"
-
-
-@lru_cache(maxsize=1)
-def _load_parish_geojson() -> dict[str, Any] | None:
-    try:
-        raw = _PARISH_GEOJSON_PATH.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        logger.warning(
-            "parish.geometry.missing",
-            extra={"path": str(_PARISH_GEOJSON_PATH)},
-        )
-        return None
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError as exc:
-        logger.error(
-            "parish.geometry.invalid",
-            extra={"path": str(_PARISH_GEOJSON_PATH)},
-            exc_info=exc,
-        )
-        return None
-
-
 class TenantScopedModelViewSet(viewsets.ModelViewSet):
     """Base viewset enforcing tenant scoped CRUD operations."""
 
@@ -254,6 +242,45 @@ class MetricsView(APIView):
         return Response(payload)
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = parse_etags(if_none_match)
+    # Weak comparison (RFC 9110 13.1.2) is what If-None-Match calls for.
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag.removeprefix("W/") for candidate in candidates
+    )
+
+
+def _accepts_encoding(request, encoding: str) -> bool:  # noqa: ANN001
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() != encoding:
+            continue
+        quality = params.strip().lower().removeprefix("q=") if params else "1"
+        try:
+            return float(quality) > 0
+        except ValueError:
+            return True
+    return False
+
+
+def _rendered_metrics_response(request, rendered: RenderedCombinedMetrics) -> HttpResponse:  # noqa: ANN001
+    if _etag_matches(request.headers.get("If-None-Match"), rendered.etag):
+        response = HttpResponseNotModified()
+    else:
+        body, encoding = rendered.body, rendered.encoding
+        if encoding != RENDERED_ENCODING_IDENTITY and not _accepts_encoding(request, encoding):
+            body, encoding = decode_rendered_body(body, encoding), RENDERED_ENCODING_IDENTITY
+        response = HttpResponse(body, content_type="application/json")
+        if encoding != RENDERED_ENCODING_IDENTITY:
+            response["Content-Encoding"] = encoding
+    response["ETag"] = rendered.etag
+    response["Cache-Control"] = "private, no-cache"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
 class CombinedMetricsView(APIView):
     """Return a unified metrics payload for dashboards."""
 
@@ -307,15 +334,31 @@ class CombinedMetricsView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
+        ttl_seconds = getattr(settings, "METRICS_SNAPSHOT_TTL", 300)
+        cache_enabled = parse_cache_flag(request.query_params.get("cache", "true"))
         try:
+            if request.accepted_renderer.format == "json":
+                rendered = load_rendered_combined_metrics(
+                    tenant=request.user.tenant,
+                    source=source,
+                    query_params=request.query_params,
+                    ttl_seconds=ttl_seconds,
+                    cache_enabled=cache_enabled,
+                )
+                if rendered is not None:
+                    cache_outcome = "hit"
+                    query_count = rendered.query_count
+                    status_label = "success"
+                    return _rendered_metrics_response(request, rendered)
+
             result = load_combined_metrics_payload(
                 tenant=request.user.tenant,
                 tenant_id=str(tenant_id),
                 source=source,
                 adapter=adapter,
                 query_params=request.query_params,
-                ttl_seconds=getattr(settings, "METRICS_SNAPSHOT_TTL", 300),
-                cache_enabled=parse_cache_flag(request.query_params.get("cache", "true")),
+                ttl_seconds=ttl_seconds,
+                cache_enabled=cache_enabled,
             )
             cache_outcome = result.cache_outcome
             has_filters = result.has_filters
@@ -635,13 +678,6 @@ class UploadMetricsView(GenericAPIView):
         TenantMetricsSnapshot.objects.filter(tenant=tenant, source="upload").delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-class _Echo:
-    """Minimal buffer to adapt csv.writer for streaming responses."""
-
-    def write(self, value: str) -> str:  # pragma: no cover - trivial adapter
-        return value
-
-
 class MetricsExportView(APIView):
     """Stream tenant metrics as a CSV attachment."""
 
@@ -669,23 +705,15 @@ class MetricsExportView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        rows = _fetch_metric_rows(tenant_id=str(tenant_id), filters=filters)
-        data = MetricRecordSerializer(rows, many=True).data
-
+        # The query only runs once the header line has gone out; rows are then
+        # pulled in fetchmany batches so memory stays flat on large tenants.
+        rows = _iter_metric_export_rows(tenant_id=str(tenant_id), filters=filters)
         response = StreamingHttpResponse(
-            self._iter_csv_rows(METRIC_EXPORT_HEADERS, data), content_type="text/csv"
+            iter_csv_lines(METRIC_EXPORT_HEADERS, rows), content_type="text/csv"
         )
         response["Content-Disposition"] = 'attachment; filename="metrics.csv"'
         return response
 
-    @staticmethod
-    def _iter_csv_rows(headers: Sequence[str], rows: Iterable[dict[str, Any]]):
-        pseudo_buffer = _Echo()
-        writer = csv.writer(pseudo_buffer)
-        yield writer.writerow(headers)
-        for row in rows:
-            yield writer.writerow([row.get(header) for header in headers])
-
 
 def _default_snapshot_payload(*, tenant_id: str) -> dict[str, Any]:
     metrics = default_snapshot_metrics(tenant_id=tenant_id)
@@ -734,21 +762,48 @@ class AggregateSnapshotView(APIView):
 
 
 class ParishGeometryView(APIView):
-    """Serve static parish GeoJSON used by the map view."""
+    """Serve precomputed parish GeoJSON used by the map view.
+
+    ``?resolution=full|medium|low`` picks a simplification level; the body is
+    sent pre-encoded, so a request costs a dict lookup and a header check.
+    """
 
     permission_classes = [permissions.IsAuthenticated]
 
-    def get(self, request) -> Response:  # noqa: D401 - DRF signature
-        payload = _load_parish_geojson()
-        if payload is None:
+    def get(self, request) -> HttpResponse:  # noqa: D401 - DRF signature
+        resolution = request.query_params.get("resolution", DEFAULT_RESOLUTION).strip().lower()
+        if resolution not in RESOLUTIONS:
+            return Response(
+                {"detail": f"resolution must be one of: {', '.join(RESOLUTIONS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        variant = parish_geometry().variant(resolution)
+        if variant is None:
             return Response(
                 {"detail": "Parish geometry is unavailable."},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
-        return Response(payload)
+
+        accepted = [
+            encoding
+            for encoding in variant.representations
+            if _accepts_encoding(request, encoding)
+        ]
+        representation = variant.select(accepted)
+        if _etag_matches(request.headers.get("If-None-Match"), representation.etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(representation.body, content_type="application/json")
+            if representation.encoding != ENCODING_IDENTITY:
+                response["Content-Encoding"] = representation.encoding
+        max_age = int(getattr(settings, "PARISH_GEOMETRY_CACHE_MAX_AGE_SECONDS", 86400))
+        response["ETag"] = representation.etag
+        response["Cache-Control"] = f"private, max-age={max_age}"
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
 
 
-def _fetch_metric_rows(*, tenant_id: str, filters: dict[str, Any]) -> list[dict[str, Any]]:
+def _metric_rows_query(*, tenant_id: str, filters: dict[str, Any]) -> tuple[str, dict[str, Any]]:
     sql = [
         "select",
         "    date_day as date,",
@@ -785,9 +840,38 @@ def _fetch_metric_rows(*, tenant_id: str, filters: dict[str, Any]) -> list[dict[
         query_params["parish"] = parish
 
     sql.append("order by date desc")
-    sql_query = "\n".join(sql)
+    return "\n".join(sql), query_params
+
 
+def _fetch_metric_rows(*, tenant_id: str, filters: dict[str, Any]) -> list[dict[str, Any]]:
+    sql_query, query_params = _metric_rows_query(tenant_id=tenant_id, filters=filters)
     with connection.cursor() as cursor:
         cursor.execute(sql_query, query_params)
         columns: Sequence[str] = [col[0] for col in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _format_metric_export_row(row: Sequence[Any]) -> list[Any]:
+    """Mirror ``MetricRecordSerializer`` output for one ``METRIC_EXPORT_HEADERS`` row."""
+
+    day, platform, campaign, parish, impressions, clicks, spend, conversions, roas = row
+    return [
+        day if day is None or isinstance(day, str) else day.isoformat(),
+        None if platform is None else str(platform),
+        None if campaign is None else str(campaign),
+        parish,
+        None if impressions is None else int(impressions),
+        None if clicks is None else int(clicks),
+        None if spend is None else float(spend),
+        None if conversions is None else int(conversions),
+        None if roas is None else float(roas),
+    ]
+
+
+def _iter_metric_export_rows(*, tenant_id: str, filters: dict[str, Any]) -> Iterator[list[Any]]:
+    # The body is consumed after TenantMiddleware has reset the connection
+    # tenant, so RLS needs it set again for the duration of the stream.
+    with tenant_context(tenant_id):
+        sql_query, query_params = _metric_rows_query(tenant_id=tenant_id, filters=filters)
+        for row in iter_query_rows(sql_query, query_params):
+            yield _format_metric_export_row(row)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import date
-from functools import lru_cache
 from typing import Any, Mapping, Sequence
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
 from django.utils import timezone
 from django.utils.dateparse import parse_date
@@ -24,6 +27,7 @@ from adapters.warehouse import (
     WAREHOUSE_UNAVAILABLE_REASON_STALE,
     WarehouseSnapshotUnavailable,
 )
+from analytics.fx import fx_rate_engine
 from analytics.models import AdAccount, TenantMetricsSnapshot
 
 UNKNOWN_PARISH_LABELS = {"", "unknown", "unk", "n/a"}
@@ -156,52 +160,112 @@ def _normalize_parishes(value: Any) -> tuple[str, ...]:
     return _normalize_sequence(value)
 
 
-@lru_cache(maxsize=32)
-def _relation_has_column(table_name: str, column_name: str) -> bool:
-    with connection.cursor() as cursor:
-        if connection.vendor == "sqlite":
-            cursor.execute(f"PRAGMA table_info('{table_name}')")
-            columns = {row[1] for row in cursor.fetchall()}
-            return column_name in columns
-
-        cursor.execute(
-            """
-            select 1
-            from information_schema.columns
-            where table_schema = current_schema()
-              and table_name = %s
-              and column_name = %s
-            """,
-            [table_name, column_name],
-        )
-        return cursor.fetchone() is not None
+WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY = "analytics:warehouse-schema-catalog:generation"
+DEFAULT_WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS = 300
 
 
-@lru_cache(maxsize=16)
-def _relation_exists(table_name: str) -> bool:
+def _load_schema_relations() -> dict[str, frozenset[str]]:
+    """Read every relation in the current schema with its columns in one query."""
+
     with connection.cursor() as cursor:
         if connection.vendor == "sqlite":
             cursor.execute(
-                "select 1 from sqlite_master where type in ('table', 'view') and name = ?",
-                [table_name],
+                """
+                select m.name, p.name
+                from sqlite_master m
+                left join pragma_table_info(m.name) p
+                where m.type in ('table', 'view')
+                """
             )
-            return cursor.fetchone() is not None
-
-        cursor.execute(
-            """
-            select 1
-            from information_schema.tables
-            where table_schema = current_schema()
-              and table_name = %s
-            union all
-            select 1
-            from information_schema.views
-            where table_schema = current_schema()
-              and table_name = %s
-            """,
-            [table_name, table_name],
+        else:
+            cursor.execute(
+                """
+                select t.table_name, c.column_name
+                from information_schema.tables t
+                left join information_schema.columns c
+                  on c.table_schema = t.table_schema
+                 and c.table_name = t.table_name
+                where t.table_schema = current_schema()
+                """
+            )
+        rows = cursor.fetchall()
+
+    relations: dict[str, set[str]] = {}
+    for table_name, column_name in rows:
+        columns = relations.setdefault(table_name, set())
+        if column_name is not None:
+            columns.add(column_name)
+    return {name: frozenset(columns) for name, columns in relations.items()}
+
+
+class WarehouseSchemaCatalog:
+    """Process-wide cache of warehouse relation and column metadata.
+
+    The catalog loads the whole schema once and serves probes from memory until
+    ``WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS`` elapses or another process bumps
+    the shared generation marker (after dbt runs and snapshot refreshes).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._relations: dict[str, frozenset[str]] | None = None
+        self._loaded_at = 0.0
+        self._generation: Any = None
+
+    def refresh_if_stale(self) -> None:
+        """Drop the local copy when the shared generation marker has moved."""
+
+        generation = cache.get(WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY)
+        with self._lock:
+            if generation != self._generation:
+                self._relations = None
+                self._generation = generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._relations = None
+
+    def has_relation(self, table_name: str) -> bool:
+        return table_name in self._snapshot()
+
+    def has_column(self, table_name: str, column_name: str) -> bool:
+        return column_name in self._snapshot().get(table_name, frozenset())
+
+    def _snapshot(self) -> dict[str, frozenset[str]]:
+        ttl_seconds = max(
+            int(
+                getattr(
+                    settings,
+                    "WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS",
+                    DEFAULT_WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS,
+                )
+            ),
+            1,
         )
-        return cursor.fetchone() is not None
+        with self._lock:
+            now = time.monotonic()
+            if self._relations is None or now - self._loaded_at >= ttl_seconds:
+                self._relations = _load_schema_relations()
+                self._loaded_at = now
+            return self._relations
+
+
+warehouse_schema_catalog = WarehouseSchemaCatalog()
+
+
+def invalidate_warehouse_schema_catalog() -> None:
+    """Force every process to reload warehouse metadata on its next request."""
+
+    cache.set(WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+    warehouse_schema_catalog.invalidate()
+
+
+def _relation_has_column(table_name: str, column_name: str) -> bool:
+    return warehouse_schema_catalog.has_column(table_name, column_name)
+
+
+def _relation_exists(table_name: str) -> bool:
+    return warehouse_schema_catalog.has_relation(table_name)
 
 
 def _fetch_rows(sql: str, params: Sequence[Any]) -> list[dict[str, Any]]:
@@ -438,24 +502,108 @@ def _build_account_currency_lookup(tenant_id: str) -> dict[str, str]:
     return lookup
 
 
+def _account_currency(currency_lookup: Mapping[str, str], account_id: Any) -> str | None:
+    if not isinstance(account_id, str):
+        return None
+    for alias in _account_aliases(account_id):
+        currency = currency_lookup.get(alias)
+        if currency:
+            return currency
+    return None
+
+
 def _resolve_currency_for_accounts(
     *,
     tenant_id: str,
     ranked_account_rows: Sequence[Mapping[str, Any]],
     fallback: str = "USD",
+    currency_lookup: Mapping[str, str] | None = None,
 ) -> str:
-    currency_lookup = _build_account_currency_lookup(tenant_id)
+    if currency_lookup is None:
+        currency_lookup = _build_account_currency_lookup(tenant_id)
     for row in ranked_account_rows:
-        account_id = row.get("ad_account_id")
-        if not isinstance(account_id, str):
-            continue
-        for alias in _account_aliases(account_id):
-            currency = currency_lookup.get(alias)
-            if currency:
-                return currency
+        currency = _account_currency(currency_lookup, row.get("ad_account_id"))
+        if currency:
+            return currency
     return fallback
 
 
+def _convert_trend_spend(
+    summary: dict[str, Any],
+    trend: list[dict[str, Any]],
+    *,
+    currency_lookup: Mapping[str, str],
+) -> None:
+    """Re-express mixed-currency spend in the summary currency.
+
+    SQL totals add raw spend across accounts. When an account bills in another
+    currency its date × account trend points are converted as one column
+    through the FX engine, the summary spend is re-totalled and the
+    spend-derived ratios recomputed. Points without a rate keep their native
+    spend, are left out of the total and are counted in ``fxUnconvertedPoints``.
+    """
+
+    currency = summary["currency"]
+    foreign: list[tuple[dict[str, Any], str, date]] = []
+    for point in trend:
+        point_currency = _account_currency(currency_lookup, point.get("adAccountId")) or currency
+        point_date = parse_date(str(point.get("date") or "")[:10])
+        if point_currency != currency and point_date is not None:
+            foreign.append((point, point_currency, point_date))
+    if not foreign:
+        return
+
+    converted = fx_rate_engine().convert_column(
+        [point["spend"] for point, _, _ in foreign],
+        currencies=[point_currency for _, point_currency, _ in foreign],
+        dates=[point_date for _, _, point_date in foreign],
+        target=currency,
+    )
+    total_spend = summary["totalSpend"]
+    unconverted = 0
+    for (point, _, _), amount in zip(foreign, converted):
+        total_spend -= point["spend"]
+        if amount is None:
+            unconverted += 1
+            continue
+        point["spend"] = float(amount)
+        total_spend += point["spend"]
+
+    clicks = summary["totalClicks"]
+    impressions = summary["totalImpressions"]
+    conversions = summary["totalConversions"]
+    summary.update(
+        {
+            "totalSpend": total_spend,
+            "averageRoas": (conversions / total_spend) if total_spend else 0.0,
+            "cpc": (total_spend / clicks) if clicks else 0.0,
+            "cpm": ((total_spend / impressions) * 1000) if impressions else 0.0,
+            "cpa": (total_spend / conversions) if conversions else 0.0,
+            "sourceCurrencies": sorted({currency, *(ccy for _, ccy, _ in foreign)}),
+            "fxUnconvertedPoints": unconverted,
+        }
+    )
+
+
+def _campaign_summary_and_trend(
+    *,
+    tenant_id: str,
+    total_row: Mapping[str, Any],
+    ranked_account_rows: Sequence[Mapping[str, Any]],
+    trend_rows: Sequence[Mapping[str, Any]],
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    currency_lookup = _build_account_currency_lookup(tenant_id)
+    currency = _resolve_currency_for_accounts(
+        tenant_id=tenant_id,
+        ranked_account_rows=ranked_account_rows,
+        currency_lookup=currency_lookup,
+    )
+    summary = _summary_payload(total_row, currency=currency)
+    trend = [_trend_point_payload(row) for row in trend_rows]
+    _convert_trend_spend(summary, trend, currency_lookup=currency_lookup)
+    return summary, trend
+
+
 def _distinct_parishes_sql(column: str, alias: str = "parishes") -> str:
     if connection.vendor == "sqlite":
         return f"json_group_array(distinct {column}) as {alias}"
@@ -683,16 +831,121 @@ def _fetch_coverage(
     )
 
 
+def _campaign_reach_sum_sql(alias: str) -> str:
+    if _relation_has_column("vw_campaign_daily", "reach"):
+        return f"coalesce(sum({alias}.reach), 0)"
+    return "0"
+
+
+def _campaign_summary_columns_sql(alias: str, reach_sum_expr: str) -> str:
+    frequency_expr = (
+        f"case when {reach_sum_expr} = 0 then 0 else coalesce(sum({alias}.impressions), 0) / {reach_sum_expr} end"
+    )
+    return f"""
+            coalesce(sum({alias}.spend), 0) as total_spend,
+            coalesce(sum({alias}.impressions), 0) as total_impressions,
+            coalesce(sum({alias}.clicks), 0) as total_clicks,
+            coalesce(sum({alias}.conversions), 0) as total_conversions,
+            {reach_sum_expr} as total_reach,
+            case when coalesce(sum({alias}.spend), 0) = 0 then 0 else coalesce(sum({alias}.conversions), 0) / sum({alias}.spend) end as average_roas,
+            case when coalesce(sum({alias}.impressions), 0) = 0 then 0 else coalesce(sum({alias}.clicks), 0) / sum({alias}.impressions) end as ctr,
+            case when coalesce(sum({alias}.clicks), 0) = 0 then 0 else coalesce(sum({alias}.spend), 0) / sum({alias}.clicks) end as cpc,
+            case when coalesce(sum({alias}.impressions), 0) = 0 then 0 else (coalesce(sum({alias}.spend), 0) / sum({alias}.impressions)) * 1000 end as cpm,
+            case when coalesce(sum({alias}.conversions), 0) = 0 then 0 else coalesce(sum({alias}.spend), 0) / sum({alias}.conversions) end as cpa,
+            {frequency_expr} as frequency"""
+
+
+def _summary_payload(row: Mapping[str, Any], *, currency: str) -> dict[str, Any]:
+    return {
+        "currency": currency,
+        "totalSpend": _coerce_float(row.get("total_spend")),
+        "totalImpressions": _coerce_int(row.get("total_impressions")),
+        "totalClicks": _coerce_int(row.get("total_clicks")),
+        "totalConversions": _coerce_int(row.get("total_conversions")),
+        "totalReach": _coerce_int(row.get("total_reach")),
+        "averageRoas": _coerce_float(row.get("average_roas")),
+        "ctr": _coerce_float(row.get("ctr")),
+        "cpc": _coerce_float(row.get("cpc")),
+        "cpm": _coerce_float(row.get("cpm")),
+        "cpa": _coerce_float(row.get("cpa")),
+        "frequency": _coerce_float(row.get("frequency")),
+    }
+
+
+def _trend_point_payload(row: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "date": _normalize_date_string(row.get("date")),
+        "adAccountId": row.get("ad_account_id") or "",
+        "spend": _coerce_float(row.get("spend")),
+        "impressions": _coerce_int(row.get("impressions")),
+        "clicks": _coerce_int(row.get("clicks")),
+        "conversions": _coerce_int(row.get("conversions")),
+        "reach": _coerce_int(row.get("reach")),
+    }
+
+
+def _campaign_row_payload(row: Mapping[str, Any]) -> dict[str, Any]:
+    spend = _coerce_float(row.get("spend"))
+    impressions = _coerce_int(row.get("impressions"))
+    clicks = _coerce_int(row.get("clicks"))
+    conversions = _coerce_int(row.get("conversions"))
+    reach = _coerce_int(row.get("reach"))
+    parishes = _coerce_text_list(row.get("parishes"))
+    return {
+        "id": row.get("id") or "",
+        "adAccountId": row.get("ad_account_id") or "",
+        "name": row.get("name") or "Unnamed campaign",
+        "platform": _platform_label(row.get("source_platform")),
+        "status": row.get("status") or "Unknown",
+        "objective": row.get("objective") or "",
+        "parishes": parishes or ["Unknown"],
+        "spend": spend,
+        "impressions": impressions,
+        "reach": reach,
+        "clicks": clicks,
+        "conversions": conversions,
+        "roas": (conversions / spend) if spend else 0.0,
+        "ctr": (clicks / impressions) if impressions else 0.0,
+        "cpc": (spend / clicks) if clicks else 0.0,
+        "cpm": ((spend / impressions) * 1000) if impressions else 0.0,
+        "cpa": (spend / conversions) if conversions else 0.0,
+        "frequency": (impressions / reach) if reach else 0.0,
+        "startDate": _normalize_date_string(row.get("start_date")),
+        "endDate": _normalize_date_string(row.get("end_date")),
+    }
+
+
+def _parish_row_payload(row: Mapping[str, Any], *, currency: str) -> dict[str, Any]:
+    spend = _coerce_float(row.get("spend"))
+    impressions = _coerce_int(row.get("impressions"))
+    clicks = _coerce_int(row.get("clicks"))
+    conversions = _coerce_int(row.get("conversions"))
+    reach = _coerce_int(row.get("reach"))
+    return {
+        "adAccountId": row.get("ad_account_id") or "",
+        "parish": row.get("parish") or "Unknown",
+        "spend": spend,
+        "impressions": impressions,
+        "reach": reach,
+        "clicks": clicks,
+        "conversions": conversions,
+        "roas": (conversions / spend) if spend else 0.0,
+        "ctr": (clicks / impressions) if impressions else 0.0,
+        "cpc": (spend / clicks) if clicks else 0.0,
+        "cpm": ((spend / impressions) * 1000) if impressions else 0.0,
+        "cpa": (spend / conversions) if conversions else 0.0,
+        "frequency": (impressions / reach) if reach else 0.0,
+        "campaignCount": _coerce_int(row.get("campaign_count")),
+        "currency": currency,
+    }
+
+
 def _fetch_campaign_payload(
     *,
     tenant_id: str,
     filters: WarehouseCombinedFilters,
 ) -> dict[str, Any]:
-    has_reach = _relation_has_column("vw_campaign_daily", "reach")
-    reach_sum_expr = "coalesce(sum(c.reach), 0)" if has_reach else "0"
-    frequency_expr = (
-        f"case when {reach_sum_expr} = 0 then 0 else coalesce(sum(c.impressions), 0) / {reach_sum_expr} end"
-    )
+    reach_sum_expr = _campaign_reach_sum_sql("c")
 
     where_clauses, params = _build_campaign_where(
         alias="c",
@@ -712,42 +965,13 @@ def _fetch_campaign_payload(
         order by spend desc, c.ad_account_id asc
     """
     ranked_account_rows = _fetch_rows(ranked_account_sql, params)
-    currency = _resolve_currency_for_accounts(
-        tenant_id=tenant_id,
-        ranked_account_rows=ranked_account_rows,
-    )
 
     summary_sql = f"""
-        select
-            coalesce(sum(c.spend), 0) as total_spend,
-            coalesce(sum(c.impressions), 0) as total_impressions,
-            coalesce(sum(c.clicks), 0) as total_clicks,
-            coalesce(sum(c.conversions), 0) as total_conversions,
-            {reach_sum_expr} as total_reach,
-            case when coalesce(sum(c.spend), 0) = 0 then 0 else coalesce(sum(c.conversions), 0) / sum(c.spend) end as average_roas,
-            case when coalesce(sum(c.impressions), 0) = 0 then 0 else coalesce(sum(c.clicks), 0) / sum(c.impressions) end as ctr,
-            case when coalesce(sum(c.clicks), 0) = 0 then 0 else coalesce(sum(c.spend), 0) / sum(c.clicks) end as cpc,
-            case when coalesce(sum(c.impressions), 0) = 0 then 0 else (coalesce(sum(c.spend), 0) / sum(c.impressions)) * 1000 end as cpm,
-            case when coalesce(sum(c.conversions), 0) = 0 then 0 else coalesce(sum(c.spend), 0) / sum(c.conversions) end as cpa,
-            {frequency_expr} as frequency
+        select{_campaign_summary_columns_sql("c", reach_sum_expr)}
         from vw_campaign_daily c
         where {where_sql}
     """
-    summary_row = _fetch_one(summary_sql, params) or {}
-    summary = {
-        "currency": currency,
-        "totalSpend": _coerce_float(summary_row.get("total_spend")),
-        "totalImpressions": _coerce_int(summary_row.get("total_impressions")),
-        "totalClicks": _coerce_int(summary_row.get("total_clicks")),
-        "totalConversions": _coerce_int(summary_row.get("total_conversions")),
-        "totalReach": _coerce_int(summary_row.get("total_reach")),
-        "averageRoas": _coerce_float(summary_row.get("average_roas")),
-        "ctr": _coerce_float(summary_row.get("ctr")),
-        "cpc": _coerce_float(summary_row.get("cpc")),
-        "cpm": _coerce_float(summary_row.get("cpm")),
-        "cpa": _coerce_float(summary_row.get("cpa")),
-        "frequency": _coerce_float(summary_row.get("frequency")),
-    }
+    total_row = _fetch_one(summary_sql, params) or {}
 
     trend_sql = f"""
         select
@@ -763,18 +987,12 @@ def _fetch_campaign_payload(
         group by c.date_day, c.ad_account_id
         order by c.date_day asc, c.ad_account_id asc
     """
-    trend_rows = [
-        {
-            "date": _normalize_date_string(row.get("date")),
-            "adAccountId": row.get("ad_account_id") or "",
-            "spend": _coerce_float(row.get("spend")),
-            "impressions": _coerce_int(row.get("impressions")),
-            "clicks": _coerce_int(row.get("clicks")),
-            "conversions": _coerce_int(row.get("conversions")),
-            "reach": _coerce_int(row.get("reach")),
-        }
-        for row in _fetch_rows(trend_sql, params)
-    ]
+    summary, trend_rows = _campaign_summary_and_trend(
+        tenant_id=tenant_id,
+        total_row=total_row,
+        ranked_account_rows=ranked_account_rows,
+        trend_rows=_fetch_rows(trend_sql, params),
+    )
 
     rows_sql = f"""
         select
@@ -798,38 +1016,7 @@ def _fetch_campaign_payload(
         order by spend desc, name asc
         limit 100
     """
-    rows = []
-    for row in _fetch_rows(rows_sql, params):
-        spend = _coerce_float(row.get("spend"))
-        impressions = _coerce_int(row.get("impressions"))
-        clicks = _coerce_int(row.get("clicks"))
-        conversions = _coerce_int(row.get("conversions"))
-        reach = _coerce_int(row.get("reach"))
-        parishes = _coerce_text_list(row.get("parishes"))
-        rows.append(
-            {
-                "id": row.get("id") or "",
-                "adAccountId": row.get("ad_account_id") or "",
-                "name": row.get("name") or "Unnamed campaign",
-                "platform": _platform_label(row.get("source_platform")),
-                "status": row.get("status") or "Unknown",
-                "objective": row.get("objective") or "",
-                "parishes": parishes or ["Unknown"],
-                "spend": spend,
-                "impressions": impressions,
-                "reach": reach,
-                "clicks": clicks,
-                "conversions": conversions,
-                "roas": (conversions / spend) if spend else 0.0,
-                "ctr": (clicks / impressions) if impressions else 0.0,
-                "cpc": (spend / clicks) if clicks else 0.0,
-                "cpm": ((spend / impressions) * 1000) if impressions else 0.0,
-                "cpa": (spend / conversions) if conversions else 0.0,
-                "frequency": (impressions / reach) if reach else 0.0,
-                "startDate": _normalize_date_string(row.get("start_date")),
-                "endDate": _normalize_date_string(row.get("end_date")),
-            }
-        )
+    rows = [_campaign_row_payload(row) for row in _fetch_rows(rows_sql, params)]
 
     return {"summary": summary, "trend": trend_rows, "rows": rows}
 
@@ -1067,8 +1254,7 @@ def _fetch_budget_rows(*, tenant_id: str, filters: WarehouseCombinedFilters) ->
 
 
 def _fetch_parish_rows(*, tenant_id: str, filters: WarehouseCombinedFilters) -> list[dict[str, Any]]:
-    has_reach = _relation_has_column("vw_campaign_daily", "reach")
-    reach_sum_expr = "coalesce(sum(c.reach), 0)" if has_reach else "0"
+    reach_sum_expr = _campaign_reach_sum_sql("c")
     where_clauses, params = _build_campaign_where(
         alias="c",
         tenant_id=tenant_id,
@@ -1106,33 +1292,153 @@ def _fetch_parish_rows(*, tenant_id: str, filters: WarehouseCombinedFilters) ->
         tenant_id=tenant_id,
         ranked_account_rows=ranked_account_rows,
     )
-    rows = []
-    for row in _fetch_rows(sql, params):
-        spend = _coerce_float(row.get("spend"))
-        impressions = _coerce_int(row.get("impressions"))
-        clicks = _coerce_int(row.get("clicks"))
-        conversions = _coerce_int(row.get("conversions"))
-        reach = _coerce_int(row.get("reach"))
-        rows.append(
-            {
-                "adAccountId": row.get("ad_account_id") or "",
-                "parish": row.get("parish") or "Unknown",
-                "spend": spend,
-                "impressions": impressions,
-                "reach": reach,
-                "clicks": clicks,
-                "conversions": conversions,
-                "roas": (conversions / spend) if spend else 0.0,
-                "ctr": (clicks / impressions) if impressions else 0.0,
-                "cpc": (spend / clicks) if clicks else 0.0,
-                "cpm": ((spend / impressions) * 1000) if impressions else 0.0,
-                "cpa": (spend / conversions) if conversions else 0.0,
-                "frequency": (impressions / reach) if reach else 0.0,
-                "campaignCount": _coerce_int(row.get("campaign_count")),
-                "currency": currency,
-            }
+    return [_parish_row_payload(row, currency=currency) for row in _fetch_rows(sql, params)]
+
+
+# ``grouping(date_day, ad_account_id, campaign_id, parish)`` ids of the single-pass
+# grouping sets; a set bit means the column is rolled up in that set.
+_SINGLE_PASS_TOTAL = 0b1111
+_SINGLE_PASS_ACCOUNT = 0b1011
+_SINGLE_PASS_TREND = 0b0011
+_SINGLE_PASS_CAMPAIGN = 0b1001
+_SINGLE_PASS_PARISH = 0b1010
+
+
+def _use_single_pass_plan() -> bool:
+    # GROUPING SETS and MATERIALIZED CTEs need Postgres; SQLite keeps the
+    # per-section queries.
+    return bool(getattr(settings, "WAREHOUSE_SINGLE_PASS_QUERY_PLAN", True)) and (
+        connection.vendor == "postgresql"
+    )
+
+
+def _fetch_campaign_slice_single_pass(
+    *,
+    tenant_id: str,
+    filters: WarehouseCombinedFilters,
+) -> tuple[DatasetCoverage, dict[str, Any], list[dict[str, Any]]]:
+    """Coverage, campaign payload and parish rows from one scan of ``vw_campaign_daily``.
+
+    The filtered slice is materialized once and rolled up with GROUPING SETS;
+    each set keeps the ordering and LIMIT of its per-section query so the
+    payload matches ``_fetch_coverage``/``_fetch_campaign_payload``/``_fetch_parish_rows``.
+    """
+
+    where_clauses, params = _build_campaign_where(
+        alias="c",
+        tenant_id=tenant_id,
+        filters=filters,
+        include_parish=True,
+        include_search=True,
+    )
+    has_reach = _relation_has_column("vw_campaign_daily", "reach")
+    reach_sum_expr = "coalesce(sum(f.reach), 0)" if has_reach else "0"
+    sql = f"""
+        with filtered as materialized (
+            select
+                c.date_day,
+                c.ad_account_id,
+                c.campaign_id,
+                c.campaign_name,
+                c.source_platform,
+                coalesce(c.parish_name, 'Unknown') as parish,
+                c.spend,
+                c.impressions,
+                c.clicks,
+                c.conversions,
+                {"c.reach" if has_reach else "0"} as reach,
+                {"c.status" if _relation_has_column("vw_campaign_daily", "status") else "cast(null as text)"} as status,
+                {"c.objective" if _relation_has_column("vw_campaign_daily", "objective") else "cast(null as text)"} as objective
+            from vw_campaign_daily c
+            where {" and ".join(where_clauses)}
+        ),
+        grouped as (
+            select
+                grouping(f.date_day, f.ad_account_id, f.campaign_id, f.parish) as grouping_id,
+                f.date_day as date,
+                f.ad_account_id as ad_account_id,
+                f.campaign_id as id,
+                f.parish as parish,
+                max(f.campaign_name) as name,
+                max(f.source_platform) as source_platform,
+                {_distinct_parishes_sql("f.parish")},
+                coalesce(sum(f.spend), 0) as spend,
+                coalesce(sum(f.impressions), 0) as impressions,
+                coalesce(sum(f.clicks), 0) as clicks,
+                coalesce(sum(f.conversions), 0) as conversions,
+                {reach_sum_expr} as reach,
+                max(f.status) as status,
+                max(f.objective) as objective,
+                min(f.date_day) as start_date,
+                max(f.date_day) as end_date,
+                count(*) as row_count,
+                count(distinct f.campaign_id) as campaign_count,{_campaign_summary_columns_sql("f", reach_sum_expr)}
+            from filtered f
+            group by grouping sets (
+                (),
+                (f.ad_account_id),
+                (f.date_day, f.ad_account_id),
+                (f.campaign_id, f.ad_account_id),
+                (f.ad_account_id, f.parish)
+            )
+        ),
+        ranked as (
+            select
+                g.*,
+                row_number() over (
+                    partition by g.grouping_id
+                    order by
+                        case when g.grouping_id = {_SINGLE_PASS_TREND} then g.date end asc,
+                        case when g.grouping_id <> {_SINGLE_PASS_TREND} then g.spend end desc,
+                        case g.grouping_id
+                            when {_SINGLE_PASS_CAMPAIGN} then g.name
+                            when {_SINGLE_PASS_PARISH} then g.parish
+                            else g.ad_account_id
+                        end asc
+                ) as position
+            from grouped g
         )
-    return rows
+        select *
+        from ranked
+        where not (grouping_id = {_SINGLE_PASS_CAMPAIGN} and position > 100)
+          and not (grouping_id = {_SINGLE_PASS_PARISH} and position > 50)
+        order by grouping_id, position
+    """
+    return _split_single_pass_rows(tenant_id=tenant_id, rows=_fetch_rows(sql, params))
+
+
+def _split_single_pass_rows(
+    *,
+    tenant_id: str,
+    rows: Sequence[Mapping[str, Any]],
+) -> tuple[DatasetCoverage, dict[str, Any], list[dict[str, Any]]]:
+    by_set: dict[int, list[Mapping[str, Any]]] = {}
+    for row in rows:
+        by_set.setdefault(_coerce_int(row.get("grouping_id")), []).append(row)
+
+    total = next(iter(by_set.get(_SINGLE_PASS_TOTAL, ())), {})
+    summary, trend = _campaign_summary_and_trend(
+        tenant_id=tenant_id,
+        total_row=total,
+        ranked_account_rows=by_set.get(_SINGLE_PASS_ACCOUNT, []),
+        trend_rows=by_set.get(_SINGLE_PASS_TREND, []),
+    )
+    currency = summary["currency"]
+    coverage = DatasetCoverage(
+        start_date=total.get("start_date"),
+        end_date=total.get("end_date"),
+        row_count=_coerce_int(total.get("row_count")),
+    )
+    campaign = {
+        "summary": summary,
+        "trend": trend,
+        "rows": [_campaign_row_payload(row) for row in by_set.get(_SINGLE_PASS_CAMPAIGN, [])],
+    }
+    parish = [
+        _parish_row_payload(row, currency=currency)
+        for row in by_set.get(_SINGLE_PASS_PARISH, [])
+    ]
+    return coverage, campaign, parish
 
 
 def load_filtered_warehouse_metrics(
@@ -1149,15 +1455,24 @@ def load_filtered_warehouse_metrics(
         ttl_seconds=ttl_seconds,
     )
     filters = WarehouseCombinedFilters.from_options(options)
-    base_coverage = _fetch_coverage(
-        tenant_id=tenant_id,
-        filters=filters.without_search_and_parish(),
+    warehouse_schema_catalog.refresh_if_stale()
+    if _use_single_pass_plan():
+        coverage, campaign, parish = _fetch_campaign_slice_single_pass(
+            tenant_id=tenant_id,
+            filters=filters,
+        )
+    else:
+        coverage = _fetch_coverage(tenant_id=tenant_id, filters=filters)
+        campaign = _fetch_campaign_payload(tenant_id=tenant_id, filters=filters)
+        parish = _fetch_parish_rows(tenant_id=tenant_id, filters=filters)
+    base_filters = filters.without_search_and_parish()
+    base_coverage = (
+        coverage
+        if base_filters == filters
+        else _fetch_coverage(tenant_id=tenant_id, filters=base_filters)
     )
-    coverage = _fetch_coverage(tenant_id=tenant_id, filters=filters)
-    campaign = _fetch_campaign_payload(tenant_id=tenant_id, filters=filters)
     creative = _fetch_creative_rows(tenant_id=tenant_id, filters=filters)
     budget = _fetch_budget_rows(tenant_id=tenant_id, filters=filters)
-    parish = _fetch_parish_rows(tenant_id=tenant_id, filters=filters)
 
     payload = {
         "tenant_id": tenant_id,
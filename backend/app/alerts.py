@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import logging
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import date
 from typing import Any, Mapping
 
-from django.db import connection
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -21,12 +26,99 @@ class AlertRule:
     max_rows: int = 25
     parameters: Mapping[str, Any] | None = None
     tenant_id: str | None = None
+    # Name of the ALERT_WINDOWS table ``sql`` reads; ``None`` for rules that
+    # query the warehouse directly.
+    window: str | None = None
 
 
 def _strip_sql(sql: str) -> str:
     return "\n".join(line.rstrip() for line in sql.strip().splitlines())
 
 
+@dataclass(frozen=True)
+class AlertWindow:
+    """A trailing-window table shared by every rule that reads it in a cycle.
+
+    ``sql`` scans its source view once from ``%(window_start)s``; the result is
+    materialised as a connection-scoped temporary ``table`` that rules query
+    with plain predicates.
+    """
+
+    name: str
+    table: str
+    sql: str
+    index_columns: tuple[str, ...] = ()
+
+
+ALERT_WINDOWS: dict[str, AlertWindow] = {
+    window.name: window
+    for window in (
+        AlertWindow(
+            name="campaign",
+            table="alert_window_campaign",
+            sql=_strip_sql(
+                """
+                select
+                    c.*,
+                    cast(c.tenant_id as text) as tenant_ref,
+                    avg(c.ctr) over (
+                        partition by c.source_platform, c.ad_account_id, c.campaign_id
+                        order by c.date_day
+                        rows between 7 preceding and 1 preceding
+                    ) as trailing_ctr,
+                    row_number() over (
+                        partition by c.source_platform, c.ad_account_id, c.campaign_id
+                        order by c.date_day desc
+                    ) as recency_rank
+                from vw_campaign_daily c
+                where c.date_day >= %(window_start)s
+                """
+            ),
+            index_columns=("tenant_ref", "date_day"),
+        ),
+        AlertWindow(
+            name="pacing",
+            table="alert_window_pacing",
+            sql=_strip_sql(
+                """
+                select
+                    p.*,
+                    row_number() over (
+                        partition by p.source_platform, p.ad_account_id
+                        order by p.date_day desc
+                    ) as recency_rank
+                from vw_pacing p
+                where p.date_day >= %(window_start)s
+                """
+            ),
+            index_columns=("recency_rank",),
+        ),
+        AlertWindow(
+            name="creative",
+            table="alert_window_creative",
+            sql=_strip_sql(
+                """
+                select
+                    d.*,
+                    avg(d.cpm) over (
+                        partition by d.source_platform, d.ad_account_id, d.ad_id
+                        order by d.date_day
+                        rows between 7 preceding and 1 preceding
+                    ) as trailing_cpm,
+                    row_number() over (
+                        partition by d.source_platform, d.ad_account_id, d.ad_id
+                        order by d.date_day desc
+                    ) as recency_rank
+                from vw_creative_daily d
+                where d.date_day >= %(window_start)s
+                """
+            ),
+            index_columns=("recency_rank",),
+        ),
+    )
+}
+
+
 ALERT_RULES: tuple[AlertRule, ...] = (
     AlertRule(
         slug="campaign_ctr_drop",
@@ -38,26 +130,6 @@ ALERT_RULES: tuple[AlertRule, ...] = (
         severity="high",
         sql=_strip_sql(
             """
-            with ranked as (
-                select
-                    date_day,
-                    source_platform,
-                    ad_account_id,
-                    campaign_id,
-                    parish_name,
-                    spend,
-                    ctr,
-                    avg(ctr) over (
-                        partition by source_platform, ad_account_id, campaign_id
-                        order by date_day
-                        rows between 7 preceding and 1 preceding
-                    ) as trailing_ctr,
-                    row_number() over (
-                        partition by source_platform, ad_account_id, campaign_id
-                        order by date_day desc
-                    ) as recency_rank
-                from vw_campaign_daily
-            )
             select
                 date_day,
                 source_platform,
@@ -70,7 +142,7 @@ ALERT_RULES: tuple[AlertRule, ...] = (
                 case
                     when trailing_ctr > 0 then ctr / nullif(trailing_ctr, 0)
                 end as ctr_vs_trailing
-            from ranked
+            from alert_window_campaign
             where recency_rank = 1
               and trailing_ctr is not null
               and trailing_ctr > 0.0005
@@ -80,6 +152,7 @@ ALERT_RULES: tuple[AlertRule, ...] = (
             limit %(limit)s
             """
         ),
+        window="campaign",
     ),
     AlertRule(
         slug="account_spend_spike",
@@ -91,19 +164,6 @@ ALERT_RULES: tuple[AlertRule, ...] = (
         severity="medium",
         sql=_strip_sql(
             """
-            with windowed as (
-                select
-                    date_day,
-                    source_platform,
-                    ad_account_id,
-                    spend,
-                    trailing_7d_avg_spend,
-                    row_number() over (
-                        partition by source_platform, ad_account_id
-                        order by date_day desc
-                    ) as recency_rank
-                from vw_pacing
-            )
             select
                 date_day,
                 source_platform,
@@ -114,7 +174,7 @@ ALERT_RULES: tuple[AlertRule, ...] = (
                 case
                     when trailing_7d_avg_spend > 0 then spend / nullif(trailing_7d_avg_spend, 0)
                 end as spend_vs_avg
-            from windowed
+            from alert_window_pacing
             where recency_rank = 1
               and trailing_7d_avg_spend is not null
               and spend > trailing_7d_avg_spend * 1.4
@@ -123,6 +183,7 @@ ALERT_RULES: tuple[AlertRule, ...] = (
             limit %(limit)s
             """
         ),
+        window="pacing",
     ),
     AlertRule(
         slug="creative_cpm_outlier",
@@ -134,28 +195,6 @@ ALERT_RULES: tuple[AlertRule, ...] = (
         severity="medium",
         sql=_strip_sql(
             """
-            with ranked as (
-                select
-                    date_day,
-                    source_platform,
-                    ad_account_id,
-                    ad_id,
-                    adset_id,
-                    campaign_id,
-                    impressions,
-                    spend,
-                    cpm,
-                    avg(cpm) over (
-                        partition by source_platform, ad_account_id, ad_id
-                        order by date_day
-                        rows between 7 preceding and 1 preceding
-                    ) as trailing_cpm,
-                    row_number() over (
-                        partition by source_platform, ad_account_id, ad_id
-                        order by date_day desc
-                    ) as recency_rank
-                from vw_creative_daily
-            )
             select
                 date_day,
                 source_platform,
@@ -168,7 +207,7 @@ ALERT_RULES: tuple[AlertRule, ...] = (
                 cpm,
                 trailing_cpm,
                 cpm - trailing_cpm as cpm_variance
-            from ranked
+            from alert_window_creative
             where recency_rank = 1
               and trailing_cpm is not null
               and trailing_cpm > 0
@@ -179,6 +218,7 @@ ALERT_RULES: tuple[AlertRule, ...] = (
             limit %(limit)s
             """
         ),
+        window="creative",
     ),
 )
 
@@ -199,6 +239,50 @@ class AlertEvaluator:
     def __init__(self, django_connection=connection) -> None:
         self._connection = django_connection
 
+    @contextmanager
+    def windows(
+        self, names: Iterable[str], *, window_start: date
+    ) -> Iterator[dict[str, Exception]]:
+        """Materialise the named ALERT_WINDOWS for the duration of the block.
+
+        Each source view is scanned once; the temporary tables live on this
+        connection only, so rules reading them must run on the same thread.
+        Every window is built in its own savepoint, and the block receives the
+        windows that failed to build mapped to their error.
+        """
+
+        built: list[AlertWindow] = []
+        failed: dict[str, Exception] = {}
+        try:
+            for window in (ALERT_WINDOWS[name] for name in sorted(set(names))):
+                try:
+                    with transaction.atomic(using=self._connection.alias):
+                        with self._connection.cursor() as cursor:
+                            cursor.execute(f"drop table if exists {window.table}")
+                            cursor.execute(
+                                f"create temporary table {window.table} as {window.sql}",
+                                {"window_start": window_start},
+                            )
+                            if window.index_columns:
+                                cursor.execute(
+                                    f"create index {window.table}_idx on {window.table} "
+                                    f"({', '.join(window.index_columns)})"
+                                )
+                except Exception as exc:  # noqa: BLE001 - reported to the caller per window
+                    logger.exception("Alert window %s could not be built", window.name)
+                    failed[window.name] = exc
+                else:
+                    built.append(window)
+            yield failed
+        finally:
+            for window in built:
+                try:
+                    with transaction.atomic(using=self._connection.alias):
+                        with self._connection.cursor() as cursor:
+                            cursor.execute(f"drop table if exists {window.table}")
+                except Exception:  # noqa: BLE001 - never mask the cycle's own error
+                    logger.warning("Alert window %s could not be dropped", window.name)
+
     def run(self, rule: AlertRule) -> list[dict[str, Any]]:
         with self._connection.cursor() as cursor:
             cursor.execute(
@@ -217,4 +301,12 @@ def iter_rules() -> Iterable[AlertRule]:
     return iter(ALERT_RULES)
 
 
-__all__ = ["AlertRule", "ALERT_RULES", "AlertEvaluator", "get_rule", "iter_rules"]
+__all__ = [
+    "AlertRule",
+    "AlertWindow",
+    "ALERT_RULES",
+    "ALERT_WINDOWS",
+    "AlertEvaluator",
+    "get_rule",
+    "iter_rules",
+]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
 
@@ -17,6 +18,7 @@ if TYPE_CHECKING:  # pragma: no cover - imported for typing only
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 10.0
+DEFAULT_BATCH_CONCURRENCY = 4
 MAX_ROWS = 10
 MAX_SUMMARY_LENGTH = 800
 SYSTEM_PROMPT = (
@@ -49,6 +51,71 @@ class LLMClient:
             logger.info("LLM client disabled; returning fallback summary for %s", rule.slug)
             return self.fallback_summary(rows)
 
+        try:
+            response = httpx.post(
+                self.base_url,
+                json=self._request_body(rule, rows),
+                headers=self._headers(),
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:  # pragma: no cover - network failures
+            logger.warning("LLM request failed for %s: %s", rule.slug, exc)
+            raise LLMError("LLM request failed") from exc
+        return self._summary_from_response(response)
+
+    def summarize_batch(
+        self,
+        items: Sequence[tuple["AlertRule", list[dict[str, Any]]]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[str | LLMError]:
+        """Summarise several alerts concurrently over one pooled async client.
+
+        Results line up with ``items``; a failed item yields its ``LLMError``
+        instead of aborting the batch.
+        """
+
+        if not items:
+            return []
+        if not self.is_enabled():
+            return [self.summarize(rule, rows) for rule, rows in items]
+        return asyncio.run(self._summarize_batch(items, max(concurrency, 1)))
+
+    async def _summarize_batch(
+        self,
+        items: Sequence[tuple["AlertRule", list[dict[str, Any]]]],
+        concurrency: int,
+    ) -> list[str | LLMError]:
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(
+            headers=self._headers(), timeout=self.timeout, limits=limits
+        ) as client:
+
+            async def run(rule: "AlertRule", rows: list[dict[str, Any]]) -> str | LLMError:
+                if not rows:
+                    return "No results matched this alert; nothing to summarise."
+                async with semaphore:
+                    try:
+                        response = await client.post(
+                            self.base_url, json=self._request_body(rule, rows)
+                        )
+                        response.raise_for_status()
+                    except httpx.HTTPError as exc:  # pragma: no cover - network failures
+                        logger.warning("LLM request failed for %s: %s", rule.slug, exc)
+                        return LLMError("LLM request failed")
+                try:
+                    return self._summary_from_response(response)
+                except LLMError as exc:
+                    return exc
+
+            return list(await asyncio.gather(*(run(rule, rows) for rule, rows in items)))
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def _request_body(self, rule: "AlertRule", rows: list[dict[str, Any]]) -> dict[str, Any]:
         payload_rows = rows[:MAX_ROWS]
         prompt_payload = json.dumps(payload_rows, default=str, ensure_ascii=False)
         user_prompt = (
@@ -58,9 +125,7 @@ class LLMClient:
             "two tactical remediation steps.\n"
             f"Rows: {prompt_payload}"
         )
-
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        request_body = {
+        return {
             "model": self.model,
             "messages": [
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -70,18 +135,7 @@ class LLMClient:
             "temperature": 0.2,
         }
 
-        try:
-            response = httpx.post(
-                self.base_url,
-                json=request_body,
-                headers=headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-        except httpx.HTTPError as exc:  # pragma: no cover - network failures
-            logger.warning("LLM request failed for %s: %s", rule.slug, exc)
-            raise LLMError("LLM request failed") from exc
-
+    def _summary_from_response(self, response: httpx.Response) -> str:
         try:
             data = response.json()
         except ValueError as exc:  # pragma: no cover - defensive
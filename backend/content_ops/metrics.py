@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Protocol
+from typing import Any, Iterable, Protocol, Sequence
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import F, OuterRef, Q, Subquery
 from django.utils import timezone
 
 from integrations.models import MetaPost, MetaPostInsightPoint
@@ -29,6 +30,28 @@ REACTION_BREAKDOWN_KEYS = set(POST_REACTION_PRODUCT_BREAKDOWN_KEYS)
 IMPRESSION_METRIC_KEYS = get_content_ops_post_source_keys("impressions")
 REACH_METRIC_KEYS = get_content_ops_post_source_keys("reach")
 VIDEO_VIEW_METRIC_KEYS = get_content_ops_post_source_keys("video_views")
+SNAPSHOT_METRIC_FIELDS = (
+    "impressions",
+    "reach",
+    "engagements",
+    "clicks",
+    "saves",
+    "shares",
+    "video_views",
+)
+
+# Matches the Graph ``ids=`` multi-object read limit.
+METRIC_REFRESH_BATCH_SIZE = 50
+# (max post age, minimum time between refreshes); ``None`` covers everything older.
+METRIC_REFRESH_AGE_TIERS: tuple[tuple[timedelta | None, timedelta], ...] = (
+    (timedelta(days=2), timedelta(hours=1)),
+    (timedelta(days=7), timedelta(hours=6)),
+    (timedelta(days=30), timedelta(days=1)),
+    (None, timedelta(days=7)),
+)
+# Half the hourly refresh beat, so a post stamped slightly after the previous
+# run's selection is still due on the next run instead of the one after.
+METRIC_REFRESH_GRACE = timedelta(minutes=30)
 
 
 @dataclass(frozen=True)
@@ -66,44 +89,65 @@ class OrganicMetricsProvider(Protocol):
     def fetch_snapshot(self, post: PublishedPost) -> OrganicMetricSnapshotPayload | None:
         """Return one aggregate snapshot for a Content Ops published post."""
 
+    def fetch_snapshots(
+        self, posts: Sequence[PublishedPost]
+    ) -> dict[Any, OrganicMetricSnapshotPayload | None]:
+        """Return aggregate snapshots for many posts of one tenant, keyed by post id."""
+
 
 class SyncedMetaPostInsightsProvider:
     """Bridge already-synced Meta post insight rows into Content Ops aggregates."""
 
     def fetch_snapshot(self, post: PublishedPost) -> OrganicMetricSnapshotPayload | None:
-        if post.channel != PublishedPost.CHANNEL_FACEBOOK_PAGE:
-            return None
-        meta_post = (
+        return self.fetch_snapshots([post]).get(post.id)
+
+    def fetch_snapshots(
+        self, posts: Sequence[PublishedPost]
+    ) -> dict[Any, OrganicMetricSnapshotPayload | None]:
+        """Read the latest insight points for many posts of one tenant in two queries."""
+
+        snapshots: dict[Any, OrganicMetricSnapshotPayload | None] = {post.id: None for post in posts}
+        facebook_posts = [
+            post for post in posts if post.channel == PublishedPost.CHANNEL_FACEBOOK_PAGE
+        ]
+        if not facebook_posts:
+            return snapshots
+        tenant_id = facebook_posts[0].tenant_id
+
+        meta_post_ids: dict[str, Any] = {}
+        for meta_post_id, pk in (
             MetaPost.all_objects.filter(
-                tenant=post.tenant,
-                post_id=post.meta_post_id,
+                tenant_id=tenant_id,
+                post_id__in={post.meta_post_id for post in facebook_posts},
             )
             .order_by("-updated_at")
-            .first()
+            .values_list("post_id", "pk")
+        ):
+            meta_post_ids.setdefault(meta_post_id, pk)
+        if not meta_post_ids:
+            return snapshots
+
+        latest_end_time = (
+            MetaPostInsightPoint.all_objects.filter(tenant_id=tenant_id, post_id=OuterRef("post_id"))
+            .order_by("-end_time")
+            .values("end_time")[:1]
         )
-        if meta_post is None:
-            return None
+        points_by_post: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+        for point in (
+            MetaPostInsightPoint.all_objects.filter(
+                tenant_id=tenant_id,
+                post_id__in=meta_post_ids.values(),
+                end_time=Subquery(latest_end_time),
+            )
+            .values("post_id", "end_time", "metric_key", "value_num", "breakdown_key", "breakdown_key_normalized")
+        ):
+            points_by_post[point["post_id"]].append(point)
 
-        points = MetaPostInsightPoint.all_objects.filter(
-            tenant=post.tenant,
-            post=meta_post,
-        )
-        latest_end_time = points.order_by("-end_time").values_list("end_time", flat=True).first()
-        if latest_end_time is None:
-            return None
-        metric_date = latest_end_time.date()
-        current_points = points.filter(end_time=latest_end_time)
-        clicks = _metric_sum(current_points, "post_clicks")
-        reactions = _reaction_sum(current_points)
-        return OrganicMetricSnapshotPayload(
-            metric_date=metric_date,
-            impressions=_first_metric_sum(current_points, IMPRESSION_METRIC_KEYS),
-            reach=_first_metric_sum(current_points, REACH_METRIC_KEYS),
-            engagements=clicks + reactions,
-            clicks=clicks,
-            video_views=_first_metric_sum(current_points, VIDEO_VIEW_METRIC_KEYS),
-            source=METRIC_SOURCE_META_POST_INSIGHTS,
-        )
+        for post in facebook_posts:
+            current_points = points_by_post.get(meta_post_ids.get(post.meta_post_id))
+            if current_points:
+                snapshots[post.id] = _payload_from_points(current_points)
+        return snapshots
 
 
 def refresh_published_post_metrics(
@@ -115,7 +159,6 @@ def refresh_published_post_metrics(
 ) -> OrganicMetricRefreshResult:
     """Refresh one Content Ops published post from a fakeable metric provider."""
 
-    now = now or timezone.now()
     post = (
         PublishedPost.all_objects.select_related("tenant")
         .filter(tenant=tenant, id=published_post_id)
@@ -123,89 +166,196 @@ def refresh_published_post_metrics(
     )
     if post is None:
         return OrganicMetricRefreshResult(status="noop", reason="published_post_missing")
+    return refresh_published_posts_metrics(
+        tenant=tenant,
+        posts=[post],
+        provider=provider,
+        now=now,
+    )[0]
+
+
+def refresh_published_posts_metrics(
+    *,
+    tenant,
+    posts: Iterable[PublishedPost],
+    provider: OrganicMetricsProvider | None = None,
+    now=None,
+    batch_size: int = METRIC_REFRESH_BATCH_SIZE,
+) -> list[OrganicMetricRefreshResult]:
+    """Refresh many published posts, one provider read and one write per page batch.
+
+    Posts are grouped by publishing identity (the Page and its token) and read
+    ``batch_size`` at a time through the provider's ``fetch_snapshots``.
+    """
 
+    now = now or timezone.now()
     selected_provider = provider or SyncedMetaPostInsightsProvider()
-    payload = selected_provider.fetch_snapshot(post)
-    if payload is None:
-        _mark_reporting_state(
-            post=post,
-            state=PublishedPost.REPORTING_UNAVAILABLE,
-            refreshed_at=now,
+    posts_by_identity: dict[Any, list[PublishedPost]] = defaultdict(list)
+    for post in posts:
+        posts_by_identity[post.publishing_identity_id].append(post)
+
+    results: list[OrganicMetricRefreshResult] = []
+    for identity_posts in posts_by_identity.values():
+        for offset in range(0, len(identity_posts), max(batch_size, 1)):
+            batch = identity_posts[offset : offset + max(batch_size, 1)]
+            payloads = selected_provider.fetch_snapshots(batch)
+            results.extend(_store_snapshots(tenant=tenant, posts=batch, payloads=payloads, now=now))
+    return results
+
+
+def select_due_published_posts(*, tenant, limit: int, now=None) -> list[PublishedPost]:
+    """Return posts whose age-based refresh interval has elapsed, newest first.
+
+    Never-refreshed posts always qualify. Otherwise a post is due when its
+    last refresh is older than the interval for its age bracket in
+    ``METRIC_REFRESH_AGE_TIERS``, less ``METRIC_REFRESH_GRACE``.
+    """
+
+    now = now or timezone.now()
+    due = Q(last_metrics_refresh_at__isnull=True)
+    newer_than = None
+    for max_age, interval in METRIC_REFRESH_AGE_TIERS:
+        tier = Q(last_metrics_refresh_at__lte=now - (interval - METRIC_REFRESH_GRACE))
+        if max_age is not None:
+            tier &= Q(published_at__gte=now - max_age)
+        if newer_than is not None:
+            tier &= Q(published_at__lt=newer_than)
+        due |= tier
+        newer_than = now - max_age if max_age is not None else None
+    return list(
+        PublishedPost.all_objects.filter(tenant=tenant)
+        .filter(due)
+        .order_by(F("last_metrics_refresh_at").asc(nulls_first=True), "-published_at")[:limit]
+    )
+
+
+def _store_snapshots(
+    *,
+    tenant,
+    posts: list[PublishedPost],
+    payloads: dict[Any, OrganicMetricSnapshotPayload | None],
+    now,
+) -> list[OrganicMetricRefreshResult]:
+    linked = [post for post in posts if payloads.get(post.id) is not None]
+    existing = {
+        (snapshot.published_post_id, snapshot.metric_date, snapshot.channel, snapshot.source): snapshot
+        for snapshot in OrganicPostMetricSnapshot.all_objects.filter(
+            tenant=tenant,
+            published_post__in=linked,
+            metric_date__in={payloads[post.id].metric_date for post in linked},
         )
-        return OrganicMetricRefreshResult(
-            status="unavailable",
-            published_post_id=str(post.id),
-            reporting_link_state=PublishedPost.REPORTING_UNAVAILABLE,
-            reason="organic_metrics_unavailable",
+    }
+
+    to_create: list[OrganicPostMetricSnapshot] = []
+    to_update: list[OrganicPostMetricSnapshot] = []
+    snapshots: dict[Any, OrganicPostMetricSnapshot] = {}
+    for post in linked:
+        payload = payloads[post.id]
+        key = (post.id, payload.metric_date, post.channel, payload.source)
+        snapshot = existing.get(key)
+        if snapshot is None:
+            snapshot = OrganicPostMetricSnapshot(
+                tenant=tenant,
+                published_post=post,
+                metric_date=payload.metric_date,
+                channel=post.channel,
+                source=payload.source,
+            )
+            to_create.append(snapshot)
+        else:
+            to_update.append(snapshot)
+        for field in SNAPSHOT_METRIC_FIELDS:
+            setattr(snapshot, field, getattr(payload, field))
+        snapshot.fetched_at = now
+        snapshot.updated_at = now
+        snapshots[post.id] = snapshot
+
+    results: list[OrganicMetricRefreshResult] = []
+    for post in posts:
+        snapshot = snapshots.get(post.id)
+        post.reporting_link_state = (
+            PublishedPost.REPORTING_LINKED if snapshot is not None else PublishedPost.REPORTING_UNAVAILABLE
         )
+        post.last_metrics_refresh_at = now
+        post.updated_at = now
+        if snapshot is None:
+            results.append(
+                OrganicMetricRefreshResult(
+                    status="unavailable",
+                    published_post_id=str(post.id),
+                    reporting_link_state=PublishedPost.REPORTING_UNAVAILABLE,
+                    reason="organic_metrics_unavailable",
+                )
+            )
+        else:
+            results.append(
+                OrganicMetricRefreshResult(
+                    status="refreshed",
+                    published_post_id=str(post.id),
+                    snapshot_id=str(snapshot.id),
+                    reporting_link_state=PublishedPost.REPORTING_LINKED,
+                )
+            )
 
     with transaction.atomic():
-        snapshot, _ = OrganicPostMetricSnapshot.all_objects.update_or_create(
-            tenant=tenant,
-            published_post=post,
-            metric_date=payload.metric_date,
-            channel=post.channel,
-            source=payload.source,
-            defaults={
-                "impressions": payload.impressions,
-                "reach": payload.reach,
-                "engagements": payload.engagements,
-                "clicks": payload.clicks,
-                "saves": payload.saves,
-                "shares": payload.shares,
-                "video_views": payload.video_views,
-                "fetched_at": now,
-            },
+        if to_create:
+            OrganicPostMetricSnapshot.all_objects.bulk_create(to_create)
+        if to_update:
+            OrganicPostMetricSnapshot.all_objects.bulk_update(
+                to_update, [*SNAPSHOT_METRIC_FIELDS, "fetched_at", "updated_at"]
+            )
+        PublishedPost.all_objects.bulk_update(
+            posts, ["reporting_link_state", "last_metrics_refresh_at", "updated_at"]
         )
-        post.reporting_link_state = PublishedPost.REPORTING_LINKED
-        post.last_metrics_refresh_at = now
-        post.save(update_fields=["reporting_link_state", "last_metrics_refresh_at", "updated_at"])
-    return OrganicMetricRefreshResult(
-        status="refreshed",
-        published_post_id=str(post.id),
-        snapshot_id=str(snapshot.id),
-        reporting_link_state=PublishedPost.REPORTING_LINKED,
+    return results
+
+
+def _payload_from_points(points: list[dict[str, Any]]) -> OrganicMetricSnapshotPayload:
+    clicks = _metric_sum(points, "post_clicks")
+    reactions = _reaction_sum(points)
+    return OrganicMetricSnapshotPayload(
+        metric_date=points[0]["end_time"].date(),
+        impressions=_first_metric_sum(points, IMPRESSION_METRIC_KEYS),
+        reach=_first_metric_sum(points, REACH_METRIC_KEYS),
+        engagements=clicks + reactions,
+        clicks=clicks,
+        video_views=_first_metric_sum(points, VIDEO_VIEW_METRIC_KEYS),
+        source=METRIC_SOURCE_META_POST_INSIGHTS,
     )
 
 
-def _mark_reporting_state(*, post: PublishedPost, state: str, refreshed_at) -> None:
-    post.reporting_link_state = state
-    post.last_metrics_refresh_at = refreshed_at
-    post.save(update_fields=["reporting_link_state", "last_metrics_refresh_at", "updated_at"])
+def _sum_values(points: Iterable[dict[str, Any]]) -> int | None:
+    """Mirror ``Sum``: ``None`` when no point carries a value."""
 
+    values = [point["value_num"] for point in points if point["value_num"] is not None]
+    if not values:
+        return None
+    return int(sum(values, Decimal(0)))
 
-def _metric_sum(queryset, metric_key: str) -> int:
-    total = queryset.filter(metric_key=metric_key).aggregate(total=Sum("value_num"))["total"]
-    if total is None:
-        return 0
-    if isinstance(total, Decimal):
-        return int(total)
-    return int(total or 0)
+
+def _metric_sum(points: list[dict[str, Any]], metric_key: str) -> int:
+    return _sum_values(point for point in points if point["metric_key"] == metric_key) or 0
 
 
-def _first_metric_sum(queryset, metric_keys: tuple[str, ...]) -> int:
+def _first_metric_sum(points: list[dict[str, Any]], metric_keys: tuple[str, ...]) -> int:
     for metric_key in metric_keys:
-        total = _metric_sum(queryset, metric_key)
+        total = _metric_sum(points, metric_key)
         if total:
             return total
     return 0
 
 
-def _reaction_sum(queryset) -> int:
-    total = sum(_metric_sum(queryset, key) for key in REACTION_METRIC_KEYS)
+def _reaction_sum(points: list[dict[str, Any]]) -> int:
+    total = sum(_metric_sum(points, key) for key in REACTION_METRIC_KEYS)
     if total:
         return total
 
-    by_type_total = queryset.filter(metric_key="post_reactions_by_type_total")
-    total = by_type_total.filter(
-        breakdown_key_normalized__in=REACTION_BREAKDOWN_KEYS,
-    ).aggregate(total=Sum("value_num"))["total"]
-    if total is None:
-        total = by_type_total.filter(
-            breakdown_key__in=REACTION_BREAKDOWN_KEYS,
-        ).aggregate(total=Sum("value_num"))["total"]
+    by_type_total = [point for point in points if point["metric_key"] == "post_reactions_by_type_total"]
+    total = _sum_values(
+        point for point in by_type_total if point["breakdown_key_normalized"] in REACTION_BREAKDOWN_KEYS
+    )
     if total is None:
-        return 0
-    if isinstance(total, Decimal):
-        return int(total)
-    return int(total or 0)
+        total = _sum_values(
+            point for point in by_type_total if point["breakdown_key"] in REACTION_BREAKDOWN_KEYS
+        )
+    return total or 0
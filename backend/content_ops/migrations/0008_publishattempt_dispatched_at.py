@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-16 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content_ops', '0007_contentworkspace_quick_post_approval_mode'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publishattempt',
+            name='dispatched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -53,6 +53,7 @@ PROVIDER_MAX_ATTEMPTS_EXCEEDED = "provider_max_attempts_exceeded"
 PROVIDER_CONTAINER_EXPIRED = "instagram_container_expired"
 PROVIDER_CONTAINER_ERROR = "instagram_container_error"
 PROVIDER_CONTAINER_NOT_READY = "instagram_container_not_ready"
+PUBLISHING_IDENTITY_BUSY = "publishing_identity_busy"
 
 PROCESS_STATUS_BLOCKED = "blocked"
 PROCESS_STATUS_FAILED = "failed"
@@ -64,11 +65,20 @@ PUBLISHABLE_ATTEMPT_STATES = {
     PublishAttempt.STATE_QUEUED,
     PublishAttempt.STATE_FAILED_RETRYABLE,
 }
+# An Instagram attempt in these states has a live container awaiting publish.
+INSTAGRAM_CONTAINER_STATES = {
+    PublishAttempt.STATE_CONTAINER_PENDING,
+    PublishAttempt.STATE_CONTAINER_READY,
+}
 INSTAGRAM_PROCESSABLE_STATES = {
     PublishAttempt.STATE_QUEUED,
     PublishAttempt.STATE_FAILED_RETRYABLE,
-    PublishAttempt.STATE_CONTAINER_PENDING,
-    PublishAttempt.STATE_CONTAINER_READY,
+    *INSTAGRAM_CONTAINER_STATES,
+}
+# States in which a worker is mid-call to Meta for the attempt.
+IN_FLIGHT_ATTEMPT_STATES = {
+    PublishAttempt.STATE_CONTAINER_CREATING,
+    PublishAttempt.STATE_PUBLISHING,
 }
 TERMINAL_OR_BLOCKED_ATTEMPT_STATES = {
     PublishAttempt.STATE_BLOCKED,
@@ -91,6 +101,12 @@ MAX_PUBLISH_ATTEMPTS = 5
 RETRY_BASE_DELAY = timedelta(minutes=5)
 RETRY_MAX_DELAY = timedelta(hours=1)
 RETRY_JITTER_MAX_SECONDS = 60
+# An in-flight attempt older than this is presumed abandoned by a dead worker
+# and stops holding its publishing identity.
+PUBLISH_IN_FLIGHT_LEASE = timedelta(minutes=15)
+# A dispatched attempt is not planned again until its task has run or this
+# lease expires (the task message was lost).
+PUBLISH_DISPATCH_LEASE = timedelta(minutes=10)
 INSTAGRAM_CAPTION_MAX_LENGTH = 2200
 INSTAGRAM_CONTAINER_TTL = timedelta(hours=23)
 INSTAGRAM_STATUS_FINISHED = "FINISHED"
@@ -233,6 +249,31 @@ class PublishQueueProcessResult:
         }
 
 
+@dataclass(frozen=True)
+class DuePublishAttempt:
+    attempt_id: str
+    channel: str
+    publishing_identity_id: str | None = None
+
+
+@dataclass(frozen=True)
+class DuePublishPlan:
+    """Due attempts in schedule order, minus those whose identity is mid-publish."""
+
+    scanned: int = 0
+    attempts: tuple[DuePublishAttempt, ...] = ()
+    busy: tuple[DuePublishAttempt, ...] = ()
+
+    def by_identity(self) -> list[tuple[DuePublishAttempt, ...]]:
+        """Group attempts per publishing identity, keeping schedule order within each."""
+
+        groups: dict[str, list[DuePublishAttempt]] = {}
+        for attempt in self.attempts:
+            key = attempt.publishing_identity_id or f"attempt:{attempt.attempt_id}"
+            groups.setdefault(key, []).append(attempt)
+        return [tuple(group) for group in groups.values()]
+
+
 class FacebookPagePublishError(RuntimeError):
     """Client-safe provider error for a future Facebook Page adapter."""
 
@@ -351,6 +392,17 @@ def process_facebook_page_publish_attempt(
             state=existing_attempt.state,
             published_post_id=str(published_post.id) if published_post else "",
         )
+    if (
+        existing_attempt is not None
+        and existing_attempt.tenant_id == tenant.id
+        and existing_attempt.state in IN_FLIGHT_ATTEMPT_STATES
+    ):
+        # Another worker is mid-call to Meta; preflight would mark it blocked.
+        return PublishAttemptProcessResult(
+            status=PROCESS_STATUS_NOOP,
+            attempt_id=str(existing_attempt.id),
+            state=existing_attempt.state,
+        )
     preflight = preflight_facebook_page_attempt(
         tenant=tenant,
         attempt_id=attempt_id,
@@ -391,6 +443,8 @@ def process_facebook_page_publish_attempt(
                 failure_code=PREFLIGHT_ATTEMPT_STATE_NOT_PUBLISHABLE,
                 failure_detail_safe="Publish attempt is not in a publishable state.",
             )
+        if _publishing_identity_busy(attempt, now=now):
+            return _identity_busy_result(attempt)
         attempt.state = PublishAttempt.STATE_PUBLISHING
         attempt.started_at = now
         attempt.failure_code = ""
@@ -455,6 +509,17 @@ def process_instagram_publish_attempt(
             state=existing_attempt.state,
             published_post_id=str(published_post.id) if published_post else "",
         )
+    if (
+        existing_attempt is not None
+        and existing_attempt.tenant_id == tenant.id
+        and existing_attempt.state in IN_FLIGHT_ATTEMPT_STATES
+    ):
+        # Another worker is mid-call to Meta; preflight would mark it blocked.
+        return PublishAttemptProcessResult(
+            status=PROCESS_STATUS_NOOP,
+            attempt_id=str(existing_attempt.id),
+            state=existing_attempt.state,
+        )
 
     preflight = preflight_instagram_attempt(
         tenant=tenant,
@@ -557,21 +622,14 @@ def process_instagram_publish_attempt(
             )
         _mark_instagram_container_ready(tenant=tenant, attempt_id=attempt_id)
 
-    attempt = _get_attempt(attempt_id=attempt_id)
-    if attempt is None or attempt.tenant_id != tenant.id:
-        return PublishAttemptProcessResult(
-            status=PROCESS_STATUS_NOOP,
-            failure_code=PREFLIGHT_ATTEMPT_MISSING,
-            failure_detail_safe="Publish attempt does not exist.",
-        )
-    if attempt.state != PublishAttempt.STATE_CONTAINER_READY:
-        return PublishAttemptProcessResult(
-            status=PROCESS_STATUS_QUEUED,
-            attempt_id=str(attempt.id),
-            state=attempt.state,
-            failure_code=PROVIDER_CONTAINER_NOT_READY,
-            failure_detail_safe="Instagram media container is not ready.",
-        )
+    claimed = _claim_instagram_container_publish(
+        tenant=tenant,
+        attempt_id=attempt_id,
+        now=now,
+    )
+    if isinstance(claimed, PublishAttemptProcessResult):
+        return claimed
+    attempt = claimed
     identity = attempt.publishing_identity
     try:
         publish_result = selected_publisher.publish_media_container(
@@ -675,47 +733,23 @@ def process_due_publish_attempts(
         if requeue_retryable
         else RetryRequeueResult()
     )
-    instagram_container_states = {
-        PublishAttempt.STATE_CONTAINER_PENDING,
-        PublishAttempt.STATE_CONTAINER_READY,
-    }
-    processable_state_filter = Q(state=PublishAttempt.STATE_QUEUED) | Q(
-        channel=PublishAttempt.CHANNEL_INSTAGRAM,
-        state__in=instagram_container_states,
-    )
-    attempt_ids = list(
-        PublishAttempt.all_objects.filter(
-            processable_state_filter,
-            tenant=tenant,
-            schedule__scheduled_at__lte=now,
-        )
-        .order_by("schedule__scheduled_at", "created_at")
-        .values_list("id", flat=True)[:limit]
-    )
+    plan = plan_due_publish_attempts(tenant=tenant, now=now, limit=limit)
 
     counters = PublishQueueProcessResult(
-        scanned=len(attempt_ids),
+        scanned=plan.scanned,
         requeued=retry_result.requeued,
-        skipped=retry_result.skipped,
+        skipped=retry_result.skipped + len(plan.busy),
     )
-    for attempt_id in attempt_ids:
-        attempt = _get_attempt(attempt_id=attempt_id)
-        if attempt is not None and attempt.channel == PublishAttempt.CHANNEL_INSTAGRAM:
-            result = process_instagram_publish_attempt(
-                tenant=tenant,
-                attempt_id=attempt_id,
-                publisher=instagram_publisher,
-                readiness=readiness,
-                now=now,
-            )
-        else:
-            result = process_facebook_page_publish_attempt(
-                tenant=tenant,
-                attempt_id=attempt_id,
-                publisher=publisher,
-                readiness=readiness,
-                now=now,
-            )
+    for due in plan.attempts:
+        result = process_publish_attempt(
+            tenant=tenant,
+            attempt_id=due.attempt_id,
+            channel=due.channel,
+            publisher=publisher,
+            instagram_publisher=instagram_publisher,
+            readiness=readiness,
+            now=now,
+        )
         counters = PublishQueueProcessResult(
             scanned=counters.scanned,
             processed=counters.processed
@@ -733,6 +767,121 @@ def process_due_publish_attempts(
     return counters
 
 
+def plan_due_publish_attempts(*, tenant, now=None, limit: int = 100) -> DuePublishPlan:
+    """Load due attempts in one query and hold back identities already publishing."""
+
+    return _plan_due_publish_attempts(tenant=tenant, now=now or timezone.now(), limit=limit)
+
+
+def claim_due_publish_attempts(*, tenant, now=None, limit: int = 100) -> DuePublishPlan:
+    """Plan due attempts and lease the dispatchable ones to the caller.
+
+    Rows are locked with ``skip_locked`` while ``dispatched_at`` is stamped, so
+    overlapping scans (beat plus schedule-commit triggers) never enqueue the
+    same attempt twice within ``PUBLISH_DISPATCH_LEASE``.
+    """
+
+    now = now or timezone.now()
+    with transaction.atomic():
+        plan = _plan_due_publish_attempts(tenant=tenant, now=now, limit=limit, lock=True)
+        if plan.attempts:
+            PublishAttempt.all_objects.filter(
+                id__in=[due.attempt_id for due in plan.attempts]
+            ).update(dispatched_at=now)
+    return plan
+
+
+def release_publish_attempt_dispatch(*, attempt_id: str | UUID) -> None:
+    """Clear the dispatch lease once the attempt's task has run."""
+
+    PublishAttempt.all_objects.filter(id=attempt_id).update(dispatched_at=None)
+
+
+def _plan_due_publish_attempts(
+    *,
+    tenant,
+    now,
+    limit: int,
+    lock: bool = False,
+) -> DuePublishPlan:
+    processable_state_filter = Q(state=PublishAttempt.STATE_QUEUED) | Q(
+        channel=PublishAttempt.CHANNEL_INSTAGRAM,
+        state__in=INSTAGRAM_CONTAINER_STATES,
+    )
+    not_dispatched_filter = Q(dispatched_at__isnull=True) | Q(
+        dispatched_at__lt=now - PUBLISH_DISPATCH_LEASE
+    )
+    queryset = PublishAttempt.all_objects.filter(
+        processable_state_filter,
+        not_dispatched_filter,
+        tenant=tenant,
+        schedule__scheduled_at__lte=now,
+    )
+    if lock:
+        queryset = queryset.select_for_update(skip_locked=True, of=("self",))
+    rows = list(
+        queryset.order_by("schedule__scheduled_at", "created_at").values_list(
+            "id", "channel", "publishing_identity_id"
+        )[:limit]
+    )
+    due = [
+        DuePublishAttempt(
+            attempt_id=str(attempt_id),
+            channel=channel,
+            publishing_identity_id=str(identity_id) if identity_id else None,
+        )
+        for attempt_id, channel, identity_id in rows
+    ]
+    busy_identities = _identities_with_publish_in_flight(
+        identity_ids={attempt.publishing_identity_id for attempt in due} - {None},
+        now=now,
+    )
+    return DuePublishPlan(
+        scanned=len(due),
+        attempts=tuple(
+            attempt for attempt in due if attempt.publishing_identity_id not in busy_identities
+        ),
+        busy=tuple(
+            attempt for attempt in due if attempt.publishing_identity_id in busy_identities
+        ),
+    )
+
+
+def process_publish_attempt(
+    *,
+    tenant,
+    attempt_id: str | UUID,
+    channel: str | None = None,
+    publisher=None,
+    instagram_publisher=None,
+    readiness: dict[str, Any] | None = None,
+    now=None,
+) -> PublishAttemptProcessResult:
+    """Process one attempt through the provider boundary for its channel."""
+
+    if channel is None:
+        channel = (
+            PublishAttempt.all_objects.filter(id=attempt_id)
+            .values_list("channel", flat=True)
+            .first()
+        )
+    if channel == PublishAttempt.CHANNEL_INSTAGRAM:
+        return process_instagram_publish_attempt(
+            tenant=tenant,
+            attempt_id=attempt_id,
+            publisher=instagram_publisher,
+            readiness=readiness,
+            now=now,
+        )
+    return process_facebook_page_publish_attempt(
+        tenant=tenant,
+        attempt_id=attempt_id,
+        publisher=publisher,
+        readiness=readiness,
+        now=now,
+    )
+
+
 def preflight_facebook_page_attempt(
     *,
     tenant,
@@ -926,6 +1075,84 @@ def _locked_attempt(*, attempt_id: str | UUID) -> PublishAttempt | None:
     )
 
 
+def _identities_with_publish_in_flight(
+    *,
+    identity_ids: set[str],
+    now,
+    exclude_attempt_id: str | UUID | None = None,
+) -> set[str]:
+    if not identity_ids:
+        return set()
+    in_flight = PublishAttempt.all_objects.filter(
+        publishing_identity_id__in=identity_ids,
+        state__in=IN_FLIGHT_ATTEMPT_STATES,
+        started_at__gte=now - PUBLISH_IN_FLIGHT_LEASE,
+    )
+    if exclude_attempt_id is not None:
+        in_flight = in_flight.exclude(id=exclude_attempt_id)
+    return {
+        str(identity_id)
+        for identity_id in in_flight.values_list("publishing_identity_id", flat=True).distinct()
+    }
+
+
+def _publishing_identity_busy(
+    attempt: PublishAttempt,
+    *,
+    now,
+    hold_for_containers: bool = False,
+) -> bool:
+    """Whether another worker holds or is claiming this attempt's identity.
+
+    Runs inside the claim transaction. The identity row lock serializes
+    concurrent claims for one page, so at most one attempt per identity is in
+    flight and a page's posts go out in the order they were dispatched.
+
+    With ``hold_for_containers`` an earlier Instagram attempt whose container
+    is still pending or ready also holds the identity until it is published or
+    leaves those states, so a later post cannot create and publish its own
+    container first.
+    """
+
+    if not attempt.publishing_identity_id:
+        return False
+    locked = (
+        PublishingIdentity.all_objects.select_for_update(skip_locked=True)
+        .filter(id=attempt.publishing_identity_id)
+        .values_list("id", flat=True)
+        .first()
+    )
+    if locked is None:
+        return True
+    if hold_for_containers and (
+        PublishAttempt.all_objects.filter(
+            publishing_identity_id=attempt.publishing_identity_id,
+            state__in=INSTAGRAM_CONTAINER_STATES,
+            meta_container_created_at__gte=now - INSTAGRAM_CONTAINER_TTL,
+        )
+        .exclude(id=attempt.id)
+        .exists()
+    ):
+        return True
+    return bool(
+        _identities_with_publish_in_flight(
+            identity_ids={str(attempt.publishing_identity_id)},
+            now=now,
+            exclude_attempt_id=attempt.id,
+        )
+    )
+
+
+def _identity_busy_result(attempt: PublishAttempt) -> PublishAttemptProcessResult:
+    return PublishAttemptProcessResult(
+        status=PROCESS_STATUS_NOOP,
+        attempt_id=str(attempt.id),
+        state=attempt.state,
+        failure_code=PUBLISHING_IDENTITY_BUSY,
+        failure_detail_safe="Another post is publishing to this identity; the attempt stays queued.",
+    )
+
+
 def _mark_attempt_blocked(
     preflight: PublishPreflightResult,
 ) -> PublishAttemptProcessResult:
@@ -1108,10 +1335,7 @@ def _prepare_instagram_attempt_for_container(
                 attempt_id=str(attempt.id),
                 state=attempt.state,
             )
-        if attempt.state in {
-            PublishAttempt.STATE_CONTAINER_PENDING,
-            PublishAttempt.STATE_CONTAINER_READY,
-        }:
+        if attempt.state in INSTAGRAM_CONTAINER_STATES:
             return None
         if attempt.state not in PUBLISHABLE_ATTEMPT_STATES:
             return PublishAttemptProcessResult(
@@ -1121,6 +1345,8 @@ def _prepare_instagram_attempt_for_container(
                 failure_code=PREFLIGHT_ATTEMPT_STATE_NOT_PUBLISHABLE,
                 failure_detail_safe="Publish attempt is not in a publishable state.",
             )
+        if _publishing_identity_busy(attempt, now=now, hold_for_containers=True):
+            return _identity_busy_result(attempt)
         attempt.state = PublishAttempt.STATE_CONTAINER_CREATING
         attempt.started_at = now
         attempt.meta_container_id = ""
@@ -1141,6 +1367,44 @@ def _prepare_instagram_attempt_for_container(
         return _instagram_container_payload(attempt)
 
 
+def _claim_instagram_container_publish(
+    *,
+    tenant,
+    attempt_id: str | UUID,
+    now,
+) -> PublishAttempt | PublishAttemptProcessResult:
+    """Move a ready container to ``publishing`` so only one worker publishes it.
+
+    Like the container-creation claim, this holds the attempt row lock and
+    checks the identity lock, so a Page never has two media publishes in
+    flight.
+    """
+
+    with transaction.atomic():
+        attempt = _locked_attempt(attempt_id=attempt_id)
+        if attempt is None or attempt.tenant_id != tenant.id:
+            return PublishAttemptProcessResult(
+                status=PROCESS_STATUS_NOOP,
+                failure_code=PREFLIGHT_ATTEMPT_MISSING,
+                failure_detail_safe="Publish attempt does not exist.",
+            )
+        if attempt.state != PublishAttempt.STATE_CONTAINER_READY:
+            return PublishAttemptProcessResult(
+                status=PROCESS_STATUS_QUEUED,
+                attempt_id=str(attempt.id),
+                state=attempt.state,
+                failure_code=PROVIDER_CONTAINER_NOT_READY,
+                failure_detail_safe="Instagram media container is not ready.",
+            )
+        if _publishing_identity_busy(attempt, now=now):
+            return _identity_busy_result(attempt)
+        attempt.state = PublishAttempt.STATE_PUBLISHING
+        attempt.started_at = now
+        attempt.save(update_fields=["state", "started_at", "updated_at"])
+        _refresh_schedule_and_draft_state(attempt.schedule)
+        return attempt
+
+
 def _mark_instagram_container_pending(
     *,
     tenant,
@@ -1171,6 +1435,9 @@ def _mark_instagram_container_ready(*, tenant, attempt_id: str | UUID) -> None:
         attempt = _locked_attempt(attempt_id=attempt_id)
         if attempt is None or attempt.tenant_id != tenant.id:
             return
+        # Another worker may already have claimed the publish step.
+        if attempt.state != PublishAttempt.STATE_CONTAINER_PENDING:
+            return
         attempt.state = PublishAttempt.STATE_CONTAINER_READY
         attempt.save(update_fields=["state", "updated_at"])
         _refresh_schedule_and_draft_state(attempt.schedule)
@@ -1575,7 +1842,10 @@ __all__ = [
     "PROVIDER_CONTAINER_NOT_READY",
     "PROVIDER_RETRYABLE_ERROR",
     "PROVIDER_TERMINAL_ERROR",
+    "PUBLISHING_IDENTITY_BUSY",
     "DisabledFacebookPagePublisher",
+    "DuePublishAttempt",
+    "DuePublishPlan",
     "DisabledInstagramPublisher",
     "FacebookPagePublishError",
     "FacebookPagePublishPayload",
@@ -1589,11 +1859,15 @@ __all__ = [
     "PublishQueueProcessResult",
     "PublishPreflightResult",
     "RetryRequeueResult",
+    "claim_due_publish_attempts",
+    "plan_due_publish_attempts",
     "preflight_facebook_page_attempt",
     "preflight_instagram_attempt",
     "process_due_publish_attempts",
     "process_facebook_page_publish_attempt",
     "process_instagram_publish_attempt",
+    "process_publish_attempt",
+    "release_publish_attempt_dispatch",
     "requeue_due_retryable_attempts",
     "requeue_failed_publish_attempt",
 ]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from celery import shared_task
+from celery import chain, shared_task
+from django.utils import timezone
 
 from accounts.tenant_context import tenant_context
 from accounts.models import Tenant
@@ -14,11 +15,16 @@ from .generation import (
 from .image_generation import (
     process_content_image_generation_job as process_image_generation_job,
 )
-from .metrics import refresh_published_post_metrics
+from .metrics import (
+    refresh_published_post_metrics,
+    refresh_published_posts_metrics,
+    select_due_published_posts,
+)
 from .models import GenerationJob, PublishedPost
 from .publisher import (
-    process_due_publish_attempts,
-    process_facebook_page_publish_attempt,
+    claim_due_publish_attempts,
+    process_publish_attempt,
+    release_publish_attempt_dispatch,
     requeue_due_retryable_attempts,
 )
 from .scheduler import dispatch_due_schedules
@@ -60,17 +66,59 @@ def dispatch_due_content_schedules(self, tenant_id: str | None = None, limit: in
     max_retries=5,
     name="content_ops.tasks.process_content_publish_attempt",
 )
-def process_content_publish_attempt(self, tenant_id: str, attempt_id: str):
+def process_content_publish_attempt(
+    self,
+    tenant_id: str,
+    attempt_id: str,
+    channel: str | None = None,
+):
     """Process one queued publish attempt through the disabled-by-default boundary."""
 
     tenant = Tenant.objects.get(id=tenant_id)
-    result = process_facebook_page_publish_attempt(
-        tenant=tenant,
-        attempt_id=attempt_id,
-    )
+    try:
+        result = process_publish_attempt(
+            tenant=tenant,
+            attempt_id=attempt_id,
+            channel=channel,
+        )
+    finally:
+        release_publish_attempt_dispatch(attempt_id=attempt_id)
     return result.as_dict()
 
 
+def _dispatch_due_publish_attempts(*, tenant, limit: int = 100) -> dict[str, int]:
+    """Fan due attempts out as one task chain per publishing identity.
+
+    Chains run in parallel across workers, so a slow page no longer delays
+    other pages or tenants, while each page's posts still go out one at a time
+    in schedule order. Identities with a publish already in flight are left for
+    the next run, and attempts already dispatched are not enqueued again while
+    their dispatch lease holds.
+    """
+
+    retry_result = requeue_due_retryable_attempts(tenant=tenant, limit=limit)
+    plan = claim_due_publish_attempts(tenant=tenant, limit=limit)
+    groups = plan.by_identity()
+    for group in groups:
+        chain(
+            *(
+                process_content_publish_attempt.si(
+                    str(tenant.id),
+                    due.attempt_id,
+                    due.channel,
+                )
+                for due in group
+            )
+        ).apply_async()
+    return {
+        "scanned": plan.scanned,
+        "dispatched": len(plan.attempts),
+        "identities": len(groups),
+        "skipped": retry_result.skipped + len(plan.busy),
+        "requeued": retry_result.requeued,
+    }
+
+
 @shared_task(
     bind=True,
     base=BaseAdInsightsTask,
@@ -82,7 +130,7 @@ def process_due_content_publish_attempts(
     tenant_id: str | None = None,
     limit: int = 100,
 ):
-    """Process due queued publish attempts for one or all tenants."""
+    """Dispatch due queued publish attempts for one or all tenants."""
 
     if tenant_id:
         tenant_ids = [tenant_id]
@@ -92,8 +140,10 @@ def process_due_content_publish_attempts(
     results = {}
     for current_tenant_id in tenant_ids:
         tenant = Tenant.objects.get(id=current_tenant_id)
-        result = process_due_publish_attempts(tenant=tenant, limit=limit)
-        results[str(current_tenant_id)] = result.as_dict()
+        results[str(current_tenant_id)] = _dispatch_due_publish_attempts(
+            tenant=tenant,
+            limit=limit,
+        )
     return results
 
 
@@ -135,7 +185,11 @@ def refresh_content_published_post_metrics(
     published_post_id: str | None = None,
     limit: int = 100,
 ):
-    """Refresh Content Ops organic metric snapshots for published posts."""
+    """Refresh Content Ops organic metric snapshots for published posts.
+
+    Tenant scans pick posts whose age-based refresh interval has elapsed and
+    refresh them in per-Page batches with bulk writes.
+    """
 
     if published_post_id:
         post = PublishedPost.all_objects.select_related("tenant").get(id=published_post_id)
@@ -155,24 +209,13 @@ def refresh_content_published_post_metrics(
     results = {}
     for current_tenant_id in tenant_ids:
         tenant = Tenant.objects.get(id=current_tenant_id)
-        post_ids = list(
-            PublishedPost.all_objects.filter(tenant=tenant)
-            .order_by("last_metrics_refresh_at", "-published_at")
-            .values_list("id", flat=True)[:limit]
-        )
-        refreshed = 0
-        unavailable = 0
-        for post_id in post_ids:
-            result = refresh_published_post_metrics(
-                tenant=tenant,
-                published_post_id=post_id,
-            )
-            if result.status == "refreshed":
-                refreshed += 1
-            elif result.status == "unavailable":
-                unavailable += 1
+        now = timezone.now()
+        posts = select_due_published_posts(tenant=tenant, limit=limit, now=now)
+        refresh_results = refresh_published_posts_metrics(tenant=tenant, posts=posts, now=now)
+        refreshed = sum(1 for result in refresh_results if result.status == "refreshed")
+        unavailable = sum(1 for result in refresh_results if result.status == "unavailable")
         results[str(current_tenant_id)] = {
-            "scanned": len(post_ids),
+            "scanned": len(posts),
             "refreshed": refreshed,
             "unavailable": unavailable,
         }
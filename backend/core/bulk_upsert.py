@@ -0,0 +1,174 @@
+"""Batched ``INSERT ... ON CONFLICT`` helpers shared by ingestion writers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from django.db import models, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UPSERT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+
+    @property
+    def persisted(self) -> int:
+        return self.inserted + self.updated
+
+    def __add__(self, other: "UpsertResult") -> "UpsertResult":
+        return UpsertResult(
+            inserted=self.inserted + other.inserted,
+            updated=self.updated + other.updated,
+            failed=self.failed + other.failed,
+        )
+
+
+def bulk_upsert(
+    manager: models.Manager,
+    objs: Iterable[models.Model],
+    *,
+    unique_fields: Sequence[str],
+    update_fields: Sequence[str],
+    batch_size: int | None = None,
+    row_fallback: bool = False,
+) -> UpsertResult:
+    """Insert or update ``objs`` in batches keyed on ``unique_fields``.
+
+    Each batch issues one SELECT for the keys that already exist (to report
+    inserted vs. updated counts) and one ``bulk_create(update_conflicts=True)``
+    statement. Rows repeating a key within a batch collapse to the last
+    occurrence, matching the previous ``update_or_create`` loop semantics.
+
+    With ``row_fallback`` a batch whose bulk statement fails is retried one
+    ``update_or_create`` per row, so a single bad row only loses itself;
+    rows that still fail are logged and counted in ``failed``. Without it
+    the error propagates.
+    """
+
+    size = max(int(batch_size or DEFAULT_UPSERT_BATCH_SIZE), 1)
+    model = manager.model
+    key_attnames = [model._meta.get_field(name).attname for name in unique_fields]
+    result = UpsertResult()
+    batch: dict[tuple[Any, ...], models.Model] = {}
+    for obj in objs:
+        key = tuple(getattr(obj, attname) for attname in key_attnames)
+        batch.pop(key, None)
+        batch[key] = obj
+        if len(batch) >= size:
+            result += _write_batch(
+                manager,
+                batch,
+                key_attnames=key_attnames,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
+                row_fallback=row_fallback,
+            )
+            batch = {}
+    if batch:
+        result += _write_batch(
+            manager,
+            batch,
+            key_attnames=key_attnames,
+            unique_fields=unique_fields,
+            update_fields=update_fields,
+            row_fallback=row_fallback,
+        )
+    return result
+
+
+def _write_batch(
+    manager: models.Manager,
+    batch: dict[tuple[Any, ...], models.Model],
+    *,
+    key_attnames: Sequence[str],
+    unique_fields: Sequence[str],
+    update_fields: Sequence[str],
+    row_fallback: bool = False,
+) -> UpsertResult:
+    try:
+        existing = _existing_keys(manager, batch.keys(), key_attnames=key_attnames)
+        with transaction.atomic(using=manager.db):
+            manager.bulk_create(
+                list(batch.values()),
+                update_conflicts=True,
+                unique_fields=list(unique_fields),
+                update_fields=list(update_fields),
+            )
+    except Exception:
+        if not row_fallback:
+            raise
+        logger.exception(
+            "Bulk upsert of %s rows failed (count=%s); retrying row by row",
+            manager.model.__name__,
+            len(batch),
+        )
+        return _write_rows(
+            manager,
+            batch.values(),
+            key_attnames=key_attnames,
+            update_fields=update_fields,
+        )
+    updated = sum(1 for key in batch if key in existing)
+    return UpsertResult(inserted=len(batch) - updated, updated=updated)
+
+
+def _write_rows(
+    manager: models.Manager,
+    objs: Iterable[models.Model],
+    *,
+    key_attnames: Sequence[str],
+    update_fields: Sequence[str],
+) -> UpsertResult:
+    inserted = updated = failed = 0
+    for obj in objs:
+        lookup = {attname: getattr(obj, attname) for attname in key_attnames}
+        defaults = {name: getattr(obj, name) for name in update_fields}
+        try:
+            with transaction.atomic(using=manager.db):
+                _, created = manager.update_or_create(defaults=defaults, **lookup)
+        except Exception:
+            failed += 1
+            logger.exception("Failed to upsert %s row %s", manager.model.__name__, lookup)
+            continue
+        if created:
+            inserted += 1
+        else:
+            updated += 1
+    return UpsertResult(inserted=inserted, updated=updated, failed=failed)
+
+
+def _existing_keys(
+    manager: models.Manager,
+    keys: Iterable[tuple[Any, ...]],
+    *,
+    key_attnames: Sequence[str],
+) -> set[tuple[Any, ...]]:
+    keys = list(keys)
+    filters: dict[str, set[Any]] = {attname: set() for attname in key_attnames}
+    for key in keys:
+        for attname, value in zip(key_attnames, key):
+            filters[attname].add(value)
+    # Per-column IN lists select a superset of the batch keys; the exact match
+    # happens in Python so the WHERE clause stays flat for large batches.
+    queryset = manager.all()
+    for attname, values in filters.items():
+        non_null = [value for value in values if value is not None]
+        if not non_null:
+            queryset = queryset.filter(**{f"{attname}__isnull": True})
+        elif len(non_null) == len(values):
+            queryset = queryset.filter(**{f"{attname}__in": non_null})
+    wanted = set(keys)
+    return {
+        tuple(row)
+        for row in queryset.values_list(*key_attnames)
+        if tuple(row) in wanted
+    }
@@ -4,50 +4,153 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
 from django.conf import settings
 from accounts.audit import log_audit_event
 from accounts.models import Tenant, TenantKey
 from accounts.tenant_context import tenant_context
+from core.metrics import observe_cache_eviction, observe_cache_lookup, observe_kms_request
 
 from .fields import decrypt_value, encrypt_value
-from .kms import KmsError, KmsUnavailableError, get_kms_client
+from .kms import KmsClient, KmsError, KmsUnavailableError, get_kms_client
 
 
 logger = logging.getLogger(__name__)
 
 ROTATION_ACTION = "dek_rotated"
 ROTATION_FAILURE_ACTION = "dek_rotation_failed"
+DEK_CACHE_AREA = "dek"
 
+_kms_lock = threading.Lock()
+_kms_client: KmsClient | None = None
+_kms_client_config: tuple[str | None, ...] | None = None
 
-def _kms():
-    return get_kms_client(
+
+def _kms() -> KmsClient:
+    """Return the process KMS client, rebuilding it only when settings change."""
+
+    global _kms_client, _kms_client_config  # noqa: PLW0603
+    config = (
         settings.KMS_PROVIDER,
         settings.KMS_KEY_ID,
-        region_name=settings.AWS_REGION,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        aws_session_token=settings.AWS_SESSION_TOKEN,
+        settings.AWS_REGION,
+        settings.AWS_ACCESS_KEY_ID,
+        settings.AWS_SECRET_ACCESS_KEY,
+        settings.AWS_SESSION_TOKEN,
     )
+    with _kms_lock:
+        if _kms_client is None or _kms_client_config != config:
+            _kms_client = get_kms_client(
+                settings.KMS_PROVIDER,
+                settings.KMS_KEY_ID,
+                region_name=settings.AWS_REGION,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                aws_session_token=settings.AWS_SESSION_TOKEN,
+            )
+            _kms_client_config = config
+        return _kms_client
+
+
+class DekCache:
+    """Bounded per-process LRU of decrypted DEKs keyed by (tenant, key version).
+
+    Entries expire after ``DEK_CACHE_TTL_SECONDS``. A rotation writes a new
+    key version, so other processes miss on their next lookup; the rotating
+    process also drops the retired plaintext straight away.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[bytes, float]] = OrderedDict()
+
+    @staticmethod
+    def _ttl_seconds() -> float:
+        return float(getattr(settings, "DEK_CACHE_TTL_SECONDS", 300))
+
+    @staticmethod
+    def _max_entries() -> int:
+        return int(getattr(settings, "DEK_CACHE_MAX_ENTRIES", 1024))
+
+    def get(self, tenant_id: str, key_version: str) -> bytes | None:
+        key = (tenant_id, key_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        observe_cache_lookup(area=DEK_CACHE_AREA, hit=entry is not None)
+        return entry[0] if entry is not None else None
+
+    def put(self, tenant_id: str, key_version: str, plaintext: bytes) -> None:
+        ttl = self._ttl_seconds()
+        max_entries = self._max_entries()
+        if ttl <= 0 or max_entries <= 0:
+            return
+        evicted = 0
+        with self._lock:
+            self._entries[(tenant_id, key_version)] = (plaintext, time.monotonic() + ttl)
+            self._entries.move_to_end((tenant_id, key_version))
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        for _ in range(evicted):
+            observe_cache_eviction(area=DEK_CACHE_AREA, reason="capacity")
+
+    def invalidate(self, tenant_id: str | None = None, *, reason: str = "rotation") -> None:
+        with self._lock:
+            if tenant_id is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [key for key in self._entries if key[0] == tenant_id]
+                for key in stale:
+                    del self._entries[key]
+                dropped = len(stale)
+        if dropped:
+            observe_cache_eviction(area=DEK_CACHE_AREA, reason=reason)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_dek_cache = DekCache()
+
+
+def dek_cache() -> DekCache:
+    return _dek_cache
 
 
 def get_dek_for_tenant(tenant: Tenant) -> tuple[bytes, str]:
-    kms_client = _kms()
+    tenant_id = str(tenant.id)
     tenant_key = TenantKey.all_objects.filter(tenant=tenant).first()
+    if tenant_key is not None:
+        cached = _dek_cache.get(tenant_id, tenant_key.dek_key_version)
+        if cached is not None:
+            return cached, tenant_key.dek_key_version
+
+    kms_client = _kms()
     try:
         if not tenant_key:
             plaintext = os.urandom(32)
-            version, ciphertext = kms_client.encrypt(plaintext)
+            version, ciphertext = _kms_call(kms_client, "encrypt", plaintext)
             tenant_key = TenantKey.all_objects.create(
                 tenant=tenant,
                 dek_ciphertext=ciphertext,
                 dek_key_version=version,
             )
+            _dek_cache.put(tenant_id, version, plaintext)
             return plaintext, version
-        plaintext = kms_client.decrypt(
-            tenant_key.dek_ciphertext, tenant_key.dek_key_version
+        plaintext = _kms_call(
+            kms_client, "decrypt", tenant_key.dek_ciphertext, tenant_key.dek_key_version
         )
+        _dek_cache.put(tenant_id, tenant_key.dek_key_version, plaintext)
         return plaintext, tenant_key.dek_key_version
     except KmsError:
         logger.exception(
@@ -56,7 +159,23 @@ def get_dek_for_tenant(tenant: Tenant) -> tuple[bytes, str]:
         raise
 
 
+def _kms_call(kms_client: KmsClient, operation: str, *args):  # noqa: ANN002, ANN202
+    try:
+        result = getattr(kms_client, operation)(*args)
+    except KmsUnavailableError:
+        observe_kms_request(operation=operation, status="unavailable")
+        raise
+    except KmsError:
+        observe_kms_request(operation=operation, status="error")
+        raise
+    observe_kms_request(operation=operation, status="success")
+    return result
+
+
 def rotate_all_tenant_deks(rotation_source: str = "scheduled") -> int:
+    # Rotation replaces every tenant's key material, so nothing cached before
+    # the sweep is worth keeping, even for tenants whose rotation fails.
+    _dek_cache.invalidate()
     kms_client = _kms()
     rotated = 0
     tenant_keys = list(TenantKey.all_objects.select_related("tenant"))
@@ -106,6 +225,7 @@ def rotate_tenant_dek(tenant_id: str) -> bool:
     if tenant_key is None:
         logger.warning("No tenant key found for rotation", extra={"tenant_id": tenant_id})
         return False
+    _dek_cache.invalidate(str(tenant_id))
     return _rotate_tenant_key(tenant_key, kms_client, rotation_source="manual")
 
 
@@ -121,11 +241,11 @@ def _rotate_tenant_key(
     previous_version = tenant_key.dek_key_version
     try:
         with tenant_context(tenant_id):
-            old_key = kms_client.decrypt(
-                tenant_key.dek_ciphertext, tenant_key.dek_key_version
+            old_key = _kms_call(
+                kms_client, "decrypt", tenant_key.dek_ciphertext, tenant_key.dek_key_version
             )
             new_key = os.urandom(32)
-            version, ciphertext = kms_client.encrypt(new_key)
+            version, ciphertext = _kms_call(kms_client, "encrypt", new_key)
 
             for credential in PlatformCredential.all_objects.filter(
                 tenant=tenant_key.tenant
@@ -201,6 +321,8 @@ def _rotate_tenant_key(
             tenant_key.save(
                 update_fields=["dek_ciphertext", "dek_key_version", "updated_at"]
             )
+            _dek_cache.invalidate(tenant_id)
+            _dek_cache.put(tenant_id, version, new_key)
             log_audit_event(
                 tenant=tenant_key.tenant,
                 user=None,
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from typing import Iterable, Mapping
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     CollectorRegistry,
     Counter,
+    Gauge,
     Histogram,
     generate_latest,
     multiprocess,
@@ -161,6 +164,24 @@ COMBINED_METRICS_SNAPSHOT_WRITES_TOTAL = Counter(
     ("source", "result"),
 )
 
+CACHE_REQUESTS_TOTAL = Counter(
+    "cache_requests_total",
+    "Derived cache lookups by area and outcome.",
+    ("area", "outcome"),
+)
+
+CACHE_EVICTIONS_TOTAL = Counter(
+    "cache_evictions_total",
+    "Derived cache entries retired before expiry, by area and reason.",
+    ("area", "reason"),
+)
+
+KMS_REQUESTS_TOTAL = Counter(
+    "kms_requests_total",
+    "KMS round trips partitioned by operation and outcome.",
+    ("operation", "status"),
+)
+
 META_TOKEN_VALIDATIONS_TOTAL = Counter(
     "meta_token_validations_total",
     "Meta token validation attempts partitioned by status.",
@@ -185,6 +206,48 @@ META_GRAPH_THROTTLE_EVENTS_TOTAL = Counter(
     ("header_name",),
 )
 
+# Governor gauges are labelled by scope only: per-ad-account buckets would add
+# a series per account. Each process exports the tightest value across the
+# buckets it touched within ``META_GRAPH_GOVERNOR_BUCKET_TTL_SECONDS``.
+META_GRAPH_GOVERNOR_TOKENS = Gauge(
+    "meta_graph_governor_tokens",
+    "Fewest tokens left across active Meta Graph rate governor buckets (negative while callers queue).",
+    ("scope",),
+    multiprocess_mode="livemin",
+)
+
+META_GRAPH_GOVERNOR_RATE = Gauge(
+    "meta_graph_governor_refill_rate",
+    "Lowest requests per second admitted across active Meta Graph rate governor buckets.",
+    ("scope",),
+    multiprocess_mode="livemin",
+)
+
+META_GRAPH_GOVERNOR_USAGE = Gauge(
+    "meta_graph_governor_usage_percent",
+    "Highest Meta-reported usage percentage across active rate governor buckets.",
+    ("scope",),
+    multiprocess_mode="livemax",
+)
+
+META_GRAPH_GOVERNOR_BUCKETS = Gauge(
+    "meta_graph_governor_active_buckets",
+    "Meta Graph rate governor buckets observed recently, by scope.",
+    ("scope",),
+    multiprocess_mode="livesum",
+)
+
+META_GRAPH_GOVERNOR_BUCKET_TTL_SECONDS = 300.0
+_governor_bucket_state: dict[str, dict[str, tuple[float, float, float, float]]] = {}
+_governor_bucket_state_lock = threading.Lock()
+
+META_GRAPH_GOVERNOR_WAIT_SECONDS = Histogram(
+    "meta_graph_governor_wait_seconds",
+    "Delay the Meta Graph rate governor imposed before a request, by limiting scope.",
+    ("scope",),
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+)
+
 _AIRBYTE_FAILURE_STATUSES = {
     "failed",
     "error",
@@ -336,6 +399,33 @@ def observe_combined_metrics_request(
     ).inc()
 
 
+def observe_cache_lookup(*, area: str, hit: bool) -> None:
+    """Record a derived cache hit or miss."""
+
+    CACHE_REQUESTS_TOTAL.labels(
+        area=(area or "unknown").lower(),
+        outcome="hit" if hit else "miss",
+    ).inc()
+
+
+def observe_cache_eviction(*, area: str, reason: str) -> None:
+    """Record derived cache entries being invalidated ahead of their TTL."""
+
+    CACHE_EVICTIONS_TOTAL.labels(
+        area=(area or "unknown").lower(),
+        reason=(reason or "unknown").lower(),
+    ).inc()
+
+
+def observe_kms_request(*, operation: str, status: str) -> None:
+    """Record a KMS encrypt/decrypt round trip."""
+
+    KMS_REQUESTS_TOTAL.labels(
+        operation=(operation or "unknown").lower(),
+        status=(status or "unknown").lower(),
+    ).inc()
+
+
 def observe_meta_token_validation(status: str) -> None:
     """Record a token validation event for Meta credentials."""
 
@@ -365,6 +455,37 @@ def observe_meta_graph_throttle_event(*, header_name: str) -> None:
     ).inc()
 
 
+def observe_meta_graph_governor_state(
+    *,
+    scope: str,
+    bucket: str,
+    tokens: float,
+    rate: float,
+    usage_pct: float,
+) -> None:
+    """Fold one rate governor bucket into its scope's aggregate gauges."""
+
+    scope_label = (scope or "unknown").lower()
+    now = time.monotonic()
+    with _governor_bucket_state_lock:
+        buckets = _governor_bucket_state.setdefault(scope_label, {})
+        buckets[bucket or "unknown"] = (tokens, rate, usage_pct, now)
+        cutoff = now - META_GRAPH_GOVERNOR_BUCKET_TTL_SECONDS
+        for key in [key for key, state in buckets.items() if state[3] < cutoff]:
+            del buckets[key]
+        states = list(buckets.values())
+    META_GRAPH_GOVERNOR_TOKENS.labels(scope=scope_label).set(min(state[0] for state in states))
+    META_GRAPH_GOVERNOR_RATE.labels(scope=scope_label).set(min(state[1] for state in states))
+    META_GRAPH_GOVERNOR_USAGE.labels(scope=scope_label).set(max(state[2] for state in states))
+    META_GRAPH_GOVERNOR_BUCKETS.labels(scope=scope_label).set(len(states))
+
+
+def observe_meta_graph_governor_wait(*, scope: str, seconds: float) -> None:
+    """Record a delay imposed by the Meta Graph rate governor."""
+
+    META_GRAPH_GOVERNOR_WAIT_SECONDS.labels(scope=(scope or "unknown").lower()).observe(seconds)
+
+
 def render_metrics() -> tuple[bytes, str]:
     """Return the current registry contents and content type."""
 
@@ -375,7 +496,7 @@ def render_metrics() -> tuple[bytes, str]:
     return generate_latest(), CONTENT_TYPE_LATEST
 
 
-def reset_metrics(registries: Iterable[Histogram | Counter] | None = None) -> None:
+def reset_metrics(registries: Iterable[Histogram | Counter | Gauge] | None = None) -> None:
     """Reset Prometheus collectors for deterministic tests."""
 
     collectors = registries or (
@@ -392,10 +513,20 @@ def reset_metrics(registries: Iterable[Histogram | Counter] | None = None) -> No
         COMBINED_METRICS_REQUEST_DURATION,
         COMBINED_METRICS_QUERY_COUNT,
         COMBINED_METRICS_SNAPSHOT_WRITES_TOTAL,
+        CACHE_REQUESTS_TOTAL,
+        CACHE_EVICTIONS_TOTAL,
+        KMS_REQUESTS_TOTAL,
         META_TOKEN_VALIDATIONS_TOTAL,
         META_TOKEN_REFRESH_ATTEMPTS_TOTAL,
         META_GRAPH_RETRY_TOTAL,
         META_GRAPH_THROTTLE_EVENTS_TOTAL,
+        META_GRAPH_GOVERNOR_TOKENS,
+        META_GRAPH_GOVERNOR_RATE,
+        META_GRAPH_GOVERNOR_USAGE,
+        META_GRAPH_GOVERNOR_BUCKETS,
+        META_GRAPH_GOVERNOR_WAIT_SECONDS,
     )
     for collector in collectors:
         collector.clear()
+    with _governor_bucket_state_lock:
+        _governor_bucket_state.clear()
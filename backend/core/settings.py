@@ -25,13 +25,30 @@ env = environ.Env(
     API_VERSION=(str, "dev"),
     SECRETS_PROVIDER=(str, "env"),
     KMS_PROVIDER=(str, "aws"),
+    DEK_CACHE_TTL_SECONDS=(int, 300),
+    DEK_CACHE_MAX_ENTRIES=(int, 1024),
     LLM_TIMEOUT=(float, 10.0),
+    ALERT_EVALUATION_CONCURRENCY=(int, 4),
+    ALERT_WINDOW_DAYS=(int, 14),
+    ALERT_SUMMARY_CONCURRENCY=(int, 4),
+    ALERT_SUMMARY_CACHE_TTL_SECONDS=(int, 3600),
     ENABLE_TENANCY=(bool, True),
     DJANGO_LOG_LEVEL=(str, "INFO"),
     APP_VERSION=(str, "0.0.0-dev"),
     METRICS_SNAPSHOT_TTL=(int, 300),
     METRICS_SNAPSHOT_STALE_TTL_SECONDS=(int, 3600),
     METRICS_SNAPSHOT_SYNC_LOCK_TTL_SECONDS=(int, 900),
+    METRICS_SNAPSHOT_SKIP_UNCHANGED=(bool, True),
+    METRICS_SNAPSHOT_RESPONSE_ENCODING=(str, "gzip"),
+    CACHE_URL=(str, "locmemcache://"),
+    WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS=(int, 300),
+    WAREHOUSE_SINGLE_PASS_QUERY_PLAN=(bool, True),
+    WAREHOUSE_SNAPSHOT_WINDOW_DAYS=(int, 30),
+    FX_RATE_CACHE_TTL_SECONDS=(int, 300),
+    CSV_EXPORT_FETCH_SIZE=(int, 2000),
+    PARISH_GEOMETRY_CACHE_MAX_AGE_SECONDS=(int, 86400),
+    SERVICE_ACCOUNT_KEY_CACHE_TTL_SECONDS=(int, 60),
+    SERVICE_ACCOUNT_LAST_USED_INTERVAL_SECONDS=(int, 300),
     ENABLE_FAKE_ADAPTER=(bool, False),
     ENABLE_META_DIRECT_ADAPTER=(bool, False),
     ENABLE_WAREHOUSE_ADAPTER=(bool, False),
@@ -107,6 +124,15 @@ env = environ.Env(
     META_GRAPH_API_VERSION=(str, "v24.0"),
     META_GRAPH_TIMEOUT_SECONDS=(float, 10.0),
     META_GRAPH_MAX_ATTEMPTS=(int, 5),
+    META_GRAPH_CONCURRENCY=(int, 4),
+    META_GRAPH_GOVERNOR_BACKEND=(str, "file"),
+    META_GRAPH_GOVERNOR_STATE_DIR=(str, ""),
+    META_GRAPH_GOVERNOR_MAX_RATE=(float, 5.0),
+    META_GRAPH_GOVERNOR_MIN_RATE=(float, 0.2),
+    META_GRAPH_GOVERNOR_BURST=(float, 10.0),
+    META_GRAPH_GOVERNOR_SLOWDOWN_PCT=(float, 75.0),
+    META_GRAPH_GOVERNOR_COOLDOWN_SECONDS=(float, 30.0),
+    META_INSIGHTS_UPSERT_BATCH_SIZE=(int, 500),
     META_PAGE_INSIGHTS_ENABLED=(bool, True),
     META_PAGE_INSIGHTS_METRIC_PACK_PATH=(str, ""),
     META_PAGE_INSIGHTS_BACKFILL_DAYS=(int, 90),
@@ -115,6 +141,7 @@ env = environ.Env(
     META_PAGE_INSIGHTS_METRIC_CHUNK_SIZE=(int, 10),
     META_PAGE_INSIGHTS_TIMEOUT_SECONDS=(float, 20.0),
     META_PAGE_INSIGHTS_MAX_ATTEMPTS=(int, 5),
+    META_GRAPH_BATCH_SIZE=(int, 50),
     META_PAGE_INSIGHTS_NIGHTLY_HOUR=(int, 3),
     META_PAGE_INSIGHTS_NIGHTLY_MINUTE=(int, 10),
     META_POST_INSIGHTS_NIGHTLY_HOUR=(int, 3),
@@ -152,6 +179,8 @@ env = environ.Env(
     GOOGLE_ADS_PARITY_CLICKS_MAX_DELTA_PCT=(float, 2.0),
     GOOGLE_ADS_PARITY_CONVERSIONS_MAX_DELTA_PCT=(float, 2.0),
     GOOGLE_ADS_TODAY_CACHE_TTL_SECONDS=(int, 300),
+    GOOGLE_ADS_UPSERT_BATCH_SIZE=(int, 500),
+    GOOGLE_ADS_SYNC_CHILD_CONCURRENCY=(int, 4),
     DRF_THROTTLE_AUTH_BURST=(str, "10/min"),
     DRF_THROTTLE_AUTH_SUSTAINED=(str, "100/day"),
     DRF_THROTTLE_PUBLIC=(str, "120/min"),
@@ -220,6 +249,18 @@ API_VERSION = env("API_VERSION")
 METRICS_SNAPSHOT_TTL = env.int("METRICS_SNAPSHOT_TTL")
 METRICS_SNAPSHOT_STALE_TTL_SECONDS = max(env.int("METRICS_SNAPSHOT_STALE_TTL_SECONDS"), 1)
 METRICS_SNAPSHOT_SYNC_LOCK_TTL_SECONDS = max(env.int("METRICS_SNAPSHOT_SYNC_LOCK_TTL_SECONDS"), 1)
+METRICS_SNAPSHOT_SKIP_UNCHANGED = env.bool("METRICS_SNAPSHOT_SKIP_UNCHANGED", default=True)
+METRICS_SNAPSHOT_RESPONSE_ENCODING = env("METRICS_SNAPSHOT_RESPONSE_ENCODING").strip().lower()
+WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS = max(env.int("WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS"), 1)
+WAREHOUSE_SINGLE_PASS_QUERY_PLAN = env.bool("WAREHOUSE_SINGLE_PASS_QUERY_PLAN", default=True)
+WAREHOUSE_SNAPSHOT_WINDOW_DAYS = max(env.int("WAREHOUSE_SNAPSHOT_WINDOW_DAYS"), 1)
+FX_RATE_CACHE_TTL_SECONDS = max(env.int("FX_RATE_CACHE_TTL_SECONDS"), 1)
+CSV_EXPORT_FETCH_SIZE = max(env.int("CSV_EXPORT_FETCH_SIZE"), 1)
+PARISH_GEOMETRY_CACHE_MAX_AGE_SECONDS = max(env.int("PARISH_GEOMETRY_CACHE_MAX_AGE_SECONDS"), 0)
+SERVICE_ACCOUNT_KEY_CACHE_TTL_SECONDS = max(env.int("SERVICE_ACCOUNT_KEY_CACHE_TTL_SECONDS"), 0)
+SERVICE_ACCOUNT_LAST_USED_INTERVAL_SECONDS = max(
+    env.int("SERVICE_ACCOUNT_LAST_USED_INTERVAL_SECONDS"), 0
+)
 # In local DEBUG sessions, keep demo/fake adapters on by default so dashboard
 # toggles always have a working non-live data source unless explicitly disabled.
 ENABLE_FAKE_ADAPTER = env.bool("ENABLE_FAKE_ADAPTER", default=DEBUG)
@@ -414,6 +455,10 @@ SIMPLE_JWT = {
 
 LOGGING = build_logging_config(env("DJANGO_LOG_LEVEL"))
 
+# Shared cache for derived payloads, quotas and locks. Point CACHE_URL at Redis
+# (``redis://host:6379/1``) whenever more than one web/worker process runs.
+CACHES = {"default": env.cache_url("CACHE_URL")}
+
 CELERY_BROKER_URL = env("CELERY_BROKER_URL")
 CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND")
 CELERY_TASK_DEFAULT_QUEUE = env("CELERY_TASK_DEFAULT_QUEUE", default="default")
@@ -525,6 +570,8 @@ CELERY_TASK_ROUTES = {
     "content_ops.tasks.process_content_caption_generation_job": {"queue": CELERY_QUEUE_SYNC},
     "analytics.sync_metrics_snapshots": {"queue": CELERY_QUEUE_SNAPSHOT},
     "analytics.tasks.sync_metrics_snapshots": {"queue": CELERY_QUEUE_SNAPSHOT},
+    "analytics.sync_tenant_metrics_snapshot": {"queue": CELERY_QUEUE_SNAPSHOT},
+    "analytics.summarize_metrics_snapshots": {"queue": CELERY_QUEUE_SNAPSHOT},
     "analytics.ai_daily_summary": {"queue": CELERY_QUEUE_SUMMARY},
     "analytics.run_report_export_job": {"queue": CELERY_QUEUE_SUMMARY},
 }
@@ -822,6 +869,8 @@ AWS_ACCESS_KEY_ID = _optional(env("AWS_ACCESS_KEY_ID", default=None))
 AWS_SECRET_ACCESS_KEY = _optional(env("AWS_SECRET_ACCESS_KEY", default=None))
 AWS_SESSION_TOKEN = _optional(env("AWS_SESSION_TOKEN", default=None))
 validate_kms_configuration(KMS_PROVIDER, KMS_KEY_ID, AWS_REGION)
+DEK_CACHE_TTL_SECONDS = max(env.int("DEK_CACHE_TTL_SECONDS"), 0)
+DEK_CACHE_MAX_ENTRIES = max(env.int("DEK_CACHE_MAX_ENTRIES"), 0)
 
 CORS_ALLOW_ALL_ORIGINS = env.bool("CORS_ALLOW_ALL_ORIGINS", default=False)
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])
@@ -845,6 +894,10 @@ LLM_API_URL = _optional(env("LLM_API_URL", default=None))
 LLM_API_KEY = _optional(env("LLM_API_KEY", default=None))
 LLM_MODEL = env("LLM_MODEL", default="gpt-5.1")
 LLM_TIMEOUT = env.float("LLM_TIMEOUT")
+ALERT_EVALUATION_CONCURRENCY = max(env.int("ALERT_EVALUATION_CONCURRENCY"), 1)
+ALERT_WINDOW_DAYS = max(env.int("ALERT_WINDOW_DAYS"), 8)
+ALERT_SUMMARY_CONCURRENCY = max(env.int("ALERT_SUMMARY_CONCURRENCY"), 1)
+ALERT_SUMMARY_CACHE_TTL_SECONDS = max(env.int("ALERT_SUMMARY_CACHE_TTL_SECONDS"), 1)
 APP_VERSION = env("APP_VERSION")
 EMAIL_PROVIDER = env("EMAIL_PROVIDER")
 EMAIL_FROM_ADDRESS = env("EMAIL_FROM_ADDRESS")
@@ -895,6 +948,8 @@ GOOGLE_ADS_PARITY_CONVERSIONS_MAX_DELTA_PCT = env.float(
     default=2.0,
 )
 GOOGLE_ADS_TODAY_CACHE_TTL_SECONDS = env.int("GOOGLE_ADS_TODAY_CACHE_TTL_SECONDS", default=300)
+GOOGLE_ADS_UPSERT_BATCH_SIZE = env.int("GOOGLE_ADS_UPSERT_BATCH_SIZE", default=500)
+GOOGLE_ADS_SYNC_CHILD_CONCURRENCY = env.int("GOOGLE_ADS_SYNC_CHILD_CONCURRENCY", default=4)
 META_APP_ID = _optional(env("META_APP_ID", default=None))
 META_APP_SECRET = _optional(env("META_APP_SECRET", default=None))
 META_OAUTH_REDIRECT_URI = _optional(env("META_OAUTH_REDIRECT_URI", default=None))
@@ -907,6 +962,21 @@ META_PUBLISH_SCOPES = env.list("META_PUBLISH_SCOPES")
 META_GRAPH_API_VERSION = env("META_GRAPH_API_VERSION", default="v24.0")
 META_GRAPH_TIMEOUT_SECONDS = env.float("META_GRAPH_TIMEOUT_SECONDS", default=10.0)
 META_GRAPH_MAX_ATTEMPTS = env.int("META_GRAPH_MAX_ATTEMPTS", default=5)
+# In-flight Graph requests when insights + breakdowns are fetched concurrently.
+META_GRAPH_CONCURRENCY = max(env.int("META_GRAPH_CONCURRENCY", default=4), 1)
+# Shared token-bucket governor fed by Meta usage headers: "file" (flock-shared by
+# every worker on the host), "memory" (per process) or "off".
+META_GRAPH_GOVERNOR_BACKEND = env("META_GRAPH_GOVERNOR_BACKEND", default="file").strip().lower()
+META_GRAPH_GOVERNOR_STATE_DIR = _optional(env("META_GRAPH_GOVERNOR_STATE_DIR", default=""))
+META_GRAPH_GOVERNOR_MAX_RATE = env.float("META_GRAPH_GOVERNOR_MAX_RATE", default=5.0)
+META_GRAPH_GOVERNOR_MIN_RATE = env.float("META_GRAPH_GOVERNOR_MIN_RATE", default=0.2)
+META_GRAPH_GOVERNOR_BURST = env.float("META_GRAPH_GOVERNOR_BURST", default=10.0)
+META_GRAPH_GOVERNOR_SLOWDOWN_PCT = env.float("META_GRAPH_GOVERNOR_SLOWDOWN_PCT", default=75.0)
+META_GRAPH_GOVERNOR_COOLDOWN_SECONDS = env.float(
+    "META_GRAPH_GOVERNOR_COOLDOWN_SECONDS",
+    default=30.0,
+)
+META_INSIGHTS_UPSERT_BATCH_SIZE = env.int("META_INSIGHTS_UPSERT_BATCH_SIZE", default=500)
 META_PAGE_INSIGHTS_ENABLED = env.bool("META_PAGE_INSIGHTS_ENABLED", default=True)
 META_PAGE_INSIGHTS_METRIC_PACK_PATH = _optional(
     env("META_PAGE_INSIGHTS_METRIC_PACK_PATH", default=None)
@@ -920,6 +990,8 @@ META_PAGE_INSIGHTS_POST_RECENCY_DAYS = env.int("META_PAGE_INSIGHTS_POST_RECENCY_
 META_PAGE_INSIGHTS_METRIC_CHUNK_SIZE = env.int("META_PAGE_INSIGHTS_METRIC_CHUNK_SIZE", default=10)
 META_PAGE_INSIGHTS_TIMEOUT_SECONDS = env.float("META_PAGE_INSIGHTS_TIMEOUT_SECONDS", default=20.0)
 META_PAGE_INSIGHTS_MAX_ATTEMPTS = env.int("META_PAGE_INSIGHTS_MAX_ATTEMPTS", default=5)
+# Post-insights requests packed into one Graph ``batch`` call (Graph caps it at 50).
+META_GRAPH_BATCH_SIZE = min(max(env.int("META_GRAPH_BATCH_SIZE", default=50), 1), 50)
 META_PAGE_INSIGHTS_NIGHTLY_HOUR = env.int("META_PAGE_INSIGHTS_NIGHTLY_HOUR", default=3)
 META_PAGE_INSIGHTS_NIGHTLY_MINUTE = env.int("META_PAGE_INSIGHTS_NIGHTLY_MINUTE", default=10)
 META_POST_INSIGHTS_NIGHTLY_HOUR = env.int("META_POST_INSIGHTS_NIGHTLY_HOUR", default=3)
@@ -0,0 +1,78 @@
+"""Tenant-namespaced keys for derived caches on the shared cache backend.
+
+Keys follow ``tenant:<id>:<area>:<digest>``. Versioned keys fold the tenant's
+generation counter into the digest, so bumping the counter (when a sync task
+lands new rows) retires every derived payload for that tenant at once without
+scanning the backend. Counters such as quotas use unversioned keys and survive
+generation bumps.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from django.core.cache import cache
+
+from core.metrics import observe_cache_eviction, observe_cache_lookup
+
+
+def _generation_key(tenant_id: object) -> str:
+    return f"tenant:{tenant_id}:generation"
+
+
+def tenant_cache_generation(tenant_id: object) -> int:
+    value = cache.get(_generation_key(tenant_id))
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def bump_tenant_cache_generation(tenant_id: object) -> int:
+    """Invalidate every versioned derived cache entry for ``tenant_id``."""
+
+    key = _generation_key(tenant_id)
+    try:
+        generation = cache.incr(key)
+    except ValueError:
+        # No counter yet: readers have been using generation 0.
+        cache.set(key, 1, timeout=None)
+        generation = 1
+    observe_cache_eviction(area="tenant", reason="generation_bump")
+    return int(generation)
+
+
+def tenant_cache_key(
+    tenant_id: object,
+    area: str,
+    *parts: Any,
+    versioned: bool = True,
+) -> str:
+    material: list[Any] = list(parts)
+    if versioned:
+        material.insert(0, tenant_cache_generation(tenant_id))
+    digest = hashlib.sha256(
+        json.dumps(material, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+    return f"tenant:{tenant_id}:{area}:{digest}"
+
+
+def get_cached(key: str, *, area: str) -> Any:
+    value = cache.get(key)
+    observe_cache_lookup(area=area, hit=value is not None)
+    return value
+
+
+def increment_counter(key: str, *, timeout: int) -> int:
+    """Atomically increment ``key`` on the shared backend, creating it at 1."""
+
+    if cache.add(key, 1, timeout=timeout):
+        return 1
+    try:
+        return int(cache.incr(key))
+    except ValueError:
+        # Expired between add() and incr().
+        cache.set(key, 1, timeout=timeout)
+        return 1
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 application = get_wsgi_application()
+
+# Parse and precompute the parish map geometry before the first request.
+from analytics.geometry import parish_geometry  # noqa: E402
+
+parish_geometry().warm()
@@ -16,6 +16,7 @@ from .resolver import (
 )
 from .suggester import (
     ClientSuggestion,
+    NameTokenCache,
     SuggestionAccount,
     normalize_name,
     suggest_clients,
@@ -27,6 +28,7 @@ __all__ = [
     "resolve_client_accounts",
     "resolve_client_for_external",
     "ClientSuggestion",
+    "NameTokenCache",
     "SuggestionAccount",
     "normalize_name",
     "suggest_clients",
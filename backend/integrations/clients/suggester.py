@@ -11,16 +11,22 @@ Algorithm
 4. For each group, propose either attaching to an existing Client with a
    matching name, or creating a new Client.
 
-Complexity: O(N²) pairwise for N accounts — fine for the dozens-to-low-hundreds
-scale this sees. If an agency ever has >1k unlinked accounts we can switch to
-a token-indexed approach.
+Complexity: candidate pairs come from a prefix-filtered token inverted index
+(tokens ordered rarest-first; two sets with Jaccard ≥ t must share one of
+their first ``|x| - ceil(t·|x|) + 1`` tokens), so only accounts sharing a rare
+token are ever compared. Existing Clients are loaded and tokenized once per
+call into their own inverted index. Normalized names are memoized in a
+``NameTokenCache`` that ``refresh_client_suggestions`` persists on the
+tenant's ``ClientSuggestionSnapshot``.
 """
 
 from __future__ import annotations
 
+import math
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Iterable, Mapping, Optional
 
 from integrations.models import (
     Client,
@@ -49,6 +55,10 @@ _PAREN_CONTENT = re.compile(r"\([^)]*\)")
 _NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
 _MULTISPACE = re.compile(r"\s+")
 
+# Bump whenever ``normalize_name`` changes so persisted token caches built by
+# the previous rules are discarded instead of reused.
+NORMALIZER_VERSION = 1
+
 
 def normalize_name(raw: Optional[str]) -> str:
     """Lowercase, strip parentheticals + common suffixes + punctuation."""
@@ -76,6 +86,71 @@ def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
     return inter / union if union else 0.0
 
 
+class NameTokenCache:
+    """Memoizes ``normalize_name`` per raw display name.
+
+    ``from_payload``/``to_payload`` round-trip the JSON stored on
+    ``ClientSuggestionSnapshot.token_cache``; only names looked up since the
+    cache was loaded are written back, so entries for renamed or linked
+    accounts age out on the next refresh.
+    """
+
+    def __init__(self, entries: Optional[Mapping[str, str]] = None) -> None:
+        self._entries: dict[str, str] = dict(entries or {})
+        self._used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "NameTokenCache":
+        if not isinstance(payload, dict) or payload.get("version") != NORMALIZER_VERSION:
+            return cls()
+        names = payload.get("names")
+        if not isinstance(names, dict):
+            return cls()
+        return cls(
+            {raw: value for raw, value in names.items() if isinstance(value, str)}
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "version": NORMALIZER_VERSION,
+            "names": {raw: self._entries[raw] for raw in sorted(self._used)},
+        }
+
+    def normalized(self, raw: Optional[str]) -> str:
+        key = raw or ""
+        self._used.add(key)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        value = normalize_name(key)
+        self._entries[key] = value
+        return value
+
+    def tokens(self, raw: Optional[str]) -> frozenset[str]:
+        return _tokens(self.normalized(raw))
+
+
+def _prefix_length(size: int, threshold: float) -> int:
+    # Tolerance keeps e.g. 0.7 * 10 from rounding up to 8 shared tokens.
+    required = math.ceil(threshold * size - 1e-9)
+    return max(1, min(size, size - required + 1))
+
+
+def _token_order(token_sets: Iterable[frozenset[str]]) -> dict[str, int]:
+    """Rank tokens rarest-first (ties alphabetical) for prefix filtering."""
+
+    frequency: dict[str, int] = defaultdict(int)
+    for tokens in token_sets:
+        for token in tokens:
+            frequency[token] += 1
+    ordered = sorted(frequency, key=lambda token: (frequency[token], token))
+    return {token: rank for rank, token in enumerate(ordered)}
+
+
 @dataclass(frozen=True)
 class SuggestionAccount:
     platform: str
@@ -161,11 +236,30 @@ def _collect_unclaimed(tenant_id: str) -> list[SuggestionAccount]:
 
 
 def _group_by_similarity(
-    candidates: list[SuggestionAccount], *, threshold: float
+    candidates: list[SuggestionAccount],
+    *,
+    threshold: float,
+    token_cache: Optional[NameTokenCache] = None,
 ) -> list[list[SuggestionAccount]]:
-    """Greedy agglomerative grouping by token Jaccard ≥ threshold."""
+    """Greedy agglomerative grouping by token Jaccard ≥ threshold.
+
+    Each account joins the group of the first earlier unused account whose
+    tokens clear the threshold — the same greedy order as a full pairwise
+    scan — but only accounts sharing a prefix token are ever compared.
+    """
+
+    cache = token_cache or NameTokenCache()
+    tokenized = [(c, cache.tokens(c.display_name)) for c in candidates]
+    rank = _token_order(toks for _, toks in tokenized)
+    prefixes: list[list[str]] = []
+    postings: dict[str, list[int]] = defaultdict(list)
+    for index, (_, toks) in enumerate(tokenized):
+        ordered = sorted(toks, key=rank.__getitem__)
+        prefix = ordered[: _prefix_length(len(ordered), threshold)] if ordered else []
+        prefixes.append(prefix)
+        for token in prefix:
+            postings[token].append(index)
 
-    tokenized = [(c, _tokens(normalize_name(c.display_name))) for c in candidates]
     used = [False] * len(tokenized)
     groups: list[list[SuggestionAccount]] = []
 
@@ -174,17 +268,21 @@ def _group_by_similarity(
             continue
         used[i] = True
         group = [acct_i]
-        for j in range(i + 1, len(tokenized)):
-            if used[j]:
-                continue
+        candidate_ids = {
+            j for token in prefixes[i] for j in postings[token] if j > i and not used[j]
+        }
+        for j in sorted(candidate_ids):
             acct_j, toks_j = tokenized[j]
-            if not toks_j:
-                continue
             # Same platform + same external_id would already be dedup'd by
             # collect; we skip same-platform matches so a group always
             # represents a CROSS-platform grouping opportunity.
             if acct_j.platform == acct_i.platform and acct_j.external_id == acct_i.external_id:
                 continue
+            # Size filter: |B| outside [t·|A|, |A|/t] cannot reach the threshold.
+            if len(toks_j) < threshold * len(toks_i) - 1e-9 or (
+                threshold * len(toks_j) > len(toks_i) + 1e-9
+            ):
+                continue
             if _jaccard(toks_i, toks_j) >= threshold:
                 used[j] = True
                 group.append(acct_j)
@@ -221,26 +319,48 @@ def _match_score(a: frozenset[str], b: frozenset[str]) -> float:
     return max(jaccard, containment_a, containment_b)
 
 
-def _match_existing_client(
-    tenant_id: str, tokens: frozenset[str], *, threshold: float
-) -> tuple[Optional[str], Optional[str], float]:
-    """Return (client_id, client_name, confidence) for the best existing match."""
+class _ExistingClientIndex:
+    """A tenant's Clients, tokenized once and indexed by token."""
 
-    best: tuple[Optional[str], Optional[str], float] = (None, None, 0.0)
-    for client in Client.all_objects.filter(tenant_id=tenant_id).values(
-        "id", "name"
-    ):
-        client_tokens = _tokens(normalize_name(client["name"]))
-        if not client_tokens:
-            continue
-        score = _match_score(tokens, client_tokens)
-        if score >= threshold and score > best[2]:
-            best = (str(client["id"]), client["name"], score)
-    return best
+    def __init__(self, clients: Iterable[Mapping[str, Any]], cache: NameTokenCache) -> None:
+        self._clients: list[tuple[str, str, frozenset[str]]] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for client in clients:
+            tokens = cache.tokens(client["name"])
+            if not tokens:
+                continue
+            position = len(self._clients)
+            self._clients.append((str(client["id"]), client["name"], tokens))
+            for token in tokens:
+                self._postings[token].append(position)
+
+    @classmethod
+    def for_tenant(cls, tenant_id: str, cache: NameTokenCache) -> "_ExistingClientIndex":
+        return cls(
+            Client.all_objects.filter(tenant_id=tenant_id).values("id", "name"), cache
+        )
+
+    def best_match(
+        self, tokens: frozenset[str], *, threshold: float
+    ) -> tuple[Optional[str], Optional[str], float]:
+        """Return (client_id, client_name, confidence) for the best existing match."""
+
+        best: tuple[Optional[str], Optional[str], float] = (None, None, 0.0)
+        # A score is only non-zero when at least one token is shared.
+        positions = sorted({p for token in tokens for p in self._postings.get(token, ())})
+        for position in positions:
+            client_id, client_name, client_tokens = self._clients[position]
+            score = _match_score(tokens, client_tokens)
+            if score >= threshold and score > best[2]:
+                best = (client_id, client_name, score)
+        return best
 
 
 def suggest_clients(
-    tenant_id: str, *, threshold: float = 0.7
+    tenant_id: str,
+    *,
+    threshold: float = 0.7,
+    token_cache: Optional[NameTokenCache] = None,
 ) -> list[ClientSuggestion]:
     """Return a list of proposed Client groupings for a tenant.
 
@@ -251,19 +371,22 @@ def suggest_clients(
       name matches an existing ``Client.name``.
 
     Results are sorted by confidence descending, then by account count.
+    Pass ``token_cache`` to reuse (and collect) normalized names across calls.
     """
 
     candidates = _collect_unclaimed(tenant_id)
     if not candidates:
         return []
 
-    groups = _group_by_similarity(candidates, threshold=threshold)
+    cache = token_cache if token_cache is not None else NameTokenCache()
+    groups = _group_by_similarity(candidates, threshold=threshold, token_cache=cache)
+    clients = _ExistingClientIndex.for_tenant(tenant_id, cache)
     suggestions: list[ClientSuggestion] = []
 
     for group in groups:
         # Representative name: longest display_name wins (most specific).
         rep = max(group, key=lambda a: len(a.display_name or ""))
-        normalized = normalize_name(rep.display_name)
+        normalized = cache.normalized(rep.display_name)
         tokens = _tokens(normalized)
         if not tokens:
             # No tokens means we can't match anything; only surface if group
@@ -271,8 +394,8 @@ def suggest_clients(
             if len(group) <= 1:
                 continue
 
-        existing_id, existing_name, existing_score = _match_existing_client(
-            tenant_id, tokens, threshold=threshold
+        existing_id, existing_name, existing_score = clients.best_match(
+            tokens, threshold=threshold
         )
 
         platforms_in_group = frozenset(a.platform for a in group)
@@ -24,7 +24,7 @@ from django.utils import timezone
 
 from accounts.tenant_context import tenant_context
 from core.tasks import BaseAdInsightsTask
-from integrations.clients.suggester import suggest_clients
+from integrations.clients.suggester import NameTokenCache, suggest_clients
 from integrations.models import ClientSuggestionSnapshot
 
 logger = logging.getLogger(__name__)
@@ -76,8 +76,16 @@ def refresh_client_suggestions(
 
     tenant_id = str(tenant_id)
     with tenant_context(tenant_id):
+        existing = ClientSuggestionSnapshot.all_objects.filter(
+            tenant_id=tenant_id
+        ).first()
+        token_cache = NameTokenCache.from_payload(
+            existing.token_cache if existing is not None else None
+        )
         try:
-            suggestions = suggest_clients(tenant_id, threshold=threshold)
+            suggestions = suggest_clients(
+                tenant_id, threshold=threshold, token_cache=token_cache
+            )
         except Exception as exc:  # pragma: no cover - defensive
             logger.exception(
                 "client_suggestions.refresh_failed",
@@ -88,9 +96,6 @@ def refresh_client_suggestions(
         payload = _serialize_suggestions(suggestions)
         generated_at = timezone.now()
 
-        existing = ClientSuggestionSnapshot.all_objects.filter(
-            tenant_id=tenant_id
-        ).first()
         had_prior_count = existing.suggestion_count if existing is not None else 0
         snapshot, _created = ClientSuggestionSnapshot.all_objects.update_or_create(
             tenant_id=tenant_id,
@@ -99,6 +104,7 @@ def refresh_client_suggestions(
                 "threshold": threshold,
                 "suggestion_count": len(payload),
                 "payload": payload,
+                "token_cache": token_cache.to_payload(),
                 "generated_at": generated_at,
                 # New run of different shape → resurface the banner.
                 "acknowledged_at": (
@@ -117,6 +123,8 @@ def refresh_client_suggestions(
             "tenant_id": tenant_id,
             "trigger_reason": trigger_reason,
             "count": snapshot.suggestion_count,
+            "token_cache_hits": token_cache.hits,
+            "token_cache_misses": token_cache.misses,
         },
     )
     return {
@@ -348,282 +348,358 @@ class GoogleAdsSdkClient:
         except Exception as exc:  # pragma: no cover - integration surface
             raise _classify_google_ads_exception(exc, google_ads_exception_cls) from exc
 
-    def fetch_campaign_daily(
+    def iter_campaign_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[CampaignDailyRow]:
+    ) -> Iterator[CampaignDailyRow]:
         query = render_gaql_template(
             "campaign_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[CampaignDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
-            rows.append(
-                CampaignDailyRow(
-                    customer_id=str(row.customer.id),
-                    campaign_id=str(row.campaign.id),
-                    campaign_name=str(getattr(row.campaign, "name", "") or ""),
-                    campaign_status=str(getattr(row.campaign, "status", "") or ""),
-                    advertising_channel_type=str(
-                        getattr(row.campaign, "advertising_channel_type", "") or ""
-                    ),
-                    date_day=_as_date(row.segments.date),
-                    currency_code=str(getattr(row.customer, "currency_code", "") or ""),
-                    impressions=_as_int(getattr(row.metrics, "impressions", 0)),
-                    clicks=_as_int(getattr(row.metrics, "clicks", 0)),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
-                    request_id=request_id,
-                )
+            yield CampaignDailyRow(
+                customer_id=str(row.customer.id),
+                campaign_id=str(row.campaign.id),
+                campaign_name=str(getattr(row.campaign, "name", "") or ""),
+                campaign_status=str(getattr(row.campaign, "status", "") or ""),
+                advertising_channel_type=str(
+                    getattr(row.campaign, "advertising_channel_type", "") or ""
+                ),
+                date_day=_as_date(row.segments.date),
+                currency_code=str(getattr(row.customer, "currency_code", "") or ""),
+                impressions=_as_int(getattr(row.metrics, "impressions", 0)),
+                clicks=_as_int(getattr(row.metrics, "clicks", 0)),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_ad_group_ad_daily(
+    def fetch_campaign_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[AdGroupAdDailyRow]:
+    ) -> list[CampaignDailyRow]:
+        return list(
+            self.iter_campaign_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_ad_group_ad_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[AdGroupAdDailyRow]:
         query = render_gaql_template(
             "ad_group_ad_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[AdGroupAdDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
-            rows.append(
-                AdGroupAdDailyRow(
-                    customer_id=str(row.customer.id),
-                    campaign_id=str(row.campaign.id),
-                    ad_group_id=str(row.ad_group.id),
-                    ad_id=str(row.ad_group_ad.ad.id),
-                    campaign_name=str(getattr(row.campaign, "name", "") or ""),
-                    ad_name=str(getattr(row.ad_group_ad.ad, "name", "") or ""),
-                    ad_status=str(getattr(row.ad_group_ad, "status", "") or ""),
-                    policy_approval_status=str(
-                        getattr(getattr(row.ad_group_ad, "policy_summary", None), "approval_status", "") or ""
-                    ),
-                    policy_review_status=str(
-                        getattr(getattr(row.ad_group_ad, "policy_summary", None), "review_status", "") or ""
-                    ),
-                    date_day=_as_date(row.segments.date),
-                    currency_code=str(getattr(row.customer, "currency_code", "") or ""),
-                    impressions=_as_int(getattr(row.metrics, "impressions", 0)),
-                    clicks=_as_int(getattr(row.metrics, "clicks", 0)),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
-                    request_id=request_id,
-                )
+            yield AdGroupAdDailyRow(
+                customer_id=str(row.customer.id),
+                campaign_id=str(row.campaign.id),
+                ad_group_id=str(row.ad_group.id),
+                ad_id=str(row.ad_group_ad.ad.id),
+                campaign_name=str(getattr(row.campaign, "name", "") or ""),
+                ad_name=str(getattr(row.ad_group_ad.ad, "name", "") or ""),
+                ad_status=str(getattr(row.ad_group_ad, "status", "") or ""),
+                policy_approval_status=str(
+                    getattr(getattr(row.ad_group_ad, "policy_summary", None), "approval_status", "") or ""
+                ),
+                policy_review_status=str(
+                    getattr(getattr(row.ad_group_ad, "policy_summary", None), "review_status", "") or ""
+                ),
+                date_day=_as_date(row.segments.date),
+                currency_code=str(getattr(row.customer, "currency_code", "") or ""),
+                impressions=_as_int(getattr(row.metrics, "impressions", 0)),
+                clicks=_as_int(getattr(row.metrics, "clicks", 0)),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_geographic_daily(
+    def fetch_ad_group_ad_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[GeographicDailyRow]:
+    ) -> list[AdGroupAdDailyRow]:
+        return list(
+            self.iter_ad_group_ad_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_geographic_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[GeographicDailyRow]:
         query = render_gaql_template(
             "geographic_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[GeographicDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
-            rows.append(
-                GeographicDailyRow(
-                    customer_id=str(row.customer.id),
-                    campaign_id=str(row.campaign.id),
-                    date_day=_as_date(row.segments.date),
-                    geo_target_country=str(getattr(row.segments, "geo_target_country", "") or ""),
-                    geo_target_region=str(getattr(row.segments, "geo_target_region", "") or ""),
-                    geo_target_city=str(getattr(row.segments, "geo_target_city", "") or ""),
-                    currency_code=str(getattr(row.customer, "currency_code", "") or ""),
-                    impressions=_as_int(getattr(row.metrics, "impressions", 0)),
-                    clicks=_as_int(getattr(row.metrics, "clicks", 0)),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
-                    request_id=request_id,
-                )
+            yield GeographicDailyRow(
+                customer_id=str(row.customer.id),
+                campaign_id=str(row.campaign.id),
+                date_day=_as_date(row.segments.date),
+                geo_target_country=str(getattr(row.segments, "geo_target_country", "") or ""),
+                geo_target_region=str(getattr(row.segments, "geo_target_region", "") or ""),
+                geo_target_city=str(getattr(row.segments, "geo_target_city", "") or ""),
+                currency_code=str(getattr(row.customer, "currency_code", "") or ""),
+                impressions=_as_int(getattr(row.metrics, "impressions", 0)),
+                clicks=_as_int(getattr(row.metrics, "clicks", 0)),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_keyword_daily(
+    def fetch_geographic_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[KeywordDailyRow]:
+    ) -> list[GeographicDailyRow]:
+        return list(
+            self.iter_geographic_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_keyword_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[KeywordDailyRow]:
         query = render_gaql_template(
             "keyword_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[KeywordDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
             quality_info = getattr(row.ad_group_criterion, "quality_info", None)
             quality_score_raw = getattr(quality_info, "quality_score", None)
-            rows.append(
-                KeywordDailyRow(
-                    customer_id=str(row.customer.id),
-                    campaign_id=str(row.campaign.id),
-                    ad_group_id=str(row.ad_group.id),
-                    criterion_id=str(row.ad_group_criterion.criterion_id),
-                    keyword_text=str(getattr(getattr(row.ad_group_criterion, "keyword", None), "text", "") or ""),
-                    match_type=str(
-                        getattr(getattr(row.ad_group_criterion, "keyword", None), "match_type", "") or ""
-                    ),
-                    criterion_status=str(getattr(row.ad_group_criterion, "status", "") or ""),
-                    quality_score=_as_int(quality_score_raw) if quality_score_raw is not None else None,
-                    ad_relevance=str(
-                        getattr(quality_info, "ad_relevance", "") or ""
-                    ),
-                    expected_ctr=str(
-                        getattr(
-                            quality_info,
-                            "expected_clickthrough_rate",
-                            "",
-                        )
-                        or ""
-                    ),
-                    landing_page_experience=str(
-                        getattr(
-                            quality_info,
-                            "landing_page_experience",
-                            "",
-                        )
-                        or ""
-                    ),
-                    date_day=_as_date(row.segments.date),
-                    currency_code=str(getattr(row.customer, "currency_code", "") or ""),
-                    impressions=_as_int(getattr(row.metrics, "impressions", 0)),
-                    clicks=_as_int(getattr(row.metrics, "clicks", 0)),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
-                    request_id=request_id,
-                )
+            yield KeywordDailyRow(
+                customer_id=str(row.customer.id),
+                campaign_id=str(row.campaign.id),
+                ad_group_id=str(row.ad_group.id),
+                criterion_id=str(row.ad_group_criterion.criterion_id),
+                keyword_text=str(getattr(getattr(row.ad_group_criterion, "keyword", None), "text", "") or ""),
+                match_type=str(
+                    getattr(getattr(row.ad_group_criterion, "keyword", None), "match_type", "") or ""
+                ),
+                criterion_status=str(getattr(row.ad_group_criterion, "status", "") or ""),
+                quality_score=_as_int(quality_score_raw) if quality_score_raw is not None else None,
+                ad_relevance=str(
+                    getattr(quality_info, "ad_relevance", "") or ""
+                ),
+                expected_ctr=str(
+                    getattr(
+                        quality_info,
+                        "expected_clickthrough_rate",
+                        "",
+                    )
+                    or ""
+                ),
+                landing_page_experience=str(
+                    getattr(
+                        quality_info,
+                        "landing_page_experience",
+                        "",
+                    )
+                    or ""
+                ),
+                date_day=_as_date(row.segments.date),
+                currency_code=str(getattr(row.customer, "currency_code", "") or ""),
+                impressions=_as_int(getattr(row.metrics, "impressions", 0)),
+                clicks=_as_int(getattr(row.metrics, "clicks", 0)),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_search_term_daily(
+    def fetch_keyword_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[SearchTermDailyRow]:
+    ) -> list[KeywordDailyRow]:
+        return list(
+            self.iter_keyword_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_search_term_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[SearchTermDailyRow]:
         query = render_gaql_template(
             "search_term_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[SearchTermDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
-            rows.append(
-                SearchTermDailyRow(
-                    customer_id=str(row.customer.id),
-                    campaign_id=str(row.campaign.id),
-                    ad_group_id=str(row.ad_group.id),
-                    criterion_id=str(getattr(row.ad_group_criterion, "criterion_id", "") or ""),
-                    search_term=str(getattr(row.search_term_view, "search_term", "") or ""),
-                    date_day=_as_date(row.segments.date),
-                    currency_code=str(getattr(row.customer, "currency_code", "") or ""),
-                    impressions=_as_int(getattr(row.metrics, "impressions", 0)),
-                    clicks=_as_int(getattr(row.metrics, "clicks", 0)),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
-                    request_id=request_id,
-                )
+            yield SearchTermDailyRow(
+                customer_id=str(row.customer.id),
+                campaign_id=str(row.campaign.id),
+                ad_group_id=str(row.ad_group.id),
+                criterion_id=str(getattr(row.ad_group_criterion, "criterion_id", "") or ""),
+                search_term=str(getattr(row.search_term_view, "search_term", "") or ""),
+                date_day=_as_date(row.segments.date),
+                currency_code=str(getattr(row.customer, "currency_code", "") or ""),
+                impressions=_as_int(getattr(row.metrics, "impressions", 0)),
+                clicks=_as_int(getattr(row.metrics, "clicks", 0)),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_asset_group_daily(
+    def fetch_search_term_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[AssetGroupDailyRow]:
+    ) -> list[SearchTermDailyRow]:
+        return list(
+            self.iter_search_term_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_asset_group_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[AssetGroupDailyRow]:
         query = render_gaql_template(
             "asset_group_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[AssetGroupDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
-            rows.append(
-                AssetGroupDailyRow(
-                    customer_id=str(row.customer.id),
-                    campaign_id=str(row.campaign.id),
-                    asset_group_id=str(row.asset_group.id),
-                    asset_group_name=str(getattr(row.asset_group, "name", "") or ""),
-                    asset_group_status=str(getattr(row.asset_group, "status", "") or ""),
-                    date_day=_as_date(row.segments.date),
-                    currency_code=str(getattr(row.customer, "currency_code", "") or ""),
-                    impressions=_as_int(getattr(row.metrics, "impressions", 0)),
-                    clicks=_as_int(getattr(row.metrics, "clicks", 0)),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
-                    request_id=request_id,
-                )
+            yield AssetGroupDailyRow(
+                customer_id=str(row.customer.id),
+                campaign_id=str(row.campaign.id),
+                asset_group_id=str(row.asset_group.id),
+                asset_group_name=str(getattr(row.asset_group, "name", "") or ""),
+                asset_group_status=str(getattr(row.asset_group, "status", "") or ""),
+                date_day=_as_date(row.segments.date),
+                currency_code=str(getattr(row.customer, "currency_code", "") or ""),
+                impressions=_as_int(getattr(row.metrics, "impressions", 0)),
+                clicks=_as_int(getattr(row.metrics, "clicks", 0)),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                cost_micros=_as_int(getattr(row.metrics, "cost_micros", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_conversion_action_daily(
+    def fetch_asset_group_daily(
         self,
         *,
         customer_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[ConversionActionDailyRow]:
+    ) -> list[AssetGroupDailyRow]:
+        return list(
+            self.iter_asset_group_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_conversion_action_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[ConversionActionDailyRow]:
         query = render_gaql_template(
             "conversion_action_daily_performance",
             start_date=start_date,
             end_date=end_date,
         )
-        rows: list[ConversionActionDailyRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
-            rows.append(
-                ConversionActionDailyRow(
-                    customer_id=str(row.customer.id),
-                    conversion_action_id=str(row.conversion_action.id),
-                    conversion_action_name=str(getattr(row.conversion_action, "name", "") or ""),
-                    conversion_action_type=str(getattr(row.conversion_action, "type", "") or ""),
-                    date_day=_as_date(row.segments.date),
-                    conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
-                    all_conversions=_as_decimal(getattr(row.metrics, "all_conversions", 0)),
-                    conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
-                    request_id=request_id,
-                )
+            yield ConversionActionDailyRow(
+                customer_id=str(row.customer.id),
+                conversion_action_id=str(row.conversion_action.id),
+                conversion_action_name=str(getattr(row.conversion_action, "name", "") or ""),
+                conversion_action_type=str(getattr(row.conversion_action, "type", "") or ""),
+                date_day=_as_date(row.segments.date),
+                conversions=_as_decimal(getattr(row.metrics, "conversions", 0)),
+                all_conversions=_as_decimal(getattr(row.metrics, "all_conversions", 0)),
+                conversions_value=_as_decimal(getattr(row.metrics, "conversions_value", 0)),
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_change_events(
+    def fetch_conversion_action_daily(
+        self,
+        *,
+        customer_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> list[ConversionActionDailyRow]:
+        return list(
+            self.iter_conversion_action_daily(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    def iter_change_events(
         self,
         *,
         customer_id: str,
         start_datetime: datetime,
         end_datetime: datetime,
-    ) -> list[ChangeEventRow]:
+    ) -> Iterator[ChangeEventRow]:
         query = render_gaql_template(
             "change_event_incremental",
             start_datetime=start_datetime,
             end_datetime=end_datetime,
         )
-        rows: list[ChangeEventRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
             changed_fields_raw = getattr(row.change_event, "changed_fields", None)
             changed_fields: list[str] = []
@@ -650,50 +726,65 @@ class GoogleAdsSdkClient:
                     ",".join(changed_fields),
                 ]
             )
-            rows.append(
-                ChangeEventRow(
-                    customer_id=str(row.change_event.customer),
-                    event_fingerprint=hashlib.sha256(fingerprint_source.encode("utf-8")).hexdigest(),
-                    change_date_time=change_date_time,
-                    user_email=str(getattr(row.change_event, "user_email", "") or ""),
-                    client_type=str(getattr(row.change_event, "client_type", "") or ""),
-                    change_resource_type=resource_type,
-                    resource_change_operation=operation,
-                    campaign_id=campaign_id,
-                    ad_group_id=ad_group_id,
-                    ad_id=ad_id,
-                    changed_fields=changed_fields,
-                    request_id=request_id,
-                )
+            yield ChangeEventRow(
+                customer_id=str(row.change_event.customer),
+                event_fingerprint=hashlib.sha256(fingerprint_source.encode("utf-8")).hexdigest(),
+                change_date_time=change_date_time,
+                user_email=str(getattr(row.change_event, "user_email", "") or ""),
+                client_type=str(getattr(row.change_event, "client_type", "") or ""),
+                change_resource_type=resource_type,
+                resource_change_operation=operation,
+                campaign_id=campaign_id,
+                ad_group_id=ad_group_id,
+                ad_id=ad_id,
+                changed_fields=changed_fields,
+                request_id=request_id,
             )
-        return rows
 
-    def fetch_recommendations(
+    def fetch_change_events(
         self,
         *,
         customer_id: str,
-    ) -> list[RecommendationRow]:
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> list[ChangeEventRow]:
+        return list(
+            self.iter_change_events(
+                customer_id=customer_id,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+            )
+        )
+
+    def iter_recommendations(
+        self,
+        *,
+        customer_id: str,
+    ) -> Iterator[RecommendationRow]:
         query = render_gaql_template("recommendations_inventory")
-        rows: list[RecommendationRow] = []
         for request_id, row in self._search_stream(customer_id=customer_id, query=query):
             rec = row.recommendation
             impact_metadata = {
                 "impact": str(getattr(rec, "impact", "") or ""),
                 "primary_status": str(getattr(rec, "primary_status", "") or ""),
             }
-            rows.append(
-                RecommendationRow(
-                    customer_id=str(row.customer.id),
-                    recommendation_type=str(getattr(rec, "type", "") or ""),
-                    resource_name=str(getattr(rec, "resource_name", "") or ""),
-                    campaign_id=str(getattr(rec, "campaign", "") or ""),
-                    ad_group_id=str(getattr(rec, "ad_group", "") or ""),
-                    dismissed=_as_bool(getattr(rec, "dismissed", False)),
-                    impact_metadata=impact_metadata,
-                    request_id=request_id,
-                )
+            yield RecommendationRow(
+                customer_id=str(row.customer.id),
+                recommendation_type=str(getattr(rec, "type", "") or ""),
+                resource_name=str(getattr(rec, "resource_name", "") or ""),
+                campaign_id=str(getattr(rec, "campaign", "") or ""),
+                ad_group_id=str(getattr(rec, "ad_group", "") or ""),
+                dismissed=_as_bool(getattr(rec, "dismissed", False)),
+                impact_metadata=impact_metadata,
+                request_id=request_id,
             )
-        return rows
+
+    def fetch_recommendations(
+        self,
+        *,
+        customer_id: str,
+    ) -> list[RecommendationRow]:
+        return list(self.iter_recommendations(customer_id=customer_id))
 
     def fetch_accessible_customers(self, *, customer_id: str) -> list[AccessibleCustomerRow]:
         query = render_gaql_template("accessible_customers")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.db import models, transaction
 from django.utils import timezone
 
 from accounts.models import Tenant
+from core.bulk_upsert import DEFAULT_UPSERT_BATCH_SIZE, bulk_upsert
 from integrations.google_ads.client import (
     AccessibleCustomerRow,
     AdGroupAdDailyRow,
@@ -31,168 +37,372 @@ from integrations.models import (
 )
 
 
+@dataclass(frozen=True)
+class TableUpsertSpec:
+    """Natural key and mutable columns for one Google Ads SDK table."""
+
+    model: type[models.Model]
+    unique_fields: tuple[str, ...]
+    update_fields: tuple[str, ...]
+
+
+_DAILY_METRIC_FIELDS = (
+    "currency_code",
+    "impressions",
+    "clicks",
+    "conversions",
+    "conversions_value",
+    "cost_micros",
+    "source_request_id",
+    "updated_at",
+)
+
+CAMPAIGN_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkCampaignDaily,
+    unique_fields=("tenant", "customer_id", "campaign_id", "date_day"),
+    update_fields=(
+        "campaign_name",
+        "campaign_status",
+        "advertising_channel_type",
+        *_DAILY_METRIC_FIELDS,
+    ),
+)
+AD_GROUP_AD_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkAdGroupAdDaily,
+    unique_fields=("tenant", "customer_id", "campaign_id", "ad_group_id", "ad_id", "date_day"),
+    update_fields=(
+        "campaign_name",
+        "ad_name",
+        "ad_status",
+        "policy_approval_status",
+        "policy_review_status",
+        *_DAILY_METRIC_FIELDS,
+    ),
+)
+GEOGRAPHIC_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkGeographicDaily,
+    unique_fields=(
+        "tenant",
+        "customer_id",
+        "campaign_id",
+        "date_day",
+        "geo_target_country",
+        "geo_target_region",
+        "geo_target_city",
+    ),
+    update_fields=_DAILY_METRIC_FIELDS,
+)
+KEYWORD_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkKeywordDaily,
+    unique_fields=("tenant", "customer_id", "campaign_id", "ad_group_id", "criterion_id", "date_day"),
+    update_fields=(
+        "keyword_text",
+        "match_type",
+        "criterion_status",
+        "quality_score",
+        "ad_relevance",
+        "expected_ctr",
+        "landing_page_experience",
+        *_DAILY_METRIC_FIELDS,
+    ),
+)
+SEARCH_TERM_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkSearchTermDaily,
+    unique_fields=("tenant", "customer_id", "campaign_id", "ad_group_id", "search_term", "date_day"),
+    update_fields=("criterion_id", *_DAILY_METRIC_FIELDS),
+)
+ASSET_GROUP_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkAssetGroupDaily,
+    unique_fields=("tenant", "customer_id", "campaign_id", "asset_group_id", "date_day"),
+    update_fields=("asset_group_name", "asset_group_status", *_DAILY_METRIC_FIELDS),
+)
+CONVERSION_ACTION_DAILY_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkConversionActionDaily,
+    unique_fields=("tenant", "customer_id", "conversion_action_id", "date_day"),
+    update_fields=(
+        "conversion_action_name",
+        "conversion_action_type",
+        "conversions",
+        "all_conversions",
+        "conversions_value",
+        "source_request_id",
+        "updated_at",
+    ),
+)
+CHANGE_EVENT_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkChangeEvent,
+    unique_fields=("tenant", "customer_id", "event_fingerprint"),
+    update_fields=(
+        "change_date_time",
+        "user_email",
+        "client_type",
+        "change_resource_type",
+        "resource_change_operation",
+        "campaign_id",
+        "ad_group_id",
+        "ad_id",
+        "changed_fields",
+        "source_request_id",
+        "updated_at",
+    ),
+)
+RECOMMENDATION_SPEC = TableUpsertSpec(
+    model=GoogleAdsSdkRecommendation,
+    unique_fields=("tenant", "customer_id", "recommendation_type", "resource_name"),
+    update_fields=(
+        "campaign_id",
+        "ad_group_id",
+        "dismissed",
+        "impact_metadata",
+        "source_request_id",
+        "last_seen_at",
+        "updated_at",
+    ),
+)
+ACCESSIBLE_CUSTOMER_SPEC = TableUpsertSpec(
+    model=GoogleAdsAccountMapping,
+    unique_fields=("tenant", "customer_id"),
+    update_fields=(
+        "manager_customer_id",
+        "customer_name",
+        "currency_code",
+        "time_zone",
+        "status",
+        "is_manager",
+        "last_seen_at",
+        "updated_at",
+    ),
+)
+
+
 def _decimal(value: Decimal) -> Decimal:
     return value if isinstance(value, Decimal) else Decimal(str(value))
 
 
-def upsert_campaign_daily_rows(*, tenant: Tenant, rows: Iterable[CampaignDailyRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkCampaignDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            campaign_id=row.campaign_id,
-            date_day=row.date_day,
-            defaults={
-                "campaign_name": row.campaign_name,
-                "campaign_status": row.campaign_status,
-                "advertising_channel_type": row.advertising_channel_type,
-                "currency_code": row.currency_code,
-                "impressions": int(row.impressions),
-                "clicks": int(row.clicks),
-                "conversions": _decimal(row.conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "cost_micros": int(row.cost_micros),
-                "source_request_id": row.request_id,
-            },
+def _batch_size() -> int:
+    return max(
+        int(getattr(settings, "GOOGLE_ADS_UPSERT_BATCH_SIZE", DEFAULT_UPSERT_BATCH_SIZE) or 0),
+        1,
+    )
+
+
+def _write_rows(
+    spec: TableUpsertSpec,
+    *,
+    tenant: Tenant,
+    rows: Iterable[Any],
+    build: Callable[[Tenant, Any], models.Model],
+    batch_size: int | None = None,
+) -> int:
+    """Upsert ``rows`` into ``spec.model`` in chunks inside a single transaction.
+
+    ``batch_size`` defaults to ``GOOGLE_ADS_UPSERT_BATCH_SIZE``.
+    """
+
+    with transaction.atomic(using=spec.model.all_objects.db):
+        result = bulk_upsert(
+            spec.model.all_objects,
+            (build(tenant, row) for row in rows),
+            unique_fields=spec.unique_fields,
+            update_fields=spec.update_fields,
+            batch_size=max(batch_size, 1) if batch_size else _batch_size(),
         )
-        persisted += 1
-    return persisted
+    return result.persisted
+
+
+def _campaign_daily_record(tenant: Tenant, row: CampaignDailyRow) -> GoogleAdsSdkCampaignDaily:
+    return GoogleAdsSdkCampaignDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        campaign_id=row.campaign_id,
+        date_day=row.date_day,
+        campaign_name=row.campaign_name,
+        campaign_status=row.campaign_status,
+        advertising_channel_type=row.advertising_channel_type,
+        currency_code=row.currency_code,
+        impressions=int(row.impressions),
+        clicks=int(row.clicks),
+        conversions=_decimal(row.conversions),
+        conversions_value=_decimal(row.conversions_value),
+        cost_micros=int(row.cost_micros),
+        source_request_id=row.request_id,
+    )
+
+
+def _ad_group_ad_daily_record(tenant: Tenant, row: AdGroupAdDailyRow) -> GoogleAdsSdkAdGroupAdDaily:
+    return GoogleAdsSdkAdGroupAdDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        campaign_id=row.campaign_id,
+        ad_group_id=row.ad_group_id,
+        ad_id=row.ad_id,
+        date_day=row.date_day,
+        campaign_name=row.campaign_name,
+        ad_name=row.ad_name,
+        ad_status=row.ad_status,
+        policy_approval_status=row.policy_approval_status,
+        policy_review_status=row.policy_review_status,
+        currency_code=row.currency_code,
+        impressions=int(row.impressions),
+        clicks=int(row.clicks),
+        conversions=_decimal(row.conversions),
+        conversions_value=_decimal(row.conversions_value),
+        cost_micros=int(row.cost_micros),
+        source_request_id=row.request_id,
+    )
+
+
+def _geographic_daily_record(tenant: Tenant, row: GeographicDailyRow) -> GoogleAdsSdkGeographicDaily:
+    return GoogleAdsSdkGeographicDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        campaign_id=row.campaign_id,
+        date_day=row.date_day,
+        geo_target_country=row.geo_target_country,
+        geo_target_region=row.geo_target_region,
+        geo_target_city=row.geo_target_city,
+        currency_code=row.currency_code,
+        impressions=int(row.impressions),
+        clicks=int(row.clicks),
+        conversions=_decimal(row.conversions),
+        conversions_value=_decimal(row.conversions_value),
+        cost_micros=int(row.cost_micros),
+        source_request_id=row.request_id,
+    )
+
+
+def _keyword_daily_record(tenant: Tenant, row: KeywordDailyRow) -> GoogleAdsSdkKeywordDaily:
+    return GoogleAdsSdkKeywordDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        campaign_id=row.campaign_id,
+        ad_group_id=row.ad_group_id,
+        criterion_id=row.criterion_id,
+        date_day=row.date_day,
+        keyword_text=row.keyword_text,
+        match_type=row.match_type,
+        criterion_status=row.criterion_status,
+        quality_score=row.quality_score,
+        ad_relevance=row.ad_relevance,
+        expected_ctr=row.expected_ctr,
+        landing_page_experience=row.landing_page_experience,
+        currency_code=row.currency_code,
+        impressions=int(row.impressions),
+        clicks=int(row.clicks),
+        conversions=_decimal(row.conversions),
+        conversions_value=_decimal(row.conversions_value),
+        cost_micros=int(row.cost_micros),
+        source_request_id=row.request_id,
+    )
+
+
+def search_term_daily_record(tenant: Tenant, row: SearchTermDailyRow) -> GoogleAdsSdkSearchTermDaily:
+    return GoogleAdsSdkSearchTermDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        campaign_id=row.campaign_id,
+        ad_group_id=row.ad_group_id,
+        search_term=row.search_term,
+        date_day=row.date_day,
+        criterion_id=row.criterion_id,
+        currency_code=row.currency_code,
+        impressions=int(row.impressions),
+        clicks=int(row.clicks),
+        conversions=_decimal(row.conversions),
+        conversions_value=_decimal(row.conversions_value),
+        cost_micros=int(row.cost_micros),
+        source_request_id=row.request_id,
+    )
+
+
+def _asset_group_daily_record(tenant: Tenant, row: AssetGroupDailyRow) -> GoogleAdsSdkAssetGroupDaily:
+    return GoogleAdsSdkAssetGroupDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        campaign_id=row.campaign_id,
+        asset_group_id=row.asset_group_id,
+        date_day=row.date_day,
+        asset_group_name=row.asset_group_name,
+        asset_group_status=row.asset_group_status,
+        currency_code=row.currency_code,
+        impressions=int(row.impressions),
+        clicks=int(row.clicks),
+        conversions=_decimal(row.conversions),
+        conversions_value=_decimal(row.conversions_value),
+        cost_micros=int(row.cost_micros),
+        source_request_id=row.request_id,
+    )
+
+
+def _conversion_action_daily_record(
+    tenant: Tenant,
+    row: ConversionActionDailyRow,
+) -> GoogleAdsSdkConversionActionDaily:
+    return GoogleAdsSdkConversionActionDaily(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        conversion_action_id=row.conversion_action_id,
+        date_day=row.date_day,
+        conversion_action_name=row.conversion_action_name,
+        conversion_action_type=row.conversion_action_type,
+        conversions=_decimal(row.conversions),
+        all_conversions=_decimal(row.all_conversions),
+        conversions_value=_decimal(row.conversions_value),
+        source_request_id=row.request_id,
+    )
+
+
+def _change_event_record(tenant: Tenant, row: ChangeEventRow) -> GoogleAdsSdkChangeEvent:
+    return GoogleAdsSdkChangeEvent(
+        tenant=tenant,
+        customer_id=row.customer_id,
+        event_fingerprint=row.event_fingerprint,
+        change_date_time=row.change_date_time,
+        user_email=row.user_email,
+        client_type=row.client_type,
+        change_resource_type=row.change_resource_type,
+        resource_change_operation=row.resource_change_operation,
+        campaign_id=row.campaign_id,
+        ad_group_id=row.ad_group_id,
+        ad_id=row.ad_id,
+        changed_fields=row.changed_fields,
+        source_request_id=row.request_id,
+    )
+
+
+def upsert_campaign_daily_rows(*, tenant: Tenant, rows: Iterable[CampaignDailyRow]) -> int:
+    return _write_rows(CAMPAIGN_DAILY_SPEC, tenant=tenant, rows=rows, build=_campaign_daily_record)
 
 
 def upsert_ad_group_ad_daily_rows(*, tenant: Tenant, rows: Iterable[AdGroupAdDailyRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkAdGroupAdDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            campaign_id=row.campaign_id,
-            ad_group_id=row.ad_group_id,
-            ad_id=row.ad_id,
-            date_day=row.date_day,
-            defaults={
-                "campaign_name": row.campaign_name,
-                "ad_name": row.ad_name,
-                "ad_status": row.ad_status,
-                "policy_approval_status": row.policy_approval_status,
-                "policy_review_status": row.policy_review_status,
-                "currency_code": row.currency_code,
-                "impressions": int(row.impressions),
-                "clicks": int(row.clicks),
-                "conversions": _decimal(row.conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "cost_micros": int(row.cost_micros),
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+    return _write_rows(AD_GROUP_AD_DAILY_SPEC, tenant=tenant, rows=rows, build=_ad_group_ad_daily_record)
 
 
 def upsert_geographic_daily_rows(*, tenant: Tenant, rows: Iterable[GeographicDailyRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkGeographicDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            campaign_id=row.campaign_id,
-            date_day=row.date_day,
-            geo_target_country=row.geo_target_country,
-            geo_target_region=row.geo_target_region,
-            geo_target_city=row.geo_target_city,
-            defaults={
-                "currency_code": row.currency_code,
-                "impressions": int(row.impressions),
-                "clicks": int(row.clicks),
-                "conversions": _decimal(row.conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "cost_micros": int(row.cost_micros),
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+    return _write_rows(GEOGRAPHIC_DAILY_SPEC, tenant=tenant, rows=rows, build=_geographic_daily_record)
 
 
 def upsert_keyword_daily_rows(*, tenant: Tenant, rows: Iterable[KeywordDailyRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkKeywordDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            campaign_id=row.campaign_id,
-            ad_group_id=row.ad_group_id,
-            criterion_id=row.criterion_id,
-            date_day=row.date_day,
-            defaults={
-                "keyword_text": row.keyword_text,
-                "match_type": row.match_type,
-                "criterion_status": row.criterion_status,
-                "quality_score": row.quality_score,
-                "ad_relevance": row.ad_relevance,
-                "expected_ctr": row.expected_ctr,
-                "landing_page_experience": row.landing_page_experience,
-                "currency_code": row.currency_code,
-                "impressions": int(row.impressions),
-                "clicks": int(row.clicks),
-                "conversions": _decimal(row.conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "cost_micros": int(row.cost_micros),
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+    return _write_rows(KEYWORD_DAILY_SPEC, tenant=tenant, rows=rows, build=_keyword_daily_record)
 
 
-def upsert_search_term_daily_rows(*, tenant: Tenant, rows: Iterable[SearchTermDailyRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkSearchTermDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            campaign_id=row.campaign_id,
-            ad_group_id=row.ad_group_id,
-            search_term=row.search_term,
-            date_day=row.date_day,
-            defaults={
-                "criterion_id": row.criterion_id,
-                "currency_code": row.currency_code,
-                "impressions": int(row.impressions),
-                "clicks": int(row.clicks),
-                "conversions": _decimal(row.conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "cost_micros": int(row.cost_micros),
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+def upsert_search_term_daily_rows(
+    *,
+    tenant: Tenant,
+    rows: Iterable[SearchTermDailyRow],
+    batch_size: int | None = None,
+) -> int:
+    return _write_rows(
+        SEARCH_TERM_DAILY_SPEC,
+        tenant=tenant,
+        rows=rows,
+        build=search_term_daily_record,
+        batch_size=batch_size,
+    )
 
 
 def upsert_asset_group_daily_rows(*, tenant: Tenant, rows: Iterable[AssetGroupDailyRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkAssetGroupDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            campaign_id=row.campaign_id,
-            asset_group_id=row.asset_group_id,
-            date_day=row.date_day,
-            defaults={
-                "asset_group_name": row.asset_group_name,
-                "asset_group_status": row.asset_group_status,
-                "currency_code": row.currency_code,
-                "impressions": int(row.impressions),
-                "clicks": int(row.clicks),
-                "conversions": _decimal(row.conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "cost_micros": int(row.cost_micros),
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+    return _write_rows(ASSET_GROUP_DAILY_SPEC, tenant=tenant, rows=rows, build=_asset_group_daily_record)
 
 
 def upsert_conversion_action_daily_rows(
@@ -200,70 +410,36 @@ def upsert_conversion_action_daily_rows(
     tenant: Tenant,
     rows: Iterable[ConversionActionDailyRow],
 ) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkConversionActionDaily.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            conversion_action_id=row.conversion_action_id,
-            date_day=row.date_day,
-            defaults={
-                "conversion_action_name": row.conversion_action_name,
-                "conversion_action_type": row.conversion_action_type,
-                "conversions": _decimal(row.conversions),
-                "all_conversions": _decimal(row.all_conversions),
-                "conversions_value": _decimal(row.conversions_value),
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+    return _write_rows(
+        CONVERSION_ACTION_DAILY_SPEC,
+        tenant=tenant,
+        rows=rows,
+        build=_conversion_action_daily_record,
+    )
 
 
 def upsert_change_event_rows(*, tenant: Tenant, rows: Iterable[ChangeEventRow]) -> int:
-    persisted = 0
-    for row in rows:
-        GoogleAdsSdkChangeEvent.all_objects.update_or_create(
-            tenant=tenant,
-            customer_id=row.customer_id,
-            event_fingerprint=row.event_fingerprint,
-            defaults={
-                "change_date_time": row.change_date_time,
-                "user_email": row.user_email,
-                "client_type": row.client_type,
-                "change_resource_type": row.change_resource_type,
-                "resource_change_operation": row.resource_change_operation,
-                "campaign_id": row.campaign_id,
-                "ad_group_id": row.ad_group_id,
-                "ad_id": row.ad_id,
-                "changed_fields": row.changed_fields,
-                "source_request_id": row.request_id,
-            },
-        )
-        persisted += 1
-    return persisted
+    return _write_rows(CHANGE_EVENT_SPEC, tenant=tenant, rows=rows, build=_change_event_record)
 
 
 def upsert_recommendation_rows(*, tenant: Tenant, rows: Iterable[RecommendationRow]) -> int:
-    persisted = 0
     now = timezone.now()
-    for row in rows:
-        GoogleAdsSdkRecommendation.all_objects.update_or_create(
+
+    def build(tenant: Tenant, row: RecommendationRow) -> GoogleAdsSdkRecommendation:
+        return GoogleAdsSdkRecommendation(
             tenant=tenant,
             customer_id=row.customer_id,
             recommendation_type=row.recommendation_type,
             resource_name=row.resource_name,
-            defaults={
-                "campaign_id": row.campaign_id,
-                "ad_group_id": row.ad_group_id,
-                "dismissed": row.dismissed,
-                "impact_metadata": row.impact_metadata,
-                "source_request_id": row.request_id,
-                "last_seen_at": now,
-            },
+            campaign_id=row.campaign_id,
+            ad_group_id=row.ad_group_id,
+            dismissed=row.dismissed,
+            impact_metadata=row.impact_metadata,
+            source_request_id=row.request_id,
+            last_seen_at=now,
         )
-        persisted += 1
-    return persisted
+
+    return _write_rows(RECOMMENDATION_SPEC, tenant=tenant, rows=rows, build=build)
 
 
 def upsert_accessible_customer_rows(
@@ -271,21 +447,19 @@ def upsert_accessible_customer_rows(
     tenant: Tenant,
     rows: Iterable[AccessibleCustomerRow],
 ) -> int:
-    persisted = 0
     now = timezone.now()
-    for row in rows:
-        GoogleAdsAccountMapping.all_objects.update_or_create(
+
+    def build(tenant: Tenant, row: AccessibleCustomerRow) -> GoogleAdsAccountMapping:
+        return GoogleAdsAccountMapping(
             tenant=tenant,
             customer_id=row.customer_id,
-            defaults={
-                "manager_customer_id": row.manager_customer_id,
-                "customer_name": row.customer_name,
-                "currency_code": row.currency_code,
-                "time_zone": row.time_zone,
-                "status": row.status,
-                "is_manager": row.is_manager,
-                "last_seen_at": now,
-            },
+            manager_customer_id=row.manager_customer_id,
+            customer_name=row.customer_name,
+            currency_code=row.currency_code,
+            time_zone=row.time_zone,
+            status=row.status,
+            is_manager=row.is_manager,
+            last_seen_at=now,
         )
-        persisted += 1
-    return persisted
+
+    return _write_rows(ACCESSIBLE_CUSTOMER_SPEC, tenant=tenant, rows=rows, build=build)
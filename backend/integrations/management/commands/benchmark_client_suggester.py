@@ -0,0 +1,158 @@
+"""Measure the client suggester against a large synthetic agency tenant.
+
+Usage:
+    python manage.py benchmark_client_suggester
+    python manage.py benchmark_client_suggester --accounts 10000 --clients 500
+    python manage.py benchmark_client_suggester --accounts 2000 --compare-pairwise
+
+Seeds Google Ads mappings, Meta ad accounts, Meta pages and existing Clients
+inside a transaction that is rolled back, then times ``suggest_clients`` cold
+and with a warm ``NameTokenCache``. ``--compare-pairwise`` also times the old
+O(N²) grouping on the same candidates; it is quadratic, so keep N modest.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from accounts.models import Tenant
+from analytics.models import AdAccount
+from integrations.clients.suggester import (
+    NameTokenCache,
+    SuggestionAccount,
+    _collect_unclaimed,
+    _group_by_similarity,
+    _jaccard,
+    _tokens,
+    normalize_name,
+    suggest_clients,
+)
+from integrations.models import Client, GoogleAdsAccountMapping, MetaPage
+
+_WORDS = (
+    "bank", "jamaica", "kingston", "island", "caribbean", "grace", "digicel",
+    "national", "royal", "blue", "mountain", "coffee", "sandals", "resorts",
+    "insurance", "deposit", "trust", "wholesale", "motors", "foods", "pharmacy",
+    "hardware", "rum", "spirits", "telecom", "media", "credit", "union",
+    "montego", "ocho", "rios", "negril", "portland", "mandeville", "spanish",
+    "town", "energy", "water", "logistics", "shipping", "airways", "tours",
+)
+_SUFFIXES = ("", " Limited", " Ltd.", " Group", " (JA)", " Official", " Ads")
+
+
+def _brand(rng: random.Random, index: int) -> str:
+    words = rng.sample(_WORDS, rng.randint(1, 3))
+    return " ".join(word.title() for word in words) + f" {index}"
+
+
+def _pairwise_groups(candidates: list[SuggestionAccount], *, threshold: float) -> int:
+    tokenized = [_tokens(normalize_name(c.display_name)) for c in candidates]
+    used = [False] * len(tokenized)
+    groups = 0
+    for i, toks_i in enumerate(tokenized):
+        if used[i] or not toks_i:
+            continue
+        used[i] = True
+        groups += 1
+        for j in range(i + 1, len(tokenized)):
+            if not used[j] and tokenized[j] and _jaccard(toks_i, tokenized[j]) >= threshold:
+                used[j] = True
+    return groups
+
+
+class Command(BaseCommand):
+    help = "Time suggest_clients on a synthetic tenant with many unclaimed accounts."
+
+    def add_arguments(self, parser):  # noqa: ANN001
+        parser.add_argument("--accounts", type=int, default=10000, help="Unclaimed accounts to seed.")
+        parser.add_argument("--clients", type=int, default=500, help="Existing Clients to seed.")
+        parser.add_argument("--threshold", type=float, default=0.7)
+        parser.add_argument("--seed", type=int, default=7)
+        parser.add_argument(
+            "--compare-pairwise",
+            action="store_true",
+            help="Also time the legacy O(N²) pairwise grouping.",
+        )
+
+    def handle(self, *args: Any, **options: Any):  # noqa: ANN001
+        account_count = int(options["accounts"])
+        client_count = int(options["clients"])
+        threshold = float(options["threshold"])
+        if account_count <= 0 or client_count < 0:
+            raise CommandError("--accounts must be positive and --clients non-negative.")
+        rng = random.Random(options["seed"])
+
+        results: list[tuple[str, float, str]] = []
+        with transaction.atomic():
+            tenant = Tenant.objects.create(name="benchmark-client-suggester")
+            brands = [_brand(rng, index) for index in range(max(account_count // 3, 1))]
+            google, meta, pages = [], [], []
+            for index in range(account_count):
+                name = rng.choice(brands) + rng.choice(_SUFFIXES)
+                bucket = index % 3
+                if bucket == 0:
+                    google.append(
+                        GoogleAdsAccountMapping(
+                            tenant=tenant, customer_id=f"{index:010d}", customer_name=name
+                        )
+                    )
+                elif bucket == 1:
+                    meta.append(AdAccount(tenant=tenant, external_id=f"act_{index}", name=name))
+                else:
+                    pages.append(
+                        MetaPage(
+                            tenant=tenant,
+                            page_id=f"page_{index}",
+                            name=name,
+                            page_token_enc=b"",
+                            page_token_nonce=b"",
+                            page_token_tag=b"",
+                        )
+                    )
+            GoogleAdsAccountMapping.all_objects.bulk_create(google, batch_size=1000)
+            AdAccount.all_objects.bulk_create(meta, batch_size=1000)
+            MetaPage.all_objects.bulk_create(pages, batch_size=1000)
+            Client.all_objects.bulk_create(
+                [
+                    Client(tenant=tenant, name=brands[index % len(brands)], slug=f"bench-{index}")
+                    for index in range(client_count)
+                ],
+                batch_size=1000,
+            )
+
+            candidates = _collect_unclaimed(str(tenant.id))
+            started = time.perf_counter()
+            groups = _group_by_similarity(candidates, threshold=threshold)
+            results.append(("group_indexed", time.perf_counter() - started, f"groups={len(groups)}"))
+
+            if options["compare_pairwise"]:
+                started = time.perf_counter()
+                pairwise = _pairwise_groups(candidates, threshold=threshold)
+                results.append(("group_pairwise", time.perf_counter() - started, f"groups={pairwise}"))
+
+            cache = NameTokenCache()
+            started = time.perf_counter()
+            suggestions = suggest_clients(str(tenant.id), threshold=threshold, token_cache=cache)
+            results.append(
+                ("suggest_cold", time.perf_counter() - started, f"suggestions={len(suggestions)}")
+            )
+
+            warm = NameTokenCache.from_payload(cache.to_payload())
+            started = time.perf_counter()
+            suggest_clients(str(tenant.id), threshold=threshold, token_cache=warm)
+            results.append(
+                ("suggest_warm", time.perf_counter() - started, f"cache_hits={warm.hits}")
+            )
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"vendor={connection.vendor} accounts={len(candidates)} clients={client_count} "
+            f"threshold={threshold}"
+        )
+        for label, elapsed, detail in results:
+            self.stdout.write(f"{label:<15} {elapsed:8.3f}s  {detail}")
@@ -0,0 +1,116 @@
+"""Compare per-row and batched Google Ads SDK repository writes.
+
+Usage:
+    python manage.py benchmark_google_ads_upserts
+    python manage.py benchmark_google_ads_upserts --rows 20000 --batch-size 1000
+
+Runs against the configured database (SQLite locally, Postgres in staging)
+inside a transaction that is rolled back, so no benchmark rows are kept.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from accounts.models import Tenant
+from core.bulk_upsert import DEFAULT_UPSERT_BATCH_SIZE
+from integrations.google_ads.client import SearchTermDailyRow
+from integrations.google_ads.repository import (
+    SEARCH_TERM_DAILY_SPEC,
+    search_term_daily_record,
+    upsert_search_term_daily_rows,
+)
+
+
+def _synthetic_rows(count: int, *, clicks: int) -> list[SearchTermDailyRow]:
+    start = date(2026, 1, 1)
+    return [
+        SearchTermDailyRow(
+            customer_id="1234567890",
+            campaign_id=str(100 + index % 20),
+            ad_group_id=str(1000 + index % 200),
+            criterion_id=str(5000 + index % 500),
+            search_term=f"benchmark term {index}",
+            date_day=start + timedelta(days=index % 90),
+            currency_code="USD",
+            impressions=100 + index % 50,
+            clicks=clicks,
+            conversions=Decimal("1.5"),
+            conversions_value=Decimal("12.25"),
+            cost_micros=1_250_000,
+            request_id="benchmark",
+        )
+        for index in range(count)
+    ]
+
+
+def _legacy_upsert(
+    *,
+    tenant: Tenant,
+    rows: list[SearchTermDailyRow],
+    batch_size: int,  # noqa: ARG001 - per-row writes ignore batching
+) -> int:
+    spec = SEARCH_TERM_DAILY_SPEC
+    persisted = 0
+    for row in rows:
+        record = search_term_daily_record(tenant, row)
+        lookup = {field: getattr(record, field) for field in spec.unique_fields}
+        defaults = {
+            field: getattr(record, field) for field in spec.update_fields if field != "updated_at"
+        }
+        spec.model.all_objects.update_or_create(defaults=defaults, **lookup)
+        persisted += 1
+    return persisted
+
+
+class Command(BaseCommand):
+    help = "Measure rows/second for per-row vs. batched Google Ads SDK upserts."
+
+    def add_arguments(self, parser):  # noqa: ANN001
+        parser.add_argument("--rows", type=int, default=5000, help="Synthetic rows per pass.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Override GOOGLE_ADS_UPSERT_BATCH_SIZE for the batched passes.",
+        )
+
+    def handle(self, *args: Any, **options: Any):  # noqa: ANN001
+        row_count = int(options["rows"])
+        if row_count <= 0:
+            raise CommandError("--rows must be positive.")
+        batch_size = int(
+            options.get("batch_size")
+            or getattr(settings, "GOOGLE_ADS_UPSERT_BATCH_SIZE", DEFAULT_UPSERT_BATCH_SIZE)
+        )
+        if batch_size <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        results: list[tuple[str, str, float]] = []
+        with transaction.atomic():
+            for strategy, writer in (
+                ("per_row", _legacy_upsert),
+                ("batched", upsert_search_term_daily_rows),
+            ):
+                tenant = Tenant.objects.create(name=f"benchmark-{strategy}")
+                for phase, clicks in (("insert", 1), ("update", 2)):
+                    rows = _synthetic_rows(row_count, clicks=clicks)
+                    started = time.perf_counter()
+                    writer(tenant=tenant, rows=rows, batch_size=batch_size)
+                    elapsed = time.perf_counter() - started
+                    results.append((strategy, phase, elapsed))
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"vendor={connection.vendor} rows={row_count} batch_size={batch_size}"
+        )
+        for strategy, phase, elapsed in results:
+            rate = row_count / elapsed if elapsed > 0 else float("inf")
+            self.stdout.write(f"{strategy:<8} {phase:<6} {elapsed:8.3f}s {rate:12.1f} rows/s")
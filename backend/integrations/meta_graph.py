@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 import json
 import logging
 import random
 import time
-from typing import Any
+from typing import Any, Sequence
 
 import httpx
 from django.conf import settings
 
 from core.metrics import observe_meta_graph_retry, observe_meta_graph_throttle_event
+from integrations.meta_graph_governor import MetaGraphRateGovernor
 
 logger = logging.getLogger(__name__)
 
@@ -148,8 +150,125 @@ class MetaAdAccount:
         }
 
 
-class MetaGraphClient:
-    """HTTP client for Meta Graph API OAuth + page/account discovery."""
+_BASE_INSIGHTS_DIMENSIONS = "date_start,date_stop,account_id,campaign_id,adset_id,ad_id,"
+_INSIGHTS_METRIC_FIELDS = "impressions,reach,spend,clicks,cpc,cpm,actions"
+
+
+@dataclass(frozen=True, slots=True)
+class MetaInsightsBreakdown:
+    level: str
+    breakdowns: str
+    dimensions: str
+    request_name: str
+
+
+META_INSIGHTS_BREAKDOWNS: dict[str, MetaInsightsBreakdown] = {
+    "region": MetaInsightsBreakdown(
+        level="campaign",
+        breakdowns="region",
+        dimensions="date_start,date_stop,account_id,campaign_id,",
+        request_name="list_insights_by_region",
+    ),
+    "age_gender": MetaInsightsBreakdown(
+        level="account",
+        breakdowns="age,gender",
+        dimensions="date_start,date_stop,account_id,",
+        request_name="list_insights_by_age_gender",
+    ),
+    "platform": MetaInsightsBreakdown(
+        level="account",
+        breakdowns="publisher_platform,device_platform",
+        dimensions="date_start,date_stop,account_id,",
+        request_name="list_insights_by_platform",
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MetaInsightsRequest:
+    account_id: str
+    user_access_token: str
+    level: str
+    since: str
+    until: str
+
+
+@dataclass(slots=True)
+class MetaAccountInsights:
+    """Base insight rows (or the error) plus each breakdown's rows (or its error)."""
+
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    error: MetaGraphClientError | None = None
+    breakdowns: dict[str, list[dict[str, Any]] | MetaGraphClientError] = field(default_factory=dict)
+
+
+def meta_graph_concurrency() -> int:
+    return max(int(getattr(settings, "META_GRAPH_CONCURRENCY", 4) or 1), 1)
+
+
+def _backoff_seconds(attempt: int) -> float:
+    base = 2 ** max(attempt - 1, 0)
+    jitter = random.uniform(0.0, 1.0)
+    return base + jitter
+
+
+class _PageCursor:
+    """Pagination state shared by the sync and async ``_paginated_data``."""
+
+    def __init__(
+        self,
+        path_or_url: str,
+        params: dict[str, Any] | None,
+        *,
+        request_name: str,
+        page_cap: int,
+        row_cap: int,
+    ) -> None:
+        self.rows: list[Any] = []
+        self.next_url: str | None = path_or_url
+        self.next_params: dict[str, Any] | None = params
+        self.pages_read = 0
+        self.request_name = request_name
+        self.page_cap = page_cap
+        self.row_cap = row_cap
+
+    def has_next(self) -> bool:
+        return bool(self.next_url) and self.pages_read < self.page_cap and len(self.rows) < self.row_cap
+
+    def consume(self, payload: dict[str, Any]) -> None:
+        self.pages_read += 1
+        self.next_params = None
+
+        data = payload.get("data")
+        if isinstance(data, list):
+            remaining = max(self.row_cap - len(self.rows), 0)
+            if remaining:
+                self.rows.extend(data[:remaining])
+
+        self.next_url = None
+        paging = payload.get("paging")
+        if isinstance(paging, dict):
+            candidate = paging.get("next")
+            if isinstance(candidate, str) and candidate.strip():
+                self.next_url = candidate.strip()
+
+    def finish(self) -> list[Any]:
+        if self.next_url and (self.pages_read >= self.page_cap or len(self.rows) >= self.row_cap):
+            logger.warning(
+                "meta.graph.pagination_cap_reached",
+                extra={
+                    "request_name": self.request_name,
+                    "pages_read": self.pages_read,
+                    "rows_read": len(self.rows),
+                    "page_cap": self.page_cap,
+                    "row_cap": self.row_cap,
+                },
+            )
+        return self.rows
+
+
+class _MetaGraphBase:
+    """Configuration, request building and response handling shared by both clients."""
 
     def __init__(
         self,
@@ -159,15 +278,18 @@ class MetaGraphClient:
         graph_version: str,
         timeout_seconds: float = 10.0,
         max_attempts: int = 5,
+        governor: MetaGraphRateGovernor | None = None,
     ) -> None:
         self.app_id = app_id
         self.app_secret = app_secret
+        self.graph_version = graph_version
         self.base_url = f"https://graph.facebook.com/{graph_version}"
+        self.timeout_seconds = timeout_seconds
         self.max_attempts = max(max_attempts, 1)
-        self._client = httpx.Client(timeout=timeout_seconds)
+        self.governor = governor
 
     @classmethod
-    def from_settings(cls) -> "MetaGraphClient":
+    def from_settings(cls):  # noqa: ANN206 - returns an instance of ``cls``
         app_id = (getattr(settings, "META_APP_ID", "") or "").strip()
         app_secret = (getattr(settings, "META_APP_SECRET", "") or "").strip()
         if not app_id or not app_secret:
@@ -183,7 +305,309 @@ class MetaGraphClient:
             graph_version=graph_version,
             timeout_seconds=timeout_seconds,
             max_attempts=max_attempts,
+            governor=MetaGraphRateGovernor.from_settings(),
+        )
+
+    def _insights_query(
+        self,
+        *,
+        account_id: str,
+        user_access_token: str,
+        level: str,
+        since: str,
+        until: str,
+        dimensions: str,
+        breakdowns: str | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        params: dict[str, Any] = {
+            "level": level,
+            "time_increment": 1,
+            "time_range": json.dumps({"since": since, "until": until}),
+        }
+        if breakdowns:
+            params["breakdowns"] = breakdowns
+        params.update(
+            {
+                "fields": dimensions + _INSIGHTS_METRIC_FIELDS,
+                "limit": 200,
+                "access_token": user_access_token,
+            }
+        )
+        return f"/{self._account_node_id(account_id)}/insights", params
+
+    def _breakdown_query(
+        self,
+        spec: MetaInsightsBreakdown,
+        *,
+        account_id: str,
+        user_access_token: str,
+        since: str,
+        until: str,
+    ) -> tuple[str, dict[str, Any]]:
+        return self._insights_query(
+            account_id=account_id,
+            user_access_token=user_access_token,
+            level=spec.level,
+            since=since,
+            until=until,
+            dimensions=spec.dimensions,
+            breakdowns=spec.breakdowns,
+        )
+
+    def _handle_transport_error(self, exc: httpx.HTTPError, *, attempt: int, request_name: str) -> None:
+        """Raise on the final attempt; otherwise record the retry."""
+
+        if attempt >= self.max_attempts:
+            raise MetaGraphClientError(
+                f"Meta Graph API request failed: {exc}",
+                retryable=True,
+            ) from exc
+        self._observe_retry(
+            request_name=request_name,
+            attempt=attempt,
+            reason=META_GRAPH_RETRY_REASON_TRANSPORT,
+            status_code=None,
+        )
+
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        *,
+        attempt: int,
+        request_name: str,
+        rate_keys: dict[str, str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the payload, ``None`` when the request should be retried, or raise."""
+
+        self._emit_throttle_from_headers(response.headers, request_name=request_name)
+        if self.governor is not None and rate_keys:
+            self.governor.observe_headers(rate_keys, response.headers)
+
+        payload = self._safe_json(response)
+        if response.is_success:
+            if isinstance(payload, dict):
+                return payload
+            raise MetaGraphClientError("Meta Graph API returned an unexpected response payload.")
+
+        details = self._extract_error_details(payload)
+        message = details["message"] or f"Meta Graph API returned HTTP {response.status_code}."
+        retryable = self._should_retry_response(
+            status_code=response.status_code,
+            payload=payload,
+        )
+        reason = _classify_retry_reason(status_code=response.status_code, payload=payload)
+        if (
+            retryable
+            and reason == META_GRAPH_RETRY_REASON_RATE_LIMITED
+            and self.governor is not None
+            and rate_keys
+        ):
+            self.governor.observe_throttled(rate_keys)
+        if retryable and attempt < self.max_attempts:
+            self._observe_retry(
+                request_name=request_name,
+                attempt=attempt,
+                reason=reason,
+                status_code=response.status_code,
+            )
+            return None
+
+        raise MetaGraphClientError(
+            message,
+            status_code=response.status_code,
+            error_code=details["error_code"],
+            error_subcode=details["error_subcode"],
+            retryable=retryable,
+            payload=payload if isinstance(payload, dict) else None,
+        )
+
+    def _rate_keys(self, url: str) -> dict[str, str]:
+        if self.governor is None:
+            return {}
+        return self.governor.bucket_keys(self.app_id, url)
+
+    def _governor_delay(self, rate_keys: dict[str, str]) -> float:
+        """Reserve a slot with the rate governor; return the seconds to hold off."""
+
+        if self.governor is None or not rate_keys:
+            return 0.0
+        return self.governor.reserve(rate_keys)
+
+    def _governor_pause(self, rate_keys: dict[str, str]) -> float:
+        if self.governor is None or not rate_keys:
+            return 0.0
+        return self.governor.blocked_for(rate_keys)
+
+    def _absolute_url(self, path_or_url: str) -> str:
+        if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
+            return path_or_url
+        if path_or_url.startswith("/"):
+            return f"{self.base_url}{path_or_url}"
+        return f"{self.base_url}/{path_or_url}"
+
+    @staticmethod
+    def _account_node_id(account_id: str) -> str:
+        cleaned = account_id.strip()
+        if cleaned.startswith("act_"):
+            return cleaned
+        if cleaned.isdigit():
+            return f"act_{cleaned}"
+        return cleaned
+
+    @staticmethod
+    def _safe_json(response: httpx.Response) -> Any:
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def _emit_throttle_from_headers(self, headers: httpx.Headers, *, request_name: str) -> None:
+        for header_name in (
+            "x-app-usage",
+            "x-ad-account-usage",
+            "x-business-use-case-usage",
+        ):
+            raw_value = headers.get(header_name)
+            if not raw_value:
+                continue
+            parsed = self._try_parse_usage_header(raw_value)
+            usage_pct = self._max_usage_percentage(parsed)
+            if usage_pct is None or usage_pct < 85:
+                continue
+            observe_meta_graph_throttle_event(header_name=header_name)
+            logger.warning(
+                "meta.graph.throttle_near_limit",
+                extra={
+                    "request_name": request_name,
+                    "header_name": header_name,
+                    "usage_pct": usage_pct,
+                },
+            )
+
+    @staticmethod
+    def _try_parse_usage_header(raw_value: str) -> Any:
+        try:
+            return json.loads(raw_value)
+        except ValueError:
+            return raw_value
+
+    def _max_usage_percentage(self, payload: Any) -> int | None:
+        values: list[int] = []
+
+        def _collect(value: Any, key_hint: str | None = None) -> None:
+            if isinstance(value, dict):
+                for child_key, child_value in value.items():
+                    _collect(child_value, child_key)
+                return
+            if isinstance(value, list):
+                for child in value:
+                    _collect(child, key_hint)
+                return
+            if isinstance(value, (int, float)) and key_hint in {
+                "call_count",
+                "total_cputime",
+                "total_time",
+            }:
+                values.append(int(value))
+
+        _collect(payload)
+        if not values:
+            return None
+        return max(values)
+
+    def _observe_retry(
+        self,
+        *,
+        request_name: str,
+        attempt: int,
+        reason: str,
+        status_code: int | None,
+    ) -> None:
+        observe_meta_graph_retry(reason=reason)
+        logger.info(
+            "meta.graph.retry",
+            extra={
+                "request_name": request_name,
+                "attempt": attempt,
+                "reason": reason,
+                "status_code": status_code,
+            },
+        )
+
+    def _should_retry_response(self, *, status_code: int, payload: Any) -> bool:
+        if status_code in _RETRYABLE_HTTP_STATUS:
+            return True
+        if status_code < 400:
+            return False
+
+        if not isinstance(payload, dict):
+            return False
+        error_payload = payload.get("error")
+        if not isinstance(error_payload, dict):
+            return False
+        if bool(error_payload.get("is_transient")):
+            return True
+
+        raw_code = error_payload.get("code")
+        try:
+            code = int(raw_code)
+        except (TypeError, ValueError):
+            code = None
+        return code in _RETRYABLE_META_ERROR_CODES if code is not None else False
+
+    @staticmethod
+    def _extract_error_details(payload: Any) -> dict[str, Any]:
+        details: dict[str, Any] = {
+            "message": None,
+            "error_code": None,
+            "error_subcode": None,
+        }
+        if not isinstance(payload, dict):
+            return details
+        error_payload = payload.get("error")
+        if isinstance(error_payload, dict):
+            message = error_payload.get("message")
+            if isinstance(message, str) and message.strip():
+                details["message"] = message
+            raw_code = error_payload.get("code")
+            raw_subcode = error_payload.get("error_subcode")
+            try:
+                details["error_code"] = int(raw_code) if raw_code is not None else None
+            except (TypeError, ValueError):
+                details["error_code"] = None
+            try:
+                details["error_subcode"] = int(raw_subcode) if raw_subcode is not None else None
+            except (TypeError, ValueError):
+                details["error_subcode"] = None
+            return details
+        detail = payload.get("error_description")
+        if isinstance(detail, str) and detail.strip():
+            details["message"] = detail
+        return details
+
+
+class MetaGraphClient(_MetaGraphBase):
+    """HTTP client for Meta Graph API OAuth + page/account discovery."""
+
+    def __init__(
+        self,
+        *,
+        app_id: str,
+        app_secret: str,
+        graph_version: str,
+        timeout_seconds: float = 10.0,
+        max_attempts: int = 5,
+        governor: MetaGraphRateGovernor | None = None,
+    ) -> None:
+        super().__init__(
+            app_id=app_id,
+            app_secret=app_secret,
+            graph_version=graph_version,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            governor=governor,
         )
+        self._client = httpx.Client(timeout=timeout_seconds)
 
     def close(self) -> None:
         self._client.close()
@@ -477,45 +901,49 @@ class MetaGraphClient:
         since: str,
         until: str,
     ) -> list[dict[str, Any]]:
-        return self._paginated_data(
-            f"/{self._account_node_id(account_id)}/insights",
-            params={
-                "level": level,
-                "time_increment": 1,
-                "time_range": json.dumps({"since": since, "until": until}),
-                "fields": (
-                    "date_start,date_stop,account_id,campaign_id,adset_id,ad_id,"
-                    "impressions,reach,spend,clicks,cpc,cpm,actions"
-                ),
-                "limit": 200,
-                "access_token": user_access_token,
-            },
-            request_name="list_insights",
+        path, params = self._insights_query(
+            account_id=account_id,
+            user_access_token=user_access_token,
+            level=level,
+            since=since,
+            until=until,
+            dimensions=_BASE_INSIGHTS_DIMENSIONS,
         )
+        return self._paginated_data(path, params=params, request_name="list_insights")
 
-    def list_insights_by_region(
+    def list_insights_breakdown(
         self,
         *,
+        breakdown: str,
         account_id: str,
         user_access_token: str,
         since: str,
         until: str,
     ) -> list[dict[str, Any]]:
-        return self._paginated_data(
-            f"/{self._account_node_id(account_id)}/insights",
-            params={
-                "level": "campaign",
-                "time_increment": 1,
-                "time_range": json.dumps({"since": since, "until": until}),
-                "breakdowns": "region",
-                "fields": (
-                    "date_start,date_stop,account_id,campaign_id,"
-                    "impressions,reach,spend,clicks,cpc,cpm,actions"
-                ),
-                "limit": 200,
-                "access_token": user_access_token,
-            },
-            request_name="list_insights_by_region",
+        spec = META_INSIGHTS_BREAKDOWNS[breakdown]
+        path, params = self._breakdown_query(
+            spec,
+            account_id=account_id,
+            user_access_token=user_access_token,
+            since=since,
+            until=until,
+        )
+        return self._paginated_data(path, params=params, request_name=spec.request_name)
+
+    def list_insights_by_region(
+        self,
+        *,
+        account_id: str,
+        user_access_token: str,
+        since: str,
+        until: str,
+    ) -> list[dict[str, Any]]:
+        return self.list_insights_breakdown(
+            breakdown="region",
+            account_id=account_id,
+            user_access_token=user_access_token,
+            since=since,
+            until=until,
         )
 
     def list_insights_by_age_gender(
@@ -526,21 +954,12 @@ class MetaGraphClient:
         since: str,
         until: str,
     ) -> list[dict[str, Any]]:
-        return self._paginated_data(
-            f"/{self._account_node_id(account_id)}/insights",
-            params={
-                "level": "account",
-                "time_increment": 1,
-                "time_range": json.dumps({"since": since, "until": until}),
-                "breakdowns": "age,gender",
-                "fields": (
-                    "date_start,date_stop,account_id,"
-                    "impressions,reach,spend,clicks,cpc,cpm,actions"
-                ),
-                "limit": 200,
-                "access_token": user_access_token,
-            },
-            request_name="list_insights_by_age_gender",
+        return self.list_insights_breakdown(
+            breakdown="age_gender",
+            account_id=account_id,
+            user_access_token=user_access_token,
+            since=since,
+            until=until,
         )
 
     def list_insights_by_platform(
@@ -551,23 +970,44 @@ class MetaGraphClient:
         since: str,
         until: str,
     ) -> list[dict[str, Any]]:
-        return self._paginated_data(
-            f"/{self._account_node_id(account_id)}/insights",
-            params={
-                "level": "account",
-                "time_increment": 1,
-                "time_range": json.dumps({"since": since, "until": until}),
-                "breakdowns": "publisher_platform,device_platform",
-                "fields": (
-                    "date_start,date_stop,account_id,"
-                    "impressions,reach,spend,clicks,cpc,cpm,actions"
-                ),
-                "limit": 200,
-                "access_token": user_access_token,
-            },
-            request_name="list_insights_by_platform",
+        return self.list_insights_breakdown(
+            breakdown="platform",
+            account_id=account_id,
+            user_access_token=user_access_token,
+            since=since,
+            until=until,
         )
 
+    def fetch_account_insights(
+        self,
+        requests: Sequence[MetaInsightsRequest],
+        *,
+        concurrency: int | None = None,
+    ) -> list[MetaAccountInsights]:
+        """Fetch base insights plus every breakdown for many accounts concurrently.
+
+        Runs ``AsyncMetaGraphClient`` on a private event loop with this
+        client's configuration, so synchronous callers (Celery tasks) get the
+        concurrency without becoming async themselves.
+        """
+
+        if not requests:
+            return []
+
+        async def _run() -> list[MetaAccountInsights]:
+            async with AsyncMetaGraphClient(
+                app_id=self.app_id,
+                app_secret=self.app_secret,
+                graph_version=self.graph_version,
+                timeout_seconds=self.timeout_seconds,
+                max_attempts=self.max_attempts,
+                max_concurrency=concurrency or meta_graph_concurrency(),
+                governor=self.governor,
+            ) as client:
+                return await client.fetch_account_insights(requests)
+
+        return asyncio.run(_run())
+
     def _request_json(
         self,
         method: str,
@@ -577,71 +1017,28 @@ class MetaGraphClient:
         request_name: str,
     ) -> dict[str, Any]:
         url = self._absolute_url(path_or_url)
-        last_error: str | None = None
+        rate_keys = self._rate_keys(url)
 
         for attempt in range(1, self.max_attempts + 1):
+            delay = self._governor_delay(rate_keys)
+            while delay > 0:
+                time.sleep(delay)
+                delay = self._governor_pause(rate_keys)
             try:
                 response = self._client.request(method, url, params=params)
             except httpx.HTTPError as exc:
-                last_error = f"Meta Graph API request failed: {exc}"
-                if attempt >= self.max_attempts:
-                    raise MetaGraphClientError(
-                        last_error,
-                        retryable=True,
-                    ) from exc
-                self._observe_retry(
-                    request_name=request_name,
-                    attempt=attempt,
-                    reason=META_GRAPH_RETRY_REASON_TRANSPORT,
-                    status_code=None,
-                )
+                self._handle_transport_error(exc, attempt=attempt, request_name=request_name)
                 self._sleep_with_backoff(attempt)
                 continue
 
-            self._emit_throttle_from_headers(response.headers, request_name=request_name)
-
-            payload = self._safe_json(response)
-            if response.is_success:
-                if isinstance(payload, dict):
-                    return payload
-                raise MetaGraphClientError("Meta Graph API returned an unexpected response payload.")
-
-            details = self._extract_error_details(payload)
-            message = details["message"]
-            last_error = message or f"Meta Graph API returned HTTP {response.status_code}."
-            retryable = self._should_retry_response(
-                status_code=response.status_code,
-                payload=payload,
+            payload = self._handle_response(
+                response, attempt=attempt, request_name=request_name, rate_keys=rate_keys
             )
-            if attempt < self.max_attempts and self._should_retry_response(
-                status_code=response.status_code,
-                payload=payload,
-            ):
-                self._observe_retry(
-                    request_name=request_name,
-                    attempt=attempt,
-                    reason=_classify_retry_reason(
-                        status_code=response.status_code,
-                        payload=payload,
-                    ),
-                    status_code=response.status_code,
-                )
-                self._sleep_with_backoff(attempt)
-                continue
+            if payload is not None:
+                return payload
+            self._sleep_with_backoff(attempt)
 
-            raise MetaGraphClientError(
-                last_error,
-                status_code=response.status_code,
-                error_code=details["error_code"],
-                error_subcode=details["error_subcode"],
-                retryable=retryable,
-                payload=payload if isinstance(payload, dict) else None,
-            )
-
-        raise MetaGraphClientError(
-            last_error or "Meta Graph API request failed after retries.",
-            retryable=True,
-        )
+        raise MetaGraphClientError("Meta Graph API request failed after retries.", retryable=True)
 
     def _paginated_data(
         self,
@@ -652,200 +1049,23 @@ class MetaGraphClient:
         page_cap: int = _DEFAULT_PAGE_CAP,
         row_cap: int = _DEFAULT_ROW_CAP,
     ) -> list[Any]:
-        rows: list[Any] = []
-        next_url: str | None = path_or_url
-        next_params: dict[str, Any] | None = params
-        pages_read = 0
-
-        while next_url and pages_read < page_cap and len(rows) < row_cap:
-            payload = self._request_json(
-                "GET",
-                next_url,
-                params=next_params,
-                request_name=request_name,
-            )
-            pages_read += 1
-            next_params = None
-
-            data = payload.get("data")
-            if isinstance(data, list):
-                remaining = max(row_cap - len(rows), 0)
-                if remaining:
-                    rows.extend(data[:remaining])
-
-            next_url = None
-            paging = payload.get("paging")
-            if isinstance(paging, dict):
-                candidate = paging.get("next")
-                if isinstance(candidate, str) and candidate.strip():
-                    next_url = candidate.strip()
-
-        if next_url and (pages_read >= page_cap or len(rows) >= row_cap):
-            logger.warning(
-                "meta.graph.pagination_cap_reached",
-                extra={
-                    "request_name": request_name,
-                    "pages_read": pages_read,
-                    "rows_read": len(rows),
-                    "page_cap": page_cap,
-                    "row_cap": row_cap,
-                },
-            )
-
-        return rows
-
-    def _absolute_url(self, path_or_url: str) -> str:
-        if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
-            return path_or_url
-        if path_or_url.startswith("/"):
-            return f"{self.base_url}{path_or_url}"
-        return f"{self.base_url}/{path_or_url}"
-
-    @staticmethod
-    def _account_node_id(account_id: str) -> str:
-        cleaned = account_id.strip()
-        if cleaned.startswith("act_"):
-            return cleaned
-        if cleaned.isdigit():
-            return f"act_{cleaned}"
-        return cleaned
-
-    @staticmethod
-    def _safe_json(response: httpx.Response) -> Any:
-        try:
-            return response.json()
-        except ValueError:
-            return None
-
-    def _emit_throttle_from_headers(self, headers: httpx.Headers, *, request_name: str) -> None:
-        for header_name in (
-            "x-app-usage",
-            "x-ad-account-usage",
-            "x-business-use-case-usage",
-        ):
-            raw_value = headers.get(header_name)
-            if not raw_value:
-                continue
-            parsed = self._try_parse_usage_header(raw_value)
-            usage_pct = self._max_usage_percentage(parsed)
-            if usage_pct is None or usage_pct < 85:
-                continue
-            observe_meta_graph_throttle_event(header_name=header_name)
-            logger.warning(
-                "meta.graph.throttle_near_limit",
-                extra={
-                    "request_name": request_name,
-                    "header_name": header_name,
-                    "usage_pct": usage_pct,
-                },
-            )
-
-    @staticmethod
-    def _try_parse_usage_header(raw_value: str) -> Any:
-        try:
-            return json.loads(raw_value)
-        except ValueError:
-            return raw_value
-
-    def _max_usage_percentage(self, payload: Any) -> int | None:
-        values: list[int] = []
-
-        def _collect(value: Any, key_hint: str | None = None) -> None:
-            if isinstance(value, dict):
-                for child_key, child_value in value.items():
-                    _collect(child_value, child_key)
-                return
-            if isinstance(value, list):
-                for child in value:
-                    _collect(child, key_hint)
-                return
-            if isinstance(value, (int, float)) and key_hint in {
-                "call_count",
-                "total_cputime",
-                "total_time",
-            }:
-                values.append(int(value))
-
-        _collect(payload)
-        if not values:
-            return None
-        return max(values)
-
-    def _observe_retry(
-        self,
-        *,
-        request_name: str,
-        attempt: int,
-        reason: str,
-        status_code: int | None,
-    ) -> None:
-        observe_meta_graph_retry(reason=reason)
-        logger.info(
-            "meta.graph.retry",
-            extra={
-                "request_name": request_name,
-                "attempt": attempt,
-                "reason": reason,
-                "status_code": status_code,
-            },
+        cursor = _PageCursor(
+            path_or_url, params, request_name=request_name, page_cap=page_cap, row_cap=row_cap
         )
+        while cursor.has_next():
+            cursor.consume(
+                self._request_json(
+                    "GET",
+                    cursor.next_url,
+                    params=cursor.next_params,
+                    request_name=request_name,
+                )
+            )
+        return cursor.finish()
 
     @staticmethod
     def _sleep_with_backoff(attempt: int) -> None:
-        base = 2 ** max(attempt - 1, 0)
-        jitter = random.uniform(0.0, 1.0)
-        time.sleep(base + jitter)
-
-    def _should_retry_response(self, *, status_code: int, payload: Any) -> bool:
-        if status_code in _RETRYABLE_HTTP_STATUS:
-            return True
-        if status_code < 400:
-            return False
-
-        if not isinstance(payload, dict):
-            return False
-        error_payload = payload.get("error")
-        if not isinstance(error_payload, dict):
-            return False
-        if bool(error_payload.get("is_transient")):
-            return True
-
-        raw_code = error_payload.get("code")
-        try:
-            code = int(raw_code)
-        except (TypeError, ValueError):
-            code = None
-        return code in _RETRYABLE_META_ERROR_CODES if code is not None else False
-
-    @staticmethod
-    def _extract_error_details(payload: Any) -> dict[str, Any]:
-        details: dict[str, Any] = {
-            "message": None,
-            "error_code": None,
-            "error_subcode": None,
-        }
-        if not isinstance(payload, dict):
-            return details
-        error_payload = payload.get("error")
-        if isinstance(error_payload, dict):
-            message = error_payload.get("message")
-            if isinstance(message, str) and message.strip():
-                details["message"] = message
-            raw_code = error_payload.get("code")
-            raw_subcode = error_payload.get("error_subcode")
-            try:
-                details["error_code"] = int(raw_code) if raw_code is not None else None
-            except (TypeError, ValueError):
-                details["error_code"] = None
-            try:
-                details["error_subcode"] = int(raw_subcode) if raw_subcode is not None else None
-            except (TypeError, ValueError):
-                details["error_subcode"] = None
-            return details
-        detail = payload.get("error_description")
-        if isinstance(detail, str) and detail.strip():
-            details["message"] = detail
-        return details
+        time.sleep(_backoff_seconds(attempt))
 
     @staticmethod
     def _parse_access_token_payload(payload: dict[str, Any]) -> MetaToken:
@@ -932,7 +1152,7 @@ class MetaGraphClient:
         if existing is None:
             accounts_by_id[account.id] = account
             return
-        for field in (
+        for attribute in (
             "username",
             "name",
             "profile_picture_url",
@@ -942,5 +1162,185 @@ class MetaGraphClient:
             "source_page_name",
             "source_field",
         ):
-            if getattr(existing, field) in (None, "") and getattr(account, field) not in (None, ""):
-                setattr(existing, field, getattr(account, field))
+            if getattr(existing, attribute) in (None, "") and getattr(account, attribute) not in (None, ""):
+                setattr(existing, attribute, getattr(account, attribute))
+
+
+class AsyncMetaGraphClient(_MetaGraphBase):
+    """``httpx.AsyncClient`` variant of ``MetaGraphClient`` for the insights reads.
+
+    Retries, throttle telemetry and error mapping match the synchronous
+    client; backoff awaits ``asyncio.sleep`` and at most ``max_concurrency``
+    requests are in flight at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        app_id: str,
+        app_secret: str,
+        graph_version: str,
+        timeout_seconds: float = 10.0,
+        max_attempts: int = 5,
+        max_concurrency: int | None = None,
+        governor: MetaGraphRateGovernor | None = None,
+    ) -> None:
+        super().__init__(
+            app_id=app_id,
+            app_secret=app_secret,
+            graph_version=graph_version,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            governor=governor,
+        )
+        self.max_concurrency = max(max_concurrency or meta_graph_concurrency(), 1)
+        self._client = httpx.AsyncClient(timeout=timeout_seconds)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncMetaGraphClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: D401 - context manager contract
+        await self.aclose()
+
+    async def list_insights(
+        self,
+        *,
+        account_id: str,
+        user_access_token: str,
+        level: str,
+        since: str,
+        until: str,
+    ) -> list[dict[str, Any]]:
+        path, params = self._insights_query(
+            account_id=account_id,
+            user_access_token=user_access_token,
+            level=level,
+            since=since,
+            until=until,
+            dimensions=_BASE_INSIGHTS_DIMENSIONS,
+        )
+        return await self._paginated_data(path, params=params, request_name="list_insights")
+
+    async def list_insights_breakdown(
+        self,
+        *,
+        breakdown: str,
+        account_id: str,
+        user_access_token: str,
+        since: str,
+        until: str,
+    ) -> list[dict[str, Any]]:
+        spec = META_INSIGHTS_BREAKDOWNS[breakdown]
+        path, params = self._breakdown_query(
+            spec,
+            account_id=account_id,
+            user_access_token=user_access_token,
+            since=since,
+            until=until,
+        )
+        return await self._paginated_data(path, params=params, request_name=spec.request_name)
+
+    async def fetch_account_insights(
+        self, requests: Sequence[MetaInsightsRequest]
+    ) -> list[MetaAccountInsights]:
+        """Fetch every account concurrently; breakdowns run once base insights succeed."""
+
+        return list(await asyncio.gather(*(self._fetch_one_account(request) for request in requests)))
+
+    async def _fetch_one_account(self, request: MetaInsightsRequest) -> MetaAccountInsights:
+        result = MetaAccountInsights()
+        try:
+            result.rows = await self.list_insights(
+                account_id=request.account_id,
+                user_access_token=request.user_access_token,
+                level=request.level,
+                since=request.since,
+                until=request.until,
+            )
+        except MetaGraphClientError as exc:
+            result.error = exc
+            return result
+
+        names = list(META_INSIGHTS_BREAKDOWNS)
+        outcomes = await asyncio.gather(
+            *(
+                self.list_insights_breakdown(
+                    breakdown=name,
+                    account_id=request.account_id,
+                    user_access_token=request.user_access_token,
+                    since=request.since,
+                    until=request.until,
+                )
+                for name in names
+            ),
+            return_exceptions=True,
+        )
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, MetaGraphClientError):
+                raise outcome
+            result.breakdowns[name] = outcome
+        return result
+
+    async def _request_json(
+        self,
+        method: str,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        request_name: str,
+    ) -> dict[str, Any]:
+        url = self._absolute_url(path_or_url)
+        rate_keys = self._rate_keys(url)
+
+        for attempt in range(1, self.max_attempts + 1):
+            delay = self._governor_delay(rate_keys)
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self._governor_pause(rate_keys)
+            # The slot is released before backing off so other requests proceed.
+            async with self._semaphore:
+                try:
+                    response = await self._client.request(method, url, params=params)
+                except httpx.HTTPError as exc:
+                    self._handle_transport_error(exc, attempt=attempt, request_name=request_name)
+                    response = None
+            if response is not None:
+                payload = self._handle_response(
+                    response, attempt=attempt, request_name=request_name, rate_keys=rate_keys
+                )
+                if payload is not None:
+                    return payload
+            await self._sleep_with_backoff(attempt)
+
+        raise MetaGraphClientError("Meta Graph API request failed after retries.", retryable=True)
+
+    async def _paginated_data(
+        self,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None,
+        request_name: str,
+        page_cap: int = _DEFAULT_PAGE_CAP,
+        row_cap: int = _DEFAULT_ROW_CAP,
+    ) -> list[Any]:
+        cursor = _PageCursor(
+            path_or_url, params, request_name=request_name, page_cap=page_cap, row_cap=row_cap
+        )
+        while cursor.has_next():
+            cursor.consume(
+                await self._request_json(
+                    "GET",
+                    cursor.next_url,
+                    params=cursor.next_params,
+                    request_name=request_name,
+                )
+            )
+        return cursor.finish()
+
+    @staticmethod
+    async def _sleep_with_backoff(attempt: int) -> None:
+        await asyncio.sleep(_backoff_seconds(attempt))
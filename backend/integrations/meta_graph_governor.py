@@ -0,0 +1,322 @@
+"""Adaptive token-bucket governor shared by every Meta Graph client.
+
+Meta reports how close an app and each ad account are to their rate limits in
+the ``x-app-usage``, ``x-ad-account-usage`` and ``x-business-use-case-usage``
+response headers. The governor keeps one bucket per app and one per
+app + ad account, feeds those percentages back into each bucket's refill rate,
+and hands callers the delay they should wait before their next request. Bucket
+state lives in a ``MetaGraphBucketStore``; the file store serializes updates
+with ``flock`` so every Celery worker on a host slows down together instead of
+each one discovering the limit through its own 429/#17 errors.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Collection, Iterator, Mapping
+
+from django.conf import settings
+
+from core.metrics import observe_meta_graph_governor_state, observe_meta_graph_governor_wait
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts fall back to the memory store
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+SCOPE_APP = "app"
+SCOPE_AD_ACCOUNT = "ad_account"
+
+_AD_ACCOUNT_PATTERN = re.compile(r"/(act_\d+)(?=[/?]|$)")
+_USAGE_KEYS = {"call_count", "total_cputime", "total_time", "acc_id_util_pct"}
+
+
+@dataclass(slots=True)
+class MetaGraphBucket:
+    tokens: float
+    rate: float
+    usage_pct: float = 0.0
+    blocked_until: float = 0.0
+    updated_at: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MetaGraphUsage:
+    usage_pct: float
+    regain_seconds: float = 0.0
+
+
+class MemoryBucketStore:
+    """Process-local store; buckets are shared by threads and event loops only."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: dict[str, dict[str, float]] = {}
+
+    @contextmanager
+    def locked(self, key: str) -> Iterator[dict[str, dict[str, float]]]:
+        with self._lock:
+            yield self._buckets
+
+
+class FileBucketStore:
+    """One JSON file per bucket, updated under an exclusive ``flock``."""
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def locked(self, key: str) -> Iterator[dict[str, dict[str, float]]]:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        fd = os.open(self.directory / f"{digest}.json", os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+", encoding="utf-8") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                try:
+                    buckets = json.loads(handle.read() or "{}")
+                except ValueError:
+                    buckets = {}
+                if not isinstance(buckets, dict):
+                    buckets = {}
+                yield buckets
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(buckets, separators=(",", ":")))
+                handle.flush()
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+MetaGraphBucketStore = MemoryBucketStore | FileBucketStore
+
+
+class MetaGraphRateGovernor:
+    """Token buckets whose refill rate tracks Meta's reported usage.
+
+    ``reserve`` takes a token from every bucket a request touches and returns
+    how long to wait first (then ``blocked_for`` until it returns zero).
+    Buckets may go negative, so concurrent callers
+    queue behind each other rather than racing for the same token. Below
+    ``slowdown_pct`` usage a bucket refills at ``max_rate``; above it the rate
+    falls linearly to ``min_rate`` at 100%. A throttled response, or a usage
+    header announcing a regain time, blocks the bucket until then.
+    """
+
+    def __init__(
+        self,
+        store: MetaGraphBucketStore,
+        *,
+        max_rate: float = 5.0,
+        min_rate: float = 0.2,
+        burst: float = 10.0,
+        slowdown_pct: float = 75.0,
+        cooldown_seconds: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.store = store
+        self.max_rate = max(max_rate, 0.001)
+        self.min_rate = min(max(min_rate, 0.001), self.max_rate)
+        self.burst = max(burst, 1.0)
+        self.slowdown_pct = min(max(slowdown_pct, 0.0), 99.0)
+        self.cooldown_seconds = max(cooldown_seconds, 0.0)
+        self.clock = clock
+
+    @classmethod
+    def from_settings(cls) -> "MetaGraphRateGovernor | None":
+        backend = (getattr(settings, "META_GRAPH_GOVERNOR_BACKEND", "file") or "").strip().lower()
+        if backend in {"", "off", "none", "disabled"}:
+            return None
+        if backend == "file" and fcntl is not None:
+            store: MetaGraphBucketStore = FileBucketStore(_state_dir())
+        else:
+            store = _process_memory_store()
+        return cls(
+            store,
+            max_rate=float(getattr(settings, "META_GRAPH_GOVERNOR_MAX_RATE", 5.0)),
+            min_rate=float(getattr(settings, "META_GRAPH_GOVERNOR_MIN_RATE", 0.2)),
+            burst=float(getattr(settings, "META_GRAPH_GOVERNOR_BURST", 10.0)),
+            slowdown_pct=float(getattr(settings, "META_GRAPH_GOVERNOR_SLOWDOWN_PCT", 75.0)),
+            cooldown_seconds=float(getattr(settings, "META_GRAPH_GOVERNOR_COOLDOWN_SECONDS", 30.0)),
+        )
+
+    @staticmethod
+    def bucket_keys(app_id: str, url: str) -> dict[str, str]:
+        """Map each scope a request to ``url`` counts against to its bucket key."""
+
+        keys = {SCOPE_APP: f"app:{app_id}"}
+        match = _AD_ACCOUNT_PATTERN.search(url.split("?", 1)[0])
+        if match:
+            keys[SCOPE_AD_ACCOUNT] = f"app:{app_id}:{match.group(1)}"
+        return keys
+
+    def reserve(self, keys: Mapping[str, str]) -> float:
+        """Consume one token per bucket; return the seconds to wait before sending."""
+
+        wait = 0.0
+        limiting_scope = ""
+        for scope, key in keys.items():
+            with self._bucket(scope, key) as (bucket, now):
+                bucket.tokens -= 1.0
+                bucket_wait = max(-bucket.tokens / bucket.rate, bucket.blocked_until - now, 0.0)
+            if bucket_wait > wait:
+                wait, limiting_scope = bucket_wait, scope
+        if wait > 0:
+            observe_meta_graph_governor_wait(scope=limiting_scope, seconds=wait)
+        return wait
+
+    def blocked_for(self, keys: Mapping[str, str]) -> float:
+        """Seconds until every bucket's pause lifts, without taking a token.
+
+        Callers re-check this after sleeping off a reservation, so a throttle
+        reported by another worker meanwhile holds back queued requests too.
+        """
+
+        wait = 0.0
+        for scope, key in keys.items():
+            with self._bucket(scope, key) as (bucket, now):
+                wait = max(wait, bucket.blocked_until - now)
+        return wait
+
+    def observe_headers(self, keys: Mapping[str, str], headers: Mapping[str, str]) -> None:
+        for scope, usage in parse_usage_headers(headers, scopes=keys.keys()).items():
+            with self._bucket(scope, keys[scope]) as (bucket, now):
+                bucket.usage_pct = usage.usage_pct
+                bucket.rate = self._rate_for_usage(usage.usage_pct)
+                if usage.regain_seconds > 0:
+                    bucket.blocked_until = max(bucket.blocked_until, now + usage.regain_seconds)
+
+    def observe_throttled(self, keys: Mapping[str, str]) -> None:
+        """Record a rate-limit error by pausing every bucket the request touched.
+
+        Meta does not say which limit tripped, so the refill rate is left to
+        the usage headers; the pause only stops the burst that caused it.
+        """
+
+        for scope, key in keys.items():
+            with self._bucket(scope, key) as (bucket, now):
+                bucket.tokens = min(bucket.tokens, 0.0)
+                bucket.blocked_until = max(bucket.blocked_until, now + self.cooldown_seconds)
+        logger.warning("meta.graph.governor.throttled", extra={"buckets": sorted(keys.values())})
+
+    def _rate_for_usage(self, usage_pct: float) -> float:
+        if usage_pct <= self.slowdown_pct:
+            return self.max_rate
+        if usage_pct >= 100.0:
+            return self.min_rate
+        span = (usage_pct - self.slowdown_pct) / (100.0 - self.slowdown_pct)
+        return self.max_rate - (self.max_rate - self.min_rate) * span
+
+    @contextmanager
+    def _bucket(self, scope: str, key: str) -> Iterator[tuple[MetaGraphBucket, float]]:
+        with self.store.locked(key) as buckets:
+            now = self.clock()
+            raw = buckets.get(key)
+            bucket = (
+                MetaGraphBucket(**raw)
+                if isinstance(raw, dict)
+                else MetaGraphBucket(tokens=self.burst, rate=self.max_rate, updated_at=now)
+            )
+            elapsed = max(now - bucket.updated_at, 0.0)
+            bucket.tokens = min(bucket.tokens + elapsed * bucket.rate, self.burst)
+            bucket.updated_at = now
+            yield bucket, now
+            buckets[key] = asdict(bucket)
+        observe_meta_graph_governor_state(
+            scope=scope,
+            bucket=key,
+            tokens=bucket.tokens,
+            rate=bucket.rate,
+            usage_pct=bucket.usage_pct,
+        )
+
+
+def parse_usage_headers(
+    headers: Mapping[str, str],
+    *,
+    scopes: Collection[str] = (SCOPE_APP, SCOPE_AD_ACCOUNT),
+) -> dict[str, MetaGraphUsage]:
+    """Reduce Meta's usage headers to the highest usage seen per scope.
+
+    ``x-app-usage`` counts against the app bucket. Ad-account and
+    business-use-case usage count against the ad account when the request
+    targets one, otherwise against the app.
+    """
+
+    account_scope = SCOPE_AD_ACCOUNT if SCOPE_AD_ACCOUNT in scopes else SCOPE_APP
+    usage: dict[str, MetaGraphUsage] = {}
+    for header_name, scope in (
+        ("x-app-usage", SCOPE_APP),
+        ("x-ad-account-usage", account_scope),
+        ("x-business-use-case-usage", account_scope),
+    ):
+        raw_value = headers.get(header_name)
+        if not raw_value:
+            continue
+        try:
+            parsed = json.loads(raw_value)
+        except ValueError:
+            continue
+        pct, regain_seconds = _collect_usage(parsed)
+        if pct is None:
+            continue
+        current = usage.get(scope, MetaGraphUsage(usage_pct=0.0))
+        usage[scope] = MetaGraphUsage(
+            usage_pct=max(pct, current.usage_pct),
+            regain_seconds=max(regain_seconds, current.regain_seconds),
+        )
+    return usage
+
+
+def _collect_usage(payload: Any) -> tuple[float | None, float]:
+    percentages: list[float] = []
+    regain: list[float] = [0.0]
+
+    def _walk(value: Any, key_hint: str | None = None) -> None:
+        if isinstance(value, dict):
+            for child_key, child_value in value.items():
+                _walk(child_value, child_key)
+            return
+        if isinstance(value, list):
+            for child in value:
+                _walk(child, key_hint)
+            return
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return
+        if key_hint in _USAGE_KEYS:
+            percentages.append(float(value))
+        elif key_hint == "estimated_time_to_regain_access":
+            # Business use case headers report minutes.
+            regain.append(float(value) * 60.0)
+
+    _walk(payload)
+    return (max(percentages) if percentages else None), max(regain)
+
+
+def _state_dir() -> str:
+    configured = (getattr(settings, "META_GRAPH_GOVERNOR_STATE_DIR", "") or "").strip()
+    return configured or os.path.join(tempfile.gettempdir(), "adinsights-meta-graph-governor")
+
+
+_MEMORY_STORE: MemoryBucketStore | None = None
+_MEMORY_STORE_LOCK = threading.Lock()
+
+
+def _process_memory_store() -> MemoryBucketStore:
+    global _MEMORY_STORE
+    with _MEMORY_STORE_LOCK:
+        if _MEMORY_STORE is None:
+            _MEMORY_STORE = MemoryBucketStore()
+        return _MEMORY_STORE
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.13 on 2026-10-16 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("integrations", "0027_metapage_instagram_business_account_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clientsuggestionsnapshot",
+            name="token_cache",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
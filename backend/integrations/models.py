@@ -1845,6 +1845,9 @@ class ClientSuggestionSnapshot(models.Model):
     threshold = models.FloatField(default=0.7)
     suggestion_count = models.PositiveIntegerField(default=0)
     payload = models.JSONField(default=list, blank=True)
+    # Normalized account/client names from the last refresh, reused by the
+    # suggester so unchanged names are not re-normalized on every sync.
+    token_cache = models.JSONField(default=dict, blank=True)
     generated_at = models.DateTimeField(default=timezone.now)
     acknowledged_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
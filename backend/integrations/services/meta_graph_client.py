@@ -4,7 +4,9 @@ import json
 import logging
 import random
 import time
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Sequence
+from urllib.parse import urlencode
 
 import httpx
 from django.conf import settings
@@ -21,6 +23,8 @@ META_PAGE_RETRY_REASON_RATE_LIMITED = "meta_page_insights_rate_limited"
 META_PAGE_RETRY_REASON_UPSTREAM_5XX = "meta_page_insights_upstream_5xx"
 META_PAGE_RETRY_REASON_TRANSIENT = "meta_page_insights_transient_error"
 META_PAGE_RETRY_REASON_RETRYABLE = "meta_page_insights_retryable"
+# Graph rejects batches with more than 50 operations.
+GRAPH_BATCH_MAX_REQUESTS = 50
 
 
 def _classify_retry_reason(*, status_code: int | None, error_code: int | None, retryable: bool) -> str:
@@ -52,6 +56,23 @@ class MetaInsightsGraphClientError(RuntimeError):
         self.payload = payload or {}
 
 
+@dataclass(frozen=True)
+class PostInsightsRequest:
+    post_id: str
+    metrics: tuple[str, ...]
+    period: str
+    since: str | None = None
+    until: str | None = None
+
+    def relative_url(self) -> str:
+        params: dict[str, Any] = {"metric": ",".join(self.metrics), "period": self.period}
+        if self.since:
+            params["since"] = self.since
+        if self.until:
+            params["until"] = self.until
+        return f"{self.post_id}/insights?{urlencode(params)}"
+
+
 class MetaInsightsGraphClient:
     def __init__(
         self,
@@ -59,9 +80,11 @@ class MetaInsightsGraphClient:
         graph_version: str,
         timeout_seconds: float = 20.0,
         max_attempts: int = 5,
+        batch_size: int = GRAPH_BATCH_MAX_REQUESTS,
     ) -> None:
         self.base_url = f"https://graph.facebook.com/{graph_version}"
         self.max_attempts = max(max_attempts, 1)
+        self.batch_size = min(max(batch_size, 1), GRAPH_BATCH_MAX_REQUESTS)
         self._client = httpx.Client(timeout=timeout_seconds)
 
     @classmethod
@@ -71,6 +94,7 @@ class MetaInsightsGraphClient:
             graph_version=graph_version,
             timeout_seconds=float(getattr(settings, "META_PAGE_INSIGHTS_TIMEOUT_SECONDS", 20.0)),
             max_attempts=int(getattr(settings, "META_PAGE_INSIGHTS_MAX_ATTEMPTS", 5)),
+            batch_size=int(getattr(settings, "META_GRAPH_BATCH_SIZE", GRAPH_BATCH_MAX_REQUESTS)),
         )
 
     def close(self) -> None:
@@ -90,14 +114,29 @@ class MetaInsightsGraphClient:
         params: dict[str, Any] | None,
         token: str,
     ) -> dict[str, Any]:
+        payload = self._send(method, path, params=params, data=None, token=token)
+        return payload if isinstance(payload, dict) else {}
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        token: str,
+    ) -> Any:
         url = self._absolute_url(path)
         request_params = dict(params or {})
         request_params["access_token"] = token
+        request_kwargs: dict[str, Any] = {"params": request_params}
+        if data is not None:
+            request_kwargs["data"] = data
 
         last_message = "Meta Graph request failed"
         for attempt in range(1, self.max_attempts + 1):
             try:
-                response = self._client.request(method, url, params=request_params)
+                response = self._client.request(method, url, **request_kwargs)
             except httpx.HTTPError as exc:
                 retryable = attempt < self.max_attempts
                 if retryable:
@@ -114,9 +153,7 @@ class MetaInsightsGraphClient:
             details = self._extract_error_details(payload)
             retryable = self._should_retry(response.status_code, details["error_code"])
             if response.is_success:
-                if isinstance(payload, dict):
-                    return payload
-                return {}
+                return payload
 
             last_message = details["message"] or f"Meta Graph request failed with status {response.status_code}."
             if retryable and attempt < self.max_attempts:
@@ -202,6 +239,92 @@ class MetaInsightsGraphClient:
             token=token,
         )
 
+    def batch(
+        self,
+        relative_urls: Sequence[str],
+        *,
+        token: str,
+    ) -> list[dict[str, Any] | MetaInsightsGraphClientError]:
+        """Run GET operations through the Graph ``batch`` endpoint.
+
+        Operations are packed ``batch_size`` per HTTP call. Results line up
+        with ``relative_urls``; a failed operation yields its
+        ``MetaInsightsGraphClientError`` instead of raising, and retryable
+        operations are re-sent (with backoff) until ``max_attempts``.
+        Transport and top-level HTTP failures still raise.
+        """
+
+        results: list[dict[str, Any] | MetaInsightsGraphClientError] = [
+            MetaInsightsGraphClientError("Batch operation was not sent.", retryable=True)
+            for _ in relative_urls
+        ]
+        pending = list(range(len(relative_urls)))
+        for attempt in range(1, self.max_attempts + 1):
+            retry: list[int] = []
+            for offset in range(0, len(pending), self.batch_size):
+                window = pending[offset : offset + self.batch_size]
+                responses = self._send(
+                    "POST",
+                    "/",
+                    params=None,
+                    data={
+                        "batch": json.dumps(
+                            [{"method": "GET", "relative_url": relative_urls[index]} for index in window],
+                            separators=(",", ":"),
+                        ),
+                        "include_headers": "false",
+                    },
+                    token=token,
+                )
+                if not isinstance(responses, list):
+                    responses = []
+                for position, index in enumerate(window):
+                    item = responses[position] if position < len(responses) else None
+                    outcome = self._batch_item_result(item)
+                    results[index] = outcome
+                    if isinstance(outcome, MetaInsightsGraphClientError) and outcome.retryable:
+                        retry.append(index)
+            if not retry or attempt == self.max_attempts:
+                break
+            first_error = results[retry[0]]
+            observe_meta_graph_retry(
+                reason=_classify_retry_reason(
+                    status_code=getattr(first_error, "status_code", None),
+                    error_code=getattr(first_error, "error_code", None),
+                    retryable=True,
+                )
+            )
+            self._sleep_backoff(attempt)
+            pending = retry
+        return results
+
+    def fetch_post_insights_batch(
+        self,
+        *,
+        requests: Sequence[PostInsightsRequest],
+        token: str,
+    ) -> list[dict[str, Any] | MetaInsightsGraphClientError]:
+        results: list[dict[str, Any] | MetaInsightsGraphClientError] = []
+        sendable: list[int] = []
+        for index, item in enumerate(requests):
+            if item.metrics:
+                sendable.append(index)
+                results.append({})
+            else:
+                results.append(
+                    MetaInsightsGraphClientError(
+                        "No metrics were provided for Post Insights request.",
+                        error_code=3001,
+                        error_subcode=1504028,
+                        retryable=False,
+                    )
+                )
+        if sendable:
+            responses = self.batch([requests[index].relative_url() for index in sendable], token=token)
+            for index, outcome in zip(sendable, responses):
+                results[index] = outcome
+        return results
+
     def fetch_page_posts(
         self,
         *,
@@ -302,6 +425,29 @@ class MetaInsightsGraphClient:
             "error_subcode": None,
         }
 
+    def _batch_item_result(self, item: Any) -> dict[str, Any] | MetaInsightsGraphClientError:
+        if not isinstance(item, dict):
+            # Graph returns null for operations it did not get to in time.
+            return MetaInsightsGraphClientError("Meta Graph batch operation timed out.", retryable=True)
+        status_code = _maybe_int(item.get("code")) or 0
+        body: Any = item.get("body")
+        if isinstance(body, str):
+            try:
+                body = json.loads(body) if body else {}
+            except ValueError:
+                body = None
+        if 200 <= status_code < 300:
+            return body if isinstance(body, dict) else {}
+        details = self._extract_error_details(body)
+        return MetaInsightsGraphClientError(
+            details["message"] or f"Meta Graph batch operation failed with status {status_code}.",
+            status_code=status_code,
+            error_code=details["error_code"],
+            error_subcode=details["error_subcode"],
+            retryable=self._should_retry(status_code, details["error_code"]),
+            payload=body if isinstance(body, dict) else None,
+        )
+
     @staticmethod
     def _should_retry(status_code: int, error_code: int | None) -> bool:
         return status_code in _RETRYABLE_HTTP_STATUS or error_code in _RETRYABLE_GRAPH_CODES
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import hashlib
 import logging
+import queue
 from datetime import date, datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal, InvalidOperation
 from typing import Any, List
 
 from celery import shared_task
 from django.conf import settings
+from django.core.cache import cache
 from django.core.management import CommandError, call_command
 from django.db import transaction
 from django.utils import timezone
@@ -18,6 +23,8 @@ import httpx
 from alerts.models import AlertRun
 from accounts.tenant_context import tenant_context
 from analytics.models import Ad, AdAccount, AdSet, Campaign, RawPerformanceRecord
+from core.bulk_upsert import DEFAULT_UPSERT_BATCH_SIZE, UpsertResult, bulk_upsert
+from core.tenant_cache import bump_tenant_cache_generation
 from core.metrics import observe_meta_token_refresh_attempt, observe_meta_token_validation
 from core.observability import emit_observability_event
 
@@ -27,7 +34,13 @@ from integrations.airbyte import (
     AirbyteClientError,
     AirbyteSyncService,
 )
-from integrations.meta_graph import MetaGraphClient, MetaGraphClientError, MetaGraphConfigurationError
+from integrations.meta_graph import (
+    MetaGraphClient,
+    MetaGraphClientError,
+    MetaGraphConfigurationError,
+    MetaInsightsRequest,
+    meta_graph_concurrency,
+)
 from integrations.google_ads.client import GoogleAdsSdkClient, GoogleAdsSdkError
 from integrations.google_ads.parity import (
     ParityThresholds,
@@ -70,6 +83,7 @@ from integrations.services.insights_parser import (
 from integrations.services.meta_graph_client import (
     MetaInsightsGraphClient,
     MetaInsightsGraphClientError,
+    PostInsightsRequest,
 )
 from integrations.services.metric_registry import (
     get_default_metric_keys,
@@ -99,6 +113,35 @@ META_DIRECT_SYNC_ERROR_AUTH = "meta_auth_token"
 META_DIRECT_SYNC_ERROR_THROTTLING = "meta_throttling"
 META_DIRECT_SYNC_ERROR_REQUEST = "meta_schema_request_error"
 META_DIRECT_SYNC_ERROR_PERSISTENCE = "persistence_error"
+RAW_PERFORMANCE_UNIQUE_FIELDS = ("tenant", "source", "external_id", "date", "level")
+RAW_PERFORMANCE_UPDATE_FIELDS = (
+    "ad_account",
+    "campaign",
+    "adset",
+    "ad",
+    "impressions",
+    "reach",
+    "clicks",
+    "spend",
+    "cpc",
+    "cpm",
+    "currency",
+    "conversions",
+    "actions",
+    "raw_payload",
+    "updated_at",
+)
+META_BREAKDOWN_UPDATE_FIELDS = (
+    "currency",
+    "impressions",
+    "reach",
+    "clicks",
+    "spend",
+    "conversions",
+    "actions",
+    "raw_payload",
+    "updated_at",
+)
 
 
 class MetaDirectSyncError(RuntimeError):
@@ -276,6 +319,179 @@ def _trigger_google_sdk_rollback(
     )
 
 
+@dataclass
+class _GoogleAdsChildFetch:
+    customer_id: str
+    core_error: str = ""
+    optional_errors: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Unexpected (non-SDK) failure, re-raised on the task thread once the
+    # remaining children have drained.
+    error: BaseException | None = None
+
+
+def _google_ads_child_concurrency(child_count: int) -> int:
+    limit = int(getattr(settings, "GOOGLE_ADS_SYNC_CHILD_CONCURRENCY", 4) or 1)
+    return max(min(limit, child_count), 1)
+
+
+def _google_ads_stream_chunk_size() -> int:
+    return max(int(getattr(settings, "GOOGLE_ADS_UPSERT_BATCH_SIZE", 500) or 0), 1)
+
+
+def _emit_row_chunks(
+    rows: Iterable[Any],
+    *,
+    label: str,
+    chunk_size: int,
+    emit: Callable[[str, list[Any]], None],
+) -> None:
+    chunk: list[Any] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            emit(label, chunk)
+            chunk = []
+    if chunk:
+        emit(label, chunk)
+
+
+def _stream_google_ads_child(
+    client: GoogleAdsSdkClient,
+    *,
+    customer_id: str,
+    window_start: date,
+    window_end: date,
+    change_window_start: datetime,
+    change_window_end: datetime,
+    chunk_size: int,
+    emit: Callable[[str, list[Any]], None],
+) -> _GoogleAdsChildFetch:
+    """Stream every SDK resource for one child customer; runs on a worker thread."""
+
+    result = _GoogleAdsChildFetch(customer_id=customer_id)
+    window_kwargs = {"customer_id": customer_id, "start_date": window_start, "end_date": window_end}
+    try:
+        for label, iterate in (
+            ("campaign_daily", client.iter_campaign_daily),
+            ("ad_group_ad_daily", client.iter_ad_group_ad_daily),
+            ("geographic_daily", client.iter_geographic_daily),
+        ):
+            _emit_row_chunks(iterate(**window_kwargs), label=label, chunk_size=chunk_size, emit=emit)
+    except GoogleAdsSdkError as exc:
+        # Skip unreachable / not-enabled children but don't fail the whole
+        # sync for one bad child.
+        result.core_error = f"{exc.classification}: {exc}"
+
+    for label, iterate in (
+        ("keyword_daily", lambda: client.iter_keyword_daily(**window_kwargs)),
+        ("search_term_daily", lambda: client.iter_search_term_daily(**window_kwargs)),
+        ("asset_group_daily", lambda: client.iter_asset_group_daily(**window_kwargs)),
+        ("conversion_action_daily", lambda: client.iter_conversion_action_daily(**window_kwargs)),
+        (
+            "change_events",
+            lambda: client.iter_change_events(
+                customer_id=customer_id,
+                start_datetime=change_window_start,
+                end_datetime=change_window_end,
+            ),
+        ),
+        ("recommendations", lambda: client.iter_recommendations(customer_id=customer_id)),
+    ):
+        try:
+            _emit_row_chunks(iterate(), label=label, chunk_size=chunk_size, emit=emit)
+        except GoogleAdsSdkError as exc:
+            result.optional_errors[label] = {
+                "classification": exc.classification,
+                "request_id": exc.request_id,
+                "message": str(exc),
+                "customer_id": customer_id,
+            }
+    return result
+
+
+def _persist_google_ads_rows(*, tenant, label: str, rows: list[Any]) -> None:
+    writers = {
+        "campaign_daily": upsert_campaign_daily_rows,
+        "ad_group_ad_daily": upsert_ad_group_ad_daily_rows,
+        "geographic_daily": upsert_geographic_daily_rows,
+        "keyword_daily": upsert_keyword_daily_rows,
+        "search_term_daily": upsert_search_term_daily_rows,
+        "asset_group_daily": upsert_asset_group_daily_rows,
+        "conversion_action_daily": upsert_conversion_action_daily_rows,
+        "change_events": upsert_change_event_rows,
+        "recommendations": upsert_recommendation_rows,
+    }
+    writers[label](tenant=tenant, rows=rows)
+
+
+def _sync_google_ads_children(
+    client: GoogleAdsSdkClient,
+    *,
+    tenant,
+    target_customer_ids: list[str],
+    window_start: date,
+    window_end: date,
+    change_window_start: datetime,
+    change_window_end: datetime,
+) -> dict[str, _GoogleAdsChildFetch]:
+    """Fan children out to a bounded pool and persist their rows as they stream in.
+
+    Worker threads only talk to the Google Ads API. Row chunks flow back through
+    a bounded queue and are written on the calling thread, so DB access stays on
+    the task's own connection and memory is capped at a few chunks per worker
+    regardless of window size.
+    """
+
+    concurrency = _google_ads_child_concurrency(len(target_customer_ids))
+    chunk_size = _google_ads_stream_chunk_size()
+    row_queue: queue.Queue[Any] = queue.Queue(maxsize=concurrency * 2)
+
+    def emit(label: str, rows: list[Any]) -> None:
+        row_queue.put((label, rows))
+
+    def run(target: str) -> None:
+        try:
+            result = _stream_google_ads_child(
+                client,
+                customer_id=target,
+                window_start=window_start,
+                window_end=window_end,
+                change_window_start=change_window_start,
+                change_window_end=change_window_end,
+                chunk_size=chunk_size,
+                emit=emit,
+            )
+        except BaseException as exc:  # noqa: BLE001 - surfaced on the task thread
+            result = _GoogleAdsChildFetch(customer_id=target, error=exc)
+        row_queue.put(result)
+
+    child_results: dict[str, _GoogleAdsChildFetch] = {}
+    failure: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="google-ads-child") as executor:
+        for target in target_customer_ids:
+            executor.submit(run, target)
+        pending = len(target_customer_ids)
+        while pending:
+            item = row_queue.get()
+            if isinstance(item, _GoogleAdsChildFetch):
+                pending -= 1
+                child_results[item.customer_id] = item
+                if failure is None and item.error is not None:
+                    failure = item.error
+                continue
+            if failure is not None:
+                # Keep draining so blocked workers can finish and exit.
+                continue
+            label, rows = item
+            try:
+                _persist_google_ads_rows(tenant=tenant, label=label, rows=rows)
+            except Exception as exc:  # noqa: BLE001 - re-raised after draining
+                failure = exc
+    if failure is not None:
+        raise failure
+    return child_results
+
+
 @shared_task(bind=True, base=BaseAdInsightsTask, max_retries=5)
 def sync_google_ads_sdk_incremental(
     self,
@@ -353,44 +569,6 @@ def sync_google_ads_sdk_incremental(
                 # credential's own account_id.
                 target_customer_ids = child_customer_ids or [account_id]
 
-                campaign_rows: list[Any] = []
-                ad_rows: list[Any] = []
-                geo_rows: list[Any] = []
-                per_child_errors: dict[str, str] = {}
-                for target in target_customer_ids:
-                    try:
-                        campaign_rows.extend(
-                            client.fetch_campaign_daily(
-                                customer_id=target,
-                                start_date=window_start,
-                                end_date=window_end,
-                            )
-                        )
-                        ad_rows.extend(
-                            client.fetch_ad_group_ad_daily(
-                                customer_id=target,
-                                start_date=window_start,
-                                end_date=window_end,
-                            )
-                        )
-                        geo_rows.extend(
-                            client.fetch_geographic_daily(
-                                customer_id=target,
-                                start_date=window_start,
-                                end_date=window_end,
-                            )
-                        )
-                    except GoogleAdsSdkError as child_exc:
-                        # Skip unreachable / not-enabled children but don't
-                        # fail the whole sync for one bad child.
-                        per_child_errors[target] = f"{child_exc.classification}: {child_exc}"
-                        continue
-
-                upsert_campaign_daily_rows(tenant=credential.tenant, rows=campaign_rows)
-                upsert_ad_group_ad_daily_rows(tenant=credential.tenant, rows=ad_rows)
-                upsert_geographic_daily_rows(tenant=credential.tenant, rows=geo_rows)
-
-                optional_errors: dict[str, dict[str, Any]] = {}
                 change_window_start = datetime.combine(
                     window_start,
                     datetime.min.time(),
@@ -402,94 +580,26 @@ def sync_google_ads_sdk_incremental(
                     tzinfo=dt_timezone.utc,
                 )
 
-                keyword_rows_all: list[Any] = []
-                search_term_rows_all: list[Any] = []
-                asset_group_rows_all: list[Any] = []
-                conversion_action_rows_all: list[Any] = []
-                change_event_rows_all: list[Any] = []
-                recommendation_rows_all: list[Any] = []
-
-                for target in target_customer_ids:
-                    for label, fetch in (
-                        (
-                            "keyword_daily",
-                            lambda t=target: keyword_rows_all.extend(
-                                client.fetch_keyword_daily(
-                                    customer_id=t,
-                                    start_date=window_start,
-                                    end_date=window_end,
-                                )
-                            ),
-                        ),
-                        (
-                            "search_term_daily",
-                            lambda t=target: search_term_rows_all.extend(
-                                client.fetch_search_term_daily(
-                                    customer_id=t,
-                                    start_date=window_start,
-                                    end_date=window_end,
-                                )
-                            ),
-                        ),
-                        (
-                            "asset_group_daily",
-                            lambda t=target: asset_group_rows_all.extend(
-                                client.fetch_asset_group_daily(
-                                    customer_id=t,
-                                    start_date=window_start,
-                                    end_date=window_end,
-                                )
-                            ),
-                        ),
-                        (
-                            "conversion_action_daily",
-                            lambda t=target: conversion_action_rows_all.extend(
-                                client.fetch_conversion_action_daily(
-                                    customer_id=t,
-                                    start_date=window_start,
-                                    end_date=window_end,
-                                )
-                            ),
-                        ),
-                        (
-                            "change_events",
-                            lambda t=target: change_event_rows_all.extend(
-                                client.fetch_change_events(
-                                    customer_id=t,
-                                    start_datetime=change_window_start,
-                                    end_datetime=change_window_end,
-                                )
-                            ),
-                        ),
-                        (
-                            "recommendations",
-                            lambda t=target: recommendation_rows_all.extend(
-                                client.fetch_recommendations(customer_id=t)
-                            ),
-                        ),
-                    ):
-                        try:
-                            fetch()
-                        except GoogleAdsSdkError as exc:
-                            # Record the first failure per resource label;
-                            # one bad child must not sink the whole sync.
-                            if label not in optional_errors:
-                                optional_errors[label] = {
-                                    "classification": exc.classification,
-                                    "request_id": exc.request_id,
-                                    "message": str(exc),
-                                    "customer_id": target,
-                                }
-
-                upsert_keyword_daily_rows(tenant=credential.tenant, rows=keyword_rows_all)
-                upsert_search_term_daily_rows(tenant=credential.tenant, rows=search_term_rows_all)
-                upsert_asset_group_daily_rows(tenant=credential.tenant, rows=asset_group_rows_all)
-                upsert_conversion_action_daily_rows(
+                child_results = _sync_google_ads_children(
+                    client,
                     tenant=credential.tenant,
-                    rows=conversion_action_rows_all,
+                    target_customer_ids=target_customer_ids,
+                    window_start=window_start,
+                    window_end=window_end,
+                    change_window_start=change_window_start,
+                    change_window_end=change_window_end,
                 )
-                upsert_change_event_rows(tenant=credential.tenant, rows=change_event_rows_all)
-                upsert_recommendation_rows(tenant=credential.tenant, rows=recommendation_rows_all)
+
+                optional_errors: dict[str, dict[str, Any]] = {}
+                per_child_errors: dict[str, str] = {}
+                for target in target_customer_ids:
+                    child = child_results[target]
+                    if child.core_error:
+                        per_child_errors[target] = child.core_error
+                    for label, error in child.optional_errors.items():
+                        # Record the first failure per resource label;
+                        # one bad child must not sink the whole sync.
+                        optional_errors.setdefault(label, error)
 
                 if per_child_errors:
                     optional_errors["per_child_metric_errors"] = {
@@ -530,6 +640,7 @@ def sync_google_ads_sdk_incremental(
                 continue
 
             synced += 1
+            bump_tenant_cache_generation(tenant_id)
             sync_state.consecutive_sdk_failures = 0
             sync_state.last_sync_success_at = timezone.now()
             sync_state.last_sync_error = ""
@@ -909,6 +1020,7 @@ def refresh_fx_rates(  # noqa: ANN001
     "quote_currency": str, "rate": number, "source": str}``.
     """
 
+    from analytics.fx import invalidate_fx_rates
     from analytics.models import DailyFxRate
 
     base = (base_currency or FX_DEFAULT_BASE_CURRENCY).upper()
@@ -939,6 +1051,8 @@ def refresh_fx_rates(  # noqa: ANN001
                     },
                 )
             upserts += 1
+        if upserts:
+            invalidate_fx_rates()
         return {"upserted": upserts, "skipped": skipped, "source": "manual"}
 
     timeout_seconds = float(getattr(settings, "FX_PROVIDER_TIMEOUT_SECONDS", 10.0))
@@ -972,6 +1086,8 @@ def refresh_fx_rates(  # noqa: ANN001
                 },
             )
         upserts += 1
+    if upserts:
+        invalidate_fx_rates()
 
     logger.info(
         "fx.refresh.completed",
@@ -1815,6 +1931,7 @@ def _sync_meta_hierarchy_core(
                         )
                         ads_synced += 1
                 succeeded += 1
+                bump_tenant_cache_generation(credential.tenant_id)
                 _touch_meta_sync_state(
                     tenant=credential.tenant,
                     account_id=account_external_id,
@@ -1846,7 +1963,14 @@ def _sync_meta_insights_core(
 ) -> dict[str, int]:
     credentials = _meta_credentials(tenant_id=tenant_id, account_id=account_id)
     if not credentials:
-        return {"processed": 0, "succeeded": 0, "failed": 0, "insights_synced": 0}
+        return {
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "insights_synced": 0,
+            "insights_inserted": 0,
+            "insights_updated": 0,
+        }
 
     level_value = (level or DEFAULT_META_INSIGHTS_LEVEL).strip().lower()
     if level_value not in {"account", "campaign", "adset", "ad"}:
@@ -1872,229 +1996,238 @@ def _sync_meta_insights_core(
         )
 
     processed = succeeded = failed = insights_synced = 0
+    insights_inserted = insights_updated = 0
     correlation_id = getattr(getattr(task, "request", None), "id", "") or ""
+    # Credentials are resolved, fetched (concurrently) and persisted in waves so
+    # only a bounded number of accounts' rows are held in memory at once.
+    wave_size = meta_graph_concurrency() * 2
     with client:
-        for credential in credentials:
-            processed += 1
-            tenant_id = str(credential.tenant_id)
-            with tenant_context(tenant_id):
-                access_token = credential.decrypt_access_token()
-                if not access_token:
-                    failed += 1
-                    _touch_meta_sync_state(
-                        tenant=credential.tenant,
-                        account_id=credential.account_id,
-                        job_status="failed",
-                        job_error="Missing stored Meta access token.",
-                        window_start=since_date,
-                        window_end=until_date,
-                        sync_completed_at=timezone.now(),
-                        sync_engine=MetaAccountSyncState.SYNC_ENGINE_DIRECT,
-                        error_category=META_DIRECT_SYNC_ERROR_AUTH,
-                    )
-                    if raise_on_error:
-                        raise MetaDirectSyncError(
-                            "Missing stored Meta access token.",
-                            category=META_DIRECT_SYNC_ERROR_AUTH,
-                            retryable=False,
+        for wave_start in range(0, len(credentials), wave_size):
+            prepared: list[tuple[PlatformCredential, AdAccount, MetaInsightsRequest]] = []
+            for credential in credentials[wave_start : wave_start + wave_size]:
+                processed += 1
+                tenant_id = str(credential.tenant_id)
+                with tenant_context(tenant_id):
+                    access_token = credential.decrypt_access_token()
+                    if not access_token:
+                        failed += 1
+                        _touch_meta_sync_state(
+                            tenant=credential.tenant,
+                            account_id=credential.account_id,
+                            job_status="failed",
+                            job_error="Missing stored Meta access token.",
+                            window_start=since_date,
+                            window_end=until_date,
+                            sync_completed_at=timezone.now(),
+                            sync_engine=MetaAccountSyncState.SYNC_ENGINE_DIRECT,
+                            error_category=META_DIRECT_SYNC_ERROR_AUTH,
                         )
-                    continue
-                account_external_id = _normalize_meta_account_id(credential.account_id)
-                ad_account = (
-                    AdAccount.all_objects.filter(
-                        tenant=credential.tenant,
-                        external_id=account_external_id,
-                    )
-                    .order_by("-updated_at")
-                    .first()
-                )
-                if ad_account is None:
-                    ad_account = AdAccount.all_objects.create(
-                        tenant=credential.tenant,
-                        external_id=account_external_id,
-                        account_id=account_external_id.replace("act_", ""),
+                        if raise_on_error:
+                            raise MetaDirectSyncError(
+                                "Missing stored Meta access token.",
+                                category=META_DIRECT_SYNC_ERROR_AUTH,
+                                retryable=False,
+                            )
+                        continue
+                    account_external_id = _normalize_meta_account_id(credential.account_id)
+                    ad_account = (
+                        AdAccount.all_objects.filter(
+                            tenant=credential.tenant,
+                            external_id=account_external_id,
+                        )
+                        .order_by("-updated_at")
+                        .first()
                     )
-                try:
-                    rows = client.list_insights(
-                        account_id=account_external_id,
-                        user_access_token=access_token,
-                        level=level_value,
-                        since=since_date.isoformat(),
-                        until=until_date.isoformat(),
+                    if ad_account is None:
+                        ad_account = AdAccount.all_objects.create(
+                            tenant=credential.tenant,
+                            external_id=account_external_id,
+                            account_id=account_external_id.replace("act_", ""),
+                        )
+                    prepared.append(
+                        (
+                            credential,
+                            ad_account,
+                            MetaInsightsRequest(
+                                account_id=account_external_id,
+                                user_access_token=access_token,
+                                level=level_value,
+                                since=since_date.isoformat(),
+                                until=until_date.isoformat(),
+                            ),
+                        )
                     )
-                except MetaGraphClientError as exc:
-                    failed += 1
-                    _log_meta_api_error(
-                        tenant=credential.tenant,
-                        account_id=account_external_id,
-                        endpoint=f"/{account_external_id}/insights",
-                        exc=exc,
-                        correlation_id=correlation_id,
+
+            fetched = client.fetch_account_insights([request for _, _, request in prepared])
+            for (credential, ad_account, request), insights in zip(prepared, fetched):
+                tenant_id = str(credential.tenant_id)
+                account_external_id = request.account_id
+                with tenant_context(tenant_id):
+                    if insights.error is not None:
+                        exc = insights.error
+                        failed += 1
+                        _log_meta_api_error(
+                            tenant=credential.tenant,
+                            account_id=account_external_id,
+                            endpoint=f"/{account_external_id}/insights",
+                            exc=exc,
+                            correlation_id=correlation_id,
+                        )
+                        _touch_meta_sync_state(
+                            tenant=credential.tenant,
+                            account_id=account_external_id,
+                            job_status="failed",
+                            job_error=str(exc),
+                            window_start=since_date,
+                            window_end=until_date,
+                            sync_completed_at=timezone.now(),
+                            sync_engine=MetaAccountSyncState.SYNC_ENGINE_DIRECT,
+                            error_category=_classify_meta_direct_sync_error(exc),
+                        )
+                        if raise_on_error:
+                            raise exc
+                        continue
+
+                    rows = insights.rows
+                    campaign_cache: dict[str, Campaign | None] = {}
+                    adset_cache: dict[str, AdSet | None] = {}
+                    ad_cache: dict[str, Ad | None] = {}
+                    records: list[RawPerformanceRecord] = []
+                    latest_record_date = None
+                    for row in rows:
+                        if not isinstance(row, dict):
+                            continue
+                        record_date = _parse_iso_date(str(row.get("date_start") or "")) or since_date
+                        external_id = _insight_external_id(row=row, level=level_value, account_id=account_external_id)
+                        if not external_id:
+                            continue
+                        campaign = _cached_campaign(campaign_cache, credential_tenant=credential.tenant, external_id=str(row.get("campaign_id") or ""))
+                        adset = _cached_adset(adset_cache, credential_tenant=credential.tenant, external_id=str(row.get("adset_id") or ""))
+                        ad = _cached_ad(ad_cache, credential_tenant=credential.tenant, external_id=str(row.get("ad_id") or ""))
+                        actions = row.get("actions") if isinstance(row.get("actions"), list) else []
+                        records.append(
+                            RawPerformanceRecord(
+                                tenant=credential.tenant,
+                                ad_account=ad_account,
+                                external_id=external_id,
+                                date=record_date,
+                                level=level_value,
+                                source="meta",
+                                campaign=campaign,
+                                adset=adset,
+                                ad=ad,
+                                impressions=_int_value(row.get("impressions")),
+                                reach=_int_value(row.get("reach")),
+                                clicks=_int_value(row.get("clicks")),
+                                spend=_decimal(row.get("spend")),
+                                cpc=_decimal(row.get("cpc")),
+                                cpm=_decimal(row.get("cpm")),
+                                currency=ad_account.currency,
+                                conversions=_insight_conversions(actions),
+                                actions=actions,
+                                raw_payload=row,
+                            )
+                        )
+                        if latest_record_date is None or record_date > latest_record_date:
+                            latest_record_date = record_date
+                    upsert_result = bulk_upsert(
+                        RawPerformanceRecord.all_objects,
+                        records,
+                        unique_fields=RAW_PERFORMANCE_UNIQUE_FIELDS,
+                        update_fields=RAW_PERFORMANCE_UPDATE_FIELDS,
+                        batch_size=_meta_upsert_batch_size(),
                     )
+                    credential_rows_synced = upsert_result.persisted
+                    insights_synced += upsert_result.persisted
+                    insights_inserted += upsert_result.inserted
+                    insights_updated += upsert_result.updated
+
+                    # Region (parish map), age + gender (demographics) and
+                    # platform breakdowns; a failed breakdown is logged and skipped.
+                    for breakdown, upsert_rows in _META_BREAKDOWN_UPSERTS.items():
+                        breakdown_rows = insights.breakdowns.get(breakdown) or []
+                        if isinstance(breakdown_rows, MetaGraphClientError):
+                            logger.warning(
+                                f"meta.sync.insights_by_{breakdown}.failed",
+                                extra={"account_id": account_external_id, "error": str(breakdown_rows)},
+                            )
+                            continue
+                        if breakdown_rows:
+                            upsert_rows(
+                                tenant=credential.tenant,
+                                account_id=account_external_id,
+                                rows=breakdown_rows,
+                                currency=ad_account.currency or "",
+                            )
+
+                    succeeded += 1
+                    bump_tenant_cache_generation(credential.tenant_id)
                     _touch_meta_sync_state(
                         tenant=credential.tenant,
                         account_id=account_external_id,
-                        job_status="failed",
-                        job_error=str(exc),
+                        job_status="succeeded",
+                        job_error="",
                         window_start=since_date,
                         window_end=until_date,
                         sync_completed_at=timezone.now(),
                         sync_engine=MetaAccountSyncState.SYNC_ENGINE_DIRECT,
-                        error_category=_classify_meta_direct_sync_error(exc),
+                        rows_synced=credential_rows_synced,
+                        data_date=latest_record_date,
+                        error_category="",
                     )
-                    if raise_on_error:
-                        raise
-                    continue
-
-                campaign_cache: dict[str, Campaign | None] = {}
-                adset_cache: dict[str, AdSet | None] = {}
-                ad_cache: dict[str, Ad | None] = {}
-                credential_rows_synced = 0
-                latest_record_date = None
-                for row in rows:
-                    if not isinstance(row, dict):
-                        continue
-                    record_date = _parse_iso_date(str(row.get("date_start") or "")) or since_date
-                    external_id = _insight_external_id(row=row, level=level_value, account_id=account_external_id)
-                    if not external_id:
-                        continue
-                    campaign = _cached_campaign(campaign_cache, credential_tenant=credential.tenant, external_id=str(row.get("campaign_id") or ""))
-                    adset = _cached_adset(adset_cache, credential_tenant=credential.tenant, external_id=str(row.get("adset_id") or ""))
-                    ad = _cached_ad(ad_cache, credential_tenant=credential.tenant, external_id=str(row.get("ad_id") or ""))
-                    actions = row.get("actions") if isinstance(row.get("actions"), list) else []
-                    conversions = _insight_conversions(actions)
-                    defaults = {
-                        "ad_account": ad_account,
-                        "date": record_date,
-                        "level": level_value,
-                        "source": "meta",
-                        "campaign": campaign,
-                        "adset": adset,
-                        "ad": ad,
-                        "impressions": _int_value(row.get("impressions")),
-                        "reach": _int_value(row.get("reach")),
-                        "clicks": _int_value(row.get("clicks")),
-                        "spend": _decimal(row.get("spend")),
-                        "cpc": _decimal(row.get("cpc")),
-                        "cpm": _decimal(row.get("cpm")),
-                        "currency": ad_account.currency,
-                        "conversions": conversions,
-                        "actions": actions,
-                        "raw_payload": row,
-                    }
-                    RawPerformanceRecord.all_objects.update_or_create(
-                        tenant=credential.tenant,
-                        source="meta",
-                        external_id=external_id,
-                        level=level_value,
-                        date=record_date,
-                        defaults=defaults,
-                    )
-                    credential_rows_synced += 1
-                    insights_synced += 1
-                    if latest_record_date is None or record_date > latest_record_date:
-                        latest_record_date = record_date
-                # --- Geographic (region) breakdown for parish map ---
-                try:
-                    region_rows = client.list_insights_by_region(
-                        account_id=account_external_id,
-                        user_access_token=access_token,
-                        since=since_date.isoformat(),
-                        until=until_date.isoformat(),
-                    )
-                except MetaGraphClientError as exc:
-                    logger.warning(
-                        "meta.sync.insights_by_region.failed",
-                        extra={"account_id": account_external_id, "error": str(exc)},
-                    )
-                    region_rows = []
-
-                if region_rows:
-                    _upsert_meta_region_rows(
-                        tenant=credential.tenant,
-                        account_id=account_external_id,
-                        rows=region_rows,
-                        currency=ad_account.currency or "",
-                    )
-
-                # --- Age + gender breakdown for demographics ---
-                try:
-                    age_gender_rows = client.list_insights_by_age_gender(
-                        account_id=account_external_id,
-                        user_access_token=access_token,
-                        since=since_date.isoformat(),
-                        until=until_date.isoformat(),
-                    )
-                except MetaGraphClientError as exc:
-                    logger.warning(
-                        "meta.sync.insights_by_age_gender.failed",
-                        extra={"account_id": account_external_id, "error": str(exc)},
-                    )
-                    age_gender_rows = []
-
-                if age_gender_rows:
-                    _upsert_meta_age_gender_rows(
-                        tenant=credential.tenant,
-                        account_id=account_external_id,
-                        rows=age_gender_rows,
-                        currency=ad_account.currency or "",
-                    )
-
-                # --- Platform breakdown for platform analytics ---
-                try:
-                    platform_rows = client.list_insights_by_platform(
-                        account_id=account_external_id,
-                        user_access_token=access_token,
-                        since=since_date.isoformat(),
-                        until=until_date.isoformat(),
-                    )
-                except MetaGraphClientError as exc:
-                    logger.warning(
-                        "meta.sync.insights_by_platform.failed",
-                        extra={"account_id": account_external_id, "error": str(exc)},
-                    )
-                    platform_rows = []
-
-                if platform_rows:
-                    _upsert_meta_platform_rows(
-                        tenant=credential.tenant,
-                        account_id=account_external_id,
-                        rows=platform_rows,
-                        currency=ad_account.currency or "",
-                    )
-
-                succeeded += 1
-                _touch_meta_sync_state(
-                    tenant=credential.tenant,
-                    account_id=account_external_id,
-                    job_status="succeeded",
-                    job_error="",
-                    window_start=since_date,
-                    window_end=until_date,
-                    sync_completed_at=timezone.now(),
-                    sync_engine=MetaAccountSyncState.SYNC_ENGINE_DIRECT,
-                    rows_synced=credential_rows_synced,
-                    data_date=latest_record_date,
-                    error_category="",
-                )
     return {
         "processed": processed,
         "succeeded": succeeded,
         "failed": failed,
         "insights_synced": insights_synced,
+        "insights_inserted": insights_inserted,
+        "insights_updated": insights_updated,
     }
 
 
+def _meta_upsert_batch_size() -> int:
+    return max(
+        int(getattr(settings, "META_INSIGHTS_UPSERT_BATCH_SIZE", DEFAULT_UPSERT_BATCH_SIZE) or 0),
+        1,
+    )
+
+
+def _upsert_meta_breakdown_rows(
+    manager,
+    objs: list[Any],
+    *,
+    unique_fields: tuple[str, ...],
+    update_fields: tuple[str, ...] = META_BREAKDOWN_UPDATE_FIELDS,
+    label: str,
+) -> UpsertResult:
+    result = bulk_upsert(
+        manager,
+        objs,
+        unique_fields=unique_fields,
+        update_fields=update_fields,
+        batch_size=_meta_upsert_batch_size(),
+        row_fallback=True,
+    )
+    if result.failed:
+        logger.warning(
+            "Failed to upsert %s rows (failed=%s, persisted=%s)",
+            label,
+            result.failed,
+            result.persisted,
+        )
+    return result
+
+
 def _upsert_meta_region_rows(
     *,
     tenant: object,
     account_id: str,
     rows: list[dict[str, Any]],
     currency: str,
-) -> int:
+) -> UpsertResult:
     from integrations.models import MetaRegionDaily
 
-    persisted = 0
+    objs: list[MetaRegionDaily] = []
     for row in rows:
         region = (row.get("region") or "").strip()
         if not region:
@@ -2102,31 +2235,32 @@ def _upsert_meta_region_rows(
         record_date = _parse_iso_date(str(row.get("date_start") or ""))
         if not record_date:
             continue
-        campaign_id = str(row.get("campaign_id") or "")
         actions = row.get("actions") if isinstance(row.get("actions"), list) else []
-        try:
-            MetaRegionDaily.all_objects.update_or_create(
+        objs.append(
+            MetaRegionDaily(
                 tenant=tenant,
                 account_id=account_id,
-                campaign_id=campaign_id,
+                campaign_id=str(row.get("campaign_id") or ""),
                 date_day=record_date,
                 region=region,
-                defaults={
-                    "country": str(row.get("country") or ""),
-                    "currency": currency,
-                    "impressions": _int_value(row.get("impressions")),
-                    "reach": _int_value(row.get("reach")),
-                    "clicks": _int_value(row.get("clicks")),
-                    "spend": _decimal(row.get("spend")),
-                    "conversions": _insight_conversions(actions),
-                    "actions": actions,
-                    "raw_payload": row,
-                },
+                country=str(row.get("country") or ""),
+                currency=currency,
+                impressions=_int_value(row.get("impressions")),
+                reach=_int_value(row.get("reach")),
+                clicks=_int_value(row.get("clicks")),
+                spend=_decimal(row.get("spend")),
+                conversions=_insight_conversions(actions),
+                actions=actions,
+                raw_payload=row,
             )
-            persisted += 1
-        except Exception:
-            logger.exception("Failed to upsert MetaRegionDaily row for region=%s date=%s", region, record_date)
-    return persisted
+        )
+    return _upsert_meta_breakdown_rows(
+        MetaRegionDaily.all_objects,
+        objs,
+        unique_fields=("tenant", "account_id", "campaign_id", "date_day", "region"),
+        update_fields=("country", *META_BREAKDOWN_UPDATE_FIELDS),
+        label="MetaRegionDaily",
+    )
 
 
 def _upsert_meta_age_gender_rows(
@@ -2135,10 +2269,10 @@ def _upsert_meta_age_gender_rows(
     account_id: str,
     rows: list[dict[str, Any]],
     currency: str,
-) -> int:
+) -> UpsertResult:
     from integrations.models import MetaAgeGenderDaily
 
-    persisted = 0
+    objs: list[MetaAgeGenderDaily] = []
     for row in rows:
         age_range = (row.get("age") or "").strip()
         gender = (row.get("gender") or "").strip()
@@ -2148,28 +2282,29 @@ def _upsert_meta_age_gender_rows(
         if not record_date:
             continue
         actions = row.get("actions") if isinstance(row.get("actions"), list) else []
-        try:
-            MetaAgeGenderDaily.all_objects.update_or_create(
+        objs.append(
+            MetaAgeGenderDaily(
                 tenant=tenant,
                 account_id=account_id,
                 date_day=record_date,
                 age_range=age_range,
                 gender=gender,
-                defaults={
-                    "currency": currency,
-                    "impressions": _int_value(row.get("impressions")),
-                    "reach": _int_value(row.get("reach")),
-                    "clicks": _int_value(row.get("clicks")),
-                    "spend": _decimal(row.get("spend")),
-                    "conversions": _insight_conversions(actions),
-                    "actions": actions,
-                    "raw_payload": row,
-                },
+                currency=currency,
+                impressions=_int_value(row.get("impressions")),
+                reach=_int_value(row.get("reach")),
+                clicks=_int_value(row.get("clicks")),
+                spend=_decimal(row.get("spend")),
+                conversions=_insight_conversions(actions),
+                actions=actions,
+                raw_payload=row,
             )
-            persisted += 1
-        except Exception:
-            logger.exception("Failed to upsert MetaAgeGenderDaily row for age=%s gender=%s date=%s", age_range, gender, record_date)
-    return persisted
+        )
+    return _upsert_meta_breakdown_rows(
+        MetaAgeGenderDaily.all_objects,
+        objs,
+        unique_fields=("tenant", "account_id", "date_day", "age_range", "gender"),
+        label="MetaAgeGenderDaily",
+    )
 
 
 def _upsert_meta_platform_rows(
@@ -2178,10 +2313,10 @@ def _upsert_meta_platform_rows(
     account_id: str,
     rows: list[dict[str, Any]],
     currency: str,
-) -> int:
+) -> UpsertResult:
     from integrations.models import MetaPlatformDaily
 
-    persisted = 0
+    objs: list[MetaPlatformDaily] = []
     for row in rows:
         publisher_platform = (row.get("publisher_platform") or "").strip()
         device_platform = (row.get("device_platform") or "").strip()
@@ -2191,28 +2326,36 @@ def _upsert_meta_platform_rows(
         if not record_date:
             continue
         actions = row.get("actions") if isinstance(row.get("actions"), list) else []
-        try:
-            MetaPlatformDaily.all_objects.update_or_create(
+        objs.append(
+            MetaPlatformDaily(
                 tenant=tenant,
                 account_id=account_id,
                 date_day=record_date,
                 publisher_platform=publisher_platform,
                 device_platform=device_platform,
-                defaults={
-                    "currency": currency,
-                    "impressions": _int_value(row.get("impressions")),
-                    "reach": _int_value(row.get("reach")),
-                    "clicks": _int_value(row.get("clicks")),
-                    "spend": _decimal(row.get("spend")),
-                    "conversions": _insight_conversions(actions),
-                    "actions": actions,
-                    "raw_payload": row,
-                },
+                currency=currency,
+                impressions=_int_value(row.get("impressions")),
+                reach=_int_value(row.get("reach")),
+                clicks=_int_value(row.get("clicks")),
+                spend=_decimal(row.get("spend")),
+                conversions=_insight_conversions(actions),
+                actions=actions,
+                raw_payload=row,
             )
-            persisted += 1
-        except Exception:
-            logger.exception("Failed to upsert MetaPlatformDaily row for platform=%s device=%s date=%s", publisher_platform, device_platform, record_date)
-    return persisted
+        )
+    return _upsert_meta_breakdown_rows(
+        MetaPlatformDaily.all_objects,
+        objs,
+        unique_fields=("tenant", "account_id", "date_day", "publisher_platform", "device_platform"),
+        label="MetaPlatformDaily",
+    )
+
+
+_META_BREAKDOWN_UPSERTS: dict[str, Callable[..., UpsertResult]] = {
+    "region": _upsert_meta_region_rows,
+    "age_gender": _upsert_meta_age_gender_rows,
+    "platform": _upsert_meta_platform_rows,
+}
 
 
 def _resolve_meta_window(
@@ -2709,18 +2852,17 @@ def sync_meta_post_insights(  # noqa: ANN001
                         continue
 
                     chunk_size = max(int(getattr(settings, "META_PAGE_INSIGHTS_METRIC_CHUNK_SIZE", 10)), 1)
-                    for post in posts:
-                        rows_processed = _sync_post_metric_window(
-                            client=client,
-                            post=post,
-                            page_tokens=page_tokens,
-                            metrics=registry_metrics,
-                            since=since_date,
-                            until=until_date,
-                            chunk_size=chunk_size,
-                        )
-                        total_rows_processed += rows_processed
-                        posts_processed += 1
+                    total_rows_processed += _sync_post_metric_batches(
+                        client=client,
+                        page=page,
+                        posts=posts,
+                        page_tokens=page_tokens,
+                        metrics=registry_metrics,
+                        since=since_date,
+                        until=until_date,
+                        chunk_size=chunk_size,
+                    )
+                    posts_processed += len(posts)
 
                     emit_observability_event(
                         logger,
@@ -3192,107 +3334,120 @@ def _sync_page_metric_chunk(
     return _upsert_meta_insight_points(page=page, points=points)
 
 
-def _sync_post_metric_window(
+_PostMetricChunk = tuple[MetaPost, list[str]]
+
+_PAGE_TOKEN_MEMORY_TTL_SECONDS = 24 * 60 * 60
+
+
+def _sync_post_metric_batches(
     *,
     client: MetaInsightsGraphClient,
-    post: MetaPost,
+    page: MetaPage,
+    posts: list[MetaPost],
     page_tokens: list[str],
     metrics: list[str],
     since: date,
     until: date,
     chunk_size: int,
 ) -> int:
+    """Sync every post x metric chunk of a page, batching the Graph calls.
+
+    Each round sends all pending chunks with one token (packed into Graph
+    ``batch`` calls by the client); chunks failing on auth fall through to
+    the next token, and chunks rejected with error 100 are split in half and
+    re-queued for the next round, mirroring the per-post fallback rules.
+    """
+
+    if not page_tokens or not metrics:
+        return 0
+    tokens = _preferred_page_tokens(page, page_tokens)
+    work: list[_PostMetricChunk] = [
+        (post, chunk) for post in posts for chunk in _chunked(metrics, chunk_size) if chunk
+    ]
     rows_processed = 0
-    for chunk in _chunked(metrics, chunk_size):
-        rows_processed += _sync_post_metric_chunk(
+    while work:
+        processed, work = _sync_post_metric_round(
             client=client,
-            post=post,
-            page_tokens=page_tokens,
-            metric_chunk=chunk,
+            page=page,
+            items=work,
+            tokens=tokens,
             since=since,
             until=until,
         )
+        rows_processed += processed
     return rows_processed
 
 
-def _sync_post_metric_chunk(
+def _sync_post_metric_round(
     *,
     client: MetaInsightsGraphClient,
-    post: MetaPost,
-    page_tokens: list[str],
-    metric_chunk: list[str],
+    page: MetaPage,
+    items: list[_PostMetricChunk],
+    tokens: list[str],
     since: date,
     until: date,
-) -> int:
-    if not metric_chunk:
-        return 0
-    if not page_tokens:
-        return 0
-
-    payload: dict[str, Any] | None = None
-    last_error: MetaInsightsGraphClientError | None = None
-    for token in page_tokens:
-        try:
-            payload = client.fetch_post_insights(
-                post_id=post.post_id,
-                metrics=metric_chunk,
-                period="lifetime",
-                since=since.isoformat(),
-                until=until.isoformat(),
-                token=token,
-            )
-            _mark_metric_support(
-                page=post.page,
-                level=MetaMetricRegistry.LEVEL_POST,
-                metric_chunk=metric_chunk,
-                supported=True,
-                last_error={},
-            )
+) -> tuple[int, list[_PostMetricChunk]]:
+    rows_processed = 0
+    splits: list[_PostMetricChunk] = []
+    retryable_error: MetaInsightsGraphClientError | None = None
+    pending: list[tuple[MetaPost, list[str], MetaInsightsGraphClientError | None]] = [
+        (post, chunk, None) for post, chunk in items
+    ]
+    for token in tokens:
+        if not pending:
             break
-        except MetaInsightsGraphClientError as exc:
-            last_error = exc
+        results = _fetch_post_insights_for_chunks(
+            client=client,
+            items=[(post, chunk) for post, chunk, _ in pending],
+            token=token,
+            since=since,
+            until=until,
+        )
+        still_pending: list[tuple[MetaPost, list[str], MetaInsightsGraphClientError | None]] = []
+        token_worked = False
+        for (post, metric_chunk, _), result in zip(pending, results):
+            if not isinstance(result, MetaInsightsGraphClientError):
+                token_worked = True
+                _mark_metric_support(
+                    page=page,
+                    level=MetaMetricRegistry.LEVEL_POST,
+                    metric_chunk=metric_chunk,
+                    supported=True,
+                    last_error={},
+                )
+                rows_processed += _store_post_insights_payload(post=post, payload=result)
+                continue
+            exc = result
             if _is_auth_or_permission_error(exc):
+                still_pending.append((post, metric_chunk, exc))
                 continue
             if exc.error_code == 100:
                 if len(metric_chunk) == 1:
                     mark_metric_invalid(MetaMetricRegistry.LEVEL_POST, metric_chunk[0])
                     _mark_metric_support(
-                        page=post.page,
+                        page=page,
                         level=MetaMetricRegistry.LEVEL_POST,
                         metric_chunk=metric_chunk,
                         supported=False,
                         last_error=_error_payload(exc),
                     )
-                    return 0
+                    continue
                 midpoint = max(len(metric_chunk) // 2, 1)
-                left = metric_chunk[:midpoint]
-                right = metric_chunk[midpoint:]
-                return _sync_post_metric_chunk(
-                    client=client,
-                    post=post,
-                    page_tokens=page_tokens,
-                    metric_chunk=left,
-                    since=since,
-                    until=until,
-                ) + _sync_post_metric_chunk(
-                    client=client,
-                    post=post,
-                    page_tokens=page_tokens,
-                    metric_chunk=right,
-                    since=since,
-                    until=until,
-                )
+                splits.append((post, metric_chunk[:midpoint]))
+                splits.append((post, metric_chunk[midpoint:]))
+                continue
             if exc.error_code == 3001 and exc.error_subcode == 1504028:
                 _mark_metric_support(
-                    page=post.page,
+                    page=page,
                     level=MetaMetricRegistry.LEVEL_POST,
                     metric_chunk=metric_chunk,
                     supported=False,
                     last_error=_error_payload(exc),
                 )
-                return 0
+                continue
             if exc.retryable:
-                raise
+                retryable_error = retryable_error or exc
+                continue
             logger.warning(
                 "meta.post_insights.chunk_failed",
                 extra={
@@ -3304,35 +3459,72 @@ def _sync_post_metric_chunk(
                 },
             )
             _mark_metric_support(
-                page=post.page,
+                page=page,
                 level=MetaMetricRegistry.LEVEL_POST,
                 metric_chunk=metric_chunk,
                 supported=False,
                 last_error=_error_payload(exc),
             )
-            return 0
+        if token_worked:
+            _remember_page_token(page, token)
+        pending = still_pending
 
-    if payload is None:
-        if last_error is not None:
-            logger.warning(
-                "meta.post_insights.chunk_auth_failed",
-                extra={
-                    "tenant_id": str(post.tenant_id),
-                    "post_id": post.post_id,
-                    "metric_chunk": metric_chunk,
-                    "status_code": last_error.status_code,
-                    "error_code": last_error.error_code,
-                },
-            )
-            _mark_metric_support(
-                page=post.page,
-                level=MetaMetricRegistry.LEVEL_POST,
-                metric_chunk=metric_chunk,
-                supported=False,
-                last_error=_error_payload(last_error),
-            )
-        return 0
+    # Rows already fetched in this round are stored; the task retry picks up the rest.
+    if retryable_error is not None:
+        raise retryable_error
+
+    for post, metric_chunk, last_error in pending:
+        if last_error is None:
+            continue
+        logger.warning(
+            "meta.post_insights.chunk_auth_failed",
+            extra={
+                "tenant_id": str(post.tenant_id),
+                "post_id": post.post_id,
+                "metric_chunk": metric_chunk,
+                "status_code": last_error.status_code,
+                "error_code": last_error.error_code,
+            },
+        )
+        _mark_metric_support(
+            page=page,
+            level=MetaMetricRegistry.LEVEL_POST,
+            metric_chunk=metric_chunk,
+            supported=False,
+            last_error=_error_payload(last_error),
+        )
+    return rows_processed, splits
 
+
+def _fetch_post_insights_for_chunks(
+    *,
+    client: MetaInsightsGraphClient,
+    items: list[_PostMetricChunk],
+    token: str,
+    since: date,
+    until: date,
+) -> list[dict[str, Any] | MetaInsightsGraphClientError]:
+    requests = [
+        PostInsightsRequest(
+            post_id=post.post_id,
+            metrics=tuple(metric_chunk),
+            period="lifetime",
+            since=since.isoformat(),
+            until=until.isoformat(),
+        )
+        for post, metric_chunk in items
+    ]
+    try:
+        return client.fetch_post_insights_batch(requests=requests, token=token)
+    except MetaInsightsGraphClientError as exc:
+        # A bad token fails the whole batch POST rather than each item;
+        # fail every item so the round moves on to the next token.
+        if not _is_auth_or_permission_error(exc):
+            raise
+        return [exc for _ in requests]
+
+
+def _store_post_insights_payload(*, post: MetaPost, payload: dict[str, Any]) -> int:
     fallback_end_time = post.created_time or timezone.now()
     points, metadata = normalize_insights_payload(payload, fallback_end_time=fallback_end_time)
     for meta in metadata:
@@ -3343,10 +3535,34 @@ def _sync_post_metric_chunk(
             description=meta.description,
             periods=[meta.period],
         )
-
     return _upsert_meta_post_insight_points(post=post, points=points)
 
 
+def _page_token_memory_key(page: MetaPage) -> str:
+    return f"integrations:meta-page:{page.pk}:working-token"
+
+
+def _token_fingerprint(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _preferred_page_tokens(page: MetaPage, tokens: list[str]) -> list[str]:
+    """Move the page's last working token (remembered by fingerprint) to the front."""
+
+    remembered = cache.get(_page_token_memory_key(page))
+    if not remembered:
+        return list(tokens)
+    return sorted(tokens, key=lambda token: _token_fingerprint(token) != remembered)
+
+
+def _remember_page_token(page: MetaPage, token: str) -> None:
+    cache.set(
+        _page_token_memory_key(page),
+        _token_fingerprint(token),
+        timeout=_PAGE_TOKEN_MEMORY_TTL_SECONDS,
+    )
+
+
 def _candidate_page_tokens(page: MetaPage) -> list[str]:
     tokens: list[str] = []
 
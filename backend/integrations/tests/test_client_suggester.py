@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from accounts.models import Tenant
 from analytics.models import AdAccount
 from integrations.clients import (
     ClientSuggestion,
+    SuggestionAccount,
     normalize_name,
     suggest_clients,
 )
+from integrations.clients.suggester import _group_by_similarity, _jaccard, _tokens
 from integrations.models import (
     Client,
     ClientPlatformAccount,
@@ -163,8 +169,63 @@ class TestSuggesterCrossPlatformGrouping:
         assert "1111" not in t2_ids
 
 
+class TestSuggesterIndex:
+    def test_indexed_grouping_matches_pairwise_scan(self):
+        rng = random.Random(11)
+        words = ["bank", "jamaica", "kingston", "grace", "coffee", "blue", "mountain", "rum"]
+        platforms = ["google_ads", "meta_ads", "meta_page"]
+        candidates = [
+            SuggestionAccount(
+                platform=platforms[i % 3],
+                external_id=str(i),
+                display_name=" ".join(rng.sample(words, rng.randint(0, 4))),
+            )
+            for i in range(400)
+        ]
+
+        def pairwise(threshold):
+            tokenized = [_tokens(normalize_name(c.display_name)) for c in candidates]
+            used = [False] * len(candidates)
+            groups = []
+            for i, toks in enumerate(tokenized):
+                if used[i] or not toks:
+                    continue
+                used[i] = True
+                group = [candidates[i]]
+                for j in range(i + 1, len(candidates)):
+                    if not used[j] and tokenized[j] and _jaccard(toks, tokenized[j]) >= threshold:
+                        used[j] = True
+                        group.append(candidates[j])
+                groups.append(group)
+            groups.extend([c] for c, toks in zip(candidates, tokenized) if not toks)
+            return groups
+
+        for threshold in (0.5, 0.7, 0.75, 1.0):
+            assert _group_by_similarity(candidates, threshold=threshold) == pairwise(threshold)
+
+    def test_existing_clients_are_loaded_once_per_call(self, tenant):
+        for i in range(20):
+            Client.all_objects.create(tenant=tenant, name=f"Brand {i}", slug=f"brand-{i}")
+            GoogleAdsAccountMapping.all_objects.create(
+                tenant=tenant, customer_id=f"g{i}", customer_name=f"Brand {i} Ltd"
+            )
+            AdAccount.all_objects.create(
+                tenant=tenant, external_id=f"act_{i}", name=f"Brand {i}"
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            suggestions = suggest_clients(str(tenant.id))
+
+        client_queries = [
+            q for q in queries.captured_queries if 'FROM "integrations_client" ' in q["sql"]
+        ]
+        assert len(client_queries) == 1
+        assert len(suggestions) == 20
+        assert all(s.existing_client_id for s in suggestions)
+
+
 class TestSuggesterPerformance:
-    """Fast sanity check that the O(N²) implementation is fine at realistic scale."""
+    """Fast sanity check that the suggester is fine at realistic scale."""
 
     def test_500_accounts_completes_quickly(self, tenant):
         import time
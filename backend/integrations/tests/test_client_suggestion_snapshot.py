@@ -129,6 +129,42 @@ class TestRefreshClientSuggestionsTask:
         assert snapshot.suggestion_count == 0
         assert snapshot.payload == []
 
+    def test_token_cache_is_persisted_and_reused(self, tenant, monkeypatch):
+        from integrations.clients import suggester
+
+        _seed_unclaimed_cross_platform(tenant)
+        Client.all_objects.create(tenant=tenant, name="Sandals Resorts", slug="sandals")
+        refresh_client_suggestions.run(tenant_id=str(tenant.id))
+        snapshot = ClientSuggestionSnapshot.all_objects.get(tenant=tenant)
+        assert snapshot.token_cache == {
+            "version": suggester.NORMALIZER_VERSION,
+            "names": {
+                "Bank of Jamaica": "bank of jamaica",
+                "Bank of Jamaica Limited": "bank of jamaica",
+                "Sandals Resorts": "sandals resorts",
+            },
+        }
+
+        calls: list[str] = []
+        real_normalize = suggester.normalize_name
+        monkeypatch.setattr(
+            suggester,
+            "normalize_name",
+            lambda raw: calls.append(raw) or real_normalize(raw),
+        )
+        AdAccount.all_objects.filter(tenant=tenant).update(name="Bank of Jamaica (Meta)")
+        refresh_client_suggestions.run(tenant_id=str(tenant.id))
+
+        # Only the renamed account is normalized again; its old name ages out.
+        assert calls == ["Bank of Jamaica (Meta)"]
+        snapshot.refresh_from_db()
+        assert set(snapshot.token_cache["names"]) == {
+            "Bank of Jamaica (Meta)",
+            "Bank of Jamaica Limited",
+            "Sandals Resorts",
+        }
+        assert snapshot.suggestion_count == 1
+
 
 class TestClientSuggestionSnapshotEndpoints:
     def test_get_returns_null_when_absent(self, auth_client):
@@ -71,15 +71,25 @@ def suppress_removed_in_django60_warnings():
 
 @pytest.fixture(autouse=True)
 def reset_local_kms(monkeypatch):
+    from core.crypto.dek_manager import dek_cache
     from core.crypto.kms import LocalKmsClient
     from django.conf import settings
 
     LocalKmsClient._store.clear()
+    dek_cache().invalidate(reason="test_reset")
     settings.KMS_PROVIDER = "local"
     settings.AWS_REGION = "us-east-1"
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_fx_rate_engine():
+    from analytics.fx import fx_rate_engine
+
+    fx_rate_engine().invalidate()
+    yield
+
+
 def pytest_ignore_collect(collection_path, config):  # noqa: ANN001, ARG001
     return not should_collect_path(collection_path)
 
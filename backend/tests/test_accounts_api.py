@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from accounts.models import (
     AuditLog,
@@ -246,3 +248,52 @@ def test_service_account_deactivation(api_client, tenant, user, settings):
     )
 
     assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_service_account_repeat_requests_skip_key_reads_and_writes(api_client, tenant, settings):
+    settings.ENABLE_FAKE_ADAPTER = True
+    settings.SERVICE_ACCOUNT_LAST_USED_INTERVAL_SECONDS = 300
+    seed_default_roles()
+    role = Role.objects.get(name=Role.ADMIN)
+    key, token = ServiceAccountKey.create_key(tenant=tenant, name="BI", role=role)
+    table = ServiceAccountKey._meta.db_table
+
+    def key_statements(context) -> list[str]:
+        return [
+            query["sql"].split()[0] for query in context.captured_queries if table in query["sql"]
+        ]
+
+    with CaptureQueriesContext(connection) as first:
+        api_client.get("/api/metrics/", {"source": "fake"}, HTTP_AUTHORIZATION=f"ApiKey {token}")
+    assert key_statements(first) == ["SELECT", "UPDATE"]
+
+    with CaptureQueriesContext(connection) as repeat:
+        for _ in range(3):
+            response = api_client.get(
+                "/api/metrics/", {"source": "fake"}, HTTP_AUTHORIZATION=f"ApiKey {token}"
+            )
+    assert response.status_code == 200
+    assert key_statements(repeat) == []
+
+    wrong_secret = api_client.get(
+        "/api/metrics/", {"source": "fake"}, HTTP_AUTHORIZATION=f"ApiKey sa_{key.prefix}.nope"
+    )
+    assert wrong_secret.status_code == 401
+
+
+@pytest.mark.django_db
+def test_service_account_deactivation_evicts_cached_key(api_client, tenant, user, settings):
+    settings.ENABLE_FAKE_ADAPTER = True
+    seed_default_roles()
+    assign_role(user, Role.ADMIN)
+    role = Role.objects.get(name=Role.VIEWER)
+    key, token = ServiceAccountKey.create_key(tenant=tenant, name="Cached", role=role)
+    headers = {"HTTP_AUTHORIZATION": f"ApiKey {token}"}
+    assert api_client.get("/api/metrics/", {"source": "fake"}, **headers).status_code == 200
+
+    api_client.force_authenticate(user=user)
+    assert api_client.delete(f"/api/service-accounts/{key.id}/").status_code == 204
+    api_client.force_authenticate(user=None)
+
+    assert api_client.get("/api/metrics/", {"source": "fake"}, **headers).status_code == 401
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 
+import httpx
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from accounts.models import Tenant
@@ -12,7 +18,7 @@ from alerts.models import AlertRun
 from alerts.services import AlertService
 from alerts.tasks import run_alert_cycle
 from app import alerts as alert_rules
-from app.llm import LLMError
+from app.llm import LLMClient, LLMError
 from integrations.models import AlertRuleDefinition
 
 
@@ -26,6 +32,12 @@ def list_results(response):
 @dataclass
 class StubEvaluator:
     rows: list[dict[str, object]]
+    window_calls: list[list[str]] = field(default_factory=list)
+
+    @contextmanager
+    def windows(self, names, *, window_start):  # noqa: ANN001 - signature dictated by service
+        self.window_calls.append(sorted(set(names)))
+        yield {}
 
     def run(self, rule):  # noqa: D401, ANN001 - signature dictated by service
         return list(self.rows)
@@ -41,6 +53,15 @@ class StubLLM:
         self.called_with = (rule.slug, list(rows))
         return self.summary
 
+    def summarize_batch(self, items, *, concurrency):  # noqa: ANN001 - external API
+        results = []
+        for rule, rows in items:
+            try:
+                results.append(self.summarize(rule, rows))
+            except LLMError as exc:
+                results.append(exc)
+        return results
+
     def fallback_summary(self, rows):  # noqa: D401, ANN001 - external API
         self.fallback_called = True
         return "fallback"
@@ -87,6 +108,7 @@ def test_alert_service_persists_successful_run():
     assert "campaign_id" not in run.raw_results[0]
     assert run.raw_results[0]["ctr"] == evaluator.rows[0]["ctr"]
     assert run.error_message == ""
+    assert evaluator.window_calls == [[rule.window]]
     assert run.completed_at is not None
     assert llm.called_with[0] == rule.slug
     assert llm.called_with[1] == run.raw_results
@@ -376,3 +398,184 @@ def test_celery_task_uses_service(monkeypatch):
             "duration_ms": fake_run.duration_ms,
         }
     ]
+
+
+class BatchRecordingLLM(StubLLM):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def summarize_batch(self, items, *, concurrency):  # noqa: ANN001 - external API
+        self.batches.append([rule.slug for rule, _rows in items])
+        return [
+            LLMError("provider timeout") if rule.slug.endswith("flaky") else f"{rule.slug}: {len(rows)}"
+            for rule, rows in items
+        ]
+
+
+@pytest.mark.django_db
+def test_alert_cycle_batches_summaries_caches_them_and_bulk_creates_runs(settings):
+    settings.ALERT_EVALUATION_CONCURRENCY = 3
+    base = next(alert_rules.iter_rules())
+    rules = [
+        replace(base, slug=f"batch_{base.slug}"),
+        replace(base, slug=f"batch_{base.slug}_flaky"),
+        replace(base, slug=f"batch_{base.slug}_quiet"),
+    ]
+
+    class PerRuleEvaluator(StubEvaluator):
+        def run(self, rule):  # noqa: D401, ANN001 - signature dictated by service
+            if rule.slug.endswith("quiet"):
+                return []
+            return [{"campaign_id": "cmp_batch", "spend": 90}]
+
+    llm = BatchRecordingLLM()
+    service = AlertService(
+        rules=rules, evaluator=PerRuleEvaluator(rows=[]), llm_client=llm, include_database_rules=False
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        runs = service.run_cycle()
+    second = service.run_cycle()
+
+    assert [run.status for run in runs] == [
+        AlertRun.Status.SUCCESS,
+        AlertRun.Status.PARTIAL,
+        AlertRun.Status.NO_RESULTS,
+    ]
+    assert runs[0].llm_summary == f"{rules[0].slug}: 1"
+    assert runs[1].llm_summary == "fallback"
+    assert runs[1].error_message == "provider timeout"
+    # One batch for both rules with rows; the cycle after only retries the failure.
+    assert llm.batches == [[rules[0].slug, rules[1].slug], [rules[1].slug]]
+    assert second[0].llm_summary == runs[0].llm_summary
+    inserts = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+    assert AlertRun.objects.filter(rule_slug__startswith="batch_").count() == 6
+    assert set(service.last_cycle_timings) == {"evaluate_ms", "summarise_ms", "persist_ms", "notify_ms"}
+
+
+def test_llm_client_summarize_batch_shares_one_async_client(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = json.loads(request.content)
+        if "flaky" in body["messages"][1]["content"]:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"choices": [{"message": {"content": " Spend spiked. "}}]})
+
+    original = httpx.AsyncClient
+    monkeypatch.setattr(
+        "app.llm.httpx.AsyncClient",
+        lambda **kwargs: original(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    client = LLMClient(base_url="https://llm.test/v1/chat", api_key="key", model="m")
+    base = next(alert_rules.iter_rules())
+
+    results = client.summarize_batch(
+        [
+            (base, [{"spend": 1}]),
+            (replace(base, name="flaky"), [{"spend": 2}]),
+            (base, []),
+        ],
+        concurrency=2,
+    )
+
+    assert results[0] == "Spend spiked."
+    assert isinstance(results[1], LLMError)
+    assert "No results" in results[2]
+    assert len(requests) == 2
+    assert all(request.headers["Authorization"] == "Bearer key" for request in requests)
+
+
+def _create_alert_views() -> None:
+    with connection.cursor() as cursor:
+        for ddl in (
+            """
+            CREATE TABLE vw_campaign_daily (
+                date_day TEXT, tenant_id TEXT, source_platform TEXT, ad_account_id TEXT,
+                campaign_id TEXT, parish_name TEXT, spend REAL, ctr REAL, cpa REAL
+            )
+            """,
+            """
+            CREATE TABLE vw_pacing (
+                date_day TEXT, source_platform TEXT, ad_account_id TEXT,
+                spend REAL, trailing_7d_avg_spend REAL
+            )
+            """,
+            """
+            CREATE TABLE vw_creative_daily (
+                date_day TEXT, source_platform TEXT, ad_account_id TEXT, ad_id TEXT,
+                adset_id TEXT, campaign_id TEXT, impressions INTEGER, spend REAL, cpm REAL
+            )
+            """,
+        ):
+            cursor.execute(ddl)
+
+
+@pytest.mark.django_db
+def test_alert_cycle_scans_each_window_view_once_for_all_rules(tenant):
+    _create_alert_views()
+    other_tenant = Tenant.objects.create(name="Other Tenant")
+    today = timezone.localdate()
+    with connection.cursor() as cursor:
+        for offset in range(9):
+            for owner, campaign in ((tenant, "cmp_drop"), (other_tenant, "cmp_other")):
+                cursor.execute(
+                    "INSERT INTO vw_campaign_daily VALUES (?, ?, 'meta', 'act_1', ?, 'Kingston', ?, ?, 3)",
+                    (
+                        (today - timedelta(days=offset)).isoformat(),
+                        str(owner.id),
+                        campaign,
+                        100.0,
+                        0.01 if offset == 0 and owner == tenant else 0.05,
+                    ),
+                )
+    spend_rule = _make_alert_definition(tenant, name="Spend", metric="spend")
+    spend_rule.lookback_hours = 48
+    spend_rule.save()
+    _make_alert_definition(other_tenant, name="Other CPA", metric="cpa")
+
+    service = AlertService(llm_client=StubLLM())
+    with CaptureQueriesContext(connection) as queries:
+        runs = {run.rule_slug: run for run in service.run_cycle()}
+
+    view_scans = [q["sql"] for q in queries.captured_queries if " from vw_" in q["sql"].lower()]
+    assert len(view_scans) == 3
+    ctr_run = runs["campaign_ctr_drop"]
+    assert ctr_run.status == AlertRun.Status.SUCCESS
+    assert [row["campaign_ref"] for row in ctr_run.raw_results] == [
+        f"ref_{hashlib.sha256(b'cmp_drop').hexdigest()[:10]}"
+    ]
+    assert runs["account_spend_spike"].status == AlertRun.Status.NO_RESULTS
+    assert runs[f"tenant_alert:{spend_rule.id}"].row_count == 3
+    assert all(run.status != AlertRun.Status.FAILED for run in runs.values())
+    with connection.cursor() as cursor, pytest.raises(Exception):
+        cursor.execute("select count(*) from alert_window_campaign")
+
+
+@pytest.mark.django_db
+def test_alert_cycle_fails_only_rules_reading_a_window_that_did_not_build(tenant):
+    _create_alert_views()
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TABLE vw_creative_daily")
+    _make_alert_definition(tenant, name="Spend", metric="spend")
+
+    service = AlertService(llm_client=StubLLM())
+    runs = {run.rule_slug: run for run in service.run_cycle()}
+
+    creative_run = runs["creative_cpm_outlier"]
+    assert creative_run.status == AlertRun.Status.FAILED
+    assert "vw_creative_daily" in creative_run.error_message
+    assert all(
+        run.status == AlertRun.Status.NO_RESULTS
+        for slug, run in runs.items()
+        if slug != "creative_cpm_outlier"
+    )
+    assert len(runs) == len(alert_rules.ALERT_RULES) + 1
+    with connection.cursor() as cursor, pytest.raises(Exception):
+        cursor.execute("select count(*) from alert_window_campaign")
@@ -0,0 +1,116 @@
+"""Pre-rendered combined-metrics snapshot bodies, ETags and conditional GETs."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+from django.utils import timezone
+
+from adapters.warehouse import (
+    WAREHOUSE_SNAPSHOT_STATUS_DEFAULT,
+    WAREHOUSE_SNAPSHOT_STATUS_FETCHED,
+    WAREHOUSE_SNAPSHOT_STATUS_KEY,
+)
+from analytics import combined_metrics_service
+from analytics.combined_metrics_service import _build_snapshot_result
+from analytics.models import TenantMetricsSnapshot
+
+URL = "/api/metrics/combined/"
+PAYLOAD = {
+    "campaign": {
+        "summary": {"currency": "JMD", "totalSpend": 120.5, "totalClicks": 40},
+        "trend": [{"date": "2026-04-01", "spend": 120.5}],
+        "rows": [{"id": "cmp-1", "name": "Kingston Café", "startDate": "2026-04-01"}],
+    },
+    "creative": [],
+    "budget": [],
+    "parish": [{"parish": "Kingston", "spend": 120.5}],
+    WAREHOUSE_SNAPSHOT_STATUS_KEY: WAREHOUSE_SNAPSHOT_STATUS_FETCHED,
+}
+
+
+@pytest.fixture
+def warehouse_snapshot(settings, api_client, user):
+    settings.ENABLE_WAREHOUSE_ADAPTER = True
+    settings.METRICS_SNAPSHOT_RESPONSE_ENCODING = "gzip"
+    api_client.force_authenticate(user=user)
+    return TenantMetricsSnapshot.objects.create(
+        tenant=user.tenant,
+        source="warehouse",
+        payload=PAYLOAD,
+        generated_at=timezone.now(),
+    )
+
+
+@pytest.mark.django_db
+def test_rendered_body_matches_the_snapshot_response(warehouse_snapshot, api_client):
+    warehouse_snapshot.refresh_from_db()
+    expected = _build_snapshot_result(
+        snapshot=warehouse_snapshot,
+        source="warehouse",
+        cache_outcome="hit",
+        has_filters=False,
+        query_count=0,
+    ).payload
+
+    plain = api_client.get(URL, {"source": "warehouse"})
+    compressed = api_client.get(URL, {"source": "warehouse"}, HTTP_ACCEPT_ENCODING="gzip, br")
+
+    assert plain.status_code == 200
+    assert "Content-Encoding" not in plain
+    assert json.loads(plain.content) == expected
+    assert compressed["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.content) == plain.content
+    assert plain["ETag"] == compressed["ETag"] == warehouse_snapshot.rendered_etag
+    assert "Accept-Encoding" in plain["Vary"]
+
+
+@pytest.mark.django_db
+def test_matching_if_none_match_returns_304_without_reading_the_payload(
+    warehouse_snapshot, api_client, monkeypatch
+):
+    etag = api_client.get(URL, {"source": "warehouse"})["ETag"]
+
+    def _fail(**kwargs):  # noqa: ANN003 - test helper
+        raise AssertionError("snapshot JSON was processed on the request path")
+
+    monkeypatch.setattr(combined_metrics_service, "_snapshot_response_payload", _fail)
+    unchanged = api_client.get(URL, {"source": "warehouse"}, HTTP_IF_NONE_MATCH=etag)
+    cached = api_client.get(URL, {"source": "warehouse"})
+
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged["ETag"] == etag
+    assert cached.status_code == 200
+    assert cached.json()["campaign"]["rows"][0]["name"] == "Kingston Café"
+
+
+@pytest.mark.django_db
+def test_payload_changes_rotate_the_etag(warehouse_snapshot, api_client):
+    first = api_client.get(URL, {"source": "warehouse"})["ETag"]
+
+    warehouse_snapshot.payload = {**PAYLOAD, "budget": [{"campaign": "cmp-1", "monthlyBudget": 500}]}
+    warehouse_snapshot.save(update_fields=["payload", "updated_at"])
+    response = api_client.get(URL, {"source": "warehouse"}, HTTP_IF_NONE_MATCH=first)
+
+    assert response.status_code == 200
+    assert response["ETag"] != first
+    assert response.json()["budget"] == [{"campaign": "cmp-1", "monthlyBudget": 500}]
+
+
+@pytest.mark.django_db
+def test_filtered_requests_and_unfetched_snapshots_skip_the_rendered_body(
+    warehouse_snapshot, api_client, user
+):
+    filtered = api_client.get(URL, {"source": "warehouse", "start_date": "2026-04-01"})
+    assert "ETag" not in filtered
+
+    warehouse_snapshot.payload = {**PAYLOAD, WAREHOUSE_SNAPSHOT_STATUS_KEY: WAREHOUSE_SNAPSHOT_STATUS_DEFAULT}
+    warehouse_snapshot.save()
+    warehouse_snapshot.refresh_from_db()
+
+    assert warehouse_snapshot.rendered_body is None
+    assert warehouse_snapshot.rendered_etag == ""
+    assert api_client.get(URL, {"source": "warehouse"}).status_code == 503
@@ -7,12 +7,16 @@ from decimal import Decimal
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from accounts.models import Role, Tenant, User, assign_role, seed_default_roles
 from content_ops.assets import public_media_fetch_url
+from content_ops import metrics as content_ops_metrics
+from content_ops.metrics import select_due_published_posts
 from content_ops.models import (
     ApprovalDecision,
     ApprovalRequest,
@@ -1514,11 +1518,11 @@ def test_refresh_content_published_post_metrics_task_scans_tenant_posts(
 
     calls = []
 
-    def fake_refresh(*, tenant, published_post_id):  # noqa: ANN001
-        calls.append((str(tenant.id), str(published_post_id)))
-        return DummyResult()
+    def fake_refresh(*, tenant, posts, now):  # noqa: ANN001
+        calls.extend((str(tenant.id), str(post.id)) for post in posts)
+        return [DummyResult() for _ in posts]
 
-    monkeypatch.setattr("content_ops.tasks.refresh_published_post_metrics", fake_refresh)
+    monkeypatch.setattr("content_ops.tasks.refresh_published_posts_metrics", fake_refresh)
 
     result = refresh_content_published_post_metrics.run(
         tenant_id=str(tenant.id),
@@ -1529,6 +1533,215 @@ def test_refresh_content_published_post_metrics_task_scans_tenant_posts(
     assert calls == [(str(tenant.id), str(post.id))]
 
 
+@pytest.mark.django_db
+def test_refresh_content_published_post_metrics_batches_due_posts_by_age(
+    tenant,
+    django_assert_max_num_queries,
+):
+    workspace = ContentWorkspace.all_objects.create(tenant=tenant, name="Metrics batch")
+    draft = ContentDraft.all_objects.create(
+        tenant=tenant,
+        workspace=workspace,
+        title="Batch post",
+        state=ContentDraft.STATE_PUBLISHED,
+    )
+    version = ContentDraftVersion.all_objects.create(
+        tenant=tenant,
+        draft=draft,
+        version_number=1,
+        caption="Batch caption",
+    )
+    identity = PublishingIdentity.all_objects.create(
+        tenant=tenant,
+        platform=PublishingIdentity.PLATFORM_FACEBOOK_PAGE,
+        meta_page_id="page_batch",
+        display_name="Batch Page",
+    )
+    now = timezone.now()
+    two_hours_ago = now - timezone.timedelta(hours=2)
+
+    def _post(meta_post_id: str, *, age, last_refresh=two_hours_ago) -> PublishedPost:
+        return PublishedPost.all_objects.create(
+            tenant=tenant,
+            workspace=workspace,
+            draft=draft,
+            version=version,
+            publishing_identity=identity,
+            channel=PublishedPost.CHANNEL_FACEBOOK_PAGE,
+            meta_post_id=meta_post_id,
+            published_at=now - age,
+            last_metrics_refresh_at=last_refresh,
+        )
+
+    recent = _post("batch_recent", age=timezone.timedelta(hours=5))
+    never_refreshed = _post("batch_new", age=timezone.timedelta(days=90), last_refresh=None)
+    missing = _post("batch_missing", age=timezone.timedelta(hours=3))
+    old = _post("batch_old", age=timezone.timedelta(days=10))
+    meta_post = _create_meta_post_insight_points(
+        tenant=tenant,
+        published_post=recent,
+        end_time=now - timezone.timedelta(days=1),
+        values={"post_impressions": 10},
+    )
+    MetaPostInsightPoint.all_objects.create(
+        tenant=tenant,
+        post=meta_post,
+        metric_key="post_impressions",
+        period="lifetime",
+        end_time=now,
+        value_num=Decimal(25),
+    )
+    MetaPostInsightPoint.all_objects.create(
+        tenant=tenant,
+        post=MetaPost.all_objects.create(
+            tenant=tenant,
+            page=meta_post.page,
+            post_id=never_refreshed.meta_post_id,
+            created_time=never_refreshed.published_at,
+        ),
+        metric_key="post_clicks",
+        period="lifetime",
+        end_time=now,
+        value_num=Decimal(3),
+    )
+    OrganicPostMetricSnapshot.all_objects.create(
+        tenant=tenant,
+        published_post=recent,
+        metric_date=now.date(),
+        channel=recent.channel,
+        source="meta_post_insights",
+        impressions=1,
+    )
+
+    with django_assert_max_num_queries(10):
+        result = refresh_content_published_post_metrics.run(tenant_id=str(tenant.id), limit=10)
+
+    assert result[str(tenant.id)] == {"scanned": 3, "refreshed": 2, "unavailable": 1}
+    assert OrganicPostMetricSnapshot.all_objects.get(published_post=recent).impressions == 25
+    assert OrganicPostMetricSnapshot.all_objects.get(published_post=never_refreshed).clicks == 3
+    missing.refresh_from_db()
+    assert missing.reporting_link_state == PublishedPost.REPORTING_UNAVAILABLE
+    old.refresh_from_db()
+    assert old.last_metrics_refresh_at == two_hours_ago
+    assert old.reporting_link_state == PublishedPost.REPORTING_PENDING
+
+
+@pytest.mark.django_db
+def test_synced_provider_reads_only_latest_end_time_points_per_post(auth_client, tenant):
+    workspace_id = _create_workspace(auth_client)
+    first = _create_published_post(
+        tenant=tenant, draft_id=_create_client_approved_draft(auth_client, workspace_id)
+    )
+    second = PublishedPost.all_objects.create(
+        tenant=tenant,
+        workspace=first.workspace,
+        draft=first.draft,
+        version=first.version,
+        publishing_identity=first.publishing_identity,
+        channel=PublishedPost.CHANNEL_FACEBOOK_PAGE,
+        meta_post_id=f"{first.meta_post_id}_second",
+        published_at=first.published_at,
+    )
+    latest = datetime(2026, 6, 16, 4, 15, tzinfo=dt_timezone.utc)
+    first_meta_post = _create_meta_post_insight_points(
+        tenant=tenant,
+        published_post=first,
+        end_time=latest,
+        values={"post_impressions": 90, "post_clicks": 9},
+    )
+    second_meta_post = MetaPost.all_objects.create(
+        tenant=tenant,
+        page=first_meta_post.page,
+        post_id=second.meta_post_id,
+        created_time=second.published_at,
+    )
+    for meta_post, newest in ((first_meta_post, None), (second_meta_post, latest - timezone.timedelta(days=1))):
+        for days_back in range(1, 6):
+            for metric_key in ("post_impressions", "post_clicks"):
+                MetaPostInsightPoint.all_objects.create(
+                    tenant=tenant,
+                    post=meta_post,
+                    metric_key=metric_key,
+                    period="lifetime",
+                    end_time=(newest or latest) - timezone.timedelta(days=days_back),
+                    value_num=Decimal(days_back),
+                )
+        if newest is not None:
+            MetaPostInsightPoint.all_objects.create(
+                tenant=tenant,
+                post=meta_post,
+                metric_key="post_impressions",
+                period="lifetime",
+                end_time=newest,
+                value_num=Decimal(40),
+            )
+    with CaptureQueriesContext(connection) as queries:
+        snapshots = content_ops_metrics.SyncedMetaPostInsightsProvider().fetch_snapshots(
+            [first, second]
+        )
+
+    (points_sql,) = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith('SELECT "integrations_metapostinsightpoint"')
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(points_sql)
+        read_points = cursor.fetchall()
+    assert snapshots[first.id].impressions == 90
+    assert snapshots[first.id].clicks == 9
+    assert snapshots[second.id].impressions == 40
+    assert snapshots[second.id].metric_date == (latest - timezone.timedelta(days=1)).date()
+    # Only the latest end_time's points leave the database, not the history.
+    assert len(read_points) == 3
+
+
+@pytest.mark.django_db
+def test_select_due_published_posts_includes_post_refreshed_one_interval_ago(tenant):
+    workspace = ContentWorkspace.all_objects.create(tenant=tenant, name="Metrics grace")
+    draft = ContentDraft.all_objects.create(
+        tenant=tenant,
+        workspace=workspace,
+        title="Grace post",
+        state=ContentDraft.STATE_PUBLISHED,
+    )
+    version = ContentDraftVersion.all_objects.create(
+        tenant=tenant,
+        draft=draft,
+        version_number=1,
+        caption="Grace caption",
+    )
+    identity = PublishingIdentity.all_objects.create(
+        tenant=tenant,
+        platform=PublishingIdentity.PLATFORM_FACEBOOK_PAGE,
+        meta_page_id="page_grace",
+        display_name="Grace Page",
+    )
+    now = timezone.now()
+
+    def _post(meta_post_id: str, *, last_refresh) -> PublishedPost:
+        return PublishedPost.all_objects.create(
+            tenant=tenant,
+            workspace=workspace,
+            draft=draft,
+            version=version,
+            publishing_identity=identity,
+            channel=PublishedPost.CHANNEL_FACEBOOK_PAGE,
+            meta_post_id=meta_post_id,
+            published_at=now - timezone.timedelta(hours=5),
+            last_metrics_refresh_at=last_refresh,
+        )
+
+    # Stamped by the previous hourly run a few seconds after it selected posts.
+    previous_run = _post(
+        "grace_previous_run",
+        last_refresh=now - timezone.timedelta(hours=1) + timezone.timedelta(seconds=5),
+    )
+    _post("grace_just_refreshed", last_refresh=now - timezone.timedelta(minutes=10))
+
+    assert select_due_published_posts(tenant=tenant, limit=10, now=now) == [previous_run]
+
+
 @pytest.mark.django_db
 def test_content_plan_export_is_client_safe(auth_client, tenant):
     workspace_id = _create_workspace(auth_client)
@@ -35,6 +35,7 @@ from content_ops.publisher import (
     InstagramMediaContainerStatusResult,
     InstagramMediaPublishResult,
     InstagramPublishError,
+    PublishAttemptProcessResult,
     PREFLIGHT_APPROVAL_SNAPSHOT_MISSING,
     PREFLIGHT_ATTEMPT_MISSING,
     PREFLIGHT_ATTEMPT_STATE_NOT_PUBLISHABLE,
@@ -57,6 +58,9 @@ from content_ops.publisher import (
     PROVIDER_NOT_CONFIGURED,
     PROVIDER_RETRYABLE_ERROR,
     PROVIDER_TERMINAL_ERROR,
+    PUBLISH_DISPATCH_LEASE,
+    PUBLISHING_IDENTITY_BUSY,
+    plan_due_publish_attempts,
     preflight_facebook_page_attempt,
     preflight_instagram_attempt,
     process_due_publish_attempts,
@@ -1565,12 +1569,13 @@ def test_process_content_publish_attempt_task_returns_processor_result(
                 "published_post_id": "post-id",
             }
 
-    def fake_process(*, tenant, attempt_id):  # noqa: ANN001
+    def fake_process(*, tenant, attempt_id, channel):  # noqa: ANN001
         assert str(tenant.id)
         assert str(attempt_id) == str(attempt.id)
+        assert channel is None
         return DummyResult()
 
-    monkeypatch.setattr("content_ops.tasks.process_facebook_page_publish_attempt", fake_process)
+    monkeypatch.setattr("content_ops.tasks.process_publish_attempt", fake_process)
 
     result = process_content_publish_attempt.run(str(tenant.id), str(attempt.id))
 
@@ -1584,28 +1589,13 @@ def test_process_due_content_publish_attempts_task_can_target_one_tenant(
 ):
     other_tenant = Tenant.objects.create(name="Other Tenant")
 
-    class DummyResult:
-        def __init__(self, tenant_id):
-            self.tenant_id = tenant_id
-
-        def as_dict(self):
-            return {
-                "scanned": 1,
-                "processed": 1,
-                "published": 1,
-                "blocked": 0,
-                "failed": 0,
-                "skipped": 0,
-                "requeued": 0,
-            }
-
     calls = []
 
-    def fake_process(*, tenant, limit):  # noqa: ANN001
+    def fake_dispatch(*, tenant, limit):  # noqa: ANN001
         calls.append((str(tenant.id), limit))
-        return DummyResult(tenant.id)
+        return {"scanned": 1, "dispatched": 1, "identities": 1, "skipped": 0, "requeued": 0}
 
-    monkeypatch.setattr("content_ops.tasks.process_due_publish_attempts", fake_process)
+    monkeypatch.setattr("content_ops.tasks._dispatch_due_publish_attempts", fake_dispatch)
 
     result = process_due_content_publish_attempts.run(
         tenant_id=str(tenant.id),
@@ -1613,7 +1603,7 @@ def test_process_due_content_publish_attempts_task_can_target_one_tenant(
     )
 
     assert set(result) == {str(tenant.id)}
-    assert result[str(tenant.id)]["published"] == 1
+    assert result[str(tenant.id)]["dispatched"] == 1
     assert calls == [(str(tenant.id), 25)]
     assert str(other_tenant.id) not in result
 
@@ -1624,28 +1614,13 @@ def test_process_due_content_publish_attempts_task_scans_all_tenants(
 ):
     other_tenant = Tenant.objects.create(name="Other Tenant")
 
-    class DummyResult:
-        def __init__(self, tenant_id):
-            self.tenant_id = tenant_id
-
-        def as_dict(self):
-            return {
-                "scanned": 1,
-                "processed": 1,
-                "published": 0,
-                "blocked": 1,
-                "failed": 0,
-                "skipped": 0,
-                "requeued": 0,
-            }
-
     calls = []
 
-    def fake_process(*, tenant, limit):  # noqa: ANN001
+    def fake_dispatch(*, tenant, limit):  # noqa: ANN001
         calls.append((str(tenant.id), limit))
-        return DummyResult(tenant.id)
+        return {"scanned": 0, "dispatched": 0, "identities": 0, "skipped": 0, "requeued": 0}
 
-    monkeypatch.setattr("content_ops.tasks.process_due_publish_attempts", fake_process)
+    monkeypatch.setattr("content_ops.tasks._dispatch_due_publish_attempts", fake_dispatch)
 
     result = process_due_content_publish_attempts.run(limit=15)
 
@@ -1655,6 +1630,240 @@ def test_process_due_content_publish_attempts_task_scans_all_tenants(
     )
 
 
+@pytest.mark.django_db
+def test_plan_due_publish_attempts_groups_by_identity_and_holds_busy_identities(tenant):
+    now = timezone.now()
+    first = _publish_attempt_graph(tenant=tenant)
+    other_page = _publish_attempt_graph(tenant=tenant)
+    second = _publish_attempt_graph(tenant=tenant)
+    _share_identity(second, with_attempt=first, scheduled_after=first)
+    busy_queued = _publish_attempt_graph(tenant=tenant)
+    in_flight = _publish_attempt_graph(tenant=tenant, state=PublishAttempt.STATE_PUBLISHING)
+    _share_identity(in_flight, with_attempt=busy_queued)
+    in_flight.started_at = now - timezone.timedelta(minutes=1)
+    in_flight.save(update_fields=["started_at", "updated_at"])
+    stale_queued = _publish_attempt_graph(tenant=tenant)
+    stale = _publish_attempt_graph(tenant=tenant, state=PublishAttempt.STATE_PUBLISHING)
+    _share_identity(stale, with_attempt=stale_queued)
+    stale.started_at = now - timezone.timedelta(hours=1)
+    stale.save(update_fields=["started_at", "updated_at"])
+
+    plan = plan_due_publish_attempts(tenant=tenant, now=now)
+
+    assert plan.scanned == 5
+    assert [due.attempt_id for due in plan.busy] == [str(busy_queued.id)]
+    groups = [[due.attempt_id for due in group] for group in plan.by_identity()]
+    assert sorted(groups) == sorted(
+        [
+            [str(first.id), str(second.id)],
+            [str(other_page.id)],
+            [str(stale_queued.id)],
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_process_facebook_page_publish_attempt_waits_for_in_flight_identity(tenant):
+    attempt = _publish_attempt_graph(tenant=tenant)
+    in_flight = _publish_attempt_graph(tenant=tenant, state=PublishAttempt.STATE_PUBLISHING)
+    _share_identity(in_flight, with_attempt=attempt)
+    in_flight.started_at = timezone.now()
+    in_flight.save(update_fields=["started_at", "updated_at"])
+    publisher = _SequencedPublisher()
+
+    result = process_facebook_page_publish_attempt(
+        tenant=tenant,
+        attempt_id=attempt.id,
+        publisher=publisher,
+        readiness=_ready_readiness(),
+    )
+
+    attempt.refresh_from_db()
+    assert result.status == PROCESS_STATUS_NOOP
+    assert result.failure_code == PUBLISHING_IDENTITY_BUSY
+    assert attempt.state == PublishAttempt.STATE_QUEUED
+    assert publisher.payloads == []
+
+
+@pytest.mark.django_db
+def test_process_instagram_attempt_claims_ready_container_per_identity(
+    tenant,
+    settings,
+    tmp_path,
+):
+    settings.CONTENT_OPS_ASSET_ROOT = tmp_path
+    first = _publish_attempt_graph(
+        tenant=tenant,
+        channel=PublishAttempt.CHANNEL_INSTAGRAM,
+        identity_platform=PublishingIdentity.PLATFORM_INSTAGRAM,
+        state=PublishAttempt.STATE_CONTAINER_READY,
+    )
+    second = _publish_attempt_graph(
+        tenant=tenant,
+        channel=PublishAttempt.CHANNEL_INSTAGRAM,
+        identity_platform=PublishingIdentity.PLATFORM_INSTAGRAM,
+        state=PublishAttempt.STATE_CONTAINER_READY,
+    )
+    _share_identity(second, with_attempt=first, scheduled_after=first)
+    for attempt, container_id in ((first, "ig-container-a"), (second, "ig-container-b")):
+        _attach_publishable_media(attempt=attempt, tenant=tenant, tmp_path=tmp_path)
+        attempt.meta_container_id = container_id
+        attempt.meta_container_created_at = timezone.now()
+        attempt.save(update_fields=["meta_container_id", "meta_container_created_at", "updated_at"])
+    concurrent: dict[str, object] = {}
+
+    class _ConcurrentWorkerPublisher(_FakeInstagramPublisher):
+        def publish_media_container(self, **kwargs):  # noqa: ANN003
+            if not concurrent:
+                # Other workers pick up both attempts while this publish is in flight.
+                for key, attempt in (("same", first), ("next", second)):
+                    concurrent[key] = process_instagram_publish_attempt(
+                        tenant=tenant,
+                        attempt_id=attempt.id,
+                        publisher=self,
+                        readiness=_combined_ready_readiness(),
+                    )
+            return super().publish_media_container(**kwargs)
+
+    publisher = _ConcurrentWorkerPublisher(statuses=[])
+
+    result = process_instagram_publish_attempt(
+        tenant=tenant,
+        attempt_id=first.id,
+        publisher=publisher,
+        readiness=_combined_ready_readiness(),
+    )
+
+    second.refresh_from_db()
+    assert result.status == PROCESS_STATUS_PUBLISHED
+    assert concurrent["same"].status == PROCESS_STATUS_NOOP
+    assert concurrent["same"].state == PublishAttempt.STATE_PUBLISHING
+    assert concurrent["next"].failure_code == PUBLISHING_IDENTITY_BUSY
+    assert second.state == PublishAttempt.STATE_CONTAINER_READY
+    assert [call[1] for call in publisher.publish_calls] == ["ig-container-a"]
+
+    process_instagram_publish_attempt(
+        tenant=tenant,
+        attempt_id=second.id,
+        publisher=publisher,
+        readiness=_combined_ready_readiness(),
+    )
+
+    second.refresh_from_db()
+    assert second.state == PublishAttempt.STATE_PUBLISHED
+    assert [call[1] for call in publisher.publish_calls] == ["ig-container-a", "ig-container-b"]
+
+
+@pytest.mark.django_db
+def test_process_instagram_attempt_waits_for_earlier_container_on_identity(
+    tenant,
+    settings,
+    tmp_path,
+):
+    settings.CONTENT_OPS_ASSET_ROOT = tmp_path
+    first = _publish_attempt_graph(
+        tenant=tenant,
+        channel=PublishAttempt.CHANNEL_INSTAGRAM,
+        identity_platform=PublishingIdentity.PLATFORM_INSTAGRAM,
+    )
+    second = _publish_attempt_graph(
+        tenant=tenant,
+        channel=PublishAttempt.CHANNEL_INSTAGRAM,
+        identity_platform=PublishingIdentity.PLATFORM_INSTAGRAM,
+    )
+    _share_identity(second, with_attempt=first, scheduled_after=first)
+    for attempt in (first, second):
+        _attach_publishable_media(attempt=attempt, tenant=tenant, tmp_path=tmp_path)
+    publisher = _FakeInstagramPublisher(statuses=["IN_PROGRESS", "FINISHED"])
+
+    def _process(attempt):
+        return process_instagram_publish_attempt(
+            tenant=tenant,
+            attempt_id=attempt.id,
+            publisher=publisher,
+            readiness=_combined_ready_readiness(),
+        )
+
+    pending = _process(first)
+    held = _process(second)
+
+    second.refresh_from_db()
+    assert pending.state == PublishAttempt.STATE_CONTAINER_PENDING
+    assert held.status == PROCESS_STATUS_NOOP
+    assert held.failure_code == PUBLISHING_IDENTITY_BUSY
+    assert second.state == PublishAttempt.STATE_QUEUED
+    assert len(publisher.container_payloads) == 1
+
+    assert _process(first).status == PROCESS_STATUS_PUBLISHED
+    assert _process(second).status == PROCESS_STATUS_PUBLISHED
+
+    assert [call[1] for call in publisher.publish_calls] == ["ig-container-1", "ig-container-2"]
+
+
+@pytest.mark.django_db
+def test_process_due_content_publish_attempts_task_chains_attempts_per_identity(
+    tenant, monkeypatch
+):
+    first = _publish_attempt_graph(tenant=tenant)
+    second = _publish_attempt_graph(tenant=tenant)
+    _share_identity(second, with_attempt=first, scheduled_after=first)
+    other_page = _publish_attempt_graph(tenant=tenant)
+    processed = []
+
+    def fake_process(*, tenant, attempt_id, channel):  # noqa: ANN001
+        processed.append(str(attempt_id))
+        return PublishAttemptProcessResult(status=PROCESS_STATUS_PUBLISHED, attempt_id=str(attempt_id))
+
+    monkeypatch.setattr("content_ops.tasks.process_publish_attempt", fake_process)
+
+    result = process_due_content_publish_attempts.run(tenant_id=str(tenant.id))
+
+    assert result[str(tenant.id)] == {
+        "scanned": 3,
+        "dispatched": 3,
+        "identities": 2,
+        "skipped": 0,
+        "requeued": 0,
+    }
+    assert sorted(processed) == sorted([str(first.id), str(second.id), str(other_page.id)])
+    assert processed.index(str(first.id)) < processed.index(str(second.id))
+    # Each task releases its dispatch lease once it has run.
+    assert not PublishAttempt.all_objects.filter(dispatched_at__isnull=False).exists()
+
+
+@pytest.mark.django_db
+def test_process_due_content_publish_attempts_task_leases_dispatched_attempts(
+    tenant, monkeypatch
+):
+    attempt = _publish_attempt_graph(tenant=tenant)
+    enqueued = []
+
+    class _DeferredChain:
+        def __init__(self, *signatures):  # noqa: ANN002
+            self.signatures = signatures
+
+        def apply_async(self):
+            enqueued.append([signature.args[1] for signature in self.signatures])
+
+    monkeypatch.setattr("content_ops.tasks.chain", _DeferredChain)
+
+    first = process_due_content_publish_attempts.run(tenant_id=str(tenant.id))
+    # The chain has not run yet, so the next scan must not enqueue it again.
+    second = process_due_content_publish_attempts.run(tenant_id=str(tenant.id))
+
+    assert first[str(tenant.id)]["dispatched"] == 1
+    assert second[str(tenant.id)]["scanned"] == 0
+    assert enqueued == [[str(attempt.id)]]
+
+    attempt.refresh_from_db()
+    attempt.dispatched_at = timezone.now() - PUBLISH_DISPATCH_LEASE - timezone.timedelta(seconds=1)
+    attempt.save(update_fields=["dispatched_at", "updated_at"])
+    expired = process_due_content_publish_attempts.run(tenant_id=str(tenant.id))
+
+    assert expired[str(tenant.id)]["dispatched"] == 1
+    assert enqueued == [[str(attempt.id)], [str(attempt.id)]]
+
+
 def test_content_ops_publish_tasks_allow_five_retries():
     assert process_content_publish_attempt.max_retries == 5
     assert process_due_content_publish_attempts.max_retries == 5
@@ -1756,6 +1965,21 @@ def _publish_attempt_graph(
     )
 
 
+def _share_identity(
+    attempt: PublishAttempt,
+    *,
+    with_attempt: PublishAttempt,
+    scheduled_after: PublishAttempt | None = None,
+) -> None:
+    attempt.publishing_identity = with_attempt.publishing_identity
+    attempt.save(update_fields=["publishing_identity", "updated_at"])
+    if scheduled_after is not None:
+        attempt.schedule.scheduled_at = scheduled_after.schedule.scheduled_at + timezone.timedelta(
+            seconds=30
+        )
+        attempt.schedule.save(update_fields=["scheduled_at", "updated_at"])
+
+
 def _publishing_identity(
     *,
     tenant,
@@ -7,9 +7,15 @@ import os
 import pytest
 
 from accounts.models import AuditLog, Tenant, TenantKey
-from core.crypto.dek_manager import rotate_all_tenant_deks, rotate_tenant_dek
+from core.crypto.dek_manager import (
+    dek_cache,
+    get_dek_for_tenant,
+    rotate_all_tenant_deks,
+    rotate_tenant_dek,
+)
 from core.crypto.fields import decrypt_value, encrypt_value
 from core.crypto.kms import KmsError, KmsUnavailableError
+from core.metrics import CACHE_REQUESTS_TOTAL, KMS_REQUESTS_TOTAL, reset_metrics
 from integrations.models import NotificationChannel, PlatformCredential
 
 
@@ -223,3 +229,59 @@ def test_rotate_all_tenant_deks_raises_when_kms_unavailable(
 
     log = AuditLog.all_objects.get(action="dek_rotation_failed", tenant=tenant)
     assert log.metadata["error_kind"] == "kms_unavailable"
+
+
+@pytest.mark.django_db
+def test_get_dek_for_tenant_reuses_client_and_caches_plaintext(
+    monkeypatch: pytest.MonkeyPatch, settings
+) -> None:
+    settings.DEK_CACHE_TTL_SECONDS = 60
+    tenant = Tenant.objects.create(name="Tenant Cached")
+    TenantKey.all_objects.create(tenant=tenant, dek_ciphertext=b"cipher", dek_key_version="v1")
+    kms_client = Mock()
+    kms_client.decrypt.return_value = b"\x05" * 32
+    built: list[str] = []
+
+    def fake_get_kms_client(provider, key_id, **kwargs):  # noqa: ANN001, ANN003
+        built.append(provider)
+        return kms_client
+
+    monkeypatch.setattr("core.crypto.dek_manager.get_kms_client", fake_get_kms_client)
+    monkeypatch.setattr("core.crypto.dek_manager._kms_client", None)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("core.crypto.dek_manager.time.monotonic", lambda: clock["now"])
+    reset_metrics()
+
+    for _ in range(5):
+        assert get_dek_for_tenant(tenant) == (b"\x05" * 32, "v1")
+    clock["now"] += 61
+    get_dek_for_tenant(tenant)
+
+    assert kms_client.decrypt.call_count == 2
+    assert built == ["local"]
+    assert CACHE_REQUESTS_TOTAL.labels(area="dek", outcome="hit")._value.get() == 4
+    assert KMS_REQUESTS_TOTAL.labels(operation="decrypt", status="success")._value.get() == 2
+
+
+@pytest.mark.django_db
+def test_rotation_drops_cached_deks(monkeypatch: pytest.MonkeyPatch) -> None:
+    tenant = Tenant.objects.create(name="Tenant Rotating")
+    TenantKey.all_objects.create(tenant=tenant, dek_ciphertext=b"cipher", dek_key_version="v1")
+    other = Tenant.objects.create(name="Tenant Idle")
+    TenantKey.all_objects.create(tenant=other, dek_ciphertext=b"cipher", dek_key_version="v1")
+    kms_client = Mock()
+    kms_client.decrypt.return_value = b"\x01" * 32
+    kms_client.encrypt.return_value = ("v2", b"cipher-v2")
+    monkeypatch.setattr("core.crypto.dek_manager._kms", lambda: kms_client)
+    _patch_urandom(monkeypatch, [b"\x02" * 32, b"\x02" * 32])
+
+    get_dek_for_tenant(other)
+    get_dek_for_tenant(tenant)
+    assert len(dek_cache()) == 2
+
+    assert rotate_all_tenant_deks() == 2
+
+    assert dek_cache().get(str(tenant.id), "v1") is None
+    assert get_dek_for_tenant(tenant) == (b"\x02" * 32, "v2")
+    # Two warm-up decrypts plus one per rotated tenant; the new key is cached.
+    assert kms_client.decrypt.call_count == 4
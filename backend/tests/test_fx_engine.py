@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from analytics.fx import convert, fx_rate_engine
+from analytics.models import DailyFxRate
+from integrations import tasks as integration_tasks
+
+
+def _rate(rate_date: date, base: str, quote: str, rate: str) -> None:
+    DailyFxRate.objects.create(
+        rate_date=rate_date, base_currency=base, quote_currency=quote, rate=Decimal(rate)
+    )
+
+
+@pytest.mark.django_db
+def test_convert_column_resolves_mixed_currencies_with_one_load():
+    _rate(date(2026, 4, 1), "USD", "JMD", "155")
+    _rate(date(2026, 4, 5), "USD", "JMD", "157")
+    _rate(date(2026, 4, 3), "JMD", "GBP", "0.005")
+    engine = fx_rate_engine()
+
+    with CaptureQueriesContext(connection) as first:
+        converted = engine.convert_column(
+            [Decimal("10"), 2.5, None, 1000, 40, 7],
+            currencies=["USD", "USD", "USD", "GBP", "CAD", "JMD"],
+            dates=[
+                date(2026, 4, 4),
+                date(2026, 4, 9),
+                date(2026, 4, 9),
+                date(2026, 4, 3),
+                date(2026, 4, 3),
+                date(2026, 3, 1),
+            ],
+            target="JMD",
+        )
+    with CaptureQueriesContext(connection) as repeat:
+        engine.convert_column([1], currencies=["USD"], dates=[date(2026, 4, 2)], target="JMD")
+
+    assert converted == [
+        Decimal("1550.00000000"),
+        Decimal("392.50000000"),
+        None,
+        Decimal("200000.00000000"),
+        None,
+        Decimal("7.00000000"),
+    ]
+    assert len(first) == 1
+    assert len(repeat) == 0
+
+
+@pytest.mark.django_db
+def test_lookup_is_on_or_before_and_none_before_the_first_rate():
+    for day, rate in ((1, "150"), (8, "155"), (20, "160")):
+        _rate(date(2026, 4, day), "USD", "JMD", rate)
+    engine = fx_rate_engine()
+
+    def used(on_date: date):
+        lookup = engine.lookup(on_date=on_date, base_currency="usd", quote_currency="jmd")
+        return None if lookup is None else (lookup.used_date, lookup.rate)
+
+    assert used(date(2026, 3, 31)) is None
+    assert used(date(2026, 4, 8)) == (date(2026, 4, 8), Decimal("155"))
+    assert used(date(2026, 4, 19)) == (date(2026, 4, 8), Decimal("155"))
+    assert used(date(2027, 1, 1)) == (date(2026, 4, 20), Decimal("160"))
+
+
+@pytest.mark.django_db
+def test_refresh_fx_rates_invalidates_the_loaded_series():
+    on_date = date(2026, 4, 10)
+    assert convert(Decimal("100"), from_currency="USD", to_currency="JMD", on_date=on_date) is None
+
+    # Written behind the engine's back: the memoized miss still stands.
+    _rate(on_date, "USD", "JMD", "158")
+    assert convert(Decimal("100"), from_currency="USD", to_currency="JMD", on_date=on_date) is None
+
+    integration_tasks.refresh_fx_rates.run(
+        manual_rows=[
+            {"rate_date": "2026-04-11", "base_currency": "USD", "quote_currency": "GBP", "rate": "0.8"}
+        ]
+    )
+    assert convert(
+        Decimal("100"), from_currency="USD", to_currency="JMD", on_date=on_date
+    ) == Decimal("15800.00000000")
@@ -161,6 +161,7 @@ def test_google_ads_exports_create_and_status(api_client: APIClient, user):
     assert create_response.status_code == 201
     payload = create_response.json()
     assert payload["status"] == GoogleAdsExportJob.STATUS_COMPLETED
+    assert payload["metadata"]["row_count"] == 2
 
     status_response = api_client.get(f"/api/analytics/google-ads/exports/{payload['id']}/")
     assert status_response.status_code == 200
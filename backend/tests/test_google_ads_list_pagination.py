@@ -0,0 +1,190 @@
+"""SQL-side ordering, search and pagination for the Google Ads list endpoints."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from integrations.models import (
+    GoogleAdsAccountAssignment,
+    GoogleAdsSdkCampaignDaily,
+    GoogleAdsSdkKeywordDaily,
+)
+
+CUSTOMER_ID = "1234567890"
+WINDOW = {"start_date": "2026-02-01", "end_date": "2026-02-28"}
+CAMPAIGN_SORTS = ("campaign_name", "spend", "clicks", "impressions", "conversions", "roas", "cpa")
+
+
+@pytest.fixture
+def analyst(api_client, user):
+    GoogleAdsAccountAssignment.objects.create(
+        tenant=user.tenant,
+        user=user,
+        customer_id=CUSTOMER_ID,
+        access_level=GoogleAdsAccountAssignment.ACCESS_ANALYST,
+        is_active=True,
+    )
+    api_client.force_authenticate(user=user)
+    return user
+
+
+def _seed_campaigns(tenant, count: int = 9) -> None:
+    for index in range(count):
+        for day in (3, 4):
+            GoogleAdsSdkCampaignDaily.objects.create(
+                tenant=tenant,
+                customer_id=CUSTOMER_ID,
+                campaign_id=f"c-{index:02d}",
+                # Campaign 4 has no name and is shown (and searched) by its id.
+                campaign_name="" if index == 4 else f"{'Brand' if index % 2 else 'Generic'} {index}",
+                campaign_status="ENABLED",
+                advertising_channel_type="SEARCH",
+                date_day=date(2026, 2, day),
+                impressions=1000 + 37 * index + day,
+                clicks=20 + 3 * index + day,
+                conversions=Decimal(1 + (index * 7) % 11),
+                conversions_value=Decimal(50 + (index * 13) % 17),
+                cost_micros=(10 + (index * 5) % 9) * 1_000_000 + index,
+            )
+
+
+def _python_ordering(rows: list[dict], sort: str, query: str = "") -> list[str]:
+    """Filter and sort the way the endpoint did before the work moved into SQL."""
+
+    query = query.strip().lower()
+    matched = [row for row in rows if not query or query in row["campaign_name"].lower()]
+    reverse = sort.startswith("-")
+    key = sort.lstrip("-")
+    matched.sort(key=lambda row: row.get(key) or 0, reverse=reverse)
+    return [row["campaign_id"] for row in matched]
+
+
+def _all_campaigns(api_client) -> list[dict]:
+    response = api_client.get(reverse("google-ads-campaigns"), {**WINDOW, "page_size": 200})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("sort", [*CAMPAIGN_SORTS, *(f"-{key}" for key in CAMPAIGN_SORTS)])
+def test_campaign_pages_follow_the_python_ordering(api_client, analyst, sort):
+    _seed_campaigns(analyst.tenant)
+    expected = _python_ordering(_all_campaigns(api_client), sort)
+
+    seen: list[str] = []
+    for page in (1, 2, 3):
+        response = api_client.get(
+            reverse("google-ads-campaigns"),
+            {**WINDOW, "sort": sort, "page": page, "page_size": 4},
+        )
+        body = response.json()
+        assert set(body) == {"count", "page", "page_size", "num_pages", "results", "source_engine"}
+        assert (body["count"], body["page"], body["num_pages"]) == (9, page, 3)
+        seen += [row["campaign_id"] for row in body["results"]]
+
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_campaign_search_runs_in_sql_and_matches_unnamed_campaigns_by_id(api_client, analyst):
+    _seed_campaigns(analyst.tenant)
+    every_row = _all_campaigns(api_client)
+
+    response = api_client.get(reverse("google-ads-campaigns"), {**WINDOW, "q": "BRAND"})
+    assert [row["campaign_id"] for row in response.json()["results"]] == _python_ordering(
+        every_row, "-spend", "brand"
+    )
+    by_id = api_client.get(reverse("google-ads-campaigns"), {**WINDOW, "q": "c-04"}).json()
+    assert [row["campaign_name"] for row in by_id["results"]] == ["c-04"]
+
+
+@pytest.mark.django_db
+def test_campaign_page_reads_only_the_requested_slice(api_client, analyst):
+    _seed_campaigns(analyst.tenant)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            reverse("google-ads-campaigns"), {**WINDOW, "sort": "-roas", "page": 2, "page_size": 4}
+        )
+
+    assert len(response.json()["results"]) == 4
+    page_query = next(q["sql"] for q in queries if "LIMIT" in q["sql"] and "campaign" in q["sql"])
+    assert "LIMIT 4 OFFSET 4" in page_query
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("sort", ["-spend", "cpa", "campaign_name"])
+def test_campaign_keyset_cursor_walks_the_same_sequence(api_client, analyst, sort):
+    _seed_campaigns(analyst.tenant)
+    expected = _python_ordering(_all_campaigns(api_client), sort)
+
+    seen: list[str] = []
+    cursor = ""
+    for _ in range(5):
+        body = api_client.get(
+            reverse("google-ads-campaigns"),
+            {**WINDOW, "sort": sort, "page_size": 4, "cursor": cursor},
+        ).json()
+        assert body["count"] == 9
+        seen += [row["campaign_id"] for row in body["results"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_campaign_cursor_must_match_the_sort(api_client, analyst):
+    _seed_campaigns(analyst.tenant)
+    first = api_client.get(
+        reverse("google-ads-campaigns"), {**WINDOW, "page_size": 2, "cursor": ""}
+    ).json()
+
+    mismatched = api_client.get(
+        reverse("google-ads-campaigns"),
+        {**WINDOW, "page_size": 2, "sort": "roas", "cursor": first["next_cursor"]},
+    )
+    garbage = api_client.get(
+        reverse("google-ads-campaigns"), {**WINDOW, "page_size": 2, "cursor": "not-a-cursor"}
+    )
+
+    assert mismatched.status_code == 400
+    assert garbage.status_code == 400
+
+
+@pytest.mark.django_db
+def test_keywords_return_every_row_unless_a_page_is_requested(api_client, analyst):
+    for index in range(5):
+        GoogleAdsSdkKeywordDaily.objects.create(
+            tenant=analyst.tenant,
+            customer_id=CUSTOMER_ID,
+            campaign_id="c-1",
+            ad_group_id="ag-1",
+            criterion_id=f"kw-{index}",
+            keyword_text=f"{'jamaica' if index % 2 else 'kingston'} hotel {index}",
+            match_type="BROAD",
+            date_day=date(2026, 2, 10),
+            impressions=100,
+            clicks=10 + index,
+            cost_micros=(index + 1) * 1_000_000,
+        )
+
+    full = api_client.get(reverse("google-ads-keywords"), WINDOW).json()
+    searched = api_client.get(reverse("google-ads-keywords"), {**WINDOW, "q": "Jamaica"}).json()
+    paged = api_client.get(
+        reverse("google-ads-keywords"), {**WINDOW, "page": 2, "page_size": 2, "sort": "clicks"}
+    ).json()
+
+    assert set(full) == {"count", "results"}
+    assert [row["criterion_id"] for row in full["results"]] == [f"kw-{i}" for i in (4, 3, 2, 1, 0)]
+    assert [row["criterion_id"] for row in searched["results"]] == ["kw-3", "kw-1"]
+    assert paged["count"] == 5
+    assert (paged["page"], paged["num_pages"]) == (2, 3)
+    assert [row["criterion_id"] for row in paged["results"]] == ["kw-2", "kw-3"]
@@ -5,9 +5,14 @@ from decimal import Decimal
 
 import pytest
 
-from integrations.google_ads.client import AdGroupAdDailyRow
-from integrations.google_ads.repository import upsert_ad_group_ad_daily_rows
-from integrations.models import GoogleAdsSdkAdGroupAdDaily
+from django.core.management import call_command
+
+from integrations.google_ads.client import AdGroupAdDailyRow, SearchTermDailyRow
+from integrations.google_ads.repository import (
+    upsert_ad_group_ad_daily_rows,
+    upsert_search_term_daily_rows,
+)
+from integrations.models import GoogleAdsSdkAdGroupAdDaily, GoogleAdsSdkSearchTermDaily
 
 pytestmark = pytest.mark.django_db
 
@@ -44,3 +49,54 @@ def test_upsert_ad_group_ad_daily_rows_is_idempotent(tenant):
     assert stored is not None
     assert stored.clicks == 10
     assert stored.cost_micros == 1000000
+
+
+def _search_term_row(term: str, *, clicks: int) -> SearchTermDailyRow:
+    return SearchTermDailyRow(
+        customer_id="123",
+        campaign_id="10",
+        ad_group_id="20",
+        criterion_id="40",
+        search_term=term,
+        date_day=date(2026, 2, 20),
+        currency_code="USD",
+        impressions=100,
+        clicks=clicks,
+        conversions=Decimal("1"),
+        conversions_value=Decimal("2"),
+        cost_micros=500000,
+        request_id="req-1",
+    )
+
+
+def test_upsert_search_term_rows_writes_in_chunks_and_updates_existing(tenant, settings):
+    settings.GOOGLE_ADS_UPSERT_BATCH_SIZE = 2
+    upsert_search_term_daily_rows(
+        tenant=tenant,
+        rows=[_search_term_row(f"term {index}", clicks=1) for index in range(3)],
+    )
+
+    persisted = upsert_search_term_daily_rows(
+        tenant=tenant,
+        rows=(
+            _search_term_row(term, clicks=clicks)
+            for term, clicks in (("term 0", 5), ("term 3", 1), ("term 0", 7))
+        ),
+    )
+
+    assert persisted == 3
+    assert GoogleAdsSdkSearchTermDaily.objects.count() == 4
+    assert GoogleAdsSdkSearchTermDaily.objects.get(search_term="term 0").clicks == 7
+    assert GoogleAdsSdkSearchTermDaily.objects.get(search_term="term 1").clicks == 1
+
+
+def test_benchmark_google_ads_upserts_reports_rates_and_rolls_back(capsys, settings):
+    settings.GOOGLE_ADS_UPSERT_BATCH_SIZE = 500
+    call_command("benchmark_google_ads_upserts", rows=20, batch_size=5)
+
+    output = capsys.readouterr().out
+    assert "vendor=sqlite rows=20 batch_size=5" in output
+    assert "per_row  insert" in output
+    assert "batched  update" in output
+    assert GoogleAdsSdkSearchTermDaily.all_objects.count() == 0
+    assert settings.GOOGLE_ADS_UPSERT_BATCH_SIZE == 500
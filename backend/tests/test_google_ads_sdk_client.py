@@ -72,6 +72,60 @@ def test_google_ads_sdk_client_fetch_campaign_daily(monkeypatch, tenant, setting
     assert rows[0].cost_micros == 1200000
 
 
+def test_google_ads_sdk_client_iter_search_term_daily_yields_per_stream_batch(
+    monkeypatch, tenant, settings
+):
+    settings.GOOGLE_ADS_CLIENT_ID = "client-id"
+    settings.GOOGLE_ADS_CLIENT_SECRET = "client-secret"
+    settings.GOOGLE_ADS_DEVELOPER_TOKEN = "dev-token"
+    credential = _make_credential(tenant)
+    batches_served: list[str] = []
+
+    def _row(term: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            customer=SimpleNamespace(id="1234567890", currency_code="USD"),
+            campaign=SimpleNamespace(id="111"),
+            ad_group=SimpleNamespace(id="222"),
+            ad_group_criterion=SimpleNamespace(criterion_id="333"),
+            search_term_view=SimpleNamespace(search_term=term),
+            segments=SimpleNamespace(date="2026-02-20"),
+            metrics=SimpleNamespace(impressions=1, clicks=1, conversions=0, conversions_value=0, cost_micros=10),
+        )
+
+    class FakeService:
+        def search_stream(self, **kwargs):  # noqa: ANN003
+            for request_id, terms in (("req-1", ["a", "b"]), ("req-2", ["c"])):
+                batches_served.append(request_id)
+                yield SimpleNamespace(request_id=request_id, results=[_row(term) for term in terms])
+
+    class FakeGoogleAdsClient:
+        def get_service(self, name):  # noqa: ANN001
+            return FakeService()
+
+        @classmethod
+        def load_from_dict(cls, config):  # noqa: ANN001
+            return cls()
+
+    monkeypatch.setattr(
+        "integrations.google_ads.client._import_google_ads_symbols",
+        lambda: (FakeGoogleAdsClient, Exception),
+    )
+    client = GoogleAdsSdkClient(credential=credential)
+    rows = client.iter_search_term_daily(
+        customer_id="1234567890",
+        start_date=date(2026, 2, 20),
+        end_date=date(2026, 2, 20),
+    )
+
+    first = next(rows)
+    assert first.search_term == "a"
+    assert batches_served == ["req-1"]
+    remaining = list(rows)
+    assert [row.search_term for row in remaining] == ["b", "c"]
+    assert remaining[-1].request_id == "req-2"
+    assert batches_served == ["req-1", "req-2"]
+
+
 def test_google_ads_sdk_client_raises_when_refresh_token_missing(tenant, settings):
     settings.GOOGLE_ADS_CLIENT_ID = "client-id"
     settings.GOOGLE_ADS_CLIENT_SECRET = "client-secret"
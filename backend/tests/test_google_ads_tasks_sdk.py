@@ -2,17 +2,26 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
+import threading
 
 import pytest
 
 from alerts.models import AlertRun
+from core.tenant_cache import tenant_cache_generation
 from integrations.google_ads.client import (
+    AccessibleCustomerRow,
     AdGroupAdDailyRow,
     CampaignDailyRow,
     GeographicDailyRow,
     GoogleAdsSdkError,
+    SearchTermDailyRow,
+)
+from integrations.models import (
+    GoogleAdsSdkCampaignDaily,
+    GoogleAdsSdkSearchTermDaily,
+    GoogleAdsSyncState,
+    PlatformCredential,
 )
-from integrations.models import GoogleAdsSyncState, PlatformCredential
 from integrations.tasks import (
     RETRY_REASON_GOOGLE_OAUTH_CONFIGURATION,
     refresh_google_ads_tokens,
@@ -47,7 +56,7 @@ def test_sync_google_ads_sdk_incremental_success_resets_failures(monkeypatch, te
         def __init__(self, *args, **kwargs):  # noqa: D401
             return None
 
-        def fetch_campaign_daily(self, **kwargs):  # noqa: ANN003
+        def iter_campaign_daily(self, **kwargs):  # noqa: ANN003
             return [
                 CampaignDailyRow(
                     customer_id="1234567890",
@@ -66,7 +75,7 @@ def test_sync_google_ads_sdk_incremental_success_resets_failures(monkeypatch, te
                 )
             ]
 
-        def fetch_ad_group_ad_daily(self, **kwargs):  # noqa: ANN003
+        def iter_ad_group_ad_daily(self, **kwargs):  # noqa: ANN003
             return [
                 AdGroupAdDailyRow(
                     customer_id="1234567890",
@@ -89,7 +98,7 @@ def test_sync_google_ads_sdk_incremental_success_resets_failures(monkeypatch, te
                 )
             ]
 
-        def fetch_geographic_daily(self, **kwargs):  # noqa: ANN003
+        def iter_geographic_daily(self, **kwargs):  # noqa: ANN003
             return [
                 GeographicDailyRow(
                     customer_id="1234567890",
@@ -111,22 +120,22 @@ def test_sync_google_ads_sdk_incremental_success_resets_failures(monkeypatch, te
         def fetch_accessible_customers(self, **kwargs):  # noqa: ANN003
             return []
 
-        def fetch_keyword_daily(self, **kwargs):  # noqa: ANN003
+        def iter_keyword_daily(self, **kwargs):  # noqa: ANN003
             return []
 
-        def fetch_search_term_daily(self, **kwargs):  # noqa: ANN003
+        def iter_search_term_daily(self, **kwargs):  # noqa: ANN003
             return []
 
-        def fetch_asset_group_daily(self, **kwargs):  # noqa: ANN003
+        def iter_asset_group_daily(self, **kwargs):  # noqa: ANN003
             return []
 
-        def fetch_conversion_action_daily(self, **kwargs):  # noqa: ANN003
+        def iter_conversion_action_daily(self, **kwargs):  # noqa: ANN003
             return []
 
-        def fetch_change_events(self, **kwargs):  # noqa: ANN003
+        def iter_change_events(self, **kwargs):  # noqa: ANN003
             return []
 
-        def fetch_recommendations(self, **kwargs):  # noqa: ANN003
+        def iter_recommendations(self, **kwargs):  # noqa: ANN003
             return []
 
     monkeypatch.setattr("integrations.tasks.GoogleAdsSdkClient", DummyClient)
@@ -136,6 +145,169 @@ def test_sync_google_ads_sdk_incremental_success_resets_failures(monkeypatch, te
     assert result["synced"] == 1
     assert state.consecutive_sdk_failures == 0
     assert state.fallback_active is False
+    assert tenant_cache_generation(tenant.id) == 1
+
+
+def test_sync_google_ads_sdk_incremental_fetches_children_concurrently(monkeypatch, tenant, settings):
+    settings.GOOGLE_ADS_SYNC_CHILD_CONCURRENCY = 3
+    _create_google_credential(tenant)
+    state = GoogleAdsSyncState.objects.create(
+        tenant=tenant,
+        account_id="1234567890",
+        desired_engine=GoogleAdsSyncState.ENGINE_SDK,
+        effective_engine=GoogleAdsSyncState.ENGINE_SDK,
+    )
+    children = ["111", "222", "333"]
+    # Every child must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(len(children), timeout=5)
+
+    class DummyClient:
+        def __init__(self, *args, **kwargs):  # noqa: D401
+            return None
+
+        def fetch_accessible_customers(self, **kwargs):  # noqa: ANN003
+            return [
+                AccessibleCustomerRow(
+                    manager_customer_id="1234567890",
+                    customer_id=customer_id,
+                    customer_name=f"Child {customer_id}",
+                    currency_code="USD",
+                    time_zone="America/Jamaica",
+                    status="ENABLED",
+                    is_manager=False,
+                )
+                for customer_id in children
+            ]
+
+        def iter_campaign_daily(self, *, customer_id, **kwargs):  # noqa: ANN001, ANN003
+            barrier.wait()
+            if customer_id == "222":
+                raise GoogleAdsSdkError("child disabled", classification="customer_not_enabled")
+            return [
+                CampaignDailyRow(
+                    customer_id=customer_id,
+                    campaign_id="1",
+                    campaign_name="Campaign",
+                    campaign_status="ENABLED",
+                    advertising_channel_type="SEARCH",
+                    date_day=date(2026, 2, 20),
+                    currency_code="USD",
+                    impressions=10,
+                    clicks=2,
+                    conversions=Decimal("1"),
+                    conversions_value=Decimal("5"),
+                    cost_micros=1000000,
+                    request_id="request-id",
+                )
+            ]
+
+        def iter_ad_group_ad_daily(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_geographic_daily(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_keyword_daily(self, *, customer_id, **kwargs):  # noqa: ANN001, ANN003
+            if customer_id == "333":
+                raise GoogleAdsSdkError("keyword view denied", classification="permission_denied")
+            return []
+
+        def iter_search_term_daily(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_asset_group_daily(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_conversion_action_daily(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_change_events(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_recommendations(self, **kwargs):  # noqa: ANN003
+            return []
+
+    monkeypatch.setattr("integrations.tasks.GoogleAdsSdkClient", DummyClient)
+    result = sync_google_ads_sdk_incremental.run(str(tenant.id))
+    state.refresh_from_db()
+
+    assert result["synced"] == 1
+    assert sorted(
+        GoogleAdsSdkCampaignDaily.objects.values_list("customer_id", flat=True)
+    ) == ["111", "333"]
+    optional_errors = state.metadata["optional_fetch_errors"]
+    assert optional_errors["per_child_metric_errors"] == {
+        "count": 1,
+        "details": {"222": "customer_not_enabled: child disabled"},
+    }
+    assert optional_errors["keyword_daily"]["customer_id"] == "333"
+
+
+def test_sync_google_ads_sdk_incremental_streams_rows_in_bounded_chunks(monkeypatch, tenant, settings):
+    settings.GOOGLE_ADS_SYNC_CHILD_CONCURRENCY = 1
+    settings.GOOGLE_ADS_UPSERT_BATCH_SIZE = 50
+    _create_google_credential(tenant)
+    GoogleAdsSyncState.objects.create(
+        tenant=tenant,
+        account_id="1234567890",
+        desired_engine=GoogleAdsSyncState.ENGINE_SDK,
+        effective_engine=GoogleAdsSyncState.ENGINE_SDK,
+    )
+    total_rows = 1000
+    counters = {"produced": 0, "persisted": 0, "max_in_flight": 0}
+
+    class StreamingClient:
+        def __init__(self, *args, **kwargs):  # noqa: D401
+            return None
+
+        def fetch_accessible_customers(self, **kwargs):  # noqa: ANN003
+            return []
+
+        def iter_search_term_daily(self, **kwargs):  # noqa: ANN003
+            for index in range(total_rows):
+                counters["produced"] += 1
+                yield SearchTermDailyRow(
+                    customer_id="1234567890",
+                    campaign_id="1",
+                    ad_group_id="2",
+                    criterion_id="3",
+                    search_term=f"term {index}",
+                    date_day=date(2026, 2, 20),
+                    currency_code="USD",
+                    impressions=1,
+                    clicks=1,
+                    conversions=Decimal("0"),
+                    conversions_value=Decimal("0"),
+                    cost_micros=1000,
+                    request_id="request-id",
+                )
+
+        def __getattr__(self, name):  # noqa: ANN001, ANN204
+            if name.startswith("iter_"):
+                return lambda **kwargs: iter(())
+            raise AttributeError(name)
+
+    from integrations import tasks as integration_tasks
+
+    real_writer = integration_tasks.upsert_search_term_daily_rows
+
+    def recording_writer(*, tenant, rows):  # noqa: ANN001
+        assert len(rows) <= 50
+        in_flight = counters["produced"] - counters["persisted"]
+        counters["max_in_flight"] = max(counters["max_in_flight"], in_flight)
+        persisted = real_writer(tenant=tenant, rows=rows)
+        counters["persisted"] += len(rows)
+        return persisted
+
+    monkeypatch.setattr("integrations.tasks.GoogleAdsSdkClient", StreamingClient)
+    monkeypatch.setattr("integrations.tasks.upsert_search_term_daily_rows", recording_writer)
+    result = sync_google_ads_sdk_incremental.run(str(tenant.id))
+
+    assert result["synced"] == 1
+    assert counters["persisted"] == total_rows
+    assert GoogleAdsSdkSearchTermDaily.objects.count() == total_rows
+    # Queue (2 chunks) + one chunk being built + one being written.
+    assert counters["max_in_flight"] <= 50 * 4
 
 
 def test_sync_google_ads_sdk_incremental_auto_rolls_back_after_three_failures(monkeypatch, tenant):
@@ -0,0 +1,337 @@
+"""Parity between the SQL-aggregated meta_direct payload and the former Python loop."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from adapters.meta_direct import (
+    FALLBACK_CURRENCY,
+    META_PLATFORM_LABEL,
+    MetaDirectAdapter,
+    _manual_metric_was_supplied,
+    _safe_divide,
+    _sum_optional,
+    _sum_optional_values,
+    _to_float,
+    _to_optional_float,
+    _to_optional_int,
+)
+from analytics.models import Ad, AdAccount, AdSet, Campaign, DailyFxRate, RawPerformanceRecord
+
+
+def _legacy_currency(record: RawPerformanceRecord) -> str:
+    for candidate in (
+        record.currency,
+        record.campaign.currency if record.campaign is not None else None,
+        record.ad_account.currency if record.ad_account is not None else None,
+    ):
+        if isinstance(candidate, str) and candidate.strip():
+            return candidate.strip()
+    return FALLBACK_CURRENCY
+
+
+def _legacy_metric(record: RawPerformanceRecord, metric: str) -> float | int | None:
+    if not _manual_metric_was_supplied(record.raw_payload, metric):
+        return None
+    value = getattr(record, metric)
+    return _to_optional_float(value) if metric == "spend" else _to_optional_int(value)
+
+
+def _with_ratios(row: dict[str, Any]) -> dict[str, Any]:
+    spend, impressions, clicks = row["spend"], row["impressions"], row["clicks"]
+    row["roas"] = _safe_divide(row["conversions"], spend)
+    row["ctr"] = _safe_divide(clicks, impressions)
+    row["cpc"] = _safe_divide(spend, clicks)
+    row["cpm"] = _safe_divide(spend * 1000 if spend is not None else None, impressions)
+    row["cpa"] = _safe_divide(spend, row["conversions"])
+    row["frequency"] = _safe_divide(impressions, row["reach"])
+    return row
+
+
+def _legacy_sections(tenant) -> dict[str, Any]:
+    """Row-by-row aggregation as ``fetch_metrics`` computed it before SQL grouping."""
+
+    records = list(
+        RawPerformanceRecord.objects.filter(tenant=tenant, source__iexact="meta")
+        .select_related("ad_account", "campaign", "adset", "ad")
+        .order_by("date", "campaign__name", "ad__name", "external_id")
+    )
+    metrics = ("spend", "impressions", "reach", "clicks", "conversions")
+    currency = next(
+        (c for c in map(_legacy_currency, records) if c != FALLBACK_CURRENCY),
+        FALLBACK_CURRENCY,
+    )
+    trend: dict[str, dict[str, Any]] = {}
+    campaigns: dict[str, dict[str, Any]] = {}
+    creatives: dict[str, dict[str, Any]] = {}
+    budgets: dict[str, dict[str, float]] = defaultdict(dict)
+    for record in records:
+        values = {metric: _legacy_metric(record, metric) for metric in metrics}
+        account_id = (
+            record.ad_account.external_id
+            if record.ad_account is not None
+            else record.campaign.account_external_id
+            if record.campaign is not None
+            else ""
+        )
+        day = record.date.isoformat()
+        groups = [
+            trend.setdefault(
+                day,
+                {"date": day, **dict.fromkeys(metrics), "adAccountId": account_id or None},
+            )
+        ]
+        if record.campaign is not None:
+            group = campaigns.setdefault(
+                record.campaign.external_id,
+                {
+                    "id": record.campaign.external_id,
+                    "adAccountId": account_id,
+                    "name": record.campaign.name,
+                    "platform": META_PLATFORM_LABEL,
+                    "status": record.campaign.status or "Unknown",
+                    "objective": record.campaign.objective or None,
+                    "parishes": [],
+                    **dict.fromkeys(metrics),
+                    "startDate": day,
+                    "endDate": day,
+                },
+            )
+            groups.append(group)
+            if record.adset is not None:
+                budgets[record.campaign.external_id][record.adset.external_id] = _to_float(
+                    record.adset.daily_budget
+                )
+            if record.ad is not None:
+                thumbnail = record.ad.creative.get("thumbnail_url")
+                group = creatives.setdefault(
+                    record.ad.external_id,
+                    {
+                        "id": record.ad.external_id,
+                        "adAccountId": account_id,
+                        "name": record.ad.name,
+                        "campaignId": record.campaign.external_id,
+                        "campaignName": record.campaign.name,
+                        "platform": META_PLATFORM_LABEL,
+                        "parishes": [],
+                        **dict.fromkeys(metrics),
+                        "startDate": day,
+                        "endDate": day,
+                        "thumbnailUrl": thumbnail if isinstance(thumbnail, str) else None,
+                    },
+                )
+                groups.append(group)
+        for group in groups:
+            for metric, value in values.items():
+                group[metric] = _sum_optional(group[metric], value)
+            if "startDate" in group:
+                group["startDate"] = min(group["startDate"], day)
+                group["endDate"] = max(group["endDate"], day)
+
+    creative_rows = [_with_ratios(row) for row in creatives.values()]
+    for row in creative_rows:
+        if row["thumbnailUrl"] is None:
+            row.pop("thumbnailUrl")
+    trend_rows = [trend[key] for key in sorted(trend)]
+    return {
+        "currency": currency,
+        "totals": {
+            metric: _sum_optional_values(point[metric] for point in trend_rows)
+            for metric in metrics
+        },
+        "trend": trend_rows,
+        "rows": sorted(
+            (_with_ratios(row) for row in campaigns.values()),
+            key=lambda row: (-row["spend"], row["name"]),
+        ),
+        "creative": sorted(creative_rows, key=lambda row: (-row["spend"], row["name"])),
+        "budget_campaigns": {
+            key: sorted(budget for budget in values.values() if budget > 0)
+            for key, values in budgets.items()
+        },
+        "coverage": {
+            "startDate": records[0].date.isoformat(),
+            "endDate": records[-1].date.isoformat(),
+        },
+        "snapshot_generated_at": max(record.ingested_at for record in records).isoformat(),
+    }
+
+
+def _seed(tenant) -> None:
+    account = AdAccount.objects.create(
+        tenant=tenant, external_id="act_100", account_id="100", currency="USD"
+    )
+    campaigns = [
+        Campaign.objects.create(
+            tenant=tenant,
+            ad_account=account if index else None,
+            external_id=f"cmp-{index}",
+            name=name,
+            platform="meta",
+            account_external_id=f"act_{200 + index}",
+            status="ACTIVE" if index else "",
+            currency=" JMD " if index == 2 else "",
+        )
+        for index, name in enumerate(("Awareness", "Retargeting", "Awareness"))
+    ]
+    adsets = [
+        AdSet.objects.create(
+            tenant=tenant,
+            campaign=campaign,
+            external_id=f"adset-{index}",
+            name=f"Ad set {index}",
+            daily_budget=Decimal(25 * (index + 1)),
+        )
+        for index, campaign in enumerate(campaigns)
+    ]
+    ads = [
+        Ad.objects.create(
+            tenant=tenant,
+            adset=adsets[index % 3],
+            external_id=f"ad-{index}",
+            name=f"Creative {index % 2}",
+            creative={"thumbnail_url": f"https://cdn.example/{index}.png"} if index % 2 else {},
+        )
+        for index in range(4)
+    ]
+    manual_payloads = [
+        {},
+        {"source": "manual_meta_paid_csv", "metric_columns": ["Amount_Spent ", "impressions"]},
+        {"source": "manual_meta_paid_csv", "metric_columns": ["clicks"]},
+        {"source": "manual_meta_paid_csv"},
+    ]
+    for day in range(1, 6):
+        for index, ad in enumerate(ads):
+            if (day + index) % 5 == 0:
+                continue
+            campaign = campaigns[index % 3]
+            RawPerformanceRecord.objects.create(
+                tenant=tenant,
+                ad_account=account if index % 2 else None,
+                campaign=campaign,
+                adset=adsets[index % 3] if day % 2 else None,
+                ad=ad if day != 3 else None,
+                external_id=f"{ad.external_id}-{day}",
+                source="meta" if index else "META",
+                date=date(2026, 3, day),
+                impressions=1000 * day + index,
+                reach=700 * day,
+                clicks=10 * day + index,
+                spend=Decimal("12.5") * (day + index),
+                conversions=day + index,
+                currency="  " if index else "USD",
+                raw_payload=manual_payloads[(day + index) % 4],
+            )
+    RawPerformanceRecord.objects.create(
+        tenant=tenant,
+        external_id="orphan-1",
+        source="meta",
+        date=date(2026, 3, 6),
+        impressions=50,
+        reach=40,
+        clicks=2,
+        spend=Decimal("0.25"),
+        conversions=0,
+        raw_payload={"source": "manual_meta_paid_csv", "metric_columns": ["reach"]},
+    )
+    RawPerformanceRecord.objects.create(
+        tenant=tenant,
+        campaign=campaigns[1],
+        ad=ads[2],
+        external_id="manual-only",
+        source="meta",
+        date=date(2026, 3, 6),
+        spend=Decimal("3.75"),
+        impressions=9,
+        raw_payload={"source": "manual_meta_paid_csv", "metric_columns": ["spend"]},
+    )
+
+
+@pytest.mark.django_db
+def test_meta_direct_sql_aggregation_matches_row_by_row_payload(tenant):
+    _seed(tenant)
+    # The seed mixes USD and JMD records; a 1:1 rate keeps the FX rollup from
+    # moving the totals the legacy loop added up in raw units.
+    DailyFxRate.objects.create(
+        rate_date=date(2026, 3, 1), base_currency="USD", quote_currency="JMD", rate=Decimal("1")
+    )
+    expected = _legacy_sections(tenant)
+
+    payload = MetaDirectAdapter().fetch_metrics(tenant_id=str(tenant.id))
+
+    summary = payload["campaign"]["summary"]
+    assert summary["currency"] == expected["currency"] == "JMD"
+    assert summary["totalSpend"] == expected["totals"]["spend"]
+    assert summary["totalImpressions"] == expected["totals"]["impressions"]
+    assert summary["totalReach"] == expected["totals"]["reach"]
+    assert summary["totalClicks"] == expected["totals"]["clicks"]
+    assert summary["totalConversions"] == expected["totals"]["conversions"]
+    assert payload["campaign"]["trend"] == expected["trend"]
+    assert payload["campaign"]["rows"] == expected["rows"]
+    assert payload["creative"] == expected["creative"]
+    assert {
+        row["id"]: row["monthlyBudget"] / 30 for row in payload["budget"]
+    } == {key: sum(values) for key, values in expected["budget_campaigns"].items() if values}
+    assert payload["coverage"] == expected["coverage"]
+    assert payload["snapshot_generated_at"] == expected["snapshot_generated_at"]
+    # Manual CSV rows without any supplied metric column stay null, not zero.
+    manual_only = next(row for row in payload["creative"] if row["id"] == "ad-2")
+    assert manual_only["spend"] is not None
+    assert payload["campaign"]["trend"][-1]["spend"] == 3.75
+    assert payload["campaign"]["trend"][-1]["reach"] == 40
+    assert payload["campaign"]["trend"][-1]["clicks"] is None
+
+
+@pytest.mark.django_db
+def test_meta_direct_sql_aggregation_reads_grouped_rows_not_records(
+    tenant, django_assert_max_num_queries
+):
+    _seed(tenant)
+    for day in range(7, 28):
+        RawPerformanceRecord.objects.create(
+            tenant=tenant,
+            campaign=Campaign.objects.get(external_id="cmp-1"),
+            external_id=f"bulk-{day}",
+            source="meta",
+            date=date(2026, 3, day),
+            spend=Decimal("1"),
+        )
+
+    with django_assert_max_num_queries(16):
+        payload = MetaDirectAdapter().fetch_metrics(tenant_id=str(tenant.id))
+
+    assert len(payload["campaign"]["trend"]) == 27
+
+
+@pytest.mark.django_db
+def test_meta_direct_summary_converts_foreign_currency_spend(tenant):
+    jmd = AdAccount.objects.create(tenant=tenant, external_id="act_1", account_id="1", currency="JMD")
+    usd = AdAccount.objects.create(tenant=tenant, external_id="act_2", account_id="2", currency="USD")
+    DailyFxRate.objects.create(
+        rate_date=date(2026, 3, 1), base_currency="USD", quote_currency="JMD", rate=Decimal("156")
+    )
+    for day, account, spend in ((1, jmd, "3000"), (1, usd, "10"), (2, usd, "5"), (2, usd, "0")):
+        RawPerformanceRecord.objects.create(
+            tenant=tenant,
+            ad_account=account,
+            external_id=f"{account.external_id}-{day}-{spend}",
+            source="meta",
+            date=date(2026, 3, day),
+            spend=Decimal(spend),
+            impressions=1000,
+            clicks=10,
+        )
+
+    payload = MetaDirectAdapter().fetch_metrics(tenant_id=str(tenant.id))
+
+    summary = payload["campaign"]["summary"]
+    assert [point["spend"] for point in payload["campaign"]["trend"]] == [4560.0, 780.0]
+    assert (summary["currency"], summary["totalSpend"]) == ("JMD", 5340.0)
+    assert summary["cpc"] == pytest.approx(5340.0 / 40)
+    assert summary["sourceCurrencies"] == ["JMD", "USD"]
+    assert summary["fxUnconvertedPoints"] == 0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 from django.test import override_settings
@@ -9,6 +11,7 @@ from integrations.meta_graph import (
     META_GRAPH_RETRY_REASON_TRANSPORT,
     MetaGraphClient,
     MetaGraphClientError,
+    MetaInsightsRequest,
 )
 
 
@@ -256,3 +259,67 @@ def test_meta_graph_client_list_pages_uses_user_token_when_page_token_missing(mo
     assert len(pages) == 1
     assert pages[0].id == "page-1"
     assert pages[0].access_token == "user-token"
+
+
+@pytest.mark.django_db
+def test_meta_graph_client_fetches_breakdowns_concurrently_with_async_backoff(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+    seen: list[tuple[str, str]] = []
+    throttled: set[str] = set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        account = request.url.path.split("/")[2]
+        breakdown = request.url.params.get("breakdowns", "base")
+        seen.append((account, breakdown))
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if account == "act_2" and breakdown == "region" and account not in throttled:
+            throttled.add(account)
+            return _response(429, {"error": {"message": "slow down", "code": 4}})
+        if breakdown == "age,gender":
+            return _response(400, {"error": {"message": "unsupported breakdown", "code": 100}})
+        return _response(200, {"data": [{"account": account, "breakdown": breakdown}]})
+
+    original = httpx.AsyncClient
+    monkeypatch.setattr(
+        "integrations.meta_graph.httpx.AsyncClient",
+        lambda **kwargs: original(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr("integrations.meta_graph._backoff_seconds", lambda attempt: 0.0)
+
+    def blocking_sleep(*_args, **_kwargs):
+        raise AssertionError("async backoff must not block the thread")
+
+    monkeypatch.setattr("integrations.meta_graph.time.sleep", blocking_sleep)
+    client = MetaGraphClient(app_id="app", app_secret="secret", graph_version="v24.0")
+
+    results = client.fetch_account_insights(
+        [
+            MetaInsightsRequest(
+                account_id=account,
+                user_access_token="token",
+                level="campaign",
+                since="2026-01-01",
+                until="2026-01-31",
+            )
+            for account in ("1", "act_2", "3")
+        ],
+        concurrency=3,
+    )
+
+    # 3 accounts x (base + 3 breakdowns) + one retry after the 429.
+    assert len(seen) == 13
+    assert in_flight["peak"] == 3
+    assert [result.rows for result in results] == [
+        [{"account": account, "breakdown": "base"}] for account in ("act_1", "act_2", "act_3")
+    ]
+    second = results[1]
+    assert second.error is None
+    assert second.breakdowns["region"] == [{"account": "act_2", "breakdown": "region"}]
+    assert isinstance(second.breakdowns["age_gender"], MetaGraphClientError)
+    assert second.breakdowns["age_gender"].error_code == 100
+    assert second.breakdowns["platform"] == [
+        {"account": "act_2", "breakdown": "publisher_platform,device_platform"}
+    ]
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from collections import deque
+import json
+
+import httpx
+import pytest
+
+from core.metrics import (
+    META_GRAPH_GOVERNOR_BUCKETS,
+    META_GRAPH_GOVERNOR_USAGE,
+    reset_metrics,
+)
+from integrations.meta_graph import MetaGraphClient, MetaGraphClientError
+from integrations.meta_graph_governor import (
+    SCOPE_AD_ACCOUNT,
+    SCOPE_APP,
+    FileBucketStore,
+    MemoryBucketStore,
+    MetaGraphRateGovernor,
+    parse_usage_headers,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _SimulatedAdAccount:
+    """Meta-style sliding window: ``limit`` calls per ``window`` seconds, then #17 errors."""
+
+    def __init__(self, *, limit: int = 100, window: float = 60.0) -> None:
+        self.limit = limit
+        self.window = window
+        self.calls: deque[float] = deque()
+
+    def call(self, now: float) -> tuple[bool, dict[str, str]]:
+        while self.calls and self.calls[0] <= now - self.window:
+            self.calls.popleft()
+        if len(self.calls) >= self.limit:
+            regain_minutes = (self.calls[0] + self.window - now) / 60.0
+            return False, {
+                "x-business-use-case-usage": json.dumps(
+                    {"42": [{"call_count": 100, "estimated_time_to_regain_access": regain_minutes}]}
+                )
+            }
+        self.calls.append(now)
+        usage_pct = round(len(self.calls) * 100 / self.limit)
+        return True, {"x-ad-account-usage": json.dumps({"acc_id_util_pct": usage_pct})}
+
+
+def _simulate_concurrent_syncs(
+    *,
+    governors: list[MetaGraphRateGovernor | None],
+    clock: _FakeClock,
+    calls_per_worker: int = 50,
+    latency: float = 0.2,
+) -> int:
+    """Interleave one sync per worker against a shared ad account; return throttle errors."""
+
+    account = _SimulatedAdAccount()
+    keys = MetaGraphRateGovernor.bucket_keys("app", "https://graph.facebook.com/v24.0/act_42/insights")
+    workers = range(len(governors))
+    ready_at = [clock.now for _ in workers]
+    remaining = [calls_per_worker for _ in workers]
+    reserved = [False for _ in workers]
+    failures = [0 for _ in workers]
+    throttled = 0
+
+    while any(remaining):
+        worker = min((index for index in workers if remaining[index]), key=lambda index: ready_at[index])
+        clock.now = ready_at[worker]
+        governor = governors[worker]
+        if governor is not None:
+            wait = governor.blocked_for(keys) if reserved[worker] else governor.reserve(keys)
+            if wait > 0:
+                reserved[worker] = True
+                ready_at[worker] = clock.now + wait
+                continue
+        reserved[worker] = False
+
+        ok, headers = account.call(clock.now)
+        if governor is not None:
+            governor.observe_headers(keys, headers)
+        if ok:
+            remaining[worker] -= 1
+            failures[worker] = 0
+            ready_at[worker] = clock.now + latency
+            continue
+        throttled += 1
+        failures[worker] += 1
+        if governor is not None:
+            governor.observe_throttled(keys)
+        ready_at[worker] = clock.now + latency + min(2 ** failures[worker], 60)
+    return throttled
+
+
+def test_shared_governor_prevents_throttling_across_concurrent_workers(tmp_path):
+    clock = _FakeClock()
+    ungoverned = _simulate_concurrent_syncs(governors=[None] * 4, clock=clock)
+
+    clock = _FakeClock()
+    store = FileBucketStore(tmp_path)
+    # One governor per worker, sharing only the file-backed buckets.
+    governors = [MetaGraphRateGovernor(FileBucketStore(tmp_path), clock=clock) for _ in range(4)]
+    governed = _simulate_concurrent_syncs(governors=governors, clock=clock)
+
+    assert ungoverned >= 10
+    assert governed < ungoverned
+    assert governed <= 1
+    with store.locked("app:app:act_42") as buckets:
+        assert buckets["app:app:act_42"]["usage_pct"] > 75
+
+
+def test_governor_slows_down_from_usage_headers_and_blocks_until_regain():
+    clock = _FakeClock()
+    governor = MetaGraphRateGovernor(
+        MemoryBucketStore(), max_rate=10.0, min_rate=1.0, burst=1.0, slowdown_pct=50.0, clock=clock
+    )
+    keys = governor.bucket_keys("app", "/act_7/insights?limit=200")
+    assert keys == {SCOPE_APP: "app:app", SCOPE_AD_ACCOUNT: "app:app:act_7"}
+
+    assert governor.reserve(keys) == 0.0
+    assert governor.reserve(keys) == pytest.approx(0.1)
+
+    governor.observe_headers(keys, {"x-ad-account-usage": json.dumps({"acc_id_util_pct": 75})})
+    clock.now += 1.0
+    assert governor.reserve(keys) == 0.0
+    # The account bucket now refills at 5.5/s while the app bucket stays at 10/s.
+    assert governor.reserve(keys) == pytest.approx(1 / 5.5)
+
+    governor.observe_headers(
+        keys,
+        {"x-business-use-case-usage": json.dumps({"9": [{"call_count": 99, "estimated_time_to_regain_access": 2}]})},
+    )
+    assert governor.reserve(keys) == pytest.approx(120.0)
+
+
+def test_governor_gauges_aggregate_ad_accounts_per_scope():
+    reset_metrics()
+    governor = MetaGraphRateGovernor(MemoryBucketStore(), clock=_FakeClock())
+    for account, usage_pct in (("act_1", 40), ("act_2", 90), ("act_3", 10)):
+        keys = governor.bucket_keys("app", f"/{account}/insights")
+        governor.observe_headers(keys, {"x-ad-account-usage": json.dumps({"acc_id_util_pct": usage_pct})})
+
+    usage_samples = [
+        sample
+        for metric in META_GRAPH_GOVERNOR_USAGE.collect()
+        for sample in metric.samples
+    ]
+    assert {tuple(sample.labels) for sample in usage_samples} == {("scope",)}
+    assert META_GRAPH_GOVERNOR_USAGE.labels(scope=SCOPE_AD_ACCOUNT)._value.get() == 90
+    assert META_GRAPH_GOVERNOR_BUCKETS.labels(scope=SCOPE_AD_ACCOUNT)._value.get() == 3
+
+
+def test_parse_usage_headers_assigns_scopes():
+    headers = {
+        "x-app-usage": json.dumps({"call_count": 12, "total_time": 30}),
+        "x-business-use-case-usage": json.dumps({"9": [{"total_cputime": 88}]}),
+    }
+
+    usage = parse_usage_headers(headers)
+    assert usage[SCOPE_APP].usage_pct == 30
+    assert usage[SCOPE_AD_ACCOUNT].usage_pct == 88
+
+    app_only = parse_usage_headers(headers, scopes=(SCOPE_APP,))
+    assert app_only == {SCOPE_APP: app_only[SCOPE_APP]}
+    assert app_only[SCOPE_APP].usage_pct == 88
+
+
+def test_meta_graph_client_waits_on_governor_and_reports_throttles(monkeypatch):
+    clock = _FakeClock()
+    governor = MetaGraphRateGovernor(MemoryBucketStore(), burst=1.0, cooldown_seconds=30.0, clock=clock)
+    client = MetaGraphClient(
+        app_id="app",
+        app_secret="secret",
+        graph_version="v24.0",
+        max_attempts=1,
+        governor=governor,
+    )
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    def fake_request(method, url, params=None):  # noqa: ANN001
+        return httpx.Response(
+            400,
+            json={"error": {"message": "User request limit reached", "code": 17}},
+            request=httpx.Request(method, url),
+        )
+
+    monkeypatch.setattr("integrations.meta_graph.time.sleep", fake_sleep)
+    monkeypatch.setattr(client._client, "request", fake_request)
+
+    with pytest.raises(MetaGraphClientError):
+        client.list_insights(
+            account_id="123", user_access_token="token", level="ad", since="2026-01-01", until="2026-01-02"
+        )
+    assert sleeps == []
+
+    with pytest.raises(MetaGraphClientError):
+        client.list_insights(
+            account_id="123", user_access_token="token", level="ad", since="2026-01-01", until="2026-01-02"
+        )
+    assert sleeps == [pytest.approx(30.0)]
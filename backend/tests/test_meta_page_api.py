@@ -331,16 +331,19 @@ def test_meta_page_sync_pipeline_surfaces_graph_data_in_api(
                 }
             ]
 
-        def fetch_post_insights(self, **kwargs):  # noqa: ANN003
-            return {
-                "data": [
-                    {
-                        "name": "post_media_view",
-                        "period": "lifetime",
-                        "values": [{"value": 77}],
-                    }
-                ]
-            }
+        def fetch_post_insights_batch(self, *, requests, token):  # noqa: ANN001
+            return [
+                {
+                    "data": [
+                        {
+                            "name": "post_media_view",
+                            "period": "lifetime",
+                            "values": [{"value": 77}],
+                        }
+                    ]
+                }
+                for _ in requests
+            ]
 
     monkeypatch.setattr(
         "integrations.tasks.MetaInsightsGraphClient.from_settings",
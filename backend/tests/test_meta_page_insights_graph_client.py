@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+from urllib.parse import parse_qs
+
 import httpx
 import pytest
 
@@ -8,6 +11,7 @@ from integrations.services.meta_graph_client import (
     META_PAGE_RETRY_REASON_TRANSPORT,
     MetaInsightsGraphClient,
     MetaInsightsGraphClientError,
+    PostInsightsRequest,
 )
 
 
@@ -115,3 +119,50 @@ def test_meta_page_graph_client_emits_transport_retry_reason(monkeypatch):
     assert payload["data"] == []
     assert calls["count"] == 2
     assert observed_retry_reasons == [META_PAGE_RETRY_REASON_TRANSPORT]
+
+
+@pytest.mark.django_db
+def test_meta_graph_client_batches_post_insights_and_retries_failed_items(monkeypatch):
+    client = MetaInsightsGraphClient(graph_version="v24.0", max_attempts=3, batch_size=2)
+    sent: list[list[str]] = []
+    timed_out_once: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.url.params["access_token"] == "token"
+        operations = json.loads(parse_qs(request.content.decode())["batch"][0])
+        urls = [operation["relative_url"] for operation in operations]
+        sent.append(urls)
+        items = []
+        for url in urls:
+            if url.startswith("post-3/") and url not in timed_out_once:
+                timed_out_once.add(url)
+                items.append(None)
+            elif url.startswith("post-2/"):
+                items.append({"code": 400, "body": json.dumps({"error": {"message": "bad", "code": 100}})})
+            else:
+                items.append({"code": 200, "body": json.dumps({"data": [{"name": url.split("/")[0]}]})})
+        return httpx.Response(200, json=items)
+
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("integrations.services.meta_graph_client.time.sleep", lambda *_args, **_kwargs: None)
+
+    results = client.fetch_post_insights_batch(
+        requests=[
+            PostInsightsRequest(post_id="post-1", metrics=("post_clicks",), period="lifetime"),
+            PostInsightsRequest(post_id="post-2", metrics=("post_clicks",), period="lifetime"),
+            PostInsightsRequest(post_id="post-3", metrics=("post_clicks",), period="lifetime"),
+            PostInsightsRequest(post_id="post-4", metrics=(), period="lifetime"),
+        ],
+        token="token",
+    )
+
+    # Two batches for three sendable requests, then one retry for the timed-out item.
+    assert [len(urls) for urls in sent] == [2, 1, 1]
+    assert sent[2] == ["post-3/insights?metric=post_clicks&period=lifetime"]
+    assert results[0] == {"data": [{"name": "post-1"}]}
+    assert isinstance(results[1], MetaInsightsGraphClientError)
+    assert results[1].error_code == 100 and results[1].retryable is False
+    assert results[2] == {"data": [{"name": "post-3"}]}
+    assert isinstance(results[3], MetaInsightsGraphClientError)
+    assert results[3].error_code == 3001
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
+import httpx
 import pytest
 
 import integrations.services.metric_registry as metric_registry
@@ -14,7 +18,7 @@ from integrations.models import (
     MetaPost,
     MetaPostInsightPoint,
 )
-from integrations.services.meta_graph_client import MetaInsightsGraphClientError
+from integrations.services.meta_graph_client import MetaInsightsGraphClient, MetaInsightsGraphClientError
 from integrations.services.metric_registry import get_default_metric_keys, seed_default_metrics
 from integrations.tasks import (
     RETRY_REASON_META_GRAPH_CLIENT_ERROR,
@@ -29,6 +33,68 @@ from integrations.tasks import (
 )
 
 
+_GRAPH_RECORDINGS = json.loads(
+    (Path(__file__).parent / "fixtures" / "meta_graph" / "post_insights_batch.json").read_text()
+)
+
+
+class RecordedGraph:
+    """httpx stand-in replaying recorded Graph responses for posts + batch calls."""
+
+    def __init__(  # noqa: ANN001
+        self, *, post_count: int, expired_tokens=(), rejected_batch_tokens=(), invalid_metrics=()
+    ) -> None:
+        self.posts = [
+            {
+                "id": f"page-1_{index}",
+                "message": f"Post {index}",
+                "created_time": "2026-02-10T08:00:00+0000",
+                "updated_time": "2026-02-10T08:00:00+0000",
+            }
+            for index in range(post_count)
+        ]
+        self.expired_tokens = set(expired_tokens)
+        self.rejected_batch_tokens = set(rejected_batch_tokens)
+        self.invalid_metrics = set(invalid_metrics)
+        self.calls: list[tuple[str, str, int]] = []
+
+    def client(self) -> MetaInsightsGraphClient:
+        client = MetaInsightsGraphClient(graph_version="v24.0", max_attempts=2)
+        client._client = httpx.Client(transport=httpx.MockTransport(self.handle))
+        return client
+
+    def batch_calls(self) -> list[tuple[str, int]]:
+        return [(token, size) for kind, token, size in self.calls if kind == "batch"]
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        token = request.url.params["access_token"]
+        if request.method == "GET":
+            self.calls.append(("posts", token, 1))
+            if token in self.expired_tokens:
+                return httpx.Response(400, json=_GRAPH_RECORDINGS["errors"]["expired_token"])
+            return httpx.Response(200, json={"data": self.posts})
+        operations = json.loads(parse_qs(request.content.decode())["batch"][0])
+        self.calls.append(("batch", token, len(operations)))
+        if token in self.rejected_batch_tokens:
+            return httpx.Response(400, json=_GRAPH_RECORDINGS["errors"]["expired_token"])
+        return httpx.Response(200, json=[self._operation(op, token) for op in operations])
+
+    def _operation(self, operation: dict, token: str) -> dict:
+        url = urlsplit(operation["relative_url"])
+        post_id = url.path.split("/")[0]
+        metrics = parse_qs(url.query)["metric"][0].split(",")
+        if token in self.expired_tokens:
+            return {"code": 400, "body": json.dumps(_GRAPH_RECORDINGS["errors"]["expired_token"])}
+        if self.invalid_metrics.intersection(metrics):
+            return {"code": 400, "body": json.dumps(_GRAPH_RECORDINGS["errors"]["invalid_metric"])}
+        data = [
+            {**entry, "id": entry["id"].replace("{post_id}", post_id)}
+            for metric in metrics
+            for entry in _GRAPH_RECORDINGS["insights"][metric]["data"]
+        ]
+        return {"code": 200, "body": json.dumps({"data": data})}
+
+
 def _create_page(user) -> MetaPage:
     connection = MetaConnection(
         tenant=user.tenant,
@@ -397,16 +463,19 @@ def test_sync_meta_post_insights_upserts_post_points(monkeypatch, user):
                 }
             ]
 
-        def fetch_post_insights(self, **kwargs):  # noqa: ANN003
-            return {
-                "data": [
-                    {
-                        "name": "post_reactions_like_total",
-                        "period": "lifetime",
-                        "values": [{"value": 226}],
-                    }
-                ]
-            }
+        def fetch_post_insights_batch(self, *, requests, token):  # noqa: ANN001
+            return [
+                {
+                    "data": [
+                        {
+                            "name": "post_reactions_like_total",
+                            "period": "lifetime",
+                            "values": [{"value": 226}],
+                        }
+                    ]
+                }
+                for _ in requests
+            ]
 
     monkeypatch.setattr("integrations.tasks.MetaInsightsGraphClient.from_settings", lambda: DummyClient())
 
@@ -476,7 +545,7 @@ def test_sync_meta_post_insights_retries_retryable_errors_with_reason(monkeypatc
                 }
             ]
 
-        def fetch_post_insights(self, **kwargs):  # noqa: ANN003
+        def fetch_post_insights_batch(self, *, requests, token):  # noqa: ANN001
             raise MetaInsightsGraphClientError(
                 "Rate limit exceeded",
                 error_code=80001,
@@ -562,3 +631,81 @@ def test_sync_page_posts_retries_retryable_errors_with_reason(monkeypatch, user)
 )
 def test_classify_meta_insights_retry_reason_prefers_explicit_reason_groups(exc, expected_reason):
     assert _classify_meta_insights_retry_reason(exc) == expected_reason
+
+
+@pytest.mark.django_db
+def test_sync_meta_post_insights_batches_requests_and_remembers_working_token(
+    monkeypatch, settings, user
+):
+    settings.META_PAGE_INSIGHTS_METRIC_CHUNK_SIZE = 1
+    page = _create_page(user)
+    graph = RecordedGraph(post_count=60, expired_tokens={"page-token"})
+    monkeypatch.setattr("integrations.tasks.MetaInsightsGraphClient.from_settings", graph.client)
+    metrics = ["post_reactions_like_total", "post_clicks"]
+
+    result = sync_meta_post_insights.run(page_pk=str(page.pk), metrics=metrics)
+
+    # 60 posts x 2 metric chunks = 120 operations; the expired page token fails
+    # three batches of <=50 before the connection token serves the same three.
+    assert result["posts_processed"] == 60
+    assert result["rows_processed"] == 120
+    assert graph.batch_calls() == [
+        ("page-token", 50),
+        ("page-token", 50),
+        ("page-token", 20),
+        ("user-token", 50),
+        ("user-token", 50),
+        ("user-token", 20),
+    ]
+    point = MetaPostInsightPoint.all_objects.get(post__post_id="page-1_7", metric_key="post_clicks")
+    assert point.value_num == 41
+
+    graph.calls.clear()
+    sync_meta_post_insights.run(page_pk=str(page.pk), metrics=metrics)
+
+    assert graph.batch_calls() == [("user-token", 50), ("user-token", 50), ("user-token", 20)]
+    assert MetaPostInsightPoint.all_objects.filter(post__page=page).count() == 120
+
+
+@pytest.mark.django_db
+def test_sync_meta_post_insights_moves_to_next_token_when_batch_post_is_rejected(
+    monkeypatch, settings, user
+):
+    settings.META_PAGE_INSIGHTS_METRIC_CHUNK_SIZE = 1
+    page = _create_page(user)
+    graph = RecordedGraph(post_count=60, rejected_batch_tokens={"page-token"})
+    monkeypatch.setattr("integrations.tasks.MetaInsightsGraphClient.from_settings", graph.client)
+
+    result = sync_meta_post_insights.run(
+        page_pk=str(page.pk), metrics=["post_reactions_like_total", "post_clicks"]
+    )
+
+    # The expired page token fails the first batch POST outright (400/#190);
+    # every pending chunk then moves on to the connection token.
+    assert result["rows_processed"] == 120
+    assert graph.batch_calls() == [
+        ("page-token", 50),
+        ("user-token", 50),
+        ("user-token", 50),
+        ("user-token", 20),
+    ]
+    assert MetaPostInsightPoint.all_objects.filter(post__page=page).count() == 120
+
+
+@pytest.mark.django_db
+def test_sync_meta_post_insights_batch_splits_chunks_on_invalid_metric(monkeypatch, user):
+    page = _create_page(user)
+    graph = RecordedGraph(post_count=10, invalid_metrics={"post_clicks"})
+    monkeypatch.setattr("integrations.tasks.MetaInsightsGraphClient.from_settings", graph.client)
+
+    result = sync_meta_post_insights.run(
+        page_pk=str(page.pk), metrics=["post_reactions_like_total", "post_clicks"]
+    )
+
+    assert graph.batch_calls() == [("page-token", 10), ("page-token", 20)]
+    assert result["rows_processed"] == 10
+    support = MetaMetricSupportStatus.all_objects.get(
+        page=page, level=MetaMetricRegistry.LEVEL_POST, metric_key="post_clicks"
+    )
+    assert support.supported is False
+    assert support.last_error["error_code"] == 100
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
 import uuid
 
+import httpx
 import pytest
 
 from analytics.models import Ad, AdAccount, AdSet, Campaign, RawPerformanceRecord
-from integrations.meta_graph import MetaAdAccount, MetaGraphClientError, MetaGraphConfigurationError
+from integrations.meta_graph import (
+    MetaAccountInsights,
+    MetaAdAccount,
+    MetaGraphClient,
+    MetaGraphClientError,
+    MetaGraphConfigurationError,
+)
 from integrations.models import APIErrorLog, AirbyteConnection, MetaAccountSyncState, PlatformCredential
 from integrations.tasks import (
     RETRY_REASON_META_GRAPH_CONFIGURATION,
+    _upsert_meta_region_rows,
     sync_meta_accounts,
     sync_meta_hierarchy,
     sync_meta_insights_incremental,
@@ -265,19 +274,12 @@ def test_sync_meta_insights_incremental_persists_metrics(monkeypatch, user):
         def __exit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN204
             return None
 
-        def list_insights(
-            self,
-            *,
-            account_id: str,
-            user_access_token: str,
-            level: str,
-            since: str,
-            until: str,
-        ):
-            assert level == "ad"
-            assert since == "2026-01-01"
-            assert until == "2026-01-31"
-            return [
+        def fetch_account_insights(self, requests):  # noqa: ANN001
+            (request,) = requests
+            assert request.level == "ad"
+            assert request.since == "2026-01-01"
+            assert request.until == "2026-01-31"
+            rows = [
                 {
                     "date_start": "2026-01-30",
                     "account_id": "123",
@@ -293,15 +295,7 @@ def test_sync_meta_insights_incremental_persists_metrics(monkeypatch, user):
                     "actions": [{"action_type": "purchase", "value": "3"}],
                 }
             ]
-
-        def list_insights_by_region(self, **kwargs):  # noqa: ANN003
-            return []
-
-        def list_insights_by_age_gender(self, **kwargs):  # noqa: ANN003
-            return []
-
-        def list_insights_by_platform(self, **kwargs):  # noqa: ANN003
-            return []
+            return [MetaAccountInsights(rows=rows)]
 
     monkeypatch.setattr("integrations.tasks.MetaGraphClient.from_settings", lambda: DummyClient())
     result = sync_meta_insights_incremental.run(level="ad", since="2026-01-01", until="2026-01-31")
@@ -320,6 +314,179 @@ def test_sync_meta_insights_incremental_persists_metrics(monkeypatch, user):
     assert insight.conversions == 3
 
 
+@pytest.mark.django_db
+def test_sync_meta_insights_batches_upserts_and_reports_insert_update_counts(
+    monkeypatch, settings, user
+):
+    from integrations.models import MetaAgeGenderDaily, MetaPlatformDaily, MetaRegionDaily
+
+    settings.META_INSIGHTS_UPSERT_BATCH_SIZE = 2
+    _seed_meta_credential(user)
+    AdAccount.objects.create(
+        tenant=user.tenant,
+        external_id="act_123",
+        account_id="123",
+        currency="USD",
+    )
+    spend_by_ad = {"ad-1": "10", "ad-2": "20", "ad-3": "30"}
+
+    class DummyClient:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN204
+            return None
+
+        def fetch_account_insights(self, requests):  # noqa: ANN001
+            rows = [
+                {
+                    "date_start": "2026-01-30",
+                    "ad_id": ad_id,
+                    "impressions": "100",
+                    "spend": spend,
+                }
+                for ad_id, spend in spend_by_ad.items()
+            ]
+            breakdowns = {
+                "region": [
+                    {"date_start": "2026-01-30", "region": "Kingston", "spend": "1"},
+                    {"date_start": "2026-01-30", "region": "Kingston", "spend": "2"},
+                    {"date_start": "2026-01-30", "region": ""},
+                ],
+                "age_gender": [
+                    {"date_start": "2026-01-30", "age": "25-34", "gender": "female", "clicks": "4"}
+                ],
+                "platform": [
+                    {
+                        "date_start": "2026-01-30",
+                        "publisher_platform": "facebook",
+                        "device_platform": "mobile_app",
+                        "impressions": "7",
+                    }
+                ],
+            }
+            return [MetaAccountInsights(rows=rows, breakdowns=breakdowns) for _ in requests]
+
+    monkeypatch.setattr("integrations.tasks.MetaGraphClient.from_settings", lambda: DummyClient())
+    first = sync_meta_insights_incremental.run(level="ad", since="2026-01-01", until="2026-01-31")
+    assert first["insights_synced"] == 3
+    assert first["insights_inserted"] == 3
+    assert first["insights_updated"] == 0
+
+    spend_by_ad["ad-2"] = "25"
+    spend_by_ad["ad-4"] = "40"
+    second = sync_meta_insights_incremental.run(level="ad", since="2026-01-01", until="2026-01-31")
+    assert second["insights_synced"] == 4
+    assert second["insights_inserted"] == 1
+    assert second["insights_updated"] == 3
+
+    records = RawPerformanceRecord.objects.filter(tenant=user.tenant, source="meta", level="ad")
+    assert records.count() == 4
+    assert records.get(external_id="ad-2").spend == Decimal("25")
+    region = MetaRegionDaily.objects.get(tenant=user.tenant, region="Kingston")
+    assert region.spend == Decimal("2")
+    assert MetaAgeGenderDaily.objects.get(tenant=user.tenant).clicks == 4
+    assert MetaPlatformDaily.objects.get(tenant=user.tenant).impressions == 7
+    sync_state = MetaAccountSyncState.objects.get(tenant=user.tenant, account_id="act_123")
+    assert sync_state.last_job_status == "succeeded"
+    assert sync_state.last_rows_synced == 4
+
+
+@pytest.mark.django_db
+def test_meta_breakdown_upsert_falls_back_to_rows_when_bulk_write_fails(monkeypatch, user):
+    from integrations.models import MetaRegionDaily
+
+    manager = MetaRegionDaily.all_objects
+    original_update_or_create = manager.update_or_create
+
+    def failing_bulk_create(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise RuntimeError("bulk write rejected")
+
+    def update_or_create(*, defaults, **lookup):  # noqa: ANN003
+        if lookup["region"] == "Broken":
+            raise RuntimeError("row rejected")
+        return original_update_or_create(defaults=defaults, **lookup)
+
+    monkeypatch.setattr(manager, "bulk_create", failing_bulk_create)
+    monkeypatch.setattr(manager, "update_or_create", update_or_create)
+
+    result = _upsert_meta_region_rows(
+        tenant=user.tenant,
+        account_id="act_123",
+        rows=[
+            {"date_start": "2026-01-30", "region": "Kingston", "spend": "1"},
+            {"date_start": "2026-01-30", "region": "Broken", "spend": "2"},
+            {"date_start": "2026-01-30", "region": "St. Ann", "spend": "3"},
+        ],
+        currency="USD",
+    )
+
+    assert (result.inserted, result.updated, result.failed) == (2, 0, 1)
+    assert set(MetaRegionDaily.objects.filter(tenant=user.tenant).values_list("region", flat=True)) == {
+        "Kingston",
+        "St. Ann",
+    }
+
+
+@pytest.mark.django_db
+def test_sync_meta_insights_fetches_accounts_and_breakdowns_concurrently(monkeypatch, settings, user):
+    from integrations.models import MetaAgeGenderDaily, MetaPlatformDaily, MetaRegionDaily
+
+    settings.META_GRAPH_CONCURRENCY = 4
+    _seed_meta_credential(user)
+    second = PlatformCredential.objects.create(
+        tenant=user.tenant,
+        provider=PlatformCredential.META,
+        account_id="act_456",
+        access_token_enc=b"",
+        access_token_nonce=b"",
+        access_token_tag=b"",
+    )
+    second.set_raw_tokens("meta-token-2", None)
+    second.save()
+    in_flight = {"now": 0, "peak": 0}
+    requests: list[tuple[str, str]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        account = request.url.path.split("/")[2]
+        breakdown = request.url.params.get("breakdowns", "")
+        requests.append((account, breakdown))
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        row = {"date_start": "2026-01-30", "account_id": account, "spend": "5"}
+        if breakdown == "region":
+            row.update(region="Kingston", campaign_id="cmp-1")
+        elif breakdown == "age,gender":
+            row.update(age="25-34", gender="female")
+        elif breakdown:
+            return httpx.Response(400, json={"error": {"message": "unsupported", "code": 100}})
+        else:
+            row.update(campaign_id="cmp-1")
+        return httpx.Response(200, json={"data": [row]})
+
+    original = httpx.AsyncClient
+    monkeypatch.setattr(
+        "integrations.meta_graph.httpx.AsyncClient",
+        lambda **kwargs: original(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(
+        "integrations.tasks.MetaGraphClient.from_settings",
+        lambda: MetaGraphClient(app_id="app", app_secret="secret", graph_version="v24.0"),
+    )
+
+    result = sync_meta_insights_incremental.run(level="campaign", since="2026-01-01", until="2026-01-31")
+
+    assert result["succeeded"] == 2
+    assert result["insights_synced"] == 2
+    assert len(requests) == 8
+    assert in_flight["peak"] > 1
+    assert set(MetaRegionDaily.objects.values_list("account_id", flat=True)) == {"act_123", "act_456"}
+    assert MetaAgeGenderDaily.objects.count() == 2
+    assert MetaPlatformDaily.objects.count() == 0
+
+
 @pytest.mark.django_db
 def test_sync_meta_reporting_slice_updates_direct_sync_state(monkeypatch, user):
     _seed_meta_credential(user)
@@ -389,20 +556,13 @@ def test_sync_meta_reporting_slice_updates_direct_sync_state(monkeypatch, user):
         def list_ads(self, *, account_id: str, user_access_token: str):
             return []
 
-        def list_insights(
-            self,
-            *,
-            account_id: str,
-            user_access_token: str,
-            level: str,
-            since: str,
-            until: str,
-        ):
-            assert account_id == "act_123"
-            assert level == "ad"
-            return [
+        def fetch_account_insights(self, requests):  # noqa: ANN001
+            (request,) = requests
+            assert request.account_id == "act_123"
+            assert request.level == "ad"
+            rows = [
                 {
-                    "date_start": until,
+                    "date_start": request.until,
                     "account_id": "123",
                     "campaign_id": "cmp-1",
                     "adset_id": "adset-1",
@@ -416,15 +576,7 @@ def test_sync_meta_reporting_slice_updates_direct_sync_state(monkeypatch, user):
                     "actions": [{"action_type": "purchase", "value": "3"}],
                 }
             ]
-
-        def list_insights_by_region(self, **kwargs):  # noqa: ANN003
-            return []
-
-        def list_insights_by_age_gender(self, **kwargs):  # noqa: ANN003
-            return []
-
-        def list_insights_by_platform(self, **kwargs):  # noqa: ANN003
-            return []
+            return [MetaAccountInsights(rows=rows)]
 
     observed: dict[str, str] = {}
 
@@ -5,9 +5,13 @@ from datetime import timedelta
 from io import StringIO
 
 import pytest
+from django.conf import settings as django_settings
 from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from accounts.tenant_context import get_current_tenant_id
+from analytics.exporters import iter_query_rows
 from analytics.views import METRIC_EXPORT_HEADERS
 
 
@@ -127,3 +131,83 @@ def test_metrics_export_requires_authentication(api_client):
     response = api_client.get("/api/export/metrics.csv")
 
     assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_metrics_export_sends_header_before_querying_and_streams_in_batches(
+    api_client, user, settings
+):
+    settings.CSV_EXPORT_FETCH_SIZE = 2
+    api_client.force_authenticate(user=user)
+    _create_vw_campaign_daily()
+
+    today = timezone.now().date()
+    names = ["=HYPERLINK(\"x\")", "@SUM(A1)", "Ocho Rios Retargeting", "-Negative", "Portmore Search"]
+    with connection.cursor() as cursor:
+        for offset, name in enumerate(names):
+            cursor.execute(
+                "INSERT INTO vw_campaign_daily VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (today - timedelta(days=offset)).isoformat(),
+                    str(user.tenant_id),
+                    "Meta",
+                    name,
+                    None,
+                    10 + offset,
+                    offset,
+                    12.5,
+                    offset,
+                    1.25,
+                ),
+            )
+
+    response = api_client.get("/api/export/metrics.csv")
+    stream = iter(response.streaming_content)
+    with CaptureQueriesContext(connection) as before_header:
+        header = next(stream)
+    with CaptureQueriesContext(connection) as body:
+        remainder = list(stream)
+
+    assert len(before_header) == 0
+    assert len(body) == 1
+    rows = list(csv.reader(StringIO((header + b"".join(remainder)).decode("utf-8"))))
+    assert rows[0] == METRIC_EXPORT_HEADERS
+    assert [row[2] for row in rows[1:]] == [
+        "'=HYPERLINK(\"x\")",
+        "'@SUM(A1)",
+        "Ocho Rios Retargeting",
+        "'-Negative",
+        "Portmore Search",
+    ]
+    assert rows[1][3:] == ["", "10", "0", "12.5", "0", "1.25"]
+
+
+@pytest.mark.django_db
+def test_metrics_export_sets_tenant_context_while_streaming(api_client, user, monkeypatch):
+    api_client.force_authenticate(user=user)
+    _create_vw_campaign_daily()
+    monkeypatch.setattr("analytics.views._campaign_view_has_tenant_column", lambda: False)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO vw_campaign_daily VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (timezone.now().date().isoformat(), str(user.tenant_id), "Meta", "RLS", None, 1, 1, 1.0, 1, 1.0),
+        )
+    seen = []
+
+    def recording_iter_query_rows(sql, params=None, **kwargs):  # noqa: ANN001, ANN003
+        seen.append(
+            (get_current_tenant_id(), getattr(connection, django_settings.TENANT_SETTING_KEY, None))
+        )
+        yield from iter_query_rows(sql, params, **kwargs)
+
+    monkeypatch.setattr("analytics.views.iter_query_rows", recording_iter_query_rows)
+
+    response = api_client.get("/api/export/metrics.csv")
+    # The middleware has already reset the tenant by the time the body streams.
+    assert getattr(connection, django_settings.TENANT_SETTING_KEY, None) is None
+    rows = _read_streaming_body(response)
+
+    assert [row[2] for row in rows[1:]] == ["RLS"]
+    assert seen == [(str(user.tenant_id), str(user.tenant_id))]
+    assert get_current_tenant_id() is None
+    assert getattr(connection, django_settings.TENANT_SETTING_KEY, None) is None
@@ -4,6 +4,7 @@ import json
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
 from django.core.management import call_command
 from django.db import connection
 from django.utils import timezone
@@ -16,7 +17,9 @@ from adapters.warehouse import (
     WAREHOUSE_SNAPSHOT_STATUS_FETCHED,
     WAREHOUSE_SNAPSHOT_STATUS_KEY,
 )
+from analytics import tasks as tasks_module
 from analytics.models import TenantMetricsSnapshot
+from analytics.snapshots import fetch_snapshot_metrics_result
 from analytics.tasks import (
     DAILY_SUMMARY_FAILURE_REASON_GENERATION,
     SNAPSHOT_FAILURE_REASON_GENERATION,
@@ -29,8 +32,11 @@ from analytics.tasks import (
     ai_daily_summary,
     evaluate_snapshot_freshness,
     generate_snapshots_for_tenants,
+    summarize_metrics_snapshots,
     sync_metrics_snapshots,
+    sync_tenant_metrics_snapshot,
 )
+from analytics.warehouse_metrics import invalidate_warehouse_schema_catalog
 from core.metrics import CELERY_TASK_RETRY_TOTAL, reset_metrics
 from core.tasks import BaseAdInsightsTask
 
@@ -169,6 +175,49 @@ def test_generate_snapshots_normalizes_generated_at_timezone(tenant):
     assert parsed is not None and timezone.is_aware(parsed)
 
 
+@pytest.mark.django_db
+def test_snapshot_fetch_reads_the_configured_window_of_the_materialized_table(tenant, settings):
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS vw_dashboard_aggregate_snapshot")
+        cursor.execute(
+            """
+            CREATE TABLE vw_dashboard_aggregate_snapshot (
+                tenant_id TEXT,
+                window_days INTEGER,
+                generated_at TEXT,
+                campaign_metrics TEXT,
+                creative_metrics TEXT,
+                budget_metrics TEXT,
+                parish_metrics TEXT,
+                UNIQUE (tenant_id, window_days)
+            )
+            """
+        )
+        for window_days, spend in ((30, 300), (7, 70)):
+            cursor.execute(
+                "INSERT INTO vw_dashboard_aggregate_snapshot VALUES (?, ?, ?, ?, '[]', '[]', '[]')",
+                (
+                    str(tenant.id),
+                    window_days,
+                    # The 7-day row is newer; the window key, not recency, must pick the row.
+                    (timezone.now() + timedelta(days=window_days == 7)).isoformat(),
+                    json.dumps({"summary": {"totalSpend": spend}, "trend": [], "rows": []}),
+                ),
+            )
+    invalidate_warehouse_schema_catalog()
+    try:
+        default_window = fetch_snapshot_metrics_result(tenant_id=str(tenant.id))
+        settings.WAREHOUSE_SNAPSHOT_WINDOW_DAYS = 7
+        short_window = fetch_snapshot_metrics_result(tenant_id=str(tenant.id))
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE vw_dashboard_aggregate_snapshot")
+        invalidate_warehouse_schema_catalog()
+
+    assert default_window.metrics.campaign_metrics["summary"]["totalSpend"] == 300
+    assert short_window.metrics.campaign_metrics["summary"]["totalSpend"] == 70
+
+
 @pytest.mark.django_db
 def test_generate_snapshots_marks_default_payload_when_view_missing(tenant):
     outcomes = generate_snapshots_for_tenants([str(tenant.id)])
@@ -450,3 +499,111 @@ def test_retry_analytics_task_without_helper_records_reason_metric():
         and sample.labels == {"task_name": "analytics.retry.only", "reason": "analytics_retry_fallback"}
     )
     assert retry_sample.value == 1
+
+
+def _warehouse_record(tenant_id: str, *, generated_at: str, spend: int = 100) -> dict[str, object]:
+    return {
+        "tenant_id": tenant_id,
+        "generated_at": generated_at,
+        "campaign_metrics": {
+            "summary": {"currency": "USD", "totalSpend": spend},
+            "trend": [],
+            "rows": [{"id": "cmp-1"}],
+        },
+        "creative_metrics": [],
+        "budget_metrics": [],
+        "parish_metrics": [],
+    }
+
+
+@pytest.mark.django_db
+def test_sync_metrics_snapshots_fans_out_per_tenant_and_summarizes_in_callback(
+    tenant, monkeypatch
+):
+    other_tenant = Tenant.objects.create(name="Tenant B")
+    now = timezone.now()
+    _seed_dashboard_snapshot_view(
+        [
+            _warehouse_record(str(tenant.id), generated_at=now.isoformat()),
+            _warehouse_record(
+                str(other_tenant.id), generated_at=(now - timedelta(minutes=5)).isoformat()
+            ),
+        ]
+    )
+    invalidate_warehouse_schema_catalog()
+    summaries: list[dict] = []
+    original_summarize = tasks_module._summarize_snapshot_outcomes
+
+    def _capture(outcomes, **kwargs):  # noqa: ANN001
+        summary = original_summarize(outcomes, **kwargs)
+        summaries.append(summary)
+        return summary
+
+    monkeypatch.setattr(tasks_module, "_summarize_snapshot_outcomes", _capture)
+
+    result = sync_metrics_snapshots.run()
+
+    assert result["dispatched"] == 2
+    assert result["tenant_scope"] == SNAPSHOT_LOCK_SCOPE_ALL
+    assert TenantMetricsSnapshot.all_objects.filter(source="warehouse").count() == 2
+    [summary] = summaries
+    assert summary["processed"] == 2
+    assert summary["status_counts"] == {"default": 0, "fetched": 2}
+    assert summary["row_totals"]["campaign_rows"] == 2
+    assert summary["unchanged_count"] == 0
+    assert parse_datetime(summary["newest_snapshot_generated_at"]) == now
+
+
+@pytest.mark.django_db
+def test_tenant_snapshot_task_skips_unchanged_warehouse_rows(tenant, monkeypatch):
+    generated_at = timezone.now().replace(microsecond=0)
+    _seed_dashboard_snapshot_view(
+        [_warehouse_record(str(tenant.id), generated_at=generated_at.isoformat())]
+    )
+    invalidate_warehouse_schema_catalog()
+    fetches: list[str] = []
+    original_fetch = tasks_module.fetch_snapshot_metrics_result
+
+    def _spy(*, tenant_id):  # noqa: ANN001
+        fetches.append(tenant_id)
+        return original_fetch(tenant_id=tenant_id)
+
+    monkeypatch.setattr(tasks_module, "fetch_snapshot_metrics_result", _spy)
+
+    first = sync_tenant_metrics_snapshot.run(tenant_id=str(tenant.id))
+    second = sync_tenant_metrics_snapshot.run(tenant_id=str(tenant.id))
+    _seed_dashboard_snapshot_view(
+        [
+            _warehouse_record(
+                str(tenant.id),
+                generated_at=(generated_at + timedelta(hours=1)).isoformat(),
+                spend=250,
+            )
+        ]
+    )
+    third = sync_tenant_metrics_snapshot.run(tenant_id=str(tenant.id))
+
+    assert (first["unchanged"], second["unchanged"], third["unchanged"]) == (False, True, False)
+    assert second["status"] == "fetched"
+    assert second["row_counts"]["campaign_rows"] == 1
+    assert len(fetches) == 2
+    snapshot = TenantMetricsSnapshot.all_objects.get(tenant=tenant, source="warehouse")
+    assert snapshot.payload["campaign"]["summary"]["totalSpend"] == 250
+
+
+@pytest.mark.django_db
+def test_tenant_snapshot_task_reports_locked_tenant_without_blocking_others(tenant):
+    lock_key = _snapshot_sync_lock_key_for_tenants([str(tenant.id)])
+    cache.set(lock_key, "held-elsewhere", timeout=60)
+    try:
+        result = sync_tenant_metrics_snapshot.run(tenant_id=str(tenant.id))
+    finally:
+        cache.delete(lock_key)
+
+    assert result["status"] == "locked"
+    assert not TenantMetricsSnapshot.all_objects.filter(tenant=tenant).exists()
+    summary = summarize_metrics_snapshots.run(
+        [result, {**result, "tenant_id": "other", "status": "fetched", "row_counts": {"parish": 3}}]
+    )
+    assert summary["status_counts"] == {"default": 0, "fetched": 1, "locked": 1}
+    assert summary["row_totals"]["parish"] == 3
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+from django.core.cache import cache
+
+from core.metrics import CACHE_EVICTIONS_TOTAL, CACHE_REQUESTS_TOTAL, reset_metrics
+from core.tenant_cache import (
+    bump_tenant_cache_generation,
+    get_cached,
+    increment_counter,
+    tenant_cache_generation,
+    tenant_cache_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    cache.clear()
+    reset_metrics(registries=[CACHE_REQUESTS_TOTAL, CACHE_EVICTIONS_TOTAL])
+    yield
+    cache.clear()
+
+
+def _sample(counter, **labels) -> float:
+    for metric in counter.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total") and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+def test_tenant_cache_key_is_namespaced_and_deterministic():
+    key = tenant_cache_key("t-1", "ga_pacing", ["123", "456"], {"month": "2026-04"})
+
+    assert re.fullmatch(r"tenant:t-1:ga_pacing:[0-9a-f]{64}", key)
+    assert key == tenant_cache_key("t-1", "ga_pacing", ["123", "456"], {"month": "2026-04"})
+    assert key != tenant_cache_key("t-2", "ga_pacing", ["123", "456"], {"month": "2026-04"})
+
+
+def test_generation_bump_retires_versioned_entries_for_one_tenant_only():
+    pacing_key = tenant_cache_key("t-1", "ga_pacing", "march")
+    other_tenant_key = tenant_cache_key("t-2", "ga_pacing", "march")
+    quota_key = tenant_cache_key("t-1", "report_quota", "export", versioned=False)
+    cache.set(pacing_key, {"spend": 1})
+    cache.set(other_tenant_key, {"spend": 2})
+    increment_counter(quota_key, timeout=60)
+
+    assert bump_tenant_cache_generation("t-1") == 1
+    assert bump_tenant_cache_generation("t-1") == 2
+
+    assert tenant_cache_generation("t-1") == 2
+    assert get_cached(tenant_cache_key("t-1", "ga_pacing", "march"), area="ga_pacing") is None
+    assert get_cached(tenant_cache_key("t-2", "ga_pacing", "march"), area="ga_pacing") == {"spend": 2}
+    assert tenant_cache_key("t-1", "report_quota", "export", versioned=False) == quota_key
+    assert increment_counter(quota_key, timeout=60) == 2
+    assert _sample(CACHE_REQUESTS_TOTAL, area="ga_pacing", outcome="miss") == 1
+    assert _sample(CACHE_REQUESTS_TOTAL, area="ga_pacing", outcome="hit") == 1
+    assert _sample(CACHE_EVICTIONS_TOTAL, area="tenant", reason="generation_bump") == 2
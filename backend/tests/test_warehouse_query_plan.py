@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from analytics import warehouse_metrics
+from analytics.models import AdAccount, DailyFxRate, TenantMetricsSnapshot
+from analytics.warehouse_metrics import (
+    WarehouseCombinedFilters,
+    _SINGLE_PASS_ACCOUNT,
+    _SINGLE_PASS_CAMPAIGN,
+    _SINGLE_PASS_PARISH,
+    _SINGLE_PASS_TOTAL,
+    _SINGLE_PASS_TREND,
+    _fetch_campaign_payload,
+    _fetch_coverage,
+    _fetch_parish_rows,
+    _split_single_pass_rows,
+    load_filtered_warehouse_metrics,
+)
+
+TOTAL = {
+    "start_date": date(2026, 4, 1),
+    "end_date": date(2026, 4, 2),
+    "row_count": 3,
+    "total_spend": Decimal("30.5"),
+    "total_impressions": 900,
+    "total_clicks": 45,
+    "total_conversions": 6,
+    "total_reach": 600,
+    "average_roas": Decimal("0.19"),
+    "ctr": 0,
+    "cpc": Decimal("0.67"),
+    "cpm": Decimal("33.88"),
+    "cpa": Decimal("5.08"),
+    "frequency": 1,
+}
+ACCOUNTS = [
+    {"ad_account_id": "act_2", "spend": Decimal("20.5")},
+    {"ad_account_id": "act_1", "spend": Decimal("10")},
+]
+TREND = [
+    {"date": date(2026, 4, 1), "ad_account_id": "act_1", "spend": Decimal("10"), "impressions": 300, "clicks": 15, "conversions": 2, "reach": 200},
+    {"date": date(2026, 4, 2), "ad_account_id": "act_2", "spend": Decimal("20.5"), "impressions": 600, "clicks": 30, "conversions": 4, "reach": 400},
+]
+CAMPAIGNS = [
+    {
+        "id": "cmp-2",
+        "ad_account_id": "act_2",
+        "name": "Brand",
+        "source_platform": "meta_ads",
+        "parishes": ["Kingston", "Saint Ann"],
+        "spend": Decimal("20.5"),
+        "impressions": 600,
+        "clicks": 30,
+        "conversions": 4,
+        "reach": 400,
+        "status": "ACTIVE",
+        "objective": None,
+        "start_date": date(2026, 4, 2),
+        "end_date": date(2026, 4, 2),
+    },
+]
+PARISHES = [
+    {"ad_account_id": "act_2", "parish": "Kingston", "spend": Decimal("12"), "impressions": 400, "clicks": 20, "conversions": 3, "reach": 250, "campaign_count": 1},
+    {"ad_account_id": "act_2", "parish": "Saint Ann", "spend": Decimal("8.5"), "impressions": 200, "clicks": 10, "conversions": 1, "reach": 150, "campaign_count": 1},
+]
+
+
+def _per_section_rows(sql: str, params) -> list[dict]:
+    if "grouping sets" in sql:
+        rows = [{**TOTAL, "grouping_id": _SINGLE_PASS_TOTAL}]
+        rows += [{**row, "grouping_id": _SINGLE_PASS_ACCOUNT} for row in ACCOUNTS]
+        rows += [{**row, "grouping_id": _SINGLE_PASS_TREND} for row in TREND]
+        rows += [{**row, "grouping_id": _SINGLE_PASS_CAMPAIGN} for row in CAMPAIGNS]
+        rows += [{**row, "grouping_id": _SINGLE_PASS_PARISH} for row in PARISHES]
+        return rows
+    if "count(*) as row_count" in sql:
+        return [TOTAL]
+    if "as total_spend" in sql:
+        return [TOTAL]
+    if "group by c.date_day, c.ad_account_id" in sql:
+        return TREND
+    if "group by c.campaign_id, c.ad_account_id" in sql:
+        return CAMPAIGNS
+    if "campaign_count" in sql:
+        return PARISHES
+    if "group by c.ad_account_id" in sql:
+        return ACCOUNTS
+    return []
+
+
+@pytest.mark.django_db
+def test_single_pass_rows_assemble_the_per_section_payload(tenant, monkeypatch):
+    AdAccount.objects.create(tenant=tenant, external_id="act_2", account_id="2", currency="jmd")
+    monkeypatch.setattr(warehouse_metrics, "_fetch_rows", _per_section_rows)
+    filters = WarehouseCombinedFilters(campaign_search="brand")
+    tenant_id = str(tenant.id)
+
+    expected = (
+        _fetch_coverage(tenant_id=tenant_id, filters=filters),
+        _fetch_campaign_payload(tenant_id=tenant_id, filters=filters),
+        _fetch_parish_rows(tenant_id=tenant_id, filters=filters),
+    )
+    single_pass = _split_single_pass_rows(
+        tenant_id=tenant_id,
+        rows=_per_section_rows("group by grouping sets", []),
+    )
+
+    assert single_pass == expected
+    assert single_pass[1]["summary"]["currency"] == "JMD"
+    assert [row["parish"] for row in single_pass[2]] == ["Kingston", "Saint Ann"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("options", "expected_campaign_scans"),
+    [
+        ({"start_date": "2026-04-01"}, 1),
+        ({"start_date": "2026-04-01", "campaign_search": "brand"}, 2),
+    ],
+)
+def test_single_pass_plan_scans_campaign_view_once_per_filter_set(
+    tenant, monkeypatch, options, expected_campaign_scans
+):
+    TenantMetricsSnapshot.objects.create(
+        tenant=tenant,
+        source="warehouse",
+        payload={"campaign": {"rows": []}},
+        generated_at=timezone.now(),
+    )
+    executed: list[str] = []
+
+    def _fake_fetch_rows(sql, params):
+        executed.append(sql)
+        return _per_section_rows(sql, params)
+
+    monkeypatch.setattr(warehouse_metrics, "_fetch_rows", _fake_fetch_rows)
+    monkeypatch.setattr(warehouse_metrics, "_use_single_pass_plan", lambda: True)
+
+    payload = load_filtered_warehouse_metrics(
+        tenant=tenant,
+        tenant_id=str(tenant.id),
+        options=options,
+        ttl_seconds=300,
+    )
+
+    campaign_scans = [sql for sql in executed if "from vw_campaign_daily" in sql]
+    assert len(campaign_scans) == expected_campaign_scans
+    assert sum("grouping sets" in sql for sql in campaign_scans) == 1
+    assert payload["campaign"]["trend"][1]["spend"] == 20.5
+    assert payload["coverage"] == {"startDate": "2026-04-01", "endDate": "2026-04-02"}
+
+
+def test_single_pass_plan_is_postgres_only(settings):
+    settings.WAREHOUSE_SINGLE_PASS_QUERY_PLAN = True
+    assert warehouse_metrics._use_single_pass_plan() is False
+
+
+@pytest.mark.django_db
+def test_query_plan_benchmark_requires_postgres():
+    with pytest.raises(CommandError, match="requires Postgres"):
+        call_command("benchmark_warehouse_query_plan", "--tenant-id", "tenant-1")
+
+
+@pytest.mark.django_db
+def test_single_pass_rows_convert_foreign_account_spend(tenant):
+    AdAccount.objects.create(tenant=tenant, external_id="act_2", account_id="2", currency="jmd")
+    AdAccount.objects.create(tenant=tenant, external_id="act_1", account_id="1", currency="USD")
+    DailyFxRate.objects.create(
+        rate_date=date(2026, 3, 31), base_currency="USD", quote_currency="JMD", rate=Decimal("150")
+    )
+
+    _coverage, campaign, parish = _split_single_pass_rows(
+        tenant_id=str(tenant.id),
+        rows=_per_section_rows("group by grouping sets", []),
+    )
+
+    summary = campaign["summary"]
+    assert [point["spend"] for point in campaign["trend"]] == [1500.0, 20.5]
+    assert summary["currency"] == "JMD"
+    assert summary["totalSpend"] == 1520.5
+    assert summary["cpc"] == pytest.approx(1520.5 / 45)
+    assert summary["sourceCurrencies"] == ["JMD", "USD"]
+    assert summary["fxUnconvertedPoints"] == 0
+    assert parish[0]["currency"] == "JMD"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from analytics import warehouse_metrics
+from analytics.models import TenantMetricsSnapshot
+from analytics.tasks import generate_snapshots_for_tenants
+from analytics.warehouse_metrics import (
+    WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY,
+    invalidate_warehouse_schema_catalog,
+    load_filtered_warehouse_metrics,
+    warehouse_schema_catalog,
+)
+
+
+@pytest.fixture
+def probe_relation(db):
+    with connection.cursor() as cursor:
+        cursor.execute("create table vw_catalog_probe (date_day date, reach integer)")
+    invalidate_warehouse_schema_catalog()
+    yield "vw_catalog_probe"
+    invalidate_warehouse_schema_catalog()
+
+
+def test_catalog_serves_repeat_probes_from_memory(probe_relation):
+    with CaptureQueriesContext(connection) as first:
+        assert warehouse_schema_catalog.has_column(probe_relation, "reach") is True
+    with CaptureQueriesContext(connection) as repeat:
+        assert warehouse_schema_catalog.has_relation(probe_relation) is True
+        assert warehouse_schema_catalog.has_column(probe_relation, "status") is False
+        assert warehouse_schema_catalog.has_relation("vw_missing") is False
+
+    assert len(first) == 1
+    assert len(repeat) == 0
+
+
+def test_catalog_reloads_after_ttl_and_shared_invalidation(probe_relation, monkeypatch, settings):
+    settings.WAREHOUSE_SCHEMA_CATALOG_TTL_SECONDS = 60
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(warehouse_metrics.time, "monotonic", lambda: clock["now"])
+    warehouse_schema_catalog.refresh_if_stale()
+    assert warehouse_schema_catalog.has_column(probe_relation, "status") is False
+
+    with connection.cursor() as cursor:
+        cursor.execute("alter table vw_catalog_probe add column status text")
+    clock["now"] += 30
+    assert warehouse_schema_catalog.has_column(probe_relation, "status") is False
+    clock["now"] += 30
+    assert warehouse_schema_catalog.has_column(probe_relation, "status") is True
+
+    with connection.cursor() as cursor:
+        cursor.execute("alter table vw_catalog_probe add column objective text")
+    # Another process bumping the generation marker resets this process' copy.
+    cache.set(WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY, "dbt-run-2", timeout=None)
+    assert warehouse_schema_catalog.has_column(probe_relation, "objective") is False
+    warehouse_schema_catalog.refresh_if_stale()
+    assert warehouse_schema_catalog.has_column(probe_relation, "objective") is True
+
+
+def test_filtered_warehouse_metrics_skip_catalog_queries_once_loaded(tenant, monkeypatch):
+    TenantMetricsSnapshot.objects.create(
+        tenant=tenant,
+        source="warehouse",
+        payload={"campaign": {"rows": []}},
+        generated_at=timezone.now(),
+    )
+    monkeypatch.setattr(warehouse_metrics, "_fetch_rows", lambda sql, params: [])
+    invalidate_warehouse_schema_catalog()
+    options = {"start_date": "2026-04-01", "campaign_search": "brand"}
+
+    def _load() -> list[str]:
+        with CaptureQueriesContext(connection) as queries:
+            load_filtered_warehouse_metrics(
+                tenant=tenant,
+                tenant_id=str(tenant.id),
+                options=options,
+                ttl_seconds=300,
+            )
+        return [query["sql"] for query in queries]
+
+    cold = _load()
+    warm = _load()
+
+    assert sum("sqlite_master" in sql for sql in cold) == 1
+    assert not any("sqlite_master" in sql for sql in warm)
+    assert len(warm) == len(cold) - 1
+
+
+def test_snapshot_refresh_invalidates_schema_catalog(tenant, monkeypatch):
+    monkeypatch.setattr(
+        "analytics.tasks._snapshot_payload_for_tenant",
+        lambda tenant_id: ({}, timezone.now(), "default"),
+    )
+    cache.set(WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY, "before", timeout=None)
+
+    generate_snapshots_for_tenants([str(tenant.id)])
+
+    assert cache.get(WAREHOUSE_SCHEMA_CATALOG_GENERATION_KEY) != "before"
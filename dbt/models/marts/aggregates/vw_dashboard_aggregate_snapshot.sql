@@ -1,10 +1,23 @@
-{{ config(materialized='view') }}
+{% set using_duckdb = target.type == 'duckdb' %}
+{#
+    One row per (tenant_id, window_days). Incremental runs rebuild only the
+    tenants whose facts or Meta ad set budgets changed since their stored row
+    (or whose window end moved), and delete+insert replaces just those rows.
+    The backend reads a tenant's payload with a lookup on the unique index.
+#}
+{{ config(
+    materialized='table' if using_duckdb else 'incremental',
+    unique_key=['tenant_id', 'window_days'],
+    incremental_strategy='delete+insert' if not using_duckdb else none,
+    on_schema_change='sync_all_columns',
+    indexes=[{'columns': ['tenant_id', 'window_days'], 'unique': True}] if not using_duckdb else none
+) }}
 
 {% set currency_code = var('currency_code', 'USD') %}
 {% set window_days = var('dashboard_window_days', 30) %}
 {% set currency_literal = "'" ~ currency_code ~ "'" %}
 
-with window_bounds as (
+with fact_bounds as (
     select
         tenant_id,
         max(date_day) as window_end_date,
@@ -14,6 +27,37 @@ with window_bounds as (
     group by 1
 ),
 
+budget_changes as (
+    select
+        tenant_id,
+        max(updated_time) as budgets_updated_at
+    from {{ ref('stg_meta_adsets') }}
+    group by 1
+),
+
+window_bounds as (
+    select
+        f.tenant_id,
+        f.window_end_date,
+        f.window_start_date,
+        f.generated_at,
+        greatest(f.generated_at, coalesce(b.budgets_updated_at, f.generated_at)) as source_changed_at
+    from fact_bounds f
+    left join budget_changes b
+        on f.tenant_id = b.tenant_id
+    {% if is_incremental() %}
+    left join {{ this }} existing
+        on f.tenant_id = existing.tenant_id
+        and existing.window_days = {{ window_days }}
+    where existing.tenant_id is null
+       or existing.window_end_date <> f.window_end_date
+       or existing.source_changed_at < greatest(
+            f.generated_at,
+            coalesce(b.budgets_updated_at, f.generated_at)
+        )
+    {% endif %}
+),
+
 scoped as (
     select f.*
     from {{ ref('fact_performance') }} f
@@ -430,7 +474,11 @@ campaign_metrics_json as (
 
 select
     w.tenant_id,
+    {{ window_days }} as window_days,
+    w.window_start_date,
+    w.window_end_date,
     w.generated_at,
+    w.source_changed_at,
     coalesce(
         cm.campaign_metrics,
         {{ json_build_object({